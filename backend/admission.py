@@ -0,0 +1,128 @@
+# =============================================================================
+# ADMISSION - Concurrency limit + bounded wait queue for LLM calls
+# =============================================================================
+# An upload burst used to fan out one provider call per request, run into
+# rate limits and then retry on the fallback model, doubling load exactly
+# when the quota was exhausted. The controller caps in-flight calls at the
+# provider quota; extra requests wait in a bounded queue with a deadline.
+# When the queue is full, or a request's deadline passes while queued, the
+# request is rejected immediately with a Retry-After estimate derived from
+# the recent service time, instead of adding to the pile-up.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+# Weight of the newest sample in the service time moving average
+SERVICE_TIME_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call cannot be admitted; `retry_after` is in seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Semaphore-based limiter with a bounded, deadline-aware wait queue."""
+
+    def __init__(self, max_concurrent: int = 8, max_queue: int = 32, queue_timeout: float = 15.0):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self._waiting = 0
+        self._service_time = 0.0
+        self.stats: Dict[str, float] = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_deadline": 0,
+            "rejected_busy": 0,
+            "max_waiting": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: queue ahead / concurrency * service time."""
+        service = self._service_time or 1.0
+        return max(1, math.ceil(service * (self._waiting + 1) / self.max_concurrent))
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        timeout = self.queue_timeout if timeout is None else timeout
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()  # a slot is free: does not block
+        else:
+            if self._waiting >= self.max_queue:
+                self.stats["rejected_queue_full"] += 1
+                raise AdmissionRejected("queue full", self.retry_after())
+            self._waiting += 1
+            self.stats["queued"] += 1
+            self.stats["max_waiting"] = max(self.stats["max_waiting"], self._waiting)
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self.stats["rejected_deadline"] += 1
+                raise AdmissionRejected("queue deadline exceeded", self.retry_after())
+            finally:
+                self._waiting -= 1
+                waited = time.perf_counter() - started
+                self.stats["wait_seconds_total"] += waited
+                self.stats["wait_seconds_max"] = max(self.stats["wait_seconds_max"], waited)
+        self._active += 1
+        self.stats["admitted"] += 1
+
+    async def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now (no queueing); False otherwise."""
+        if self._semaphore.locked():
+            self.stats["rejected_busy"] += 1
+            return False
+        await self._semaphore.acquire()  # a slot is free: does not block
+        self._active += 1
+        self.stats["admitted"] += 1
+        return True
+
+    def release(self, service_seconds: float) -> None:
+        self._active -= 1
+        if self._service_time:
+            self._service_time += SERVICE_TIME_ALPHA * (service_seconds - self._service_time)
+        else:
+            self._service_time = service_seconds
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block."""
+        await self.acquire(timeout)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus live queue depth, for the debug endpoint."""
+        queued = self.stats["queued"]
+        return {
+            **self.stats,
+            "wait_seconds_total": round(self.stats["wait_seconds_total"], 3),
+            "wait_seconds_max": round(self.stats["wait_seconds_max"], 3),
+            "wait_ms_avg": round(1000 * self.stats["wait_seconds_total"] / queued, 1) if queued else 0.0,
+            "active": self._active,
+            "waiting": self._waiting,
+            "service_seconds_avg": round(self._service_time, 3),
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+        }
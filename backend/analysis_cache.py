@@ -0,0 +1,288 @@
+# =============================================================================
+# ANALYSIS CACHE - Content-addressed cache for vision food analysis results
+# =============================================================================
+# Retries, double taps and edit-and-retry flows re-submit the same photo.
+# Results are cached under sha256(locale, context, variant, resized image)
+# so the same upload never pays for a second model call. The variant names
+# what produces the result (model, detail, prompt), so requests routed
+# differently never share entries. A 64-bit dHash of the image catches
+# near-identical re-encodes (re-compressed or re-sized copies) with the same
+# locale/context/variant within a small Hamming distance.
+#
+# Tiers:
+#   1. in-process LRU with TTL (exact key, then dHash)
+#   2. optional MongoDB collection with a TTL index (exact key, then exact
+#      dHash), shared between workers and restarts
+# Identical requests that arrive while the first one is still running wait
+# for its result instead of starting their own call.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import io
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+DHASH_BITS = 64
+_INT64 = 1 << 63
+
+
+def content_key(image_base64: str, locale: str, context: str = "", variant: str = "") -> str:
+    """Exact cache key: sha256 over locale, context, variant and the (resized) image."""
+    digest = hashlib.sha256()
+    digest.update(f"{locale}\0{(context or '').strip()}\0{variant}\0".encode("utf-8"))
+    digest.update(image_base64.encode("ascii", "ignore"))
+    return digest.hexdigest()
+
+
+def request_scope(locale: str, context: str = "", variant: str = "") -> str:
+    """Perceptual matches are only valid for the same locale, context and variant."""
+    return hashlib.sha256(f"{locale}\0{(context or '').strip()}\0{variant}".encode("utf-8")).hexdigest()[:16]
+
+
+def image_dhash(image_bytes: bytes) -> Optional[int]:
+    """64-bit difference hash (9x8 grayscale, horizontal gradients), or None."""
+    if Image is None:
+        return None
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+        image.draft("L", (64, 64))  # JPEG: decode at reduced scale, much cheaper
+        pixels = list(image.convert("L").resize((9, 8), Image.Resampling.BILINEAR).getdata())
+    except Exception as e:
+        logger.warning(f"dHash failed: {e}")
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+def _to_int64(value: int) -> int:
+    return value - (1 << 64) if value >= _INT64 else value
+
+
+class AnalysisCache:
+    """Two-tier result cache with hit/miss accounting."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: int = 6 * 3600,
+        max_distance: int = 4,
+        collection=None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_distance = max_distance
+        self.collection = collection
+        # key -> (expires_at, scope, dhash, result, latency_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, str, Optional[int], Dict[str, Any], float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats: Dict[str, float] = {
+            "hits_exact": 0,
+            "hits_perceptual": 0,
+            "hits_mongo": 0,
+            "coalesced": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0,
+            "llm_calls_saved": 0,
+            "latency_saved_seconds": 0.0,
+        }
+
+    # -------------------------
+    # MEMORY TIER
+    # -------------------------
+    def _memory_get(self, key: str, scope: str, dhash: Optional[int]) -> Optional[Tuple[Dict[str, Any], float, str]]:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[3], entry[4], "hits_exact"
+            del self._entries[key]
+
+        if dhash is None or self.max_distance < 0:
+            return None
+        best_key, best_distance = None, self.max_distance + 1
+        for other_key, (expires_at, other_scope, other_hash, _, _) in self._entries.items():
+            if other_hash is None or other_scope != scope or expires_at <= now:
+                continue
+            distance = (other_hash ^ dhash).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = other_key, distance
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        entry = self._entries[best_key]
+        return entry[3], entry[4], "hits_perceptual"
+
+    def _memory_put(self, key: str, scope: str, dhash: Optional[int], result: Dict[str, Any], latency: float) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, scope, dhash, result, latency)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # -------------------------
+    # MONGO TIER
+    # -------------------------
+    async def ensure_indexes(self) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+            await self.collection.create_index([("scope", 1), ("dhash", 1)])
+        except Exception as e:
+            logger.warning(f"Analysis cache index creation failed: {e}")
+
+    async def _mongo_get(self, key: str, scope: str, dhash: Optional[int]) -> Optional[Dict[str, Any]]:
+        if self.collection is None:
+            return None
+        now = datetime.now(timezone.utc)
+        try:
+            doc = await self.collection.find_one({"_id": key, "expires_at": {"$gt": now}})
+            if doc is None and dhash is not None and self.max_distance >= 0:
+                doc = await self.collection.find_one(
+                    {"scope": scope, "dhash": _to_int64(dhash), "expires_at": {"$gt": now}}
+                )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Analysis cache lookup failed: {e}")
+            return None
+        return doc
+
+    async def _mongo_put(self, key: str, scope: str, dhash: Optional[int], result: Dict[str, Any], latency: float) -> None:
+        if self.collection is None:
+            return
+        now = datetime.now(timezone.utc)
+        doc = {
+            "scope": scope,
+            "dhash": _to_int64(dhash) if dhash is not None else None,
+            "result": result,
+            "latency": latency,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        try:
+            await self.collection.replace_one({"_id": key}, doc, upsert=True)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Analysis cache store failed: {e}")
+
+    # -------------------------
+    # PUBLIC API
+    # -------------------------
+    def _hit(self, counter: str, latency: float) -> None:
+        self.stats[counter] += 1
+        self.stats["llm_calls_saved"] += 1
+        self.stats["latency_saved_seconds"] += latency
+
+    async def lookup(self, key: str, scope: str, dhash: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Cached result from either tier (counted as a hit), or None (counted as a miss).
+
+        For callers that produce the result themselves (e.g. streaming) and
+        hand it back with store(); get_or_compute() is preferred otherwise.
+        """
+        found = self._memory_get(key, scope, dhash)
+        if found is not None:
+            result, latency, counter = found
+            self._hit(counter, latency)
+            return copy.deepcopy(result)
+        doc = await self._mongo_get(key, scope, dhash)
+        if doc is not None:
+            result, latency = doc["result"], float(doc.get("latency") or 0.0)
+            self._hit("hits_mongo", latency)
+            self._memory_put(key, scope, dhash, result, latency)
+            return copy.deepcopy(result)
+        self.stats["misses"] += 1
+        return None
+
+    async def store(self, key: str, scope: str, dhash: Optional[int], result: Dict[str, Any], latency: float) -> None:
+        self._memory_put(key, scope, dhash, copy.deepcopy(result), latency)
+        await self._mongo_put(key, scope, dhash, result, latency)
+        self.stats["stores"] += 1
+
+    async def get_or_compute(
+        self,
+        key: str,
+        scope: str,
+        dhash: Optional[int],
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Cached result for `key`, or run `compute()` once and cache it."""
+        found = self._memory_get(key, scope, dhash)
+        if found is not None:
+            result, latency, counter = found
+            self._hit(counter, latency)
+            logger.info(f"Analysis cache {counter.replace('hits_', '')} hit")
+            return copy.deepcopy(result)
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                result, latency = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this request itself was cancelled
+                # the leading request went away; compute below instead
+            else:
+                self._hit("coalesced", latency)
+                return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            doc = await self._mongo_get(key, scope, dhash)
+            if doc is not None:
+                result, latency = doc["result"], float(doc.get("latency") or 0.0)
+                self._hit("hits_mongo", latency)
+                self._memory_put(key, scope, dhash, result, latency)
+            else:
+                self.stats["misses"] += 1
+                started = time.perf_counter()
+                result = await compute()
+                latency = time.perf_counter() - started
+                self._memory_put(key, scope, dhash, copy.deepcopy(result), latency)
+                await self._mongo_put(key, scope, dhash, result, latency)
+                self.stats["stores"] += 1
+            future.set_result((result, latency))
+            return copy.deepcopy(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; avoid "never retrieved" warnings
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus derived hit rate, for the debug endpoint."""
+        hits = sum(self.stats[k] for k in ("hits_exact", "hits_perceptual", "hits_mongo", "coalesced"))
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "latency_saved_seconds": round(self.stats["latency_saved_seconds"], 2),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "mongo_tier": self.collection is not None,
+        }
@@ -0,0 +1,273 @@
+# =============================================================================
+# ANALYSIS JOBS - Background food analysis with polling
+# =============================================================================
+# Long analyze requests on flaky mobile networks get cut off and the model
+# call is wasted. In job mode the client submits the photo, gets a job id
+# back immediately and polls for the result; a fixed pool of worker tasks
+# runs the analyses from a bounded queue.
+#
+# Job documents live in MongoDB (`analysis_jobs`, TTL index on expires_at)
+# when available, so any worker process can answer a poll; otherwise in
+# process memory with the same expiry. A submission whose image hash
+# matches a live (queued / running / succeeded) job of the same user
+# attaches to that job instead of starting another analysis.
+#
+# The queue itself lives in the process that accepted the job (its `owner`),
+# which renews a lease on every job it holds, queued or running, by
+# refreshing updated_at every heartbeat_seconds. A queued or running job
+# whose lease has not been renewed for stale_seconds belonged to a process
+# that went away (restart / crash): polls report it as lost and a
+# resubmission of the same image starts a new job.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+Work = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class JobQueueFull(Exception):
+    """Raised when the pending-job queue is full."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: datetime) -> datetime:
+    # Mongo returns naive UTC datetimes
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class AnalysisJobQueue:
+    """Bounded job queue + worker tasks with Mongo-or-memory job storage."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_pending: int = 64,
+        ttl_seconds: int = 24 * 3600,
+        stale_seconds: int = 600,
+        heartbeat_seconds: Optional[float] = None,
+        collection=None,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.heartbeat_seconds = heartbeat_seconds or max(1.0, stale_seconds / 4)
+        self.collection = collection
+        self.instance_id = uuid.uuid4().hex[:12]
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        # Queued and running jobs of this process, whose leases it renews
+        self._owned: Dict[str, Dict[str, Any]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self.stats: Dict[str, int] = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "rejected": 0,
+            "succeeded": 0,
+            "failed": 0,
+        }
+
+    # -------------------------
+    # STORAGE
+    # -------------------------
+    async def ensure_indexes(self) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+            await self.collection.create_index([("user_id", 1), ("image_hash", 1)])
+        except Exception as e:
+            logger.warning(f"Analysis job index creation failed: {e}")
+
+    async def _save(self, job: Dict[str, Any]) -> None:
+        self._memory[job["_id"]] = job
+        if self.collection is not None:
+            try:
+                await self.collection.replace_one({"_id": job["_id"]}, job, upsert=True)
+            except Exception as e:
+                logger.warning(f"Saving analysis job {job['_id']} failed: {e}")
+
+    async def _update(self, job: Dict[str, Any], **fields: Any) -> None:
+        fields["updated_at"] = _now()
+        job.update(fields)
+        if job["status"] in (STATUS_SUCCEEDED, STATUS_FAILED):
+            job["expires_at"] = fields["updated_at"] + timedelta(seconds=self.ttl_seconds)
+        await self._save(job)
+        if job["status"] in (STATUS_SUCCEEDED, STATUS_FAILED) and self.collection is not None:
+            # Finished jobs are served from Mongo; keep memory for in-flight ones
+            self._memory.pop(job["_id"], None)
+
+    def _purge_memory(self) -> None:
+        now = _now()
+        for job_id in [j for j, job in self._memory.items() if _aware(job["expires_at"]) <= now]:
+            del self._memory[job_id]
+
+    def _is_live(self, job: Dict[str, Any]) -> bool:
+        now = _now()
+        if _aware(job["expires_at"]) <= now or job["status"] == STATUS_FAILED:
+            return False
+        if job["status"] in (STATUS_QUEUED, STATUS_RUNNING):
+            return (now - _aware(job["updated_at"])).total_seconds() < self.stale_seconds
+        return True
+
+    async def _find_live(self, user_id: str, image_hash: str) -> Optional[Dict[str, Any]]:
+        for job in self._memory.values():
+            if job["user_id"] == user_id and job["image_hash"] == image_hash and self._is_live(job):
+                return job
+        if self.collection is None:
+            return None
+        try:
+            cursor = self.collection.find(
+                {"user_id": user_id, "image_hash": image_hash, "status": {"$ne": STATUS_FAILED}}
+            ).sort("created_at", -1).limit(1)
+            async for job in cursor:
+                if self._is_live(job):
+                    return job
+        except Exception as e:
+            logger.warning(f"Analysis job lookup failed: {e}")
+        return None
+
+    # -------------------------
+    # WORKERS
+    # -------------------------
+    def start(self) -> None:
+        """Start the worker tasks on the running loop (idempotent)."""
+        if self._tasks and all(not t.done() for t in self._tasks):
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._renew_leases()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _renew_leases(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            if not self._owned:
+                continue
+            now = _now()
+            for job in self._owned.values():
+                job["updated_at"] = now
+            if self.collection is None:
+                continue
+            try:
+                # Conditional, so a late write can't overwrite a finished state
+                await self.collection.update_many(
+                    {"_id": {"$in": list(self._owned)}, "status": {"$in": [STATUS_QUEUED, STATUS_RUNNING]}},
+                    {"$set": {"updated_at": now}},
+                )
+            except Exception as e:
+                logger.warning(f"Analysis job lease renewal failed: {e}")
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job, work = await self._queue.get()
+            try:
+                await self._update(job, status=STATUS_RUNNING)
+                result = await work()
+                await self._update(job, status=STATUS_SUCCEEDED, result=result)
+                self.stats["succeeded"] += 1
+            except asyncio.CancelledError:
+                await self._update(job, status=STATUS_FAILED, error={"status_code": 503, "detail": "Server shutting down"})
+                raise
+            except Exception as e:
+                status_code = getattr(e, "status_code", 500)
+                detail = getattr(e, "detail", None) or f"Analysis failed: {e}"
+                logger.warning(f"Analysis job {job['_id']} failed: {detail}")
+                await self._update(job, status=STATUS_FAILED, error={"status_code": status_code, "detail": detail})
+                self.stats["failed"] += 1
+            finally:
+                self._owned.pop(job["_id"], None)
+                self._queue.task_done()
+
+    # -------------------------
+    # PUBLIC API
+    # -------------------------
+    async def submit(self, user_id: str, image_hash: str, work: Work) -> Tuple[Dict[str, Any], bool]:
+        """(job, deduplicated): attaches to a live job for the same image, else queues `work`."""
+        self.start()
+        self._purge_memory()
+        existing = await self._find_live(user_id, image_hash)
+        if existing is not None:
+            self.stats["deduplicated"] += 1
+            return existing, True
+
+        if self._queue.full():
+            self.stats["rejected"] += 1
+            raise JobQueueFull(f"{self._queue.qsize()} analysis jobs pending")
+        now = _now()
+        job = {
+            "_id": f"job_{uuid.uuid4().hex[:16]}",
+            "user_id": user_id,
+            "image_hash": image_hash,
+            "owner": self.instance_id,
+            "status": STATUS_QUEUED,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        await self._save(job)
+        self._owned[job["_id"]] = job
+        self._queue.put_nowait((job, work))
+        self.stats["submitted"] += 1
+        return job, False
+
+    async def get(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """The user's job, or None if unknown, expired or owned by someone else."""
+        job = self._memory.get(job_id)
+        if job is None and self.collection is not None:
+            try:
+                job = await self.collection.find_one({"_id": job_id})
+            except Exception as e:
+                logger.warning(f"Analysis job lookup failed: {e}")
+        if job is None or job["user_id"] != user_id or _aware(job["expires_at"]) <= _now():
+            return None
+        if job["status"] in (STATUS_QUEUED, STATUS_RUNNING) and not self._is_live(job):
+            # Lease expired: the process holding it went away (restart / crash)
+            job = {**job, "status": STATUS_FAILED, "error": {"status_code": 503, "detail": "Job was lost, please resubmit"}}
+        return job
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "ttl_seconds": self.ttl_seconds,
+            "instance_id": self.instance_id,
+            "mongo": self.collection is not None,
+        }
+
+
+def public_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """API representation of a job document."""
+    return {
+        "job_id": job["_id"],
+        "status": job["status"],
+        "created_at": _aware(job["created_at"]).isoformat(),
+        "updated_at": _aware(job["updated_at"]).isoformat(),
+        "result": job.get("result"),
+        "error": job.get("error"),
+    }
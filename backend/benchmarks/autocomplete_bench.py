@@ -0,0 +1,85 @@
+"""
+Autocomplete microbenchmark.
+
+Builds PrefixAutocomplete over the real catalog (~6k rows) and over a
+synthetic catalog (default 600k rows made by recombining real name words),
+then times lookups for prefixes of real names.
+
+Usage (from backend/):
+    python benchmarks/autocomplete_bench.py [--synthetic 600000] [--queries 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from food_database import FOOD_DATABASE  # noqa: E402
+from food_search import PrefixAutocomplete, strip_portion  # noqa: E402
+
+
+def synthetic_names(n: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    bases = [strip_portion(f["name"]) for f in FOOD_DATABASE]
+    words = sorted({w for b in bases for w in b.split()})
+    out = []
+    for _ in range(n):
+        name = rng.choice(bases).split()
+        for _ in range(rng.randint(1, 3)):
+            name.insert(rng.randint(0, len(name)), rng.choice(words))
+        out.append(" ".join(name) + " (1 Porsiyon)")
+    return out
+
+
+def query_prefixes(names: list, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    prefixes = []
+    for _ in range(count):
+        words = strip_portion(rng.choice(names)).split()
+        start = rng.randrange(len(words))
+        text = " ".join(words[start:])
+        prefixes.append(text[: rng.randint(1, min(len(text), 24))])
+    return prefixes
+
+
+def bench(label: str, names: list, queries: int) -> None:
+    t0 = time.perf_counter()
+    index = PrefixAutocomplete(names)
+    build_s = time.perf_counter() - t0
+
+    prefixes = query_prefixes(names, queries)
+    for p in prefixes[:1000]:  # warm-up
+        index.lookup(p)
+    samples = []
+    for p in prefixes:
+        t = time.perf_counter_ns()
+        index.lookup(p)
+        samples.append((time.perf_counter_ns() - t) / 1000.0)
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{label:>10}: rows={len(names):>7} keys={len(index.keys):>8} nodes={len(index.nodes):>8} "
+        f"build={build_s:6.2f}s  p50={p50:6.1f}us  p99={p99:6.1f}us  max={samples[-1]:7.1f}us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=600_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+
+    bench("catalog", [f["name"] for f in FOOD_DATABASE], args.queries)
+    if args.synthetic:
+        bench("synthetic", synthetic_names(args.synthetic), args.queries)
+
+
+if __name__ == "__main__":
+    main()
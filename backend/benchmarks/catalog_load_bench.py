@@ -0,0 +1,80 @@
+"""
+Food catalog load benchmark: Python literal vs mmap snapshot.
+
+Each scenario runs in a fresh interpreter (bytecode writing disabled, as in
+a read-only container) and reports wall time, RSS growth and private
+(unshared) memory growth from /proc/self/smaps_rollup.
+
+Usage (from backend/):
+    python benchmarks/catalog_load_bench.py [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, sys, time
+sys.path.insert(0, {backend!r})
+
+def mem():
+    out = {{}}
+    with open("/proc/self/smaps_rollup") as fh:
+        for line in fh:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Private_Clean:", "Private_Dirty:"):
+                out[parts[0][:-1]] = int(parts[1])
+    return out["Rss"], out["Private_Clean"] + out["Private_Dirty"]
+
+import numpy  # shared dependency, keep it out of the measurement
+rss0, priv0 = mem()
+t0 = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - t0
+rss1, priv1 = mem()
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss1 - rss0, "private_kb": priv1 - priv0}}))
+"""
+
+SCENARIOS = {
+    "literal: import food_database": ("", "import food_database"),
+    "snapshot: open + decode rows": (None, "from food_snapshot import FoodSnapshot, DEFAULT_SNAPSHOT_PATH\nrows = list(FoodSnapshot(DEFAULT_SNAPSHOT_PATH))"),
+    "literal: import food_search": ("", "import food_search"),
+    "snapshot: import food_search": (None, "import food_search"),
+}
+
+
+def run(snapshot_env, body: str) -> dict:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env.pop("FOOD_SNAPSHOT_PATH", None)
+    if snapshot_env is not None:
+        env["FOOD_SNAPSHOT_PATH"] = snapshot_env
+    code = PROBE.format(backend=BACKEND_DIR, body=body)
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Make sure a fresh snapshot exists before timing the mmap path
+    run(None, "import food_catalog")
+
+    for label, (snapshot_env, body) in SCENARIOS.items():
+        results = [run(snapshot_env, body) for _ in range(args.runs)]
+        secs = statistics.median(r["seconds"] for r in results)
+        rss = statistics.median(r["rss_kb"] for r in results) / 1024
+        private = statistics.median(r["private_kb"] for r in results) / 1024
+        print(f"{label:<34} {secs * 1000:8.1f} ms   RSS +{rss:6.1f} MB   private +{private:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Load test of the real LLM-backed endpoints against the local OpenAI stub.
+
+Starts benchmarks/openai_stub.py in a subprocess, points the OpenAI client
+at it (OPENAI_BASE_URL), serves server.app with uvicorn in this process and
+drives the chosen endpoints over HTTP with a fixed number of concurrent
+clients. Every request uses a distinct synthetic photo, so the analysis
+cache does not answer them. For each scenario (a stub latency / error
+configuration) it reports throughput, p50/p95/p99 latency, status codes,
+and the hedger's fallback paths (hedged fallback, fallback after error,
+breaker fallback) with the stub's per-model call counts. Model routing
+(VISION_ROUTER) is off unless --route is given, so every analysis starts on
+the primary model; with --route the router's decisions are reported too.
+
+Auth is bypassed with a dependency override (a synthetic premium user);
+each request carries its own X-Forwarded-For address so the per-IP rate
+limit does not kick in. The diet endpoints save their plan to MongoDB, so
+they only run when MONGO_URL is set.
+
+Usage (from backend/):
+    python benchmarks/llm_endpoints_bench.py [--endpoints analyze,stream,batch] \\
+        [--scenarios baseline,tail,errors,outage] [--requests 200] [--concurrency 16] [--route]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import copy
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+logging.disable(logging.WARNING)
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+import uvicorn  # noqa: E402
+from PIL import Image  # noqa: E402
+
+STUB_PORT = 8900
+APP_PORT = 8901
+
+# Stub configurations; {primary} is replaced with the primary model name
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "baseline": {"latency": "lognormal:0.6:0.3"},
+    # Heavy-tailed primary: hedging should answer the slow calls
+    "tail": {"latency": "lognormal:0.6:0.3", "model_latency": {"{primary}": "lognormal:0.8:0.9"}},
+    # Rate limits and server errors on the primary
+    "errors": {"latency": "lognormal:0.6:0.3", "model_errors": {"{primary}": "429:0.15,500:0.05,503:0.05"}},
+    # Primary unavailable (404): the breaker should open
+    "outage": {"latency": "lognormal:0.6:0.3", "missing_models": ["{primary}"]},
+}
+RESET = {"latency": "lognormal:0.6:0.3", "model_latency": {}, "model_errors": {}, "errors": "", "missing_models": []}
+
+
+def photo_bytes(seed: int, size: int = 320) -> bytes:
+    """Small noisy JPEG; distinct per seed, so neither cache tier matches it."""
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (size * 3 // 4, size, 3), dtype=np.uint8)
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "JPEG", quality=85)
+    return out.getvalue()
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+# -------------------------
+# ENDPOINT DRIVERS
+# -------------------------
+# Each driver sends one logical request and returns its final status code
+# plus optional extra metrics (e.g. time to first streamed item). `tag` is
+# sent as the analysis context: it differs per run, so a photo reused in a
+# later run is not answered from the cache.
+
+async def drive_analyze(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"image_base64": base64.b64encode(image).decode(), "locale": "tr-TR", "context": tag}
+    response = await client.post("/api/food/analyze", json=body, headers=headers)
+    return {"status": response.status_code}
+
+
+async def drive_analyze_v2(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"image_base64": base64.b64encode(image).decode(), "locale": "tr-TR", "context": tag}
+    response = await client.post("/api/food/analyze/v2", json=body, headers=headers)
+    return {"status": response.status_code}
+
+
+async def drive_upload(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    files = {"image": ("meal.jpg", image, "image/jpeg")}
+    response = await client.post("/api/food/analyze/upload", files=files, data={"locale": "tr-TR", "context": tag}, headers=headers)
+    return {"status": response.status_code}
+
+
+async def drive_stream(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"image_base64": base64.b64encode(image).decode(), "locale": "tr-TR", "context": tag}
+    started = time.perf_counter()
+    first_item = None
+    status = None
+    async with client.stream("POST", "/api/food/analyze/stream", json=body, headers=headers) as response:
+        if response.status_code != 200:
+            return {"status": response.status_code}
+        async for line in response.aiter_lines():
+            if line == "event: item" and first_item is None:
+                first_item = time.perf_counter() - started
+            elif line == "event: done":
+                status = 200
+            elif line == "event: error":
+                status = 599
+    return {"status": status or 599, "first_item": first_item}
+
+
+async def drive_batch(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    # Three analyses per request; distinct contexts keep them out of each other's cache scope
+    encoded = base64.b64encode(image).decode()
+    body = {"images": [{"image_base64": encoded, "context": f"{tag}-{n}"} for n in range(3)]}
+    response = await client.post("/api/food/analyze/batch", json=body, headers=headers)
+    if response.status_code != 200:
+        return {"status": response.status_code}
+    failed = [item["status_code"] for item in response.json()["results"] if not item["ok"]]
+    return {"status": failed[0] if failed else 200}
+
+
+async def drive_jobs(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"image_base64": base64.b64encode(image).decode(), "locale": "tr-TR", "context": tag}
+    response = await client.post("/api/food/analyze/jobs", json=body, headers=headers)
+    if response.status_code != 202:
+        return {"status": response.status_code}
+    job_id = response.json()["job_id"]
+    while True:
+        await asyncio.sleep(0.1)
+        job = (await client.get(f"/api/food/analyze/jobs/{job_id}", headers=headers)).json()
+        if job["status"] == "succeeded":
+            return {"status": 200}
+        if job["status"] == "failed":
+            return {"status": job["error"]["status_code"]}
+
+
+async def drive_diet_personal(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"name": "Bench", "target_calories": 1800, "duration_days": 3}
+    response = await client.post("/api/diet/generate-personal", json=body, headers=headers)
+    return {"status": response.status_code}
+
+
+async def drive_diet_weekly(client: httpx.AsyncClient, image: bytes, tag: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    body = {"name": "Bench", "target_calories": 1800}
+    response = await client.post("/api/diet/generate-weekly", json=body, headers=headers)
+    return {"status": response.status_code}
+
+
+DRIVERS: Dict[str, Callable] = {
+    "analyze": drive_analyze,
+    "analyze_v2": drive_analyze_v2,
+    "upload": drive_upload,
+    "stream": drive_stream,
+    "batch": drive_batch,
+    "jobs": drive_jobs,
+    "diet_personal": drive_diet_personal,
+    "diet_weekly": drive_diet_weekly,
+}
+NEEDS_MONGO = {"diet_personal", "diet_weekly"}
+
+
+# -------------------------
+# HARNESS
+# -------------------------
+def start_stub(port: int, seed: Optional[int]) -> subprocess.Popen:
+    command = [sys.executable, os.path.join(BACKEND_DIR, "benchmarks", "openai_stub.py"), "--port", str(port)]
+    if seed is not None:
+        command += ["--seed", str(seed)]
+    process = subprocess.Popen(command)
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/_stub/stats", timeout=0.5)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("OpenAI stub did not start")
+
+
+def scenario_config(name: str, primary: str) -> Dict[str, Any]:
+    text = json.dumps(SCENARIOS[name]).replace("{primary}", primary)
+    return {**RESET, **json.loads(text)}
+
+
+async def run_endpoint(
+    app_url: str,
+    endpoint: str,
+    requests: int,
+    concurrency: int,
+    images: List[bytes],
+    tag: str,
+    ip_offset: int,
+) -> Dict[str, Any]:
+    driver = DRIVERS[endpoint]
+    latencies: List[float] = []
+    first_items: List[float] = []
+    statuses: Counter = Counter()
+    next_index = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=app_url, timeout=300, limits=limits) as client:
+        async def worker() -> None:
+            nonlocal next_index
+            while next_index < requests:
+                index = next_index
+                next_index += 1
+                n = ip_offset + index
+                headers = {"X-Forwarded-For": f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"}
+                started = time.perf_counter()
+                try:
+                    outcome = await driver(client, images[index % len(images)], tag, headers)
+                except httpx.HTTPError as e:
+                    outcome = {"status": type(e).__name__}
+                latencies.append(time.perf_counter() - started)
+                statuses[outcome["status"]] += 1
+                if outcome.get("first_item") is not None:
+                    first_items.append(outcome["first_item"])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "ok": statuses.get(200, 0) + statuses.get(202, 0),
+        "statuses": dict(statuses),
+        "throughput_rps": requests / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "first_item_p50": percentile(first_items, 0.50) if first_items else None,
+        "first_item_p95": percentile(first_items, 0.95) if first_items else None,
+    }
+
+
+def fallback_rates(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, Any]:
+    delta = {k: after[k] - before.get(k, 0) for k in after if isinstance(after[k], int)}
+    calls = delta.get("calls", 0)
+    answered = {
+        "primary": delta.get("primary", 0) + delta.get("hedge_primary_won", 0),
+        "hedged_fallback": delta.get("hedge_fallback_won", 0),
+        "fallback_after_error": delta.get("fallback_after_error", 0),
+        "breaker_fallback": delta.get("breaker_fallback", 0),
+    }
+    fallbacks = calls - answered["primary"]
+    return {
+        "calls": calls,
+        **answered,
+        "failed": delta.get("failed", 0),
+        "fallback_rate": fallbacks / calls if calls else 0.0,
+    }
+
+
+def print_result(
+    scenario: str, endpoint: str, result: Dict[str, Any], paths: Dict[str, Any], stub: Dict[str, Any],
+    routes: Optional[Dict[str, int]] = None,
+) -> None:
+    print(f"\n[{scenario}] {endpoint}: {result['ok']}/{result['requests']} ok, {result['throughput_rps']:.1f} req/s")
+    print(f"  latency p50 {result['p50'] * 1000:.0f} ms  p95 {result['p95'] * 1000:.0f} ms  p99 {result['p99'] * 1000:.0f} ms")
+    if result["first_item_p50"] is not None:
+        print(f"  first item p50 {result['first_item_p50'] * 1000:.0f} ms  p95 {result['first_item_p95'] * 1000:.0f} ms")
+    print(f"  statuses {result['statuses']}")
+    if paths["calls"]:
+        print(
+            f"  hedged calls {paths['calls']}: primary {paths['primary']}, hedged fallback {paths['hedged_fallback']}, "
+            f"fallback after error {paths['fallback_after_error']}, breaker fallback {paths['breaker_fallback']}, "
+            f"failed {paths['failed']}  -> fallback rate {paths['fallback_rate']:.1%}"
+        )
+    if routes:
+        print(f"  routes {routes}")
+    print(f"  stub calls {stub}")
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    import server
+
+    server.app.dependency_overrides[server.get_current_user] = lambda: server.User(
+        user_id="bench_user", email="bench@example.com", name="Bench", is_premium=True,
+        created_at=datetime.now(timezone.utc),
+    )
+    config = uvicorn.Config(
+        server.app, host="127.0.0.1", port=args.app_port, log_level="warning",
+        proxy_headers=True, forwarded_allow_ips="*",
+    )
+    app_server = uvicorn.Server(config)
+    serve_task = asyncio.create_task(app_server.serve())
+    while not app_server.started:
+        await asyncio.sleep(0.05)
+
+    endpoints = args.endpoints.split(",")
+    if server.mongo_db is None and NEEDS_MONGO.intersection(endpoints):
+        print(f"MONGO_URL not set, skipping {', '.join(sorted(NEEDS_MONGO.intersection(endpoints)))}")
+        endpoints = [e for e in endpoints if e not in NEEDS_MONGO]
+
+    print(f"Generating {args.requests} synthetic photos...")
+    images = [photo_bytes(args.seed_offset + i) for i in range(args.requests)]
+    pristine_hedger = copy.deepcopy(server.VISION_HEDGER)
+    server.VISION_ROUTER.enabled = args.route
+    app_url = f"http://127.0.0.1:{args.app_port}"
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    results = []
+    ip_offset = 0
+    try:
+        async with httpx.AsyncClient(base_url=stub_url) as stub:
+            for scenario in args.scenarios.split(","):
+                await stub.post("/_stub/config", json=scenario_config(scenario, server.VISION_MODEL_PRIMARY))
+                for endpoint in endpoints:
+                    # Fresh breaker and latency window per run
+                    server.VISION_HEDGER = copy.deepcopy(pristine_hedger)
+                    server.VISION_HEDGERS.clear()
+                    server.VISION_ROUTER.decisions.clear()
+                    await stub.post("/_stub/reset")
+                    before = dict(server.VISION_HEDGER.stats)
+                    result = await run_endpoint(
+                        app_url, endpoint, args.requests, args.concurrency, images, f"bench-{len(results)}", ip_offset
+                    )
+                    ip_offset += args.requests
+                    paths = fallback_rates(before, server.VISION_HEDGER.stats)
+                    stub_counts = (await stub.get("/_stub/stats")).json()
+                    routes = dict(server.VISION_ROUTER.decisions) if args.route else None
+                    print_result(scenario, endpoint, result, paths, stub_counts, routes)
+                    results.append({
+                        "scenario": scenario, "endpoint": endpoint, **result,
+                        "paths": paths, "routes": routes, "stub": stub_counts,
+                    })
+    finally:
+        app_server.should_exit = True
+        await serve_task
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--endpoints", default="analyze,stream,batch")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stub-port", type=int, default=STUB_PORT)
+    parser.add_argument("--app-port", type=int, default=APP_PORT)
+    parser.add_argument("--seed", type=int, default=1, help="stub RNG seed")
+    parser.add_argument("--seed-offset", type=int, default=0, help="first synthetic photo seed")
+    parser.add_argument("--route", action="store_true", help="enable VISION_ROUTER model routing")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    for name in args.scenarios.split(","):
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+    for name in args.endpoints.split(","):
+        if name not in DRIVERS:
+            parser.error(f"unknown endpoint {name!r} (choose from {', '.join(DRIVERS)})")
+
+    # Must be set before server (and the OpenAI clients) are imported
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.stub_port}/v1"
+    os.environ["OPENAI_KEY"] = "sk-bench-stub"
+    stub = start_stub(args.stub_port, args.seed)
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        stub.terminate()
+        stub.wait()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
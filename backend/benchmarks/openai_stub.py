@@ -0,0 +1,337 @@
+"""
+Local OpenAI-compatible stub server for load tests of the LLM paths.
+
+Serves POST /v1/chat/completions (JSON mode and stream=True) with canned
+payloads: a food analysis when the request carries an image (in the flat
+compact shape when it asks for the "food_analysis" JSON schema), a 7-day or
+N-day diet plan for the diet prompts, a short text reply otherwise.
+Latency is drawn per request from a configurable distribution (optionally
+per model), errors (429 / 404 / 5xx) are injected at configurable rates,
+and responses carry a plausible `usage` block.
+
+Distributions: fixed:S, uniform:LO:HI, lognormal:MEDIAN:SIGMA (seconds).
+--token-interval adds that many seconds per completion token on top, so
+shorter completions answer faster.
+Errors: CODE:RATE[,CODE:RATE...], e.g. 429:0.05,503:0.02.
+
+Usage (from backend/):
+    python benchmarks/openai_stub.py --port 8900 --latency lognormal:0.8:0.35 \\
+        --model-latency gpt-4o-mini=lognormal:1.2:0.3 --errors 429:0.03 \\
+        --missing-model gpt-5-nano
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1 OPENAI_KEY=sk-stub uvicorn server:app
+
+Runtime control: GET /_stub/stats, POST /_stub/config (same keys as
+StubConfig.update), POST /_stub/reset.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+FOOD_PAYLOAD = {
+    "items": [
+        {
+            "name": "Mercimek Çorbası",
+            "quantity_estimate": {"grams": 250, "range_grams": [200, 300]},
+            "calories_kcal": 180,
+            "macros": {"protein_g": 9, "carbs_g": 25, "fat_g": 5},
+            "confidence": 0.86,
+        },
+        {
+            "name": "Izgara Tavuk",
+            "quantity_estimate": {"grams": 150, "range_grams": [120, 180]},
+            "calories_kcal": 248,
+            "macros": {"protein_g": 46, "carbs_g": 0, "fat_g": 5.4},
+            "confidence": 0.8,
+        },
+        {
+            "name": "Pilav",
+            "quantity_estimate": {"grams": 150, "range_grams": [120, 200]},
+            "calories_kcal": 195,
+            "macros": {"protein_g": 4, "carbs_g": 42, "fat_g": 1.5},
+            "confidence": 0.75,
+        },
+    ],
+    "total": {"calories_kcal": 623, "protein_g": 59, "carbs_g": 67, "fat_g": 11.9},
+    "questions": [],
+    "notes": "stub",
+}
+
+
+def compact_food_payload() -> Dict[str, Any]:
+    """FOOD_PAYLOAD in the compact prompt's schema (flat items, no totals)."""
+    items = []
+    for item in FOOD_PAYLOAD["items"]:
+        qty, macros = item["quantity_estimate"], item["macros"]
+        items.append({
+            "name": item["name"],
+            "grams": qty["grams"],
+            "grams_low": qty["range_grams"][0],
+            "grams_high": qty["range_grams"][1],
+            "kcal": item["calories_kcal"],
+            **macros,
+            "confidence": item["confidence"],
+        })
+    return {"items": items, "questions": [], "notes": ""}
+
+
+MEALS = [
+    ("Yulaf ezmesi, muz", 380, 14, 62, 8),
+    ("Izgara tavuk, bulgur pilavı, salata", 560, 42, 58, 14),
+    ("Fırın somon, sebze", 480, 36, 22, 26),
+    ("Yoğurt, ceviz", 180, 9, 10, 11),
+]
+
+
+def diet_payload(days: int) -> Dict[str, Any]:
+    def meal(i: int) -> Dict[str, Any]:
+        name, cal, p, c, f = MEALS[i]
+        return {"name": name, "calories": cal, "protein": p, "carbs": c, "fat": f, "ingredients": [name]}
+
+    return {
+        "name": "Stub Diet",
+        "description": "Canned plan from the OpenAI stub",
+        "target_calories": 1800,
+        "goal": "maintain",
+        "duration_days": days,
+        "macros": {"protein": 30, "carbs": 40, "fat": 30},
+        "days": [
+            {
+                "day": d + 1,
+                "total_calories": 1600,
+                "breakfast": meal(0),
+                "lunch": meal(1),
+                "dinner": meal(2),
+                "snacks": [meal(3)],
+            }
+            for d in range(days)
+        ],
+        "shopping_list": ["yulaf", "tavuk", "somon", "yoğurt"],
+        "tips": ["Bol su için"],
+    }
+
+
+def parse_distribution(spec: str) -> Tuple[str, List[float]]:
+    kind, *params = spec.split(":")
+    if kind not in ("fixed", "uniform", "lognormal") or not params:
+        raise ValueError(f"bad latency spec {spec!r}")
+    return kind, [float(p) for p in params]
+
+
+def sample(distribution: Tuple[str, List[float]]) -> float:
+    kind, params = distribution
+    if kind == "fixed":
+        return params[0]
+    if kind == "uniform":
+        return random.uniform(params[0], params[1])
+    median, sigma = params[0], params[1] if len(params) > 1 else 0.3
+    return random.lognormvariate(math.log(median), sigma)
+
+
+def parse_errors(spec: str) -> Dict[int, float]:
+    rates = {}
+    for part in filter(None, (spec or "").split(",")):
+        code, rate = part.split(":")
+        rates[int(code)] = float(rate)
+    return rates
+
+
+class StubConfig:
+    def __init__(self):
+        self.latency = parse_distribution("lognormal:0.6:0.3")
+        self.model_latency: Dict[str, Tuple[str, List[float]]] = {}
+        self.errors: Dict[int, float] = {}
+        self.model_errors: Dict[str, Dict[int, float]] = {}
+        self.missing_models: set = set()
+        # Seconds between streamed chunks (the rest of the latency is time to first token)
+        self.chunk_interval = 0.02
+        self.chunk_chars = 16
+        # Decode time per completion token, added to the sampled latency
+        self.token_interval = 0.0
+
+    def update(self, data: Dict[str, Any]) -> None:
+        if "latency" in data:
+            self.latency = parse_distribution(data["latency"])
+        for model, spec in (data.get("model_latency") or {}).items():
+            self.model_latency[model] = parse_distribution(spec)
+        if "errors" in data:
+            self.errors = parse_errors(data["errors"])
+        for model, spec in (data.get("model_errors") or {}).items():
+            self.model_errors[model] = parse_errors(spec)
+        if "missing_models" in data:
+            self.missing_models = set(data["missing_models"])
+        if "chunk_interval" in data:
+            self.chunk_interval = float(data["chunk_interval"])
+        if "token_interval" in data:
+            self.token_interval = float(data["token_interval"])
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], response_format: Optional[Dict[str, Any]] = None) -> int:
+    # A JSON schema response format is part of the prompt
+    tokens = len(json.dumps((response_format or {}).get("json_schema") or "", separators=(",", ":"))) // 4
+    for message in messages:
+        content = message.get("content")
+        parts = content if isinstance(content, list) else [{"type": "text", "text": content or ""}]
+        for part in parts:
+            if part.get("type") == "image_url":
+                tokens += 85 if part["image_url"].get("detail") == "low" else 765
+            else:
+                tokens += len(part.get("text") or "") // 4
+    return tokens
+
+
+def canned_content(messages: List[Dict[str, Any]], response_format: Dict[str, Any]) -> str:
+    text = json.dumps(messages, ensure_ascii=False)
+    json_mode = response_format.get("type") in ("json_object", "json_schema")
+    if '"image_url"' in text:
+        if (response_format.get("json_schema") or {}).get("name") == "food_analysis":
+            return json.dumps(compact_food_payload(), ensure_ascii=False)
+        return json.dumps(FOOD_PAYLOAD, ensure_ascii=False)
+    if "7-day" in text:
+        return json.dumps(diet_payload(7), ensure_ascii=False)
+    if "-day personalized diet" in text:
+        return json.dumps(diet_payload(3), ensure_ascii=False)
+    return json.dumps({"reply": "stub"}) if json_mode else "Stub reply."
+
+
+def build_app(config: Optional[StubConfig] = None) -> FastAPI:
+    config = config or StubConfig()
+    app = FastAPI()
+    counts: Counter = Counter()
+
+    def error_response(status: int, model: str) -> JSONResponse:
+        kinds = {429: "rate_limit_exceeded", 404: "model_not_found"}
+        body = {"error": {"message": f"stub {status} for {model}", "type": kinds.get(status, "server_error"), "code": kinds.get(status)}}
+        headers = {"retry-after": "1"} if status == 429 else None
+        return JSONResponse(body, status_code=status, headers=headers)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "")
+        stream = bool(body.get("stream"))
+        counts[(model, "requests")] += 1
+        delay = sample(config.model_latency.get(model, config.latency))
+
+        if model in config.missing_models:
+            counts[(model, 404)] += 1
+            return error_response(404, model)
+        roll = random.random()
+        for status, rate in {**config.errors, **config.model_errors.get(model, {})}.items():
+            if roll < rate:
+                await asyncio.sleep(delay * random.random())
+                counts[(model, status)] += 1
+                return error_response(status, model)
+            roll -= rate
+
+        response_format = body.get("response_format") or {}
+        content = canned_content(body.get("messages", []), response_format)
+        usage = {
+            "prompt_tokens": estimate_tokens(body.get("messages", []), response_format),
+            "completion_tokens": max(1, len(content) // 4),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        delay += usage["completion_tokens"] * config.token_interval
+        completion_id = f"chatcmpl-stub{uuid.uuid4().hex[:12]}"
+        counts[(model, 200)] += 1
+
+        if not stream:
+            await asyncio.sleep(delay)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+                "usage": usage,
+            }
+
+        pieces = [content[i:i + config.chunk_chars] for i in range(0, len(content), config.chunk_chars)]
+        first_token = max(0.0, delay - config.chunk_interval * len(pieces))
+        include_usage = (body.get("stream_options") or {}).get("include_usage")
+
+        async def events():
+            await asyncio.sleep(first_token)
+            for piece in pieces:
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                await asyncio.sleep(config.chunk_interval)
+            final = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                     "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            yield f"data: {json.dumps(final)}\n\n"
+            if include_usage:
+                yield f"data: {json.dumps({**final, 'choices': [], 'usage': usage})}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/_stub/stats")
+    async def stats():
+        out: Dict[str, Dict[str, int]] = {}
+        for (model, key), value in counts.items():
+            out.setdefault(model, {})[str(key)] = value
+        return out
+
+    @app.post("/_stub/config")
+    async def set_config(request: Request):
+        config.update(await request.json())
+        return {"ok": True}
+
+    @app.post("/_stub/reset")
+    async def reset():
+        counts.clear()
+        return {"ok": True}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", default="lognormal:0.6:0.3")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=SPEC")
+    parser.add_argument("--errors", default="")
+    parser.add_argument("--model-errors", action="append", default=[], metavar="MODEL=SPEC")
+    parser.add_argument("--missing-model", action="append", default=[])
+    parser.add_argument("--chunk-interval", type=float, default=0.02)
+    parser.add_argument("--token-interval", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    config = StubConfig()
+    config.update({
+        "latency": args.latency,
+        "model_latency": dict(item.split("=", 1) for item in args.model_latency),
+        "errors": args.errors,
+        "model_errors": dict(item.split("=", 1) for item in args.model_errors),
+        "missing_models": args.missing_model,
+        "chunk_interval": args.chunk_interval,
+        "token_interval": args.token_interval,
+    })
+    uvicorn.run(build_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Event-loop latency under concurrent uploads: inline resize vs IMAGE_POOL.
+
+Fires N concurrent "uploads" of a synthetic 12 MP JPEG through
+prepare_vision_image (resize + dHash), either called directly in the
+coroutine (the old behaviour) or via ImageWorkPool.run. A probe coroutine
+sleeps 5 ms in a loop and records how late it wakes up; that lag is what
+every other request on the worker experiences.
+
+Usage (from backend/):
+    python benchmarks/resize_pool_bench.py [--uploads 16] [--workers 4] [--width 4000 --height 3000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import io
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.disable(logging.WARNING)
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from image_pool import ImageWorkPool  # noqa: E402
+from server import prepare_vision_image  # noqa: E402
+
+PROBE_INTERVAL = 0.005
+
+
+def photo_base64(width: int, height: int, seed: int = 1) -> str:
+    """Noisy gradient JPEG, roughly the entropy of a real food photo."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    base = np.stack([(x * 255 // width), (y * 255 // height), ((x + y) * 127 // (width + height))], axis=-1)
+    pixels = np.clip(base + rng.normal(0, 18, base.shape), 0, 255).astype(np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=90)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+async def probe(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def scenario(image: str, uploads: int, pool: ImageWorkPool = None) -> dict:
+    async def upload():
+        await asyncio.sleep(0)
+        if pool is None:
+            return prepare_vision_image(image)
+        return await pool.run(prepare_vision_image, image)
+
+    lags: list = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(upload() for _ in range(uploads)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+    lags.sort()
+    return {
+        "wall_s": elapsed,
+        "lag_p50_ms": statistics.median(lags),
+        "lag_p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))],
+        "lag_max_ms": lags[-1],
+        "probes": len(lags),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    args = parser.parse_args()
+
+    image = photo_base64(args.width, args.height)
+    print(f"{args.width}x{args.height} JPEG, {len(image) / 1e6:.1f} MB base64, {args.uploads} concurrent uploads")
+    pool = ImageWorkPool(max_workers=args.workers, max_queue=args.uploads)
+    prepare_vision_image(image)  # warm up imports and codecs
+
+    print(f"{'mode':<12} {'wall s':>8} {'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'probes':>7}")
+    for name, selected in (("inline", None), (f"pool x{args.workers}", pool)):
+        r = asyncio.run(scenario(image, args.uploads, selected))
+        print(
+            f"{name:<12} {r['wall_s']:>8.2f} {r['lag_p50_ms']:>7.1f}ms {r['lag_p99_ms']:>7.1f}ms "
+            f"{r['lag_max_ms']:>7.1f}ms {r['probes']:>7}"
+        )
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
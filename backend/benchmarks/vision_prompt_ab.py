@@ -0,0 +1,171 @@
+"""
+A/B of the vision analysis prompts: legacy vs compact (strict JSON schema).
+
+Every photo is analyzed once with each prompt variant through
+server.call_openai_vision_model (routing off, same model and detail for
+both; the variant order alternates per photo). Reports per variant: calls,
+failures (including schema validation failures), average prompt /
+completion / cached tokens, estimated cost, and p50/p95 latency from
+LLM_USAGE, plus how far the two variants' item counts and calorie totals
+differ for the same photo.
+
+By default it runs against benchmarks/openai_stub.py with synthetic
+photos; the stub charges --token-interval seconds per completion token, so
+the shorter compact completions show up in latency. With --live it calls
+the real API (OPENAI_KEY, billed) and should be given real meal photos
+with --images.
+
+Usage (from backend/):
+    python benchmarks/vision_prompt_ab.py [--photos 40] [--concurrency 4] [--token-interval 0.006]
+    OPENAI_KEY=sk-... python benchmarks/vision_prompt_ab.py --live --images ~/meal-photos
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+logging.disable(logging.WARNING)
+
+import httpx  # noqa: E402
+
+from benchmarks.llm_endpoints_bench import percentile, photo_bytes, start_stub  # noqa: E402
+
+STUB_PORT = 8902
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp", ".heic")
+
+
+def load_photos(directory: Optional[str], count: int) -> List[bytes]:
+    if not directory:
+        return [photo_bytes(seed) for seed in range(count)]
+    names = sorted(n for n in os.listdir(directory) if n.lower().endswith(IMAGE_SUFFIXES))[:count]
+    photos = []
+    for name in names:
+        with open(os.path.join(directory, name), "rb") as f:
+            photos.append(f.read())
+    return photos
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    import server
+    from fastapi import HTTPException
+    from vision_prompt import PROMPT_COMPACT, PROMPT_LEGACY
+
+    variants = (PROMPT_LEGACY, PROMPT_COMPACT)
+    photos = load_photos(args.images, args.photos)
+    print(f"Analyzing {len(photos)} photos with {' and '.join(variants)} prompts...")
+    prepared = [(await server.prepare_vision_upload(image_bytes=photo))[0] for photo in photos]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: Dict[str, List[float]] = {v: [] for v in variants}
+    failures: Dict[str, Dict[str, int]] = {v: {} for v in variants}
+    results: Dict[str, List[Optional[Dict[str, Any]]]] = {v: [None] * len(photos) for v in variants}
+    server.set_usage_context("vision_prompt_ab", None)
+
+    async def analyze(index: int, variant: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                results[variant][index] = await server.call_openai_vision_model(
+                    prepared[index], args.locale, variant=variant
+                )
+                latencies[variant].append(time.perf_counter() - started)
+            except HTTPException as e:
+                key = f"{e.status_code} {e.detail}"
+                failures[variant][key] = failures[variant].get(key, 0) + 1
+
+    jobs = []
+    for index in range(len(photos)):
+        order = variants if index % 2 == 0 else variants[::-1]
+        jobs += [analyze(index, variant) for variant in order]
+    await asyncio.gather(*jobs)
+
+    report: Dict[str, Any] = {}
+    for variant in variants:
+        rollup = server.LLM_USAGE.by_variant.get(variant)
+        usage = server.LLM_USAGE._public(rollup) if rollup else {}
+        report[variant] = {
+            "ok": len(latencies[variant]),
+            "failures": failures[variant],
+            "avg_prompt_tokens": usage.get("avg_prompt_tokens"),
+            "avg_completion_tokens": usage.get("avg_completion_tokens"),
+            "cached_tokens": usage.get("cached_tokens"),
+            "cost_usd": usage.get("cost_usd"),
+            "p50_ms": round(percentile(latencies[variant], 0.5) * 1000),
+            "p95_ms": round(percentile(latencies[variant], 0.95) * 1000),
+        }
+
+    pairs = [(a, b) for a, b in zip(results[PROMPT_LEGACY], results[PROMPT_COMPACT]) if a and b]
+    if pairs:
+        report["agreement"] = {
+            "photos": len(pairs),
+            "same_item_count": round(sum(len(a["items"]) == len(b["items"]) for a, b in pairs) / len(pairs), 3),
+            "mean_abs_kcal_diff": round(statistics.mean(
+                abs(a["total"].get("calories_kcal", 0) - b["total"]["calories_kcal"]) for a, b in pairs
+            ), 1),
+        }
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    for variant, row in report.items():
+        if variant == "agreement":
+            continue
+        print(f"\n[{variant}] {row['ok']} ok, failures {row['failures'] or 'none'}")
+        print(
+            f"  tokens/call prompt {row['avg_prompt_tokens']}  completion {row['avg_completion_tokens']}  "
+            f"cached total {row['cached_tokens']}  cost ${row['cost_usd']}"
+        )
+        print(f"  latency p50 {row['p50_ms']} ms  p95 {row['p95_ms']} ms")
+    if "agreement" in report:
+        agreement = report["agreement"]
+        print(
+            f"\nagreement over {agreement['photos']} photos: same item count {agreement['same_item_count']:.0%}, "
+            f"mean |kcal diff| {agreement['mean_abs_kcal_diff']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--photos", type=int, default=40)
+    parser.add_argument("--images", help="directory of meal photos (default: synthetic photos)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--locale", default="tr-TR")
+    parser.add_argument("--live", action="store_true", help="call the real API with OPENAI_KEY (billed)")
+    parser.add_argument("--stub-port", type=int, default=STUB_PORT)
+    parser.add_argument("--token-interval", type=float, default=0.006, help="stub seconds per completion token")
+    args = parser.parse_args()
+
+    # Hedging would mix the variants' latencies with fallback calls; routing would pick different models
+    os.environ["VISION_HEDGE"] = "0"
+    os.environ["VISION_ROUTER"] = "0"
+    stub = None
+    if not args.live:
+        # Must be set before server (and the OpenAI clients) are imported
+        os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.stub_port}/v1"
+        os.environ["OPENAI_KEY"] = "sk-bench-stub"
+        stub = start_stub(args.stub_port, 1)
+        httpx.post(
+            f"http://127.0.0.1:{args.stub_port}/_stub/config",
+            json={"latency": "lognormal:0.4:0.2", "token_interval": args.token_interval},
+        )
+    elif not os.getenv("OPENAI_KEY") and not os.getenv("OPENAI_API_KEY"):
+        parser.error("--live needs OPENAI_KEY")
+    try:
+        print_report(asyncio.run(run(args)))
+    finally:
+        if stub is not None:
+            stub.terminate()
+            stub.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Vision upload resize benchmark: legacy full decode + 1280 px vs image_resize.
+
+For every photo reports decode time, total resize time, bytes sent to the
+provider and the estimated request latency contribution (resize time plus
+base64 upload at --uplink-mbps). The legacy path is the previous
+resize_image_base64: full-size decode, LANCZOS to 1280 px, JPEG q75.
+
+Point --corpus at a directory of real phone photos (*.jpg / *.jpeg /
+*.png); without one a synthetic 12 MP / 8 MP / 3 MP set is generated.
+
+Usage (from backend/):
+    python benchmarks/vision_resize_bench.py [--corpus ~/photos] [--detail low] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from image_resize import DETAIL_LOW, resize_for_vision  # noqa: E402
+
+LEGACY_MAX_SIZE = 1280
+
+
+def legacy_resize(data: bytes) -> tuple:
+    """Previous pipeline; returns (jpeg bytes, decode seconds)."""
+    started = time.perf_counter()
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    decode = time.perf_counter() - started
+    width, height = image.size
+    if max(width, height) > LEGACY_MAX_SIZE:
+        scale = LEGACY_MAX_SIZE / max(width, height)
+        image = image.resize((int(width * scale), int(height * scale)), Image.Resampling.LANCZOS)
+    if image.mode in ("RGBA", "P"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=75)
+    return buffer.getvalue(), decode
+
+
+def new_decode_seconds(data: bytes, detail: str) -> float:
+    """Decode step of the new pipeline alone (draft + load)."""
+    from image_resize import target_size
+
+    started = time.perf_counter()
+    image = Image.open(io.BytesIO(data))
+    if image.format == "JPEG":
+        image.draft("RGB", target_size(*image.size, detail))
+    image.load()
+    return time.perf_counter() - started
+
+
+def synthetic_corpus() -> list:
+    rng = np.random.default_rng(3)
+    photos = []
+    for width, height in ((4032, 3024), (3264, 2448), (2048, 1536)):
+        y, x = np.mgrid[0:height, 0:width]
+        base = np.stack([(x * 255 // width), (y * 255 // height), ((x * y) % 251)], axis=-1)
+        pixels = np.clip(base + rng.normal(0, 14, base.shape), 0, 255).astype(np.uint8)
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format="JPEG", quality=92)
+        photos.append((f"synthetic_{width}x{height}.jpg", buffer.getvalue()))
+    return photos
+
+
+def load_corpus(path: str) -> list:
+    files = sorted(p for p in Path(path).expanduser().iterdir() if p.suffix.lower() in (".jpg", ".jpeg", ".png"))
+    return [(p.name, p.read_bytes()) for p in files]
+
+
+def best_of(repeat: int, fn):
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="directory of photos (default: synthetic set)")
+    parser.add_argument("--detail", default=DETAIL_LOW)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--uplink-mbps", type=float, default=10.0)
+    args = parser.parse_args()
+
+    photos = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    bytes_per_s = args.uplink_mbps * 1e6 / 8
+
+    def latency(seconds: float, jpeg: bytes) -> float:
+        return 1000 * (seconds + len(jpeg) * 4 / 3 / bytes_per_s)
+
+    header = f"{'photo':<28} {'path':<7} {'decode':>8} {'resize':>8} {'sent KB':>8} {'size':>10} {'~latency':>9}"
+    print(f"detail={args.detail}, uplink {args.uplink_mbps} Mbit/s, best of {args.repeat}")
+    print(header)
+    summary = {"legacy": [], "new": []}
+    for name, data in photos:
+        seconds, (jpeg, _) = best_of(args.repeat, lambda: legacy_resize(data))
+        decode = min(legacy_resize(data)[1] for _ in range(args.repeat))
+        size = Image.open(io.BytesIO(jpeg)).size
+        summary["legacy"].append((decode, seconds, len(jpeg), latency(seconds, jpeg)))
+        print(f"{name[:28]:<28} {'legacy':<7} {decode * 1000:>6.1f}ms {seconds * 1000:>6.1f}ms "
+              f"{len(jpeg) / 1024:>8.1f} {f'{size[0]}x{size[1]}':>10} {latency(seconds, jpeg):>7.1f}ms")
+
+        seconds, result = best_of(args.repeat, lambda: resize_for_vision(data, args.detail))
+        decode = min(new_decode_seconds(data, args.detail) for _ in range(args.repeat))
+        summary["new"].append((decode, seconds, len(result.jpeg), latency(seconds, result.jpeg)))
+        print(f"{'':<28} {'new':<7} {decode * 1000:>6.1f}ms {seconds * 1000:>6.1f}ms "
+              f"{len(result.jpeg) / 1024:>8.1f} {f'{result.width}x{result.height}':>10} "
+              f"{latency(seconds, result.jpeg):>7.1f}ms  q{result.quality}")
+
+    print()
+    for path, rows in summary.items():
+        decode, resize, sent, total = (statistics.mean(col) for col in zip(*rows))
+        print(f"mean {path:<7} decode {decode * 1000:6.1f}ms  resize {resize * 1000:6.1f}ms  "
+              f"sent {sent / 1024:6.1f}KB  ~latency {total:6.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
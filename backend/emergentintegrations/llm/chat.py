@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import List, Optional, Any, Dict
+from typing import Awaitable, Callable, List, Optional, Any, Dict
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+# (client, **chat.completions.create params) -> completion; lets the host
+# app wrap calls (usage accounting, retries) without this package knowing it
+CreateHook = Callable[..., Awaitable[Any]]
 
 
 def _guess_mime_from_base64(b64: str) -> str:
@@ -55,6 +58,12 @@ class LlmChat:
       response = await chat.send_message(message)
 
     This class provides exactly that.
+
+    The host app can inject a shared AsyncOpenAI `client` and a `create`
+    hook, e.g. from server.py:
+      LlmChat(api_key=key, client=get_llm_client(key),
+              create=functools.partial(LLM_USAGE.create, role="llm_chat"))
+    Without them a client is created per LlmChat and called directly.
     """
 
     def __init__(
@@ -62,6 +71,8 @@ class LlmChat:
         api_key: str = "",
         session_id: Optional[str] = None,
         system_message: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+        create: Optional[CreateHook] = None,
         **kwargs: Any,
     ):
         self.api_key = api_key or ""
@@ -69,6 +80,8 @@ class LlmChat:
         self.system_message = system_message or ""
         self.provider = "openai"
         self.model = "gpt-5-nano"  # Updated to GPT-5 nano - fastest & cheapest GPT-5 variant
+        self._client = client
+        self._create = create
 
     def with_model(self, provider: str, model: str) -> "LlmChat":
         self.provider = provider
@@ -97,13 +110,11 @@ class LlmChat:
 
         chat_messages.append({"role": "user", "content": user_parts})
 
-        def _call_openai() -> str:
-            client = OpenAI(api_key=self.api_key)
-            resp = client.chat.completions.create(
-                model=self.model,
-                messages=chat_messages,
-            )
-            content = (resp.choices[0].message.content or "").strip()
-            return content
-
-        return await asyncio.to_thread(_call_openai)
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        params = {"model": self.model, "messages": chat_messages}
+        if self._create is not None:
+            resp = await self._create(self._client, **params)
+        else:
+            resp = await self._client.chat.completions.create(**params)
+        return (resp.choices[0].message.content or "").strip()
@@ -0,0 +1,217 @@
+# =============================================================================
+# FOOD BOWLS - Combinatorial bowl foods (food_5384 - food_6082)
+# =============================================================================
+# These catalog rows are base + protein + vegetable pair + sauce combinations.
+# Instead of one literal dict per combination we keep the component tables
+# and one line per (protein, vegetable pair) with the macros of each sauce
+# variant, in SAUCES order. Names, food_ids and row dicts are generated on
+# demand. A line may list fewer sauces than SAUCES; the remaining sauces are
+# simply not part of the catalog.
+#
+# Macros are per-combination values (they are not the sum of the components),
+# so they stay tabulated here. To add a bowl append to BOWL_LINES; to add a
+# component add it to the tables and reference it from a line. New ids
+# continue from the last generated one, so append only at the end.
+# =============================================================================
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, Tuple
+
+# Turkish name -> English name
+BASES = {
+    "Esmer Pirinç": "Brown Rice",
+}
+PROTEINS = {
+    "Izgara Tavuk": "Grilled Chicken",
+    "Izgara Hindi": "Grilled Turkey",
+    "Yağsız Dana": "Lean Beef",
+    "Ton Balığı": "Tuna",
+    "Somon": "Salmon",
+    "Levrek": "Sea Bass",
+    "Alabalık": "Trout",
+}
+VEGETABLES = {
+    "Brokoli": "Broccoli",
+    "Ispanak": "Spinach",
+    "Mantar": "Mushrooms",
+    "Domates": "Tomato",
+    "Salatalık": "Cucumber",
+    "Biber": "Pepper",
+    "Kabak": "Zucchini",
+    "Karnabahar": "Cauliflower",
+    "Havuç": "Carrot",
+    "Soğan": "Onion",
+}
+SAUCES = (
+    ("Limonlu Zeytinyağı", "Lemon-Olive Oil"),
+    ("Yoğurt Sos", "Yogurt Sauce"),
+    ("Tahini Sos", "Tahini Sauce"),
+    ("Humus Sos", "Hummus Sauce"),
+    ("Domates Sos", "Tomato Sauce"),
+    ("Pesto Sos", "Pesto Sauce"),
+    ("Avokado Sos", "Avocado Sauce"),
+)
+
+BOWL_BASE = "Esmer Pirinç"
+FIRST_BOWL_ID = 5384
+
+# (protein, vegetable 1, vegetable 2, ((calories, protein, carbs, fat) per sauce, ...))
+BOWL_LINES: Tuple[Tuple[str, str, str, Tuple[Tuple[Any, ...], ...]], ...] = (
+    ("Izgara Tavuk", "Brokoli", "Kabak", ((635, 57.3, 61.7, 18.3), (597, 60.4, 64.8, 10.6), (664, 60.7, 65.6, 19.1), (723, 62.8, 75.4, 18.7), (613, 59, 72.6, 10), (622, 58.3, 61.8, 16.1), (745, 60.8, 70.1, 26.9))),
+    ("Izgara Tavuk", "Brokoli", "Soğan", ((636, 56, 63.6, 17.8), (658, 60.9, 68.6, 15.4), (666, 59.4, 67.4, 18.6), (784, 63.3, 79.2, 23.5), (674, 59.5, 76.4, 14.8), (683, 58.8, 65.6, 20.9), (686, 57.7, 69.9, 21.3))),
+    ("Izgara Tavuk", "Ispanak", "Mantar", ((686, 62, 59.4, 23.4), (648, 65.1, 62.5, 15.8), (656, 63.6, 61.2, 19), (714, 65.7, 71.1, 18.7), (604, 61.9, 68.3, 10), (614, 61.2, 57.5, 16.1), (676, 61.9, 63.8, 21.7))),
+    ("Izgara Tavuk", "Ispanak", "Kabak", ((626, 58, 58.3, 18.4), (648, 62.9, 63.4, 15.9), (716, 63.2, 64.2, 24.3), (774, 65.3, 74, 24), (604, 59.7, 69.2, 10.1), (613, 59, 58.4, 16.2), (676, 59.7, 64.7, 21.8))),
+    ("Izgara Tavuk", "Ispanak", "Havuç", ((645, 56.9, 64.8, 18.1), (667, 61.8, 69.8, 15.6), (674, 60.3, 68.6, 18.8), (733, 62.4, 78.4, 18.5), (623, 58.6, 75.6, 9.8), (692, 59.7, 66.8, 21.1), (695, 58.6, 71.1, 21.5))),
+    ("Izgara Tavuk", "Mantar", "Salatalık", ((623, 57.4, 58.8, 17.9), (585, 60.5, 61.9, 10.2), (652, 60.8, 62.7, 18.6), (711, 62.9, 72.5, 18.3), (601, 59.1, 69.7, 9.6), (670, 60.2, 60.9, 20.9), (733, 60.9, 67.2, 26.5))),
+    ("Izgara Tavuk", "Mantar", "Havuç", ((703, 59, 66.3, 23.1), (606, 60.3, 67.4, 10.3), (733, 62.4, 70.2, 23.9), (732, 62.7, 78, 18.4), (622, 58.9, 75.2, 9.7), (630, 58.2, 64.4, 15.8), (694, 58.9, 70.7, 21.4))),
+    ("Izgara Tavuk", "Domates", "Kabak", ((623, 55.4, 59.5, 18.1), (585, 58.5, 62.6, 10.5), (712, 60.6, 65.4, 24.1), (771, 62.7, 75.2, 23.8), (661, 58.9, 72.4, 15.1), (610, 56.4, 59.6, 16), (733, 58.9, 67.9, 26.8))),
+    ("Izgara Tavuk", "Domates", "Karnabahar", ((637, 56.7, 63, 18.1), (599, 59.8, 66, 10.5), (667, 60, 66.8, 18.9), (785, 64, 78.6, 23.8), (615, 58.4, 73.8, 9.9), (684, 59.4, 65, 21.2), (687, 58.4, 69.3, 21.6))),
+    ("Izgara Tavuk", "Domates", "Havuç", ((641, 54.3, 66, 17.8), (604, 57.4, 69, 10.2), (671, 57.7, 69.8, 18.6), (730, 59.8, 79.6, 18.3), (620, 56, 76.8, 9.6), (688, 57.1, 68, 20.9), (692, 56, 72.3, 21.3))),
+    ("Izgara Tavuk", "Domates", "Soğan", ((624, 54.1, 61.4, 17.7), (586, 57.2, 64.5, 10), (654, 57.5, 65.3, 18.4), (712, 59.6, 75.1, 18.1), (602, 55.8, 72.3, 9.4), (611, 55.1, 61.5, 15.5), (674, 55.8, 67.8, 21.1))),
+    ("Izgara Tavuk", "Salatalık", "Biber", ((620, 54.3, 60.6, 17.7), (582, 57.4, 63.7, 10.1), (710, 59.5, 66.5, 23.7), (708, 59.8, 74.3, 18.2), (598, 56, 71.5, 9.5), (607, 55.3, 60.7, 15.6), (670, 56, 67, 21.2))),
+    ("Izgara Tavuk", "Kabak", "Havuç", ((703, 56.8, 67.3, 23.2), (605, 58.1, 68.4, 10.4), (673, 58.4, 69.2, 18.8), (731, 60.5, 79, 18.5), (621, 56.7, 76.2, 9.8), (630, 56, 65.4, 15.9), (693, 56.7, 71.7, 21.5))),
+    ("Izgara Hindi", "Brokoli", "Mantar", ((590, 56.5, 60.7, 15), (552, 59.6, 63.8, 7.3), (620, 59.9, 64.6, 15.8), (678, 62, 74.4, 15.4), (568, 58.2, 71.6, 6.7), (577, 57.5, 60.8, 12.9), (640, 58.2, 67.1, 18.4))),
+    ("Izgara Hindi", "Brokoli", "Salatalık", ((588, 53.4, 62.6, 14.8), (550, 56.5, 65.7, 7.1), (618, 56.8, 66.5, 15.5), (736, 60.7, 78.3, 20.4), (566, 55.1, 73.5, 6.5), (635, 56.2, 64.7, 17.8), (638, 55.1, 69, 18.2))),
+    ("Izgara Hindi", "Brokoli", "Kabak", ((590, 54.3, 61.7, 15.1), (612, 59.2, 66.8, 12.7), (619, 57.7, 65.6, 15.9), (738, 61.6, 77.4, 20.8), (568, 56, 72.6, 6.9), (637, 57.1, 63.8, 18.2), (640, 56, 68.1, 18.6))),
+    ("Izgara Hindi", "Ispanak", "Domates", ((579, 54.3, 59, 15), (602, 59.2, 64.1, 12.5), (609, 57.7, 62.9, 15.8), (668, 59.8, 72.7, 15.4), (558, 56, 69.9, 6.7), (566, 55.3, 59.1, 12.8), (630, 56, 65.4, 18.4))),
+    ("Izgara Hindi", "Ispanak", "Salatalık", ((579, 54.1, 59.2, 14.8), (542, 57.2, 62.3, 7.2), (609, 57.5, 63.1, 15.6), (728, 61.4, 74.9, 20.5), (618, 57.6, 72.1, 11.8), (566, 55.1, 59.3, 12.7), (630, 55.8, 65.6, 18.3))),
+    ("Izgara Hindi", "Ispanak", "Biber", ((579, 54.1, 59.2, 14.9), (541, 57.2, 62.3, 7.3), (608, 57.5, 63.1, 15.7), (667, 59.6, 72.9, 15.4), (557, 55.8, 70.1, 6.7), (566, 55.1, 59.3, 12.8), (629, 55.8, 65.6, 18.4))),
+    ("Izgara Hindi", "Ispanak", "Kabak", ((641, 56.8, 60.3, 20.4), (603, 59.9, 63.4, 12.8), (611, 58.4, 62.2, 16), (669, 60.5, 72, 15.6), (559, 56.7, 69.2, 6.9), (568, 56, 58.4, 13.1), (631, 56.7, 64.7, 18.6))),
+    ("Izgara Hindi", "Mantar", "Domates", ((578, 54.6, 58.6, 14.8), (540, 57.7, 61.7, 7.2), (668, 59.8, 64.4, 20.8), (726, 61.9, 74.3, 20.5), (616, 58.1, 71.5, 11.8), (565, 55.6, 58.7, 12.7), (628, 56.3, 65, 18.3))),
+    ("Izgara Hindi", "Mantar", "Karnabahar", ((654, 58.4, 63.3, 20.3), (616, 61.5, 66.4, 12.6), (624, 59.9, 65.2, 15.8), (682, 62.1, 75, 15.5), (572, 58.3, 72.2, 6.8), (581, 57.5, 61.4, 12.9), (644, 58.3, 67.7, 18.5))),
+    ("Izgara Hindi", "Mantar", "Soğan", ((641, 55.8, 61.8, 19.8), (603, 58.9, 64.9, 12.2), (611, 57.4, 63.6, 15.4), (669, 59.5, 73.5, 15.1), (619, 57.5, 72.7, 11.6), (568, 55, 59.9, 12.5), (631, 55.7, 66.2, 18.1))),
+    ("Izgara Hindi", "Domates", "Biber", ((575, 51.5, 60.4, 14.7), (537, 54.6, 63.5, 7.1), (605, 54.9, 64.3, 15.5), (723, 58.8, 76.1, 20.4), (613, 55, 73.3, 11.7), (562, 52.5, 60.5, 12.6), (625, 53.2, 66.8, 18.1))),
+    ("Izgara Hindi", "Domates", "Karnabahar", ((592, 53.7, 63, 15), (554, 56.8, 66, 7.3), (682, 58.8, 68.8, 20.9), (680, 59.2, 76.6, 15.4), (630, 57.2, 75.8, 11.9), (579, 54.6, 63, 12.8), (642, 55.4, 69.3, 18.4))),
+    ("Izgara Hindi", "Salatalık", "Kabak", ((638, 54, 61.8, 20), (540, 55.3, 62.9, 7.2), (607, 55.6, 63.6, 15.6), (666, 57.7, 73.5, 15.3), (556, 53.9, 70.7, 6.6), (565, 53.2, 59.9, 12.7), (628, 53.9, 66.2, 18.3))),
+    ("Izgara Hindi", "Biber", "Havuç", ((656, 52.9, 68.2, 19.8), (558, 54.2, 69.2, 7), (625, 54.5, 70, 15.4), (684, 56.6, 79.8, 15.1), (574, 52.8, 77, 6.4), (583, 52.1, 66.2, 12.5), (646, 52.8, 72.5, 18.1))),
+    ("Izgara Hindi", "Biber", "Soğan", ((638, 52.7, 63.6, 19.7), (540, 54, 64.7, 6.8), (608, 54.3, 65.5, 15.2), (726, 58.2, 77.3, 20.1), (556, 52.6, 72.5, 6.2), (566, 51.9, 61.7, 12.3), (628, 52.6, 68, 17.9))),
+    ("Izgara Hindi", "Karnabahar", "Soğan", ((595, 53.1, 64.2, 14.7), (558, 56.2, 67.2, 7.1), (625, 56.5, 68, 15.5), (684, 58.6, 77.8, 15.2), (574, 54.8, 75, 6.5), (642, 55.9, 66.2, 17.8), (646, 54.8, 70.5, 18.2))),
+    ("Izgara Hindi", "Havuç", "Soğan", ((600, 50.8, 67.2, 14.4), (562, 53.9, 70.2, 6.8), (689, 55.9, 73, 20.4), (688, 56.3, 80.8, 14.9), (638, 54.3, 80, 11.4), (587, 51.7, 67.2, 12.3), (650, 52.5, 73.5, 17.9))),
+    ("Yağsız Dana", "Brokoli", "Domates", ((768, 50.9, 64.4, 35.9), (670, 52.2, 65.4, 23), (737, 52.5, 66.2, 31.4), (796, 54.6, 76, 31.1), (746, 52.6, 75.2, 27.6), (755, 51.9, 64.4, 33.7), (818, 52.6, 70.7, 39.3))),
+    ("Yağsız Dana", "Brokoli", "Salatalık", ((768, 50.7, 64.6, 35.7), (670, 52, 65.7, 22.9), (797, 54.1, 68.5, 36.5), (796, 54.4, 76.3, 31), (686, 50.6, 73.5, 22.3), (695, 49.9, 62.7, 28.4), (758, 50.6, 69, 34))),
+    ("Yağsız Dana", "Brokoli", "Havuç", ((788, 50.5, 70.1, 35.8), (750, 53.6, 73.2, 28.1), (818, 53.9, 74, 36.6), (816, 54.2, 81.8, 31), (766, 52.2, 81, 27.5), (716, 49.7, 68.2, 28.4), (778, 50.4, 74.5, 34))),
+    ("Yağsız Dana", "Ispanak", "Salatalık", ((699, 49.6, 59.2, 30.6), (662, 52.7, 62.3, 22.9), (789, 54.8, 65.1, 36.6), (788, 55.1, 72.9, 31), (738, 53.1, 72.1, 27.5), (686, 50.6, 59.3, 28.5), (750, 51.3, 65.6, 34))),
+    ("Yağsız Dana", "Ispanak", "Biber", ((699, 49.6, 59.2, 30.7), (661, 52.7, 62.3, 23), (728, 53, 63.1, 31.5), (787, 55.1, 72.9, 31.1), (677, 51.3, 70.1, 22.4), (686, 50.6, 59.3, 28.6), (809, 53.1, 67.6, 39.3))),
+    ("Yağsız Dana", "Ispanak", "Karnabahar", ((716, 51.8, 61.8, 30.9), (678, 54.9, 64.8, 23.3), (745, 55.2, 65.6, 31.7), (804, 57.3, 75.4, 31.4), (694, 53.5, 72.6, 22.7), (763, 54.6, 63.8, 34), (766, 53.5, 68.1, 34.4))),
+    ("Yağsız Dana", "Ispanak", "Soğan", ((763, 51, 62.2, 35.7), (665, 52.3, 63.3, 22.8), (792, 54.4, 66.1, 36.5), (851, 56.5, 75.9, 36.1), (681, 50.9, 71.1, 22.2), (690, 50.2, 60.3, 28.4), (753, 50.9, 66.6, 33.9))),
+    ("Yağsız Dana", "Mantar", "Karnabahar", ((714, 52.1, 61.3, 30.8), (736, 57, 66.4, 28.4), (804, 57.2, 67.2, 36.8), (802, 57.6, 75, 31.3), (752, 55.6, 74.2, 27.8), (701, 53, 61.4, 28.7), (764, 53.8, 67.7, 34.3))),
+    ("Yağsız Dana", "Mantar", "Havuç", ((778, 51.5, 66.3, 35.7), (680, 52.8, 67.4, 22.9), (808, 54.9, 70.2, 36.5), (806, 55.2, 78, 31), (696, 51.4, 75.2, 22.3), (766, 52.5, 66.4, 33.6), (768, 51.4, 70.7, 34))),
+    ("Yağsız Dana", "Domates", "Kabak", ((698, 47.9, 59.5, 30.7), (720, 52.8, 64.6, 28.3), (727, 51.3, 63.4, 31.5), (786, 53.4, 73.2, 31.2), (676, 49.6, 70.4, 22.5), (685, 48.9, 59.6, 28.6), (748, 49.6, 65.9, 34.2))),
+    ("Yağsız Dana", "Domates", "Karnabahar", ((712, 49.2, 63, 30.7), (674, 52.3, 66, 23.1), (742, 52.5, 66.8, 31.5), (860, 56.5, 78.6, 36.4), (690, 50.9, 73.8, 22.5), (699, 50.1, 63, 28.6), (822, 52.7, 71.3, 39.4))),
+    ("Yağsız Dana", "Salatalık", "Kabak", ((698, 47.7, 59.8, 30.6), (660, 50.8, 62.9, 22.9), (727, 51.1, 63.6, 31.4), (846, 55, 75.5, 36.2), (736, 51.2, 72.7, 27.5), (685, 48.7, 59.9, 28.4), (808, 51.2, 68.2, 39.2))),
+    ("Yağsız Dana", "Salatalık", "Soğan", ((699, 46.4, 61.6, 30.1), (661, 49.5, 64.7, 22.5), (729, 49.8, 65.5, 30.9), (787, 51.9, 75.3, 30.6), (737, 49.9, 74.5, 27.1), (686, 47.4, 61.7, 28), (749, 48.1, 68, 33.6))),
+    ("Yağsız Dana", "Biber", "Kabak", ((697, 47.7, 59.7, 30.7), (659, 50.8, 62.8, 23), (726, 51.1, 63.6, 31.5), (845, 55, 75.4, 36.3), (675, 49.4, 70.6, 22.4), (684, 48.7, 59.8, 28.5), (807, 51.2, 68.1, 39.3))),
+    ("Yağsız Dana", "Kabak", "Havuç", ((718, 47.5, 65.3, 30.6), (680, 50.6, 68.4, 23), (748, 50.9, 69.2, 31.4), (806, 53, 79, 31.1), (696, 49.2, 76.2, 22.4), (765, 50.3, 67.4, 33.7), (828, 51, 73.7, 39.3))),
+    ("Yağsız Dana", "Havuç", "Soğan", ((720, 46.3, 67.2, 30.2), (742, 51.2, 72.2, 27.7), (749, 49.6, 71, 31), (868, 53.6, 82.8, 35.8), (758, 49.8, 80, 27.1), (707, 47.2, 67.2, 28), (770, 48, 73.5, 33.6))),
+    ("Ton Balığı", "Brokoli", "Domates", ((557, 46.5, 62.4, 14), (519, 49.6, 65.4, 6.3), (647, 51.7, 68.2, 19.9), (705, 53.8, 78, 19.6), (535, 48.2, 73.2, 5.7), (544, 47.5, 62.4, 11.8), (607, 48.2, 68.7, 17.4))),
+    ("Ton Balığı", "Brokoli", "Kabak", ((619, 49, 63.7, 19.4), (521, 50.3, 64.8, 6.5), (588, 50.6, 65.6, 15), (647, 52.7, 75.4, 14.6), (597, 50.7, 74.6, 11.1), (606, 50, 63.8, 17.2), (609, 48.9, 68.1, 17.6))),
+    ("Ton Balığı", "Ispanak", "Mantar", ((550, 50.1, 57.4, 14.1), (513, 53.2, 60.5, 6.5), (580, 53.5, 61.2, 14.9), (639, 55.6, 71.1, 14.6), (589, 53.6, 70.3, 11.1), (598, 52.9, 59.5, 17.2), (661, 53.6, 65.8, 22.8))),
+    ("Ton Balığı", "Ispanak", "Domates", ((608, 49, 61, 19.2), (511, 50.3, 62.1, 6.4), (578, 50.6, 62.9, 14.8), (637, 52.7, 72.7, 14.5), (587, 50.7, 71.9, 11), (536, 48.2, 59.1, 11.9), (599, 48.9, 65.4, 17.5))),
+    ("Ton Balığı", "Ispanak", "Havuç", ((629, 48.6, 66.8, 19.2), (531, 49.9, 67.8, 6.3), (598, 50.2, 68.6, 14.7), (657, 52.3, 78.4, 14.4), (607, 50.3, 77.6, 10.9), (556, 47.8, 64.8, 11.8), (679, 50.3, 73.1, 22.6))),
+    ("Ton Balığı", "Mantar", "Kabak", ((549, 48.2, 57.9, 14.1), (511, 51.3, 61, 6.5), (638, 53.4, 63.8, 20.1), (637, 53.7, 71.6, 14.6), (587, 51.7, 70.8, 11.1), (536, 49.2, 58, 12), (599, 49.9, 64.3, 17.6))),
+    ("Ton Balığı", "Mantar", "Karnabahar", ((563, 49.5, 61.3, 14.1), (525, 52.6, 64.4, 6.5), (593, 52.8, 65.2, 14.9), (651, 55, 75, 14.6), (541, 51.2, 72.2, 5.9), (550, 50.4, 61.4, 12), (673, 53, 69.7, 22.8))),
+    ("Ton Balığı", "Mantar", "Soğan", ((550, 46.9, 59.8, 13.7), (512, 50, 62.9, 6), (580, 50.3, 63.6, 14.4), (638, 52.4, 73.5, 14.1), (528, 48.6, 70.7, 5.4), (597, 49.7, 61.9, 16.7), (600, 48.6, 66.2, 17.1))),
+    ("Ton Balığı", "Domates", "Salatalık", ((545, 44.4, 60.4, 13.7), (507, 47.5, 63.5, 6), (635, 49.6, 66.3, 19.6), (633, 49.9, 74.1, 14.1), (523, 46.1, 71.3, 5.4), (532, 45.4, 60.5, 11.5), (655, 47.9, 68.8, 22.3))),
+    ("Ton Balığı", "Domates", "Soğan", ((548, 44, 61.4, 13.6), (510, 47.1, 64.5, 5.9), (578, 47.4, 65.3, 14.3), (696, 51.3, 77.1, 19.2), (526, 45.7, 72.3, 5.3), (595, 46.8, 63.5, 16.6), (658, 47.5, 69.8, 22.2))),
+    ("Ton Balığı", "Salatalık", "Biber", ((604, 46, 62.6, 18.8), (566, 49.1, 65.7, 11.2), (634, 49.4, 66.5, 19.6), (632, 49.7, 74.3, 14.1), (522, 45.9, 71.5, 5.4), (531, 45.2, 60.7, 11.5), (594, 45.9, 67, 17.1))),
+    ("Ton Balığı", "Salatalık", "Karnabahar", ((561, 46.4, 63.2, 13.9), (523, 49.5, 66.3, 6.2), (591, 49.8, 67.1, 14.7), (649, 51.9, 76.9, 14.3), (539, 48.1, 74.1, 5.6), (608, 49.2, 65.3, 16.9), (611, 48.1, 69.6, 17.3))),
+    ("Ton Balığı", "Biber", "Havuç", ((565, 44, 66.2, 13.7), (527, 47.1, 69.2, 6), (594, 47.4, 70, 14.5), (653, 49.5, 79.8, 14.1), (543, 45.7, 77, 5.4), (552, 45, 66.2, 11.5), (615, 45.7, 72.5, 17.1))),
+    ("Ton Balığı", "Kabak", "Havuç", ((567, 44.9, 65.3, 13.9), (589, 49.8, 70.4, 11.5), (597, 48.3, 69.2, 14.7), (655, 50.4, 79, 14.4), (545, 46.6, 76.2, 5.7), (554, 45.9, 65.4, 11.8), (617, 46.6, 71.7, 17.4))),
+    ("Ton Balığı", "Karnabahar", "Soğan", ((624, 47.8, 66.2, 19), (587, 50.9, 69.2, 11.3), (594, 49.4, 68, 14.6), (713, 53.3, 79.8, 19.4), (543, 47.7, 75, 5.5), (612, 48.8, 66.2, 16.8), (675, 49.5, 72.5, 22.4))),
+    ("Somon", "Brokoli", "Havuç", ((718, 39.7, 68.1, 32.1), (680, 42.8, 71.2, 24.4), (747, 43.1, 72, 32.9), (866, 47, 83.8, 37.7), (696, 41.4, 79, 23.8), (705, 40.7, 68.2, 29.9), (768, 41.4, 74.5, 35.5))),
+    ("Somon", "Ispanak", "Mantar", ((691, 43.7, 57.4, 32.3), (713, 48.6, 62.5, 29.9), (720, 47.1, 61.2, 33.1), (779, 49.2, 71.1, 32.8), (669, 45.4, 68.3, 24.1), (738, 46.5, 59.5, 35.4), (801, 47.2, 65.8, 41))),
+    ("Somon", "Ispanak", "Salatalık", ((749, 42.4, 61.2, 37.3), (651, 43.7, 62.3, 24.4), (778, 45.8, 65.1, 38.1), (837, 47.9, 74.9, 37.7), (667, 42.3, 70.1, 23.8), (676, 41.6, 59.3, 30), (739, 42.3, 65.6, 35.5))),
+    ("Somon", "Ispanak", "Biber", ((748, 42.4, 61.2, 37.4), (650, 43.7, 62.3, 24.5), (778, 45.8, 65.1, 38.2), (836, 47.9, 74.9, 37.8), (666, 42.3, 70.1, 23.9), (735, 43.4, 61.3, 35.3), (738, 42.3, 65.6, 35.6))),
+    ("Somon", "Ispanak", "Kabak", ((691, 41.5, 58.3, 32.4), (653, 44.6, 61.4, 24.8), (780, 46.7, 64.2, 38.4), (779, 47, 72, 32.9), (669, 43.2, 69.2, 24.2), (678, 42.5, 58.4, 30.3), (801, 45, 66.7, 41.1))),
+    ("Somon", "Ispanak", "Soğan", ((752, 42, 62.2, 37.2), (714, 45.1, 65.3, 29.5), (722, 43.6, 64.1, 32.8), (780, 45.7, 73.9, 32.4), (670, 41.9, 71.1, 23.7), (679, 41.2, 60.3, 29.9), (742, 41.9, 66.6, 35.4))),
+    ("Somon", "Mantar", "Biber", ((687, 40.9, 58.8, 32), (649, 44, 61.9, 24.4), (776, 46.1, 64.6, 38), (775, 46.4, 72.5, 32.5), (665, 42.6, 69.7, 23.8), (674, 41.9, 58.9, 29.9), (737, 42.6, 65.2, 35.5))),
+    ("Somon", "Mantar", "Karnabahar", ((704, 43.1, 61.3, 32.3), (726, 48, 66.4, 29.9), (733, 46.4, 65.2, 33.1), (792, 48.6, 75, 32.8), (682, 44.8, 72.2, 24.1), (751, 45.8, 63.4, 35.4), (754, 44.8, 67.7, 35.8))),
+    ("Somon", "Mantar", "Soğan", ((691, 40.5, 59.8, 31.9), (653, 43.6, 62.9, 24.2), (780, 45.7, 65.6, 37.8), (779, 46, 73.5, 32.3), (729, 44, 72.7, 28.8), (678, 41.5, 59.9, 29.7), (741, 42.2, 66.2, 35.3))),
+    ("Somon", "Domates", "Karnabahar", ((702, 40.2, 63, 32.2), (664, 43.3, 66, 24.6), (731, 43.5, 66.8, 33), (790, 45.7, 76.6, 32.7), (680, 41.9, 73.8, 24), (749, 42.9, 65, 35.3), (812, 43.7, 71.3, 40.9))),
+    ("Somon", "Salatalık", "Karnabahar", ((762, 41.8, 65.2, 37.3), (664, 43.1, 66.3, 24.4), (731, 43.4, 67.1, 32.9), (790, 45.5, 76.9, 32.5), (680, 41.7, 74.1, 23.8), (689, 41, 63.3, 29.9), (752, 41.7, 69.6, 35.5))),
+    ("Somon", "Salatalık", "Soğan", ((689, 37.4, 61.6, 31.6), (651, 40.5, 64.7, 24), (718, 40.8, 65.5, 32.4), (837, 44.7, 77.3, 37.3), (667, 39.1, 72.5, 23.4), (736, 40.2, 63.7, 34.7), (739, 39.1, 68, 35.1))),
+    ("Somon", "Biber", "Karnabahar", ((701, 40, 63.2, 32.2), (663, 43.1, 66.2, 24.5), (730, 43.4, 67, 33), (849, 47.3, 78.8, 37.8), (679, 41.7, 74, 23.9), (748, 42.8, 65.2, 35.2), (751, 41.7, 69.5, 35.6))),
+    ("Somon", "Biber", "Havuç", ((705, 37.6, 66.2, 31.9), (667, 40.7, 69.2, 24.2), (735, 41, 70, 32.7), (793, 43.1, 79.8, 32.3), (743, 41.1, 79, 28.8), (752, 40.4, 68.2, 34.9), (755, 39.3, 72.5, 35.3))),
+    ("Somon", "Karnabahar", "Havuç", ((722, 39.8, 68.7, 32.1), (744, 44.7, 73.8, 29.7), (752, 43.2, 72.6, 32.9), (870, 47.1, 84.4, 37.8), (700, 41.5, 79.6, 23.9), (769, 42.6, 70.8, 35.2), (832, 43.3, 77.1, 40.8))),
+    ("Somon", "Havuç", "Soğan", ((709, 37.3, 67.2, 31.7), (671, 40.4, 70.2, 24), (799, 42.4, 73, 37.7), (857, 44.6, 82.8, 37.3), (747, 40.8, 80, 28.6), (696, 38.2, 67.2, 29.5), (819, 40.8, 75.5, 40.3))),
+    ("Levrek", "Brokoli", "Ispanak", ((583, 48.7, 61.2, 16.9), (545, 51.8, 64.2, 9.2), (672, 53.9, 67, 22.9), (671, 54.2, 74.8, 17.3), (621, 52.2, 74, 13.8), (570, 49.7, 61.2, 14.8), (633, 50.4, 67.5, 20.3))),
+    ("Levrek", "Brokoli", "Biber", ((639, 47.7, 64.6, 21.8), (541, 49, 65.6, 9), (608, 49.3, 66.4, 17.4), (667, 51.4, 76.2, 17.1), (617, 49.4, 75.4, 13.6), (566, 46.9, 62.6, 14.5), (629, 47.6, 68.9, 20.1))),
+    ("Levrek", "Brokoli", "Kabak", ((641, 48.6, 63.7, 22.1), (543, 49.9, 64.8, 9.2), (611, 50.2, 65.6, 17.7), (669, 52.3, 75.4, 17.3), (559, 48.5, 72.6, 8.6), (568, 47.8, 61.8, 14.7), (691, 50.3, 70.1, 25.5))),
+    ("Levrek", "Brokoli", "Soğan", ((643, 47.3, 65.6, 21.6), (605, 50.4, 68.6, 14), (612, 48.9, 67.4, 17.2), (671, 51, 77.2, 16.9), (561, 47.2, 74.4, 8.2), (570, 46.5, 63.6, 14.3), (633, 47.2, 69.9, 19.9))),
+    ("Levrek", "Ispanak", "Kabak", ((573, 47.5, 58.3, 16.9), (535, 50.6, 61.4, 9.3), (602, 50.9, 62.2, 17.7), (721, 54.8, 74, 22.6), (551, 49.2, 69.2, 8.7), (560, 48.5, 58.4, 14.8), (683, 51, 66.7, 25.6))),
+    ("Levrek", "Ispanak", "Karnabahar", ((587, 48.8, 61.8, 16.9), (609, 53.7, 66.8, 14.5), (617, 52.2, 65.6, 17.7), (675, 54.3, 75.4, 17.4), (565, 50.5, 72.6, 8.7), (574, 49.8, 61.8, 14.8), (637, 50.5, 68.1, 20.4))),
+    ("Levrek", "Mantar", "Domates", ((570, 47.1, 58.6, 16.6), (532, 50.2, 61.7, 8.9), (599, 50.5, 62.4, 17.4), (718, 54.4, 74.3, 22.2), (548, 48.8, 69.5, 8.3), (557, 48.1, 58.7, 14.5), (620, 48.8, 65, 20))),
+    ("Levrek", "Domates", "Salatalık", ((568, 44, 60.4, 16.4), (530, 47.1, 63.5, 8.7), (597, 47.4, 64.3, 17.1), (656, 49.5, 74.1, 16.8), (606, 47.5, 73.3, 13.3), (555, 45, 60.5, 14.2), (618, 45.7, 66.8, 19.8))),
+    ("Levrek", "Domates", "Kabak", ((569, 44.9, 59.5, 16.7), (531, 48, 62.6, 9.1), (599, 48.3, 63.4, 17.5), (657, 50.4, 73.2, 17.2), (547, 46.6, 70.4, 8.5), (556, 45.9, 59.6, 14.6), (679, 48.4, 67.9, 25.4))),
+    ("Levrek", "Salatalık", "Kabak", ((629, 46.5, 61.8, 21.8), (591, 49.6, 64.9, 14.1), (599, 48.1, 63.6, 17.4), (657, 50.2, 73.5, 17), (547, 46.4, 70.7, 8.3), (556, 45.7, 59.9, 14.4), (619, 46.4, 66.2, 20))),
+    ("Levrek", "Salatalık", "Soğan", ((571, 43.4, 61.6, 16.1), (593, 48.3, 66.7, 13.7), (660, 48.6, 67.5, 22.1), (659, 48.9, 75.3, 16.6), (609, 46.9, 74.5, 13.1), (558, 44.4, 61.7, 14), (681, 46.9, 70, 24.8))),
+    ("Levrek", "Biber", "Kabak", ((568, 44.7, 59.7, 16.7), (531, 47.8, 62.8, 9), (598, 48.1, 63.6, 17.5), (657, 50.2, 73.4, 17.1), (547, 46.4, 70.6, 8.4), (556, 45.7, 59.8, 14.5), (619, 46.4, 66.1, 20.1))),
+    ("Levrek", "Biber", "Karnabahar", ((583, 46, 63.2, 16.7), (545, 49.1, 66.2, 9), (612, 49.4, 67, 17.5), (671, 51.5, 76.8, 17.1), (561, 47.7, 74, 8.4), (570, 47, 63.2, 14.5), (633, 47.7, 69.5, 20.1))),
+    ("Levrek", "Biber", "Havuç", ((647, 45.4, 68.2, 21.6), (549, 46.7, 69.2, 8.7), (677, 48.8, 72, 22.4), (675, 49.1, 79.8, 16.8), (625, 47.1, 79, 13.3), (574, 44.6, 66.2, 14.2), (637, 45.3, 72.5, 19.8))),
+    ("Levrek", "Kabak", "Karnabahar", ((586, 46.9, 62.3, 16.9), (608, 51.8, 67.4, 14.5), (675, 52.1, 68.2, 22.9), (674, 52.4, 76, 17.4), (564, 48.6, 73.2, 8.7), (573, 47.9, 62.4, 14.8), (636, 48.6, 68.7, 20.4))),
+    ("Alabalık", "Brokoli", "Ispanak", ((685, 52.7, 61.2, 26.9), (647, 55.8, 64.2, 19.2), (714, 56.1, 65, 27.7), (833, 60, 76.8, 32.5), (663, 54.4, 72, 18.6), (672, 53.7, 61.2, 24.8), (735, 54.4, 67.5, 30.3))),
+    ("Alabalık", "Ispanak", "Mantar", ((735, 55.5, 59.4, 32), (637, 56.8, 60.5, 19.2), (704, 57.1, 61.2, 27.6), (823, 61, 73.1, 32.5), (713, 57.2, 70.3, 23.8), (722, 56.5, 59.5, 29.9), (725, 55.4, 63.8, 30.3))),
+    ("Alabalık", "Ispanak", "Havuç", ((693, 50.4, 64.8, 26.6), (655, 53.5, 67.8, 19), (723, 53.8, 68.6, 27.4), (781, 55.9, 78.4, 27.1), (671, 52.1, 75.6, 18.4), (680, 51.4, 64.8, 24.5), (743, 52.1, 71.1, 30.1))),
+    ("Alabalık", "Mantar", "Domates", ((671, 51.1, 58.6, 26.6), (694, 56, 63.7, 24.1), (701, 54.5, 62.4, 27.4), (820, 58.4, 74.3, 32.2), (650, 52.8, 69.5, 18.3), (659, 52.1, 58.7, 24.5), (722, 52.8, 65, 30))),
+    ("Alabalık", "Mantar", "Salatalık", ((671, 50.9, 58.8, 26.5), (634, 54, 61.9, 18.8), (701, 54.3, 62.7, 27.2), (760, 56.4, 72.5, 26.9), (650, 52.6, 69.7, 18.2), (659, 51.9, 58.9, 24.3), (722, 52.6, 65.2, 29.9))),
+    ("Alabalık", "Mantar", "Karnabahar", ((688, 53.1, 61.3, 26.8), (650, 56.2, 64.4, 19.2), (717, 56.4, 65.2, 27.6), (776, 58.6, 75, 27.3), (666, 54.8, 72.2, 18.6), (675, 54, 61.4, 24.7), (738, 54.8, 67.7, 30.3))),
+    ("Alabalık", "Domates", "Biber", ((669, 48, 60.4, 26.5), (691, 52.9, 65.5, 24), (758, 53.2, 66.3, 32.4), (817, 55.3, 76.1, 32.1), (647, 49.7, 71.3, 18.2), (716, 50.8, 62.5, 29.5), (719, 49.7, 66.8, 29.9))),
+    ("Alabalık", "Domates", "Havuç", ((690, 47.8, 66, 26.4), (652, 50.9, 69, 18.8), (719, 51.2, 69.8, 27.2), (778, 53.3, 79.6, 26.9), (668, 49.5, 76.8, 18.2), (677, 48.8, 66, 24.3))),
+)
+
+
+class BowlFoods(Sequence):
+    """Catalog rows for BOWL_LINES, built on demand in FOOD_DATABASE format."""
+
+    def __init__(self, lines=BOWL_LINES, first_id: int = FIRST_BOWL_ID, base: str = BOWL_BASE):
+        self.lines = lines
+        self.first_id = first_id
+        self.base = base
+        # starts[i] = row index of the first sauce variant of lines[i]
+        self.starts = []
+        total = 0
+        for line in lines:
+            self.starts.append(total)
+            total += len(line[3])
+        self.size = total
+
+    def __len__(self) -> int:
+        return self.size
+
+    def row(self, line_no: int, sauce_no: int) -> Dict[str, Any]:
+        protein, veg1, veg2, macros = self.lines[line_no]
+        sauce, sauce_en = SAUCES[sauce_no]
+        calories, protein_g, carbs, fat = macros[sauce_no]
+        return {
+            "food_id": f"food_{self.first_id + self.starts[line_no] + sauce_no:03d}",
+            "name": f"{self.base} + {protein} + {veg1}-{veg2} {sauce} Bowl (1 Porsiyon)",
+            "calories": calories,
+            "protein": protein_g,
+            "carbs": carbs,
+            "fat": fat,
+            "name_en": (
+                f"{BASES[self.base]} + {PROTEINS[protein]} + "
+                f"{VEGETABLES[veg1]}-{VEGETABLES[veg2]} {sauce_en} Bowl (1 Serving)"
+            ),
+        }
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("bowl food index out of range")
+        line_no = bisect_right(self.starts, index) - 1
+        return self.row(line_no, index - self.starts[line_no])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for line_no, line in enumerate(self.lines):
+            for sauce_no in range(len(line[3])):
+                yield self.row(line_no, sauce_no)
+
+
+BOWL_FOODS = BowlFoods()
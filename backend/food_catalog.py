@@ -0,0 +1,290 @@
+# =============================================================================
+# FOOD CATALOG - Precomputed views over FOOD_DATABASE
+# =============================================================================
+# food_database.py is the editable source of truth. Rows are read through the
+# shared mmap snapshot (see food_snapshot.py) and everything in this module is
+# derived from them once at import time so request handlers never have to
+# walk the full list.
+# =============================================================================
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from food_snapshot import load_catalog
+from food_versions import CatalogVersions
+
+# Optional brotli support (not in requirements; gzip is always available)
+try:
+    import brotli  # type: ignore
+except Exception:
+    brotli = None
+
+# List-like sequence of FOOD_DATABASE rows (FoodSnapshot or the plain list)
+FOOD_CATALOG = load_catalog()
+
+SUPPORTED_LANGS = ("tr", "en")
+DEFAULT_LANG = "tr"
+
+
+def project_food(food: Dict[str, Any], lang: str = DEFAULT_LANG) -> Dict[str, Any]:
+    """Client-facing view of a single catalog row for the given language."""
+    return {
+        "food_id": food["food_id"],
+        "name": food["name_en"] if lang == "en" else food["name"],
+        "calories": food["calories"],
+        "protein": food["protein"],
+        "carbs": food["carbs"],
+        "fat": food["fat"],
+    }
+
+
+def encode_json(data: Any) -> bytes:
+    """Compact, deterministic JSON encoding used for all cached payloads."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag derived from the payload bytes."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+CONTENT_CODINGS = ("gzip", "br")
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """ETag of one content-coding of a payload: distinct per representation, as RFC 9110 requires."""
+    return etag if not encoding else etag[:-1] + "-" + encoding + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against our ETag (RFC 9110 weak comparison).
+
+    Any content-coding variant of `etag` matches: all decode to the same payload.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    variants = {etag, *(encoded_etag(etag, coding) for coding in CONTENT_CODINGS)}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in variants:
+            return True
+    return False
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parse Accept-Encoding into {coding: q}."""
+    codings: Dict[str, float] = {}
+    if not header:
+        return codings
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[token] = q
+    return codings
+
+
+@dataclass(frozen=True)
+class CatalogPayload:
+    """Serialized response body plus its precompressed variants."""
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    br_body: Optional[bytes] = None
+
+    @classmethod
+    def build(cls, data: Any) -> "CatalogPayload":
+        body = encode_json(data)
+        return cls(
+            body=body,
+            etag=content_etag(body),
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            br_body=brotli.compress(body, quality=11) if brotli is not None else None,
+        )
+
+    def encoded_for(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """Pick the best variant the client accepts. Returns (body, content-encoding)."""
+        codings = parse_accept_encoding(accept_encoding)
+        wildcard = codings.get("*", 0.0)
+        if self.br_body is not None and codings.get("br", wildcard) > 0:
+            return self.br_body, "br"
+        if codings.get("gzip", wildcard) > 0:
+            return self.gzip_body, "gzip"
+        return self.body, None
+
+
+# -------------------------
+# PER-LANGUAGE PAYLOADS (built once at import)
+# -------------------------
+# Only the serialized bytes are kept; the projected dicts are dropped after encoding
+FOOD_PAYLOADS: Dict[str, CatalogPayload] = {
+    lang: CatalogPayload.build([project_food(f, lang) for f in FOOD_CATALOG]) for lang in SUPPORTED_LANGS
+}
+
+
+def get_catalog_payload(lang: str) -> CatalogPayload:
+    """Payload for `lang`; unknown languages fall back to Turkish like the old endpoint."""
+    return FOOD_PAYLOADS.get(lang, FOOD_PAYLOADS[DEFAULT_LANG])
+
+
+# -------------------------
+# VERSIONED DELTA SYNC
+# -------------------------
+CATALOG_VERSIONS = CatalogVersions.for_catalog(FOOD_CATALOG)
+CATALOG_VERSION = CATALOG_VERSIONS.version
+
+FOOD_ROW_BY_ID: Dict[str, int] = {food["food_id"]: row for row, food in enumerate(FOOD_CATALOG)}
+
+# (since, lang) -> payload; bounded by (CATALOG_VERSION + 2) * len(SUPPORTED_LANGS)
+_CHANGES_PAYLOADS: Dict[Tuple[int, str], CatalogPayload] = {}
+
+
+def get_changes_payload(since: int, lang: str) -> CatalogPayload:
+    """Delta from catalog version `since` to CATALOG_VERSION.
+
+    Added and updated rows are sent in full, removed ones as ids. A `since`
+    the server does not know (negative or newer than the current version)
+    yields reset=true, telling the client to refetch /api/food/database.
+    """
+    if lang not in SUPPORTED_LANGS:
+        lang = DEFAULT_LANG
+    reset = since < 0 or since > CATALOG_VERSION
+    key = (-1 if reset else since, lang)
+    payload = _CHANGES_PAYLOADS.get(key)
+    if payload is None:
+        added, updated, removed = ([], [], []) if reset else CATALOG_VERSIONS.changes_since(since)
+        payload = CatalogPayload.build({
+            "version": CATALOG_VERSION,
+            "reset": reset,
+            "added": [project_food(FOOD_CATALOG[FOOD_ROW_BY_ID[i]], lang) for i in added],
+            "updated": [project_food(FOOD_CATALOG[FOOD_ROW_BY_ID[i]], lang) for i in updated],
+            "removed": removed,
+        })
+        _CHANGES_PAYLOADS[key] = payload
+    return payload
+
+
+# -------------------------
+# COLUMNAR NUTRIENT TABLE
+# -------------------------
+NUTRIENT_FIELDS = ("calories", "protein", "carbs", "fat")
+
+# Derived columns available for sorting
+#   protein_density: grams of protein per 100 kcal
+DERIVED_FIELDS = ("protein_density",)
+SORTABLE_FIELDS = NUTRIENT_FIELDS + DERIVED_FIELDS
+
+
+def macro_matrix(foods: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """(rows, len(NUTRIENT_FIELDS)) float64 matrix of the raw macro values."""
+    columns = getattr(foods, "columns", None)  # FoodSnapshot already has columns
+    if columns is not None:
+        return np.column_stack([columns[field] for field in NUTRIENT_FIELDS]).astype(np.float64)
+    return np.array([[float(f.get(field) or 0) for field in NUTRIENT_FIELDS] for f in foods], dtype=np.float64)
+
+
+class NutrientTable:
+    """Contiguous float32 columns indexed by catalog row.
+
+    Range predicates and sorts are evaluated with NumPy over whole columns,
+    so filters like "protein >= 30 and calories <= 500" never touch the
+    row dicts until the final page is projected.
+    """
+
+    def __init__(self, foods: Sequence[Dict[str, Any]]):
+        self.size = len(foods)
+        source = getattr(foods, "columns", None)  # FoodSnapshot already has columns
+        if source is not None:
+            self.columns: Dict[str, np.ndarray] = {
+                field: source[field].astype(np.float32) for field in NUTRIENT_FIELDS
+            }
+        else:
+            self.columns = {
+                field: np.fromiter((float(f.get(field) or 0) for f in foods), dtype=np.float32, count=self.size)
+                for field in NUTRIENT_FIELDS
+            }
+        calories = self.columns["calories"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            density = np.where(calories > 0, self.columns["protein"] * 100.0 / calories, 0.0)
+        self.columns["protein_density"] = density.astype(np.float32)
+        for column in self.columns.values():
+            column.setflags(write=False)
+
+    def mask(self, ranges: Dict[str, Tuple[Optional[float], Optional[float]]]) -> np.ndarray:
+        """Boolean row mask for inclusive {field: (min, max)} ranges; None means unbounded."""
+        selected = np.ones(self.size, dtype=bool)
+        for field, (low, high) in ranges.items():
+            column = self.columns[field]
+            if low is not None:
+                selected &= column >= low
+            if high is not None:
+                selected &= column <= high
+        return selected
+
+    def query(
+        self,
+        ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+        sort: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> Tuple[int, np.ndarray]:
+        """Return (total matches, row indices of the requested page)."""
+        rows = np.flatnonzero(self.mask(ranges))
+        total = int(rows.size)
+        if sort:
+            values = self.columns[sort][rows]
+            if descending:
+                values = -values
+            end = offset + limit
+            if end < total:
+                # Only the first `end` positions need to be ordered; keep every
+                # tie of the cut-off value so row order breaks ties stably.
+                cutoff = np.partition(values, end - 1)[end - 1]
+                part = np.flatnonzero(values <= cutoff)
+                order = part[np.lexsort((rows[part], values[part]))][:end]
+            else:
+                order = np.lexsort((rows, values))
+            rows = rows[order]
+        return total, rows[offset:offset + limit]
+
+
+NUTRIENT_TABLE = NutrientTable(FOOD_CATALOG)
+
+
+def filter_foods(
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+    sort: Optional[str] = None,
+    descending: bool = False,
+    offset: int = 0,
+    limit: int = 50,
+    lang: str = DEFAULT_LANG,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Vectorized macro filter; returns (total, projected page rows)."""
+    total, rows = NUTRIENT_TABLE.query(ranges, sort, descending, offset, limit)
+    page = []
+    for row in rows.tolist():
+        item = project_food(FOOD_CATALOG[row], lang)
+        if sort in DERIVED_FIELDS:
+            item[sort] = round(float(NUTRIENT_TABLE.columns[sort][row]), 2)
+        page.append(item)
+    return total, page
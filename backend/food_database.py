@@ -5390,707 +5390,14 @@ FOOD_DATABASE = [
   {"food_id": "food_5381", "name": "Tofu Sote + Bulgur + Kabak (1 Porsiyon)", "calories": 491, "protein": 28.3, "carbs": 59.4, "fat": 19.7, "name_en": "Stir-Fried Tofu + Bulgur + Zucchini (1 Serving)"},
   {"food_id": "food_5382", "name": "Tofu Sote + Bulgur + Biber (1 Porsiyon)", "calories": 494, "protein": 27.5, "carbs": 61.7, "fat": 19.5, "name_en": "Stir-Fried Tofu + Bulgur + Pepper (1 Serving)"},
   {"food_id": "food_5383", "name": "Tofu Sote + Haşlanmış Patates + Brokoli (1 Porsiyon)", "calories": 519, "protein": 27.3, "carbs": 67.4, "fat": 19.5, "name_en": "Stir-Fried Tofu + Boiled Potato + Broccoli (1 Serving)"},
-  {"food_id": "food_5384", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 635, "protein": 57.3, "carbs": 61.7, "fat": 18.3, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5385", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 597, "protein": 60.4, "carbs": 64.8, "fat": 10.6, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5386", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 664, "protein": 60.7, "carbs": 65.6, "fat": 19.1, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5387", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 723, "protein": 62.8, "carbs": 75.4, "fat": 18.7, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5388", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 613, "protein": 59, "carbs": 72.6, "fat": 10, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5389", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 622, "protein": 58.3, "carbs": 61.8, "fat": 16.1, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5390", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 745, "protein": 60.8, "carbs": 70.1, "fat": 26.9, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5391", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 636, "protein": 56, "carbs": 63.6, "fat": 17.8, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5392", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 658, "protein": 60.9, "carbs": 68.6, "fat": 15.4, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5393", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 666, "protein": 59.4, "carbs": 67.4, "fat": 18.6, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5394", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 784, "protein": 63.3, "carbs": 79.2, "fat": 23.5, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5395", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 59.5, "carbs": 76.4, "fat": 14.8, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5396", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 683, "protein": 58.8, "carbs": 65.6, "fat": 20.9, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5397", "name": "Esmer Pirinç + Izgara Tavuk + Brokoli-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 686, "protein": 57.7, "carbs": 69.9, "fat": 21.3, "name_en": "Brown Rice + Grilled Chicken + Broccoli-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5398", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 686, "protein": 62, "carbs": 59.4, "fat": 23.4, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5399", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 648, "protein": 65.1, "carbs": 62.5, "fat": 15.8, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5400", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Tahini Sos Bowl (1 Porsiyon)", "calories": 656, "protein": 63.6, "carbs": 61.2, "fat": 19, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5401", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Humus Sos Bowl (1 Porsiyon)", "calories": 714, "protein": 65.7, "carbs": 71.1, "fat": 18.7, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5402", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Domates Sos Bowl (1 Porsiyon)", "calories": 604, "protein": 61.9, "carbs": 68.3, "fat": 10, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5403", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Pesto Sos Bowl (1 Porsiyon)", "calories": 614, "protein": 61.2, "carbs": 57.5, "fat": 16.1, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5404", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Mantar Avokado Sos Bowl (1 Porsiyon)", "calories": 676, "protein": 61.9, "carbs": 63.8, "fat": 21.7, "name_en": "Brown Rice + Grilled Chicken + Spinach-Mushrooms Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5405", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 626, "protein": 58, "carbs": 58.3, "fat": 18.4, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5406", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 648, "protein": 62.9, "carbs": 63.4, "fat": 15.9, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5407", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 716, "protein": 63.2, "carbs": 64.2, "fat": 24.3, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5408", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 774, "protein": 65.3, "carbs": 74, "fat": 24, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5409", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 604, "protein": 59.7, "carbs": 69.2, "fat": 10.1, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5410", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 613, "protein": 59, "carbs": 58.4, "fat": 16.2, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5411", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 676, "protein": 59.7, "carbs": 64.7, "fat": 21.8, "name_en": "Brown Rice + Grilled Chicken + Spinach-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5412", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 645, "protein": 56.9, "carbs": 64.8, "fat": 18.1, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5413", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 61.8, "carbs": 69.8, "fat": 15.6, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5414", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 60.3, "carbs": 68.6, "fat": 18.8, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5415", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 733, "protein": 62.4, "carbs": 78.4, "fat": 18.5, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5416", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 623, "protein": 58.6, "carbs": 75.6, "fat": 9.8, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5417", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 692, "protein": 59.7, "carbs": 66.8, "fat": 21.1, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5418", "name": "Esmer Pirinç + Izgara Tavuk + Ispanak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 695, "protein": 58.6, "carbs": 71.1, "fat": 21.5, "name_en": "Brown Rice + Grilled Chicken + Spinach-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5419", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 623, "protein": 57.4, "carbs": 58.8, "fat": 17.9, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5420", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 585, "protein": 60.5, "carbs": 61.9, "fat": 10.2, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5421", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 652, "protein": 60.8, "carbs": 62.7, "fat": 18.6, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5422", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 711, "protein": 62.9, "carbs": 72.5, "fat": 18.3, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5423", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 601, "protein": 59.1, "carbs": 69.7, "fat": 9.6, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5424", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 670, "protein": 60.2, "carbs": 60.9, "fat": 20.9, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5425", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 733, "protein": 60.9, "carbs": 67.2, "fat": 26.5, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5426", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 703, "protein": 59, "carbs": 66.3, "fat": 23.1, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5427", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 606, "protein": 60.3, "carbs": 67.4, "fat": 10.3, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5428", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 733, "protein": 62.4, "carbs": 70.2, "fat": 23.9, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5429", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 732, "protein": 62.7, "carbs": 78, "fat": 18.4, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5430", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 622, "protein": 58.9, "carbs": 75.2, "fat": 9.7, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5431", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 630, "protein": 58.2, "carbs": 64.4, "fat": 15.8, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5432", "name": "Esmer Pirinç + Izgara Tavuk + Mantar-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 694, "protein": 58.9, "carbs": 70.7, "fat": 21.4, "name_en": "Brown Rice + Grilled Chicken + Mushrooms-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5433", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 623, "protein": 55.4, "carbs": 59.5, "fat": 18.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5434", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 585, "protein": 58.5, "carbs": 62.6, "fat": 10.5, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5435", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 712, "protein": 60.6, "carbs": 65.4, "fat": 24.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5436", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 771, "protein": 62.7, "carbs": 75.2, "fat": 23.8, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5437", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 661, "protein": 58.9, "carbs": 72.4, "fat": 15.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5438", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 610, "protein": 56.4, "carbs": 59.6, "fat": 16, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5439", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 733, "protein": 58.9, "carbs": 67.9, "fat": 26.8, "name_en": "Brown Rice + Grilled Chicken + Tomato-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5440", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 637, "protein": 56.7, "carbs": 63, "fat": 18.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5441", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 59.8, "carbs": 66, "fat": 10.5, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5442", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 60, "carbs": 66.8, "fat": 18.9, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5443", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 785, "protein": 64, "carbs": 78.6, "fat": 23.8, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5444", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 615, "protein": 58.4, "carbs": 73.8, "fat": 9.9, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5445", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 684, "protein": 59.4, "carbs": 65, "fat": 21.2, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5446", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 687, "protein": 58.4, "carbs": 69.3, "fat": 21.6, "name_en": "Brown Rice + Grilled Chicken + Tomato-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5447", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 641, "protein": 54.3, "carbs": 66, "fat": 17.8, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5448", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 604, "protein": 57.4, "carbs": 69, "fat": 10.2, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5449", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 57.7, "carbs": 69.8, "fat": 18.6, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5450", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 730, "protein": 59.8, "carbs": 79.6, "fat": 18.3, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5451", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 620, "protein": 56, "carbs": 76.8, "fat": 9.6, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5452", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 688, "protein": 57.1, "carbs": 68, "fat": 20.9, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5453", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 692, "protein": 56, "carbs": 72.3, "fat": 21.3, "name_en": "Brown Rice + Grilled Chicken + Tomato-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5454", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 624, "protein": 54.1, "carbs": 61.4, "fat": 17.7, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5455", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 586, "protein": 57.2, "carbs": 64.5, "fat": 10, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5456", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 654, "protein": 57.5, "carbs": 65.3, "fat": 18.4, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5457", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 712, "protein": 59.6, "carbs": 75.1, "fat": 18.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5458", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 602, "protein": 55.8, "carbs": 72.3, "fat": 9.4, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5459", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 611, "protein": 55.1, "carbs": 61.5, "fat": 15.5, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5460", "name": "Esmer Pirinç + Izgara Tavuk + Domates-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 55.8, "carbs": 67.8, "fat": 21.1, "name_en": "Brown Rice + Grilled Chicken + Tomato-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5461", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 620, "protein": 54.3, "carbs": 60.6, "fat": 17.7, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5462", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 582, "protein": 57.4, "carbs": 63.7, "fat": 10.1, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5463", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 710, "protein": 59.5, "carbs": 66.5, "fat": 23.7, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5464", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 708, "protein": 59.8, "carbs": 74.3, "fat": 18.2, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5465", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 598, "protein": 56, "carbs": 71.5, "fat": 9.5, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5466", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 607, "protein": 55.3, "carbs": 60.7, "fat": 15.6, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5467", "name": "Esmer Pirinç + Izgara Tavuk + Salatalık-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 670, "protein": 56, "carbs": 67, "fat": 21.2, "name_en": "Brown Rice + Grilled Chicken + Cucumber-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5468", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 703, "protein": 56.8, "carbs": 67.3, "fat": 23.2, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5469", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 605, "protein": 58.1, "carbs": 68.4, "fat": 10.4, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5470", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 673, "protein": 58.4, "carbs": 69.2, "fat": 18.8, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5471", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 731, "protein": 60.5, "carbs": 79, "fat": 18.5, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5472", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 621, "protein": 56.7, "carbs": 76.2, "fat": 9.8, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5473", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 630, "protein": 56, "carbs": 65.4, "fat": 15.9, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5474", "name": "Esmer Pirinç + Izgara Tavuk + Kabak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 693, "protein": 56.7, "carbs": 71.7, "fat": 21.5, "name_en": "Brown Rice + Grilled Chicken + Zucchini-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5475", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 590, "protein": 56.5, "carbs": 60.7, "fat": 15, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5476", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 552, "protein": 59.6, "carbs": 63.8, "fat": 7.3, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5477", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Tahini Sos Bowl (1 Porsiyon)", "calories": 620, "protein": 59.9, "carbs": 64.6, "fat": 15.8, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5478", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Humus Sos Bowl (1 Porsiyon)", "calories": 678, "protein": 62, "carbs": 74.4, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5479", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Domates Sos Bowl (1 Porsiyon)", "calories": 568, "protein": 58.2, "carbs": 71.6, "fat": 6.7, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5480", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Pesto Sos Bowl (1 Porsiyon)", "calories": 577, "protein": 57.5, "carbs": 60.8, "fat": 12.9, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5481", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Mantar Avokado Sos Bowl (1 Porsiyon)", "calories": 640, "protein": 58.2, "carbs": 67.1, "fat": 18.4, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Mushrooms Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5482", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 588, "protein": 53.4, "carbs": 62.6, "fat": 14.8, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5483", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 550, "protein": 56.5, "carbs": 65.7, "fat": 7.1, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5484", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 618, "protein": 56.8, "carbs": 66.5, "fat": 15.5, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5485", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 736, "protein": 60.7, "carbs": 78.3, "fat": 20.4, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5486", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 55.1, "carbs": 73.5, "fat": 6.5, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5487", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 635, "protein": 56.2, "carbs": 64.7, "fat": 17.8, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5488", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 638, "protein": 55.1, "carbs": 69, "fat": 18.2, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5489", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 590, "protein": 54.3, "carbs": 61.7, "fat": 15.1, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5490", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 612, "protein": 59.2, "carbs": 66.8, "fat": 12.7, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5491", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 619, "protein": 57.7, "carbs": 65.6, "fat": 15.9, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5492", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 738, "protein": 61.6, "carbs": 77.4, "fat": 20.8, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5493", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 568, "protein": 56, "carbs": 72.6, "fat": 6.9, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5494", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 57.1, "carbs": 63.8, "fat": 18.2, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5495", "name": "Esmer Pirinç + Izgara Hindi + Brokoli-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 640, "protein": 56, "carbs": 68.1, "fat": 18.6, "name_en": "Brown Rice + Grilled Turkey + Broccoli-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5496", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 579, "protein": 54.3, "carbs": 59, "fat": 15, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5497", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 602, "protein": 59.2, "carbs": 64.1, "fat": 12.5, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5498", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 609, "protein": 57.7, "carbs": 62.9, "fat": 15.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5499", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 668, "protein": 59.8, "carbs": 72.7, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5500", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 558, "protein": 56, "carbs": 69.9, "fat": 6.7, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5501", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 55.3, "carbs": 59.1, "fat": 12.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5502", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 630, "protein": 56, "carbs": 65.4, "fat": 18.4, "name_en": "Brown Rice + Grilled Turkey + Spinach-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5503", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 579, "protein": 54.1, "carbs": 59.2, "fat": 14.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5504", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 542, "protein": 57.2, "carbs": 62.3, "fat": 7.2, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5505", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 609, "protein": 57.5, "carbs": 63.1, "fat": 15.6, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5506", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 728, "protein": 61.4, "carbs": 74.9, "fat": 20.5, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5507", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 618, "protein": 57.6, "carbs": 72.1, "fat": 11.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5508", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 55.1, "carbs": 59.3, "fat": 12.7, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5509", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 630, "protein": 55.8, "carbs": 65.6, "fat": 18.3, "name_en": "Brown Rice + Grilled Turkey + Spinach-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5510", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 579, "protein": 54.1, "carbs": 59.2, "fat": 14.9, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5511", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 541, "protein": 57.2, "carbs": 62.3, "fat": 7.3, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5512", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 608, "protein": 57.5, "carbs": 63.1, "fat": 15.7, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5513", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 59.6, "carbs": 72.9, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5514", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 557, "protein": 55.8, "carbs": 70.1, "fat": 6.7, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5515", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 55.1, "carbs": 59.3, "fat": 12.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5516", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 629, "protein": 55.8, "carbs": 65.6, "fat": 18.4, "name_en": "Brown Rice + Grilled Turkey + Spinach-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5517", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 641, "protein": 56.8, "carbs": 60.3, "fat": 20.4, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5518", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 603, "protein": 59.9, "carbs": 63.4, "fat": 12.8, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5519", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 611, "protein": 58.4, "carbs": 62.2, "fat": 16, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5520", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 669, "protein": 60.5, "carbs": 72, "fat": 15.6, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5521", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 559, "protein": 56.7, "carbs": 69.2, "fat": 6.9, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5522", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 568, "protein": 56, "carbs": 58.4, "fat": 13.1, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5523", "name": "Esmer Pirinç + Izgara Hindi + Ispanak-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 631, "protein": 56.7, "carbs": 64.7, "fat": 18.6, "name_en": "Brown Rice + Grilled Turkey + Spinach-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5524", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 578, "protein": 54.6, "carbs": 58.6, "fat": 14.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5525", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 540, "protein": 57.7, "carbs": 61.7, "fat": 7.2, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5526", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 668, "protein": 59.8, "carbs": 64.4, "fat": 20.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5527", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 726, "protein": 61.9, "carbs": 74.3, "fat": 20.5, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5528", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 616, "protein": 58.1, "carbs": 71.5, "fat": 11.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5529", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 565, "protein": 55.6, "carbs": 58.7, "fat": 12.7, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5530", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 628, "protein": 56.3, "carbs": 65, "fat": 18.3, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5531", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 654, "protein": 58.4, "carbs": 63.3, "fat": 20.3, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5532", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 616, "protein": 61.5, "carbs": 66.4, "fat": 12.6, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5533", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 624, "protein": 59.9, "carbs": 65.2, "fat": 15.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5534", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 682, "protein": 62.1, "carbs": 75, "fat": 15.5, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5535", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 572, "protein": 58.3, "carbs": 72.2, "fat": 6.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5536", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 581, "protein": 57.5, "carbs": 61.4, "fat": 12.9, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5537", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 644, "protein": 58.3, "carbs": 67.7, "fat": 18.5, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5538", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 641, "protein": 55.8, "carbs": 61.8, "fat": 19.8, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5539", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 603, "protein": 58.9, "carbs": 64.9, "fat": 12.2, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5540", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 611, "protein": 57.4, "carbs": 63.6, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5541", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 669, "protein": 59.5, "carbs": 73.5, "fat": 15.1, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5542", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 619, "protein": 57.5, "carbs": 72.7, "fat": 11.6, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5543", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 568, "protein": 55, "carbs": 59.9, "fat": 12.5, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5544", "name": "Esmer Pirinç + Izgara Hindi + Mantar-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 631, "protein": 55.7, "carbs": 66.2, "fat": 18.1, "name_en": "Brown Rice + Grilled Turkey + Mushrooms-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5545", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 575, "protein": 51.5, "carbs": 60.4, "fat": 14.7, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5546", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 537, "protein": 54.6, "carbs": 63.5, "fat": 7.1, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5547", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 605, "protein": 54.9, "carbs": 64.3, "fat": 15.5, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5548", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 723, "protein": 58.8, "carbs": 76.1, "fat": 20.4, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5549", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 613, "protein": 55, "carbs": 73.3, "fat": 11.7, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5550", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 562, "protein": 52.5, "carbs": 60.5, "fat": 12.6, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5551", "name": "Esmer Pirinç + Izgara Hindi + Domates-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 625, "protein": 53.2, "carbs": 66.8, "fat": 18.1, "name_en": "Brown Rice + Grilled Turkey + Tomato-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5552", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 592, "protein": 53.7, "carbs": 63, "fat": 15, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5553", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 554, "protein": 56.8, "carbs": 66, "fat": 7.3, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5554", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 682, "protein": 58.8, "carbs": 68.8, "fat": 20.9, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5555", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 59.2, "carbs": 76.6, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5556", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 630, "protein": 57.2, "carbs": 75.8, "fat": 11.9, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5557", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 579, "protein": 54.6, "carbs": 63, "fat": 12.8, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5558", "name": "Esmer Pirinç + Izgara Hindi + Domates-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 642, "protein": 55.4, "carbs": 69.3, "fat": 18.4, "name_en": "Brown Rice + Grilled Turkey + Tomato-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5559", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 638, "protein": 54, "carbs": 61.8, "fat": 20, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5560", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 540, "protein": 55.3, "carbs": 62.9, "fat": 7.2, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5561", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 607, "protein": 55.6, "carbs": 63.6, "fat": 15.6, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5562", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 666, "protein": 57.7, "carbs": 73.5, "fat": 15.3, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5563", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 53.9, "carbs": 70.7, "fat": 6.6, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5564", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 565, "protein": 53.2, "carbs": 59.9, "fat": 12.7, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5565", "name": "Esmer Pirinç + Izgara Hindi + Salatalık-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 628, "protein": 53.9, "carbs": 66.2, "fat": 18.3, "name_en": "Brown Rice + Grilled Turkey + Cucumber-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5566", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 656, "protein": 52.9, "carbs": 68.2, "fat": 19.8, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5567", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 558, "protein": 54.2, "carbs": 69.2, "fat": 7, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5568", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 625, "protein": 54.5, "carbs": 70, "fat": 15.4, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5569", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 684, "protein": 56.6, "carbs": 79.8, "fat": 15.1, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5570", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 574, "protein": 52.8, "carbs": 77, "fat": 6.4, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5571", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 583, "protein": 52.1, "carbs": 66.2, "fat": 12.5, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5572", "name": "Esmer Pirinç + Izgara Hindi + Biber-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 646, "protein": 52.8, "carbs": 72.5, "fat": 18.1, "name_en": "Brown Rice + Grilled Turkey + Pepper-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5573", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 638, "protein": 52.7, "carbs": 63.6, "fat": 19.7, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5574", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 540, "protein": 54, "carbs": 64.7, "fat": 6.8, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5575", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 608, "protein": 54.3, "carbs": 65.5, "fat": 15.2, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5576", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 726, "protein": 58.2, "carbs": 77.3, "fat": 20.1, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5577", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 52.6, "carbs": 72.5, "fat": 6.2, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5578", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 51.9, "carbs": 61.7, "fat": 12.3, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5579", "name": "Esmer Pirinç + Izgara Hindi + Biber-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 628, "protein": 52.6, "carbs": 68, "fat": 17.9, "name_en": "Brown Rice + Grilled Turkey + Pepper-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5580", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 595, "protein": 53.1, "carbs": 64.2, "fat": 14.7, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5581", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 558, "protein": 56.2, "carbs": 67.2, "fat": 7.1, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5582", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 625, "protein": 56.5, "carbs": 68, "fat": 15.5, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5583", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 684, "protein": 58.6, "carbs": 77.8, "fat": 15.2, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5584", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 574, "protein": 54.8, "carbs": 75, "fat": 6.5, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5585", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 642, "protein": 55.9, "carbs": 66.2, "fat": 17.8, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5586", "name": "Esmer Pirinç + Izgara Hindi + Karnabahar-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 646, "protein": 54.8, "carbs": 70.5, "fat": 18.2, "name_en": "Brown Rice + Grilled Turkey + Cauliflower-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5587", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 600, "protein": 50.8, "carbs": 67.2, "fat": 14.4, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5588", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 562, "protein": 53.9, "carbs": 70.2, "fat": 6.8, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5589", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 689, "protein": 55.9, "carbs": 73, "fat": 20.4, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5590", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 688, "protein": 56.3, "carbs": 80.8, "fat": 14.9, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5591", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 638, "protein": 54.3, "carbs": 80, "fat": 11.4, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5592", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 587, "protein": 51.7, "carbs": 67.2, "fat": 12.3, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5593", "name": "Esmer Pirinç + Izgara Hindi + Havuç-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 650, "protein": 52.5, "carbs": 73.5, "fat": 17.9, "name_en": "Brown Rice + Grilled Turkey + Carrot-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5594", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 768, "protein": 50.9, "carbs": 64.4, "fat": 35.9, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5595", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 670, "protein": 52.2, "carbs": 65.4, "fat": 23, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5596", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 737, "protein": 52.5, "carbs": 66.2, "fat": 31.4, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5597", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 796, "protein": 54.6, "carbs": 76, "fat": 31.1, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5598", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 746, "protein": 52.6, "carbs": 75.2, "fat": 27.6, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5599", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 755, "protein": 51.9, "carbs": 64.4, "fat": 33.7, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5600", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 818, "protein": 52.6, "carbs": 70.7, "fat": 39.3, "name_en": "Brown Rice + Lean Beef + Broccoli-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5601", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 768, "protein": 50.7, "carbs": 64.6, "fat": 35.7, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5602", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 670, "protein": 52, "carbs": 65.7, "fat": 22.9, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5603", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 797, "protein": 54.1, "carbs": 68.5, "fat": 36.5, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5604", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 796, "protein": 54.4, "carbs": 76.3, "fat": 31, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5605", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 686, "protein": 50.6, "carbs": 73.5, "fat": 22.3, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5606", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 695, "protein": 49.9, "carbs": 62.7, "fat": 28.4, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5607", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 758, "protein": 50.6, "carbs": 69, "fat": 34, "name_en": "Brown Rice + Lean Beef + Broccoli-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5608", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 788, "protein": 50.5, "carbs": 70.1, "fat": 35.8, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5609", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 750, "protein": 53.6, "carbs": 73.2, "fat": 28.1, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5610", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 818, "protein": 53.9, "carbs": 74, "fat": 36.6, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5611", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 816, "protein": 54.2, "carbs": 81.8, "fat": 31, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5612", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 766, "protein": 52.2, "carbs": 81, "fat": 27.5, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5613", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 716, "protein": 49.7, "carbs": 68.2, "fat": 28.4, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5614", "name": "Esmer Pirinç + Yağsız Dana + Brokoli-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 778, "protein": 50.4, "carbs": 74.5, "fat": 34, "name_en": "Brown Rice + Lean Beef + Broccoli-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5615", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 699, "protein": 49.6, "carbs": 59.2, "fat": 30.6, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5616", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 662, "protein": 52.7, "carbs": 62.3, "fat": 22.9, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5617", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 789, "protein": 54.8, "carbs": 65.1, "fat": 36.6, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5618", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 788, "protein": 55.1, "carbs": 72.9, "fat": 31, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5619", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 738, "protein": 53.1, "carbs": 72.1, "fat": 27.5, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5620", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 686, "protein": 50.6, "carbs": 59.3, "fat": 28.5, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5621", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 750, "protein": 51.3, "carbs": 65.6, "fat": 34, "name_en": "Brown Rice + Lean Beef + Spinach-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5622", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 699, "protein": 49.6, "carbs": 59.2, "fat": 30.7, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5623", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 661, "protein": 52.7, "carbs": 62.3, "fat": 23, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5624", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 728, "protein": 53, "carbs": 63.1, "fat": 31.5, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5625", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 787, "protein": 55.1, "carbs": 72.9, "fat": 31.1, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5626", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 677, "protein": 51.3, "carbs": 70.1, "fat": 22.4, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5627", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 686, "protein": 50.6, "carbs": 59.3, "fat": 28.6, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5628", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 809, "protein": 53.1, "carbs": 67.6, "fat": 39.3, "name_en": "Brown Rice + Lean Beef + Spinach-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5629", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 716, "protein": 51.8, "carbs": 61.8, "fat": 30.9, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5630", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 678, "protein": 54.9, "carbs": 64.8, "fat": 23.3, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5631", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 745, "protein": 55.2, "carbs": 65.6, "fat": 31.7, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5632", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 804, "protein": 57.3, "carbs": 75.4, "fat": 31.4, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5633", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 694, "protein": 53.5, "carbs": 72.6, "fat": 22.7, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5634", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 763, "protein": 54.6, "carbs": 63.8, "fat": 34, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5635", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 766, "protein": 53.5, "carbs": 68.1, "fat": 34.4, "name_en": "Brown Rice + Lean Beef + Spinach-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5636", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 763, "protein": 51, "carbs": 62.2, "fat": 35.7, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5637", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 665, "protein": 52.3, "carbs": 63.3, "fat": 22.8, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5638", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 792, "protein": 54.4, "carbs": 66.1, "fat": 36.5, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5639", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 851, "protein": 56.5, "carbs": 75.9, "fat": 36.1, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5640", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 681, "protein": 50.9, "carbs": 71.1, "fat": 22.2, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5641", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 690, "protein": 50.2, "carbs": 60.3, "fat": 28.4, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5642", "name": "Esmer Pirinç + Yağsız Dana + Ispanak-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 753, "protein": 50.9, "carbs": 66.6, "fat": 33.9, "name_en": "Brown Rice + Lean Beef + Spinach-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5643", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 714, "protein": 52.1, "carbs": 61.3, "fat": 30.8, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5644", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 736, "protein": 57, "carbs": 66.4, "fat": 28.4, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5645", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 804, "protein": 57.2, "carbs": 67.2, "fat": 36.8, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5646", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 802, "protein": 57.6, "carbs": 75, "fat": 31.3, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5647", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 752, "protein": 55.6, "carbs": 74.2, "fat": 27.8, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5648", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 701, "protein": 53, "carbs": 61.4, "fat": 28.7, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5649", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 764, "protein": 53.8, "carbs": 67.7, "fat": 34.3, "name_en": "Brown Rice + Lean Beef + Mushrooms-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5650", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 778, "protein": 51.5, "carbs": 66.3, "fat": 35.7, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5651", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 52.8, "carbs": 67.4, "fat": 22.9, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5652", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 808, "protein": 54.9, "carbs": 70.2, "fat": 36.5, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5653", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 806, "protein": 55.2, "carbs": 78, "fat": 31, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5654", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 696, "protein": 51.4, "carbs": 75.2, "fat": 22.3, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5655", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 766, "protein": 52.5, "carbs": 66.4, "fat": 33.6, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5656", "name": "Esmer Pirinç + Yağsız Dana + Mantar-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 768, "protein": 51.4, "carbs": 70.7, "fat": 34, "name_en": "Brown Rice + Lean Beef + Mushrooms-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5657", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 698, "protein": 47.9, "carbs": 59.5, "fat": 30.7, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5658", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 720, "protein": 52.8, "carbs": 64.6, "fat": 28.3, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5659", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 727, "protein": 51.3, "carbs": 63.4, "fat": 31.5, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5660", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 786, "protein": 53.4, "carbs": 73.2, "fat": 31.2, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5661", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 676, "protein": 49.6, "carbs": 70.4, "fat": 22.5, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5662", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 685, "protein": 48.9, "carbs": 59.6, "fat": 28.6, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5663", "name": "Esmer Pirinç + Yağsız Dana + Domates-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 748, "protein": 49.6, "carbs": 65.9, "fat": 34.2, "name_en": "Brown Rice + Lean Beef + Tomato-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5664", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 712, "protein": 49.2, "carbs": 63, "fat": 30.7, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5665", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 52.3, "carbs": 66, "fat": 23.1, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5666", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 742, "protein": 52.5, "carbs": 66.8, "fat": 31.5, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5667", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 860, "protein": 56.5, "carbs": 78.6, "fat": 36.4, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5668", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 690, "protein": 50.9, "carbs": 73.8, "fat": 22.5, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5669", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 699, "protein": 50.1, "carbs": 63, "fat": 28.6, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5670", "name": "Esmer Pirinç + Yağsız Dana + Domates-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 822, "protein": 52.7, "carbs": 71.3, "fat": 39.4, "name_en": "Brown Rice + Lean Beef + Tomato-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5671", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 698, "protein": 47.7, "carbs": 59.8, "fat": 30.6, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5672", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 660, "protein": 50.8, "carbs": 62.9, "fat": 22.9, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5673", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 727, "protein": 51.1, "carbs": 63.6, "fat": 31.4, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5674", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 846, "protein": 55, "carbs": 75.5, "fat": 36.2, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5675", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 736, "protein": 51.2, "carbs": 72.7, "fat": 27.5, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5676", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 685, "protein": 48.7, "carbs": 59.9, "fat": 28.4, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5677", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 808, "protein": 51.2, "carbs": 68.2, "fat": 39.2, "name_en": "Brown Rice + Lean Beef + Cucumber-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5678", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 699, "protein": 46.4, "carbs": 61.6, "fat": 30.1, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5679", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 661, "protein": 49.5, "carbs": 64.7, "fat": 22.5, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5680", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 729, "protein": 49.8, "carbs": 65.5, "fat": 30.9, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5681", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 787, "protein": 51.9, "carbs": 75.3, "fat": 30.6, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5682", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 737, "protein": 49.9, "carbs": 74.5, "fat": 27.1, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5683", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 686, "protein": 47.4, "carbs": 61.7, "fat": 28, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5684", "name": "Esmer Pirinç + Yağsız Dana + Salatalık-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 749, "protein": 48.1, "carbs": 68, "fat": 33.6, "name_en": "Brown Rice + Lean Beef + Cucumber-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5685", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 697, "protein": 47.7, "carbs": 59.7, "fat": 30.7, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5686", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 659, "protein": 50.8, "carbs": 62.8, "fat": 23, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5687", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 726, "protein": 51.1, "carbs": 63.6, "fat": 31.5, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5688", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 845, "protein": 55, "carbs": 75.4, "fat": 36.3, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5689", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 49.4, "carbs": 70.6, "fat": 22.4, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5690", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 684, "protein": 48.7, "carbs": 59.8, "fat": 28.5, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5691", "name": "Esmer Pirinç + Yağsız Dana + Biber-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 807, "protein": 51.2, "carbs": 68.1, "fat": 39.3, "name_en": "Brown Rice + Lean Beef + Pepper-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5692", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 718, "protein": 47.5, "carbs": 65.3, "fat": 30.6, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5693", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 50.6, "carbs": 68.4, "fat": 23, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5694", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 748, "protein": 50.9, "carbs": 69.2, "fat": 31.4, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5695", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 806, "protein": 53, "carbs": 79, "fat": 31.1, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5696", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 696, "protein": 49.2, "carbs": 76.2, "fat": 22.4, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5697", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 765, "protein": 50.3, "carbs": 67.4, "fat": 33.7, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5698", "name": "Esmer Pirinç + Yağsız Dana + Kabak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 828, "protein": 51, "carbs": 73.7, "fat": 39.3, "name_en": "Brown Rice + Lean Beef + Zucchini-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5699", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 720, "protein": 46.3, "carbs": 67.2, "fat": 30.2, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5700", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 742, "protein": 51.2, "carbs": 72.2, "fat": 27.7, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5701", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 749, "protein": 49.6, "carbs": 71, "fat": 31, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5702", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 868, "protein": 53.6, "carbs": 82.8, "fat": 35.8, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5703", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 758, "protein": 49.8, "carbs": 80, "fat": 27.1, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5704", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 707, "protein": 47.2, "carbs": 67.2, "fat": 28, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5705", "name": "Esmer Pirinç + Yağsız Dana + Havuç-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 770, "protein": 48, "carbs": 73.5, "fat": 33.6, "name_en": "Brown Rice + Lean Beef + Carrot-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5706", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 557, "protein": 46.5, "carbs": 62.4, "fat": 14, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5707", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 519, "protein": 49.6, "carbs": 65.4, "fat": 6.3, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5708", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 647, "protein": 51.7, "carbs": 68.2, "fat": 19.9, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5709", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 705, "protein": 53.8, "carbs": 78, "fat": 19.6, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5710", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 535, "protein": 48.2, "carbs": 73.2, "fat": 5.7, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5711", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 544, "protein": 47.5, "carbs": 62.4, "fat": 11.8, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5712", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 607, "protein": 48.2, "carbs": 68.7, "fat": 17.4, "name_en": "Brown Rice + Tuna + Broccoli-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5713", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 619, "protein": 49, "carbs": 63.7, "fat": 19.4, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5714", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 521, "protein": 50.3, "carbs": 64.8, "fat": 6.5, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5715", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 588, "protein": 50.6, "carbs": 65.6, "fat": 15, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5716", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 647, "protein": 52.7, "carbs": 75.4, "fat": 14.6, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5717", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 597, "protein": 50.7, "carbs": 74.6, "fat": 11.1, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5718", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 606, "protein": 50, "carbs": 63.8, "fat": 17.2, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5719", "name": "Esmer Pirinç + Ton Balığı + Brokoli-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 609, "protein": 48.9, "carbs": 68.1, "fat": 17.6, "name_en": "Brown Rice + Tuna + Broccoli-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5720", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 550, "protein": 50.1, "carbs": 57.4, "fat": 14.1, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5721", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 513, "protein": 53.2, "carbs": 60.5, "fat": 6.5, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5722", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Tahini Sos Bowl (1 Porsiyon)", "calories": 580, "protein": 53.5, "carbs": 61.2, "fat": 14.9, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5723", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Humus Sos Bowl (1 Porsiyon)", "calories": 639, "protein": 55.6, "carbs": 71.1, "fat": 14.6, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5724", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Domates Sos Bowl (1 Porsiyon)", "calories": 589, "protein": 53.6, "carbs": 70.3, "fat": 11.1, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5725", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Pesto Sos Bowl (1 Porsiyon)", "calories": 598, "protein": 52.9, "carbs": 59.5, "fat": 17.2, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5726", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Mantar Avokado Sos Bowl (1 Porsiyon)", "calories": 661, "protein": 53.6, "carbs": 65.8, "fat": 22.8, "name_en": "Brown Rice + Tuna + Spinach-Mushrooms Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5727", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 608, "protein": 49, "carbs": 61, "fat": 19.2, "name_en": "Brown Rice + Tuna + Spinach-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5728", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 511, "protein": 50.3, "carbs": 62.1, "fat": 6.4, "name_en": "Brown Rice + Tuna + Spinach-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5729", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 578, "protein": 50.6, "carbs": 62.9, "fat": 14.8, "name_en": "Brown Rice + Tuna + Spinach-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5730", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 52.7, "carbs": 72.7, "fat": 14.5, "name_en": "Brown Rice + Tuna + Spinach-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5731", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 587, "protein": 50.7, "carbs": 71.9, "fat": 11, "name_en": "Brown Rice + Tuna + Spinach-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5732", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 536, "protein": 48.2, "carbs": 59.1, "fat": 11.9, "name_en": "Brown Rice + Tuna + Spinach-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5733", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 48.9, "carbs": 65.4, "fat": 17.5, "name_en": "Brown Rice + Tuna + Spinach-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5734", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 629, "protein": 48.6, "carbs": 66.8, "fat": 19.2, "name_en": "Brown Rice + Tuna + Spinach-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5735", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 531, "protein": 49.9, "carbs": 67.8, "fat": 6.3, "name_en": "Brown Rice + Tuna + Spinach-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5736", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 598, "protein": 50.2, "carbs": 68.6, "fat": 14.7, "name_en": "Brown Rice + Tuna + Spinach-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5737", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 657, "protein": 52.3, "carbs": 78.4, "fat": 14.4, "name_en": "Brown Rice + Tuna + Spinach-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5738", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 607, "protein": 50.3, "carbs": 77.6, "fat": 10.9, "name_en": "Brown Rice + Tuna + Spinach-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5739", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 47.8, "carbs": 64.8, "fat": 11.8, "name_en": "Brown Rice + Tuna + Spinach-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5740", "name": "Esmer Pirinç + Ton Balığı + Ispanak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 679, "protein": 50.3, "carbs": 73.1, "fat": 22.6, "name_en": "Brown Rice + Tuna + Spinach-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5741", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 549, "protein": 48.2, "carbs": 57.9, "fat": 14.1, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5742", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 511, "protein": 51.3, "carbs": 61, "fat": 6.5, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5743", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 638, "protein": 53.4, "carbs": 63.8, "fat": 20.1, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5744", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 53.7, "carbs": 71.6, "fat": 14.6, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5745", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 587, "protein": 51.7, "carbs": 70.8, "fat": 11.1, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5746", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 536, "protein": 49.2, "carbs": 58, "fat": 12, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5747", "name": "Esmer Pirinç + Ton Balığı + Mantar-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 49.9, "carbs": 64.3, "fat": 17.6, "name_en": "Brown Rice + Tuna + Mushrooms-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5748", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 563, "protein": 49.5, "carbs": 61.3, "fat": 14.1, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5749", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 525, "protein": 52.6, "carbs": 64.4, "fat": 6.5, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5750", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 593, "protein": 52.8, "carbs": 65.2, "fat": 14.9, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5751", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 651, "protein": 55, "carbs": 75, "fat": 14.6, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5752", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 541, "protein": 51.2, "carbs": 72.2, "fat": 5.9, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5753", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 550, "protein": 50.4, "carbs": 61.4, "fat": 12, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5754", "name": "Esmer Pirinç + Ton Balığı + Mantar-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 673, "protein": 53, "carbs": 69.7, "fat": 22.8, "name_en": "Brown Rice + Tuna + Mushrooms-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5755", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 550, "protein": 46.9, "carbs": 59.8, "fat": 13.7, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5756", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 512, "protein": 50, "carbs": 62.9, "fat": 6, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5757", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 580, "protein": 50.3, "carbs": 63.6, "fat": 14.4, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5758", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 638, "protein": 52.4, "carbs": 73.5, "fat": 14.1, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5759", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 528, "protein": 48.6, "carbs": 70.7, "fat": 5.4, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5760", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 597, "protein": 49.7, "carbs": 61.9, "fat": 16.7, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5761", "name": "Esmer Pirinç + Ton Balığı + Mantar-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 600, "protein": 48.6, "carbs": 66.2, "fat": 17.1, "name_en": "Brown Rice + Tuna + Mushrooms-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5762", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 545, "protein": 44.4, "carbs": 60.4, "fat": 13.7, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5763", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 507, "protein": 47.5, "carbs": 63.5, "fat": 6, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5764", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 635, "protein": 49.6, "carbs": 66.3, "fat": 19.6, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5765", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 633, "protein": 49.9, "carbs": 74.1, "fat": 14.1, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5766", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 523, "protein": 46.1, "carbs": 71.3, "fat": 5.4, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5767", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 532, "protein": 45.4, "carbs": 60.5, "fat": 11.5, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5768", "name": "Esmer Pirinç + Ton Balığı + Domates-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 655, "protein": 47.9, "carbs": 68.8, "fat": 22.3, "name_en": "Brown Rice + Tuna + Tomato-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5769", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 548, "protein": 44, "carbs": 61.4, "fat": 13.6, "name_en": "Brown Rice + Tuna + Tomato-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5770", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 510, "protein": 47.1, "carbs": 64.5, "fat": 5.9, "name_en": "Brown Rice + Tuna + Tomato-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5771", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 578, "protein": 47.4, "carbs": 65.3, "fat": 14.3, "name_en": "Brown Rice + Tuna + Tomato-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5772", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 696, "protein": 51.3, "carbs": 77.1, "fat": 19.2, "name_en": "Brown Rice + Tuna + Tomato-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5773", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 526, "protein": 45.7, "carbs": 72.3, "fat": 5.3, "name_en": "Brown Rice + Tuna + Tomato-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5774", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 595, "protein": 46.8, "carbs": 63.5, "fat": 16.6, "name_en": "Brown Rice + Tuna + Tomato-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5775", "name": "Esmer Pirinç + Ton Balığı + Domates-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 658, "protein": 47.5, "carbs": 69.8, "fat": 22.2, "name_en": "Brown Rice + Tuna + Tomato-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5776", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 604, "protein": 46, "carbs": 62.6, "fat": 18.8, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5777", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 49.1, "carbs": 65.7, "fat": 11.2, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5778", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 634, "protein": 49.4, "carbs": 66.5, "fat": 19.6, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5779", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 632, "protein": 49.7, "carbs": 74.3, "fat": 14.1, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5780", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 522, "protein": 45.9, "carbs": 71.5, "fat": 5.4, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5781", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 531, "protein": 45.2, "carbs": 60.7, "fat": 11.5, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5782", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 594, "protein": 45.9, "carbs": 67, "fat": 17.1, "name_en": "Brown Rice + Tuna + Cucumber-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5783", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 561, "protein": 46.4, "carbs": 63.2, "fat": 13.9, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5784", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 523, "protein": 49.5, "carbs": 66.3, "fat": 6.2, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5785", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 591, "protein": 49.8, "carbs": 67.1, "fat": 14.7, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5786", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 649, "protein": 51.9, "carbs": 76.9, "fat": 14.3, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5787", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 539, "protein": 48.1, "carbs": 74.1, "fat": 5.6, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5788", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 608, "protein": 49.2, "carbs": 65.3, "fat": 16.9, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5789", "name": "Esmer Pirinç + Ton Balığı + Salatalık-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 611, "protein": 48.1, "carbs": 69.6, "fat": 17.3, "name_en": "Brown Rice + Tuna + Cucumber-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5790", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 565, "protein": 44, "carbs": 66.2, "fat": 13.7, "name_en": "Brown Rice + Tuna + Pepper-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5791", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 527, "protein": 47.1, "carbs": 69.2, "fat": 6, "name_en": "Brown Rice + Tuna + Pepper-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5792", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 594, "protein": 47.4, "carbs": 70, "fat": 14.5, "name_en": "Brown Rice + Tuna + Pepper-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5793", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 653, "protein": 49.5, "carbs": 79.8, "fat": 14.1, "name_en": "Brown Rice + Tuna + Pepper-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5794", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 543, "protein": 45.7, "carbs": 77, "fat": 5.4, "name_en": "Brown Rice + Tuna + Pepper-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5795", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 552, "protein": 45, "carbs": 66.2, "fat": 11.5, "name_en": "Brown Rice + Tuna + Pepper-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5796", "name": "Esmer Pirinç + Ton Balığı + Biber-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 615, "protein": 45.7, "carbs": 72.5, "fat": 17.1, "name_en": "Brown Rice + Tuna + Pepper-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5797", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 567, "protein": 44.9, "carbs": 65.3, "fat": 13.9, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5798", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 589, "protein": 49.8, "carbs": 70.4, "fat": 11.5, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5799", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 597, "protein": 48.3, "carbs": 69.2, "fat": 14.7, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5800", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 655, "protein": 50.4, "carbs": 79, "fat": 14.4, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5801", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 545, "protein": 46.6, "carbs": 76.2, "fat": 5.7, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5802", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 554, "protein": 45.9, "carbs": 65.4, "fat": 11.8, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5803", "name": "Esmer Pirinç + Ton Balığı + Kabak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 617, "protein": 46.6, "carbs": 71.7, "fat": 17.4, "name_en": "Brown Rice + Tuna + Zucchini-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5804", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 624, "protein": 47.8, "carbs": 66.2, "fat": 19, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5805", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 587, "protein": 50.9, "carbs": 69.2, "fat": 11.3, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5806", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 594, "protein": 49.4, "carbs": 68, "fat": 14.6, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5807", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 713, "protein": 53.3, "carbs": 79.8, "fat": 19.4, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5808", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 543, "protein": 47.7, "carbs": 75, "fat": 5.5, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5809", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 612, "protein": 48.8, "carbs": 66.2, "fat": 16.8, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5810", "name": "Esmer Pirinç + Ton Balığı + Karnabahar-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 49.5, "carbs": 72.5, "fat": 22.4, "name_en": "Brown Rice + Tuna + Cauliflower-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5811", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 718, "protein": 39.7, "carbs": 68.1, "fat": 32.1, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5812", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 42.8, "carbs": 71.2, "fat": 24.4, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5813", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 747, "protein": 43.1, "carbs": 72, "fat": 32.9, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5814", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 866, "protein": 47, "carbs": 83.8, "fat": 37.7, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5815", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 696, "protein": 41.4, "carbs": 79, "fat": 23.8, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5816", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 705, "protein": 40.7, "carbs": 68.2, "fat": 29.9, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5817", "name": "Esmer Pirinç + Somon + Brokoli-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 768, "protein": 41.4, "carbs": 74.5, "fat": 35.5, "name_en": "Brown Rice + Salmon + Broccoli-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5818", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 691, "protein": 43.7, "carbs": 57.4, "fat": 32.3, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5819", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 713, "protein": 48.6, "carbs": 62.5, "fat": 29.9, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5820", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Tahini Sos Bowl (1 Porsiyon)", "calories": 720, "protein": 47.1, "carbs": 61.2, "fat": 33.1, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5821", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Humus Sos Bowl (1 Porsiyon)", "calories": 779, "protein": 49.2, "carbs": 71.1, "fat": 32.8, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5822", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Domates Sos Bowl (1 Porsiyon)", "calories": 669, "protein": 45.4, "carbs": 68.3, "fat": 24.1, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5823", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Pesto Sos Bowl (1 Porsiyon)", "calories": 738, "protein": 46.5, "carbs": 59.5, "fat": 35.4, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5824", "name": "Esmer Pirinç + Somon + Ispanak-Mantar Avokado Sos Bowl (1 Porsiyon)", "calories": 801, "protein": 47.2, "carbs": 65.8, "fat": 41, "name_en": "Brown Rice + Salmon + Spinach-Mushrooms Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5825", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 749, "protein": 42.4, "carbs": 61.2, "fat": 37.3, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5826", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 651, "protein": 43.7, "carbs": 62.3, "fat": 24.4, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5827", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 778, "protein": 45.8, "carbs": 65.1, "fat": 38.1, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5828", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 837, "protein": 47.9, "carbs": 74.9, "fat": 37.7, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5829", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 42.3, "carbs": 70.1, "fat": 23.8, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5830", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 676, "protein": 41.6, "carbs": 59.3, "fat": 30, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5831", "name": "Esmer Pirinç + Somon + Ispanak-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 739, "protein": 42.3, "carbs": 65.6, "fat": 35.5, "name_en": "Brown Rice + Salmon + Spinach-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5832", "name": "Esmer Pirinç + Somon + Ispanak-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 748, "protein": 42.4, "carbs": 61.2, "fat": 37.4, "name_en": "Brown Rice + Salmon + Spinach-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5833", "name": "Esmer Pirinç + Somon + Ispanak-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 650, "protein": 43.7, "carbs": 62.3, "fat": 24.5, "name_en": "Brown Rice + Salmon + Spinach-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5834", "name": "Esmer Pirinç + Somon + Ispanak-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 778, "protein": 45.8, "carbs": 65.1, "fat": 38.2, "name_en": "Brown Rice + Salmon + Spinach-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5835", "name": "Esmer Pirinç + Somon + Ispanak-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 836, "protein": 47.9, "carbs": 74.9, "fat": 37.8, "name_en": "Brown Rice + Salmon + Spinach-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5836", "name": "Esmer Pirinç + Somon + Ispanak-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 666, "protein": 42.3, "carbs": 70.1, "fat": 23.9, "name_en": "Brown Rice + Salmon + Spinach-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5837", "name": "Esmer Pirinç + Somon + Ispanak-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 735, "protein": 43.4, "carbs": 61.3, "fat": 35.3, "name_en": "Brown Rice + Salmon + Spinach-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5838", "name": "Esmer Pirinç + Somon + Ispanak-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 738, "protein": 42.3, "carbs": 65.6, "fat": 35.6, "name_en": "Brown Rice + Salmon + Spinach-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5839", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 691, "protein": 41.5, "carbs": 58.3, "fat": 32.4, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5840", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 653, "protein": 44.6, "carbs": 61.4, "fat": 24.8, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5841", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 780, "protein": 46.7, "carbs": 64.2, "fat": 38.4, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5842", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 779, "protein": 47, "carbs": 72, "fat": 32.9, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5843", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 669, "protein": 43.2, "carbs": 69.2, "fat": 24.2, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5844", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 678, "protein": 42.5, "carbs": 58.4, "fat": 30.3, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5845", "name": "Esmer Pirinç + Somon + Ispanak-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 801, "protein": 45, "carbs": 66.7, "fat": 41.1, "name_en": "Brown Rice + Salmon + Spinach-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5846", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 752, "protein": 42, "carbs": 62.2, "fat": 37.2, "name_en": "Brown Rice + Salmon + Spinach-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5847", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 714, "protein": 45.1, "carbs": 65.3, "fat": 29.5, "name_en": "Brown Rice + Salmon + Spinach-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5848", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 722, "protein": 43.6, "carbs": 64.1, "fat": 32.8, "name_en": "Brown Rice + Salmon + Spinach-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5849", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 780, "protein": 45.7, "carbs": 73.9, "fat": 32.4, "name_en": "Brown Rice + Salmon + Spinach-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5850", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 670, "protein": 41.9, "carbs": 71.1, "fat": 23.7, "name_en": "Brown Rice + Salmon + Spinach-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5851", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 679, "protein": 41.2, "carbs": 60.3, "fat": 29.9, "name_en": "Brown Rice + Salmon + Spinach-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5852", "name": "Esmer Pirinç + Somon + Ispanak-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 742, "protein": 41.9, "carbs": 66.6, "fat": 35.4, "name_en": "Brown Rice + Salmon + Spinach-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5853", "name": "Esmer Pirinç + Somon + Mantar-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 687, "protein": 40.9, "carbs": 58.8, "fat": 32, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5854", "name": "Esmer Pirinç + Somon + Mantar-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 649, "protein": 44, "carbs": 61.9, "fat": 24.4, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5855", "name": "Esmer Pirinç + Somon + Mantar-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 776, "protein": 46.1, "carbs": 64.6, "fat": 38, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5856", "name": "Esmer Pirinç + Somon + Mantar-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 775, "protein": 46.4, "carbs": 72.5, "fat": 32.5, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5857", "name": "Esmer Pirinç + Somon + Mantar-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 665, "protein": 42.6, "carbs": 69.7, "fat": 23.8, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5858", "name": "Esmer Pirinç + Somon + Mantar-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 41.9, "carbs": 58.9, "fat": 29.9, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5859", "name": "Esmer Pirinç + Somon + Mantar-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 737, "protein": 42.6, "carbs": 65.2, "fat": 35.5, "name_en": "Brown Rice + Salmon + Mushrooms-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5860", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 704, "protein": 43.1, "carbs": 61.3, "fat": 32.3, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5861", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 726, "protein": 48, "carbs": 66.4, "fat": 29.9, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5862", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 733, "protein": 46.4, "carbs": 65.2, "fat": 33.1, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5863", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 792, "protein": 48.6, "carbs": 75, "fat": 32.8, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5864", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 682, "protein": 44.8, "carbs": 72.2, "fat": 24.1, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5865", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 751, "protein": 45.8, "carbs": 63.4, "fat": 35.4, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5866", "name": "Esmer Pirinç + Somon + Mantar-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 754, "protein": 44.8, "carbs": 67.7, "fat": 35.8, "name_en": "Brown Rice + Salmon + Mushrooms-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5867", "name": "Esmer Pirinç + Somon + Mantar-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 691, "protein": 40.5, "carbs": 59.8, "fat": 31.9, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5868", "name": "Esmer Pirinç + Somon + Mantar-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 653, "protein": 43.6, "carbs": 62.9, "fat": 24.2, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5869", "name": "Esmer Pirinç + Somon + Mantar-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 780, "protein": 45.7, "carbs": 65.6, "fat": 37.8, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5870", "name": "Esmer Pirinç + Somon + Mantar-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 779, "protein": 46, "carbs": 73.5, "fat": 32.3, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5871", "name": "Esmer Pirinç + Somon + Mantar-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 729, "protein": 44, "carbs": 72.7, "fat": 28.8, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5872", "name": "Esmer Pirinç + Somon + Mantar-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 678, "protein": 41.5, "carbs": 59.9, "fat": 29.7, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5873", "name": "Esmer Pirinç + Somon + Mantar-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 741, "protein": 42.2, "carbs": 66.2, "fat": 35.3, "name_en": "Brown Rice + Salmon + Mushrooms-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5874", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 702, "protein": 40.2, "carbs": 63, "fat": 32.2, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5875", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 664, "protein": 43.3, "carbs": 66, "fat": 24.6, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5876", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 731, "protein": 43.5, "carbs": 66.8, "fat": 33, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5877", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 790, "protein": 45.7, "carbs": 76.6, "fat": 32.7, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5878", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 41.9, "carbs": 73.8, "fat": 24, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5879", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 749, "protein": 42.9, "carbs": 65, "fat": 35.3, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5880", "name": "Esmer Pirinç + Somon + Domates-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 812, "protein": 43.7, "carbs": 71.3, "fat": 40.9, "name_en": "Brown Rice + Salmon + Tomato-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5881", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 762, "protein": 41.8, "carbs": 65.2, "fat": 37.3, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5882", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 664, "protein": 43.1, "carbs": 66.3, "fat": 24.4, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5883", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 731, "protein": 43.4, "carbs": 67.1, "fat": 32.9, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5884", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 790, "protein": 45.5, "carbs": 76.9, "fat": 32.5, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5885", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 41.7, "carbs": 74.1, "fat": 23.8, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5886", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 689, "protein": 41, "carbs": 63.3, "fat": 29.9, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5887", "name": "Esmer Pirinç + Somon + Salatalık-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 752, "protein": 41.7, "carbs": 69.6, "fat": 35.5, "name_en": "Brown Rice + Salmon + Cucumber-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5888", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 689, "protein": 37.4, "carbs": 61.6, "fat": 31.6, "name_en": "Brown Rice + Salmon + Cucumber-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5889", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 651, "protein": 40.5, "carbs": 64.7, "fat": 24, "name_en": "Brown Rice + Salmon + Cucumber-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5890", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 718, "protein": 40.8, "carbs": 65.5, "fat": 32.4, "name_en": "Brown Rice + Salmon + Cucumber-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5891", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 837, "protein": 44.7, "carbs": 77.3, "fat": 37.3, "name_en": "Brown Rice + Salmon + Cucumber-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5892", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 39.1, "carbs": 72.5, "fat": 23.4, "name_en": "Brown Rice + Salmon + Cucumber-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5893", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 736, "protein": 40.2, "carbs": 63.7, "fat": 34.7, "name_en": "Brown Rice + Salmon + Cucumber-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5894", "name": "Esmer Pirinç + Somon + Salatalık-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 739, "protein": 39.1, "carbs": 68, "fat": 35.1, "name_en": "Brown Rice + Salmon + Cucumber-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5895", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 701, "protein": 40, "carbs": 63.2, "fat": 32.2, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5896", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 663, "protein": 43.1, "carbs": 66.2, "fat": 24.5, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5897", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 730, "protein": 43.4, "carbs": 67, "fat": 33, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5898", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 849, "protein": 47.3, "carbs": 78.8, "fat": 37.8, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5899", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 679, "protein": 41.7, "carbs": 74, "fat": 23.9, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5900", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 748, "protein": 42.8, "carbs": 65.2, "fat": 35.2, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5901", "name": "Esmer Pirinç + Somon + Biber-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 751, "protein": 41.7, "carbs": 69.5, "fat": 35.6, "name_en": "Brown Rice + Salmon + Pepper-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5902", "name": "Esmer Pirinç + Somon + Biber-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 705, "protein": 37.6, "carbs": 66.2, "fat": 31.9, "name_en": "Brown Rice + Salmon + Pepper-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5903", "name": "Esmer Pirinç + Somon + Biber-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 40.7, "carbs": 69.2, "fat": 24.2, "name_en": "Brown Rice + Salmon + Pepper-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5904", "name": "Esmer Pirinç + Somon + Biber-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 735, "protein": 41, "carbs": 70, "fat": 32.7, "name_en": "Brown Rice + Salmon + Pepper-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5905", "name": "Esmer Pirinç + Somon + Biber-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 793, "protein": 43.1, "carbs": 79.8, "fat": 32.3, "name_en": "Brown Rice + Salmon + Pepper-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5906", "name": "Esmer Pirinç + Somon + Biber-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 743, "protein": 41.1, "carbs": 79, "fat": 28.8, "name_en": "Brown Rice + Salmon + Pepper-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5907", "name": "Esmer Pirinç + Somon + Biber-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 752, "protein": 40.4, "carbs": 68.2, "fat": 34.9, "name_en": "Brown Rice + Salmon + Pepper-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5908", "name": "Esmer Pirinç + Somon + Biber-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 755, "protein": 39.3, "carbs": 72.5, "fat": 35.3, "name_en": "Brown Rice + Salmon + Pepper-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5909", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 722, "protein": 39.8, "carbs": 68.7, "fat": 32.1, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5910", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 744, "protein": 44.7, "carbs": 73.8, "fat": 29.7, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5911", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 752, "protein": 43.2, "carbs": 72.6, "fat": 32.9, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5912", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 870, "protein": 47.1, "carbs": 84.4, "fat": 37.8, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5913", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 700, "protein": 41.5, "carbs": 79.6, "fat": 23.9, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5914", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 769, "protein": 42.6, "carbs": 70.8, "fat": 35.2, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5915", "name": "Esmer Pirinç + Somon + Karnabahar-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 832, "protein": 43.3, "carbs": 77.1, "fat": 40.8, "name_en": "Brown Rice + Salmon + Cauliflower-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5916", "name": "Esmer Pirinç + Somon + Havuç-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 709, "protein": 37.3, "carbs": 67.2, "fat": 31.7, "name_en": "Brown Rice + Salmon + Carrot-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5917", "name": "Esmer Pirinç + Somon + Havuç-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 40.4, "carbs": 70.2, "fat": 24, "name_en": "Brown Rice + Salmon + Carrot-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5918", "name": "Esmer Pirinç + Somon + Havuç-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 799, "protein": 42.4, "carbs": 73, "fat": 37.7, "name_en": "Brown Rice + Salmon + Carrot-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5919", "name": "Esmer Pirinç + Somon + Havuç-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 857, "protein": 44.6, "carbs": 82.8, "fat": 37.3, "name_en": "Brown Rice + Salmon + Carrot-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5920", "name": "Esmer Pirinç + Somon + Havuç-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 747, "protein": 40.8, "carbs": 80, "fat": 28.6, "name_en": "Brown Rice + Salmon + Carrot-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5921", "name": "Esmer Pirinç + Somon + Havuç-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 696, "protein": 38.2, "carbs": 67.2, "fat": 29.5, "name_en": "Brown Rice + Salmon + Carrot-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5922", "name": "Esmer Pirinç + Somon + Havuç-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 819, "protein": 40.8, "carbs": 75.5, "fat": 40.3, "name_en": "Brown Rice + Salmon + Carrot-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5923", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 583, "protein": 48.7, "carbs": 61.2, "fat": 16.9, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5924", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 545, "protein": 51.8, "carbs": 64.2, "fat": 9.2, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5925", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Tahini Sos Bowl (1 Porsiyon)", "calories": 672, "protein": 53.9, "carbs": 67, "fat": 22.9, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5926", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Humus Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 54.2, "carbs": 74.8, "fat": 17.3, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5927", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Domates Sos Bowl (1 Porsiyon)", "calories": 621, "protein": 52.2, "carbs": 74, "fat": 13.8, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5928", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Pesto Sos Bowl (1 Porsiyon)", "calories": 570, "protein": 49.7, "carbs": 61.2, "fat": 14.8, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5929", "name": "Esmer Pirinç + Levrek + Brokoli-Ispanak Avokado Sos Bowl (1 Porsiyon)", "calories": 633, "protein": 50.4, "carbs": 67.5, "fat": 20.3, "name_en": "Brown Rice + Sea Bass + Broccoli-Spinach Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5930", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 639, "protein": 47.7, "carbs": 64.6, "fat": 21.8, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5931", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 541, "protein": 49, "carbs": 65.6, "fat": 9, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5932", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 608, "protein": 49.3, "carbs": 66.4, "fat": 17.4, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5933", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 667, "protein": 51.4, "carbs": 76.2, "fat": 17.1, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5934", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 617, "protein": 49.4, "carbs": 75.4, "fat": 13.6, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5935", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 566, "protein": 46.9, "carbs": 62.6, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5936", "name": "Esmer Pirinç + Levrek + Brokoli-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 629, "protein": 47.6, "carbs": 68.9, "fat": 20.1, "name_en": "Brown Rice + Sea Bass + Broccoli-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5937", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 641, "protein": 48.6, "carbs": 63.7, "fat": 22.1, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5938", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 543, "protein": 49.9, "carbs": 64.8, "fat": 9.2, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5939", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 611, "protein": 50.2, "carbs": 65.6, "fat": 17.7, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5940", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 669, "protein": 52.3, "carbs": 75.4, "fat": 17.3, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5941", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 559, "protein": 48.5, "carbs": 72.6, "fat": 8.6, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5942", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 568, "protein": 47.8, "carbs": 61.8, "fat": 14.7, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5943", "name": "Esmer Pirinç + Levrek + Brokoli-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 691, "protein": 50.3, "carbs": 70.1, "fat": 25.5, "name_en": "Brown Rice + Sea Bass + Broccoli-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5944", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 643, "protein": 47.3, "carbs": 65.6, "fat": 21.6, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5945", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 605, "protein": 50.4, "carbs": 68.6, "fat": 14, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5946", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 612, "protein": 48.9, "carbs": 67.4, "fat": 17.2, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5947", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 51, "carbs": 77.2, "fat": 16.9, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5948", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 561, "protein": 47.2, "carbs": 74.4, "fat": 8.2, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5949", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 570, "protein": 46.5, "carbs": 63.6, "fat": 14.3, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5950", "name": "Esmer Pirinç + Levrek + Brokoli-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 633, "protein": 47.2, "carbs": 69.9, "fat": 19.9, "name_en": "Brown Rice + Sea Bass + Broccoli-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5951", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 573, "protein": 47.5, "carbs": 58.3, "fat": 16.9, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5952", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 535, "protein": 50.6, "carbs": 61.4, "fat": 9.3, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5953", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 602, "protein": 50.9, "carbs": 62.2, "fat": 17.7, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5954", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 721, "protein": 54.8, "carbs": 74, "fat": 22.6, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5955", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 551, "protein": 49.2, "carbs": 69.2, "fat": 8.7, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5956", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 560, "protein": 48.5, "carbs": 58.4, "fat": 14.8, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5957", "name": "Esmer Pirinç + Levrek + Ispanak-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 683, "protein": 51, "carbs": 66.7, "fat": 25.6, "name_en": "Brown Rice + Sea Bass + Spinach-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5958", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 587, "protein": 48.8, "carbs": 61.8, "fat": 16.9, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5959", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 609, "protein": 53.7, "carbs": 66.8, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5960", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 617, "protein": 52.2, "carbs": 65.6, "fat": 17.7, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5961", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 54.3, "carbs": 75.4, "fat": 17.4, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5962", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 565, "protein": 50.5, "carbs": 72.6, "fat": 8.7, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5963", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 574, "protein": 49.8, "carbs": 61.8, "fat": 14.8, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5964", "name": "Esmer Pirinç + Levrek + Ispanak-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 50.5, "carbs": 68.1, "fat": 20.4, "name_en": "Brown Rice + Sea Bass + Spinach-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5965", "name": "Esmer Pirinç + Levrek + Mantar-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 570, "protein": 47.1, "carbs": 58.6, "fat": 16.6, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5966", "name": "Esmer Pirinç + Levrek + Mantar-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 532, "protein": 50.2, "carbs": 61.7, "fat": 8.9, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5967", "name": "Esmer Pirinç + Levrek + Mantar-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 50.5, "carbs": 62.4, "fat": 17.4, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5968", "name": "Esmer Pirinç + Levrek + Mantar-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 718, "protein": 54.4, "carbs": 74.3, "fat": 22.2, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5969", "name": "Esmer Pirinç + Levrek + Mantar-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 548, "protein": 48.8, "carbs": 69.5, "fat": 8.3, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5970", "name": "Esmer Pirinç + Levrek + Mantar-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 557, "protein": 48.1, "carbs": 58.7, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5971", "name": "Esmer Pirinç + Levrek + Mantar-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 620, "protein": 48.8, "carbs": 65, "fat": 20, "name_en": "Brown Rice + Sea Bass + Mushrooms-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5972", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 568, "protein": 44, "carbs": 60.4, "fat": 16.4, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5973", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 530, "protein": 47.1, "carbs": 63.5, "fat": 8.7, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5974", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 597, "protein": 47.4, "carbs": 64.3, "fat": 17.1, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5975", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 656, "protein": 49.5, "carbs": 74.1, "fat": 16.8, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5976", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 606, "protein": 47.5, "carbs": 73.3, "fat": 13.3, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5977", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 555, "protein": 45, "carbs": 60.5, "fat": 14.2, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5978", "name": "Esmer Pirinç + Levrek + Domates-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 618, "protein": 45.7, "carbs": 66.8, "fat": 19.8, "name_en": "Brown Rice + Sea Bass + Tomato-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5979", "name": "Esmer Pirinç + Levrek + Domates-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 569, "protein": 44.9, "carbs": 59.5, "fat": 16.7, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5980", "name": "Esmer Pirinç + Levrek + Domates-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 531, "protein": 48, "carbs": 62.6, "fat": 9.1, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5981", "name": "Esmer Pirinç + Levrek + Domates-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 48.3, "carbs": 63.4, "fat": 17.5, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5982", "name": "Esmer Pirinç + Levrek + Domates-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 657, "protein": 50.4, "carbs": 73.2, "fat": 17.2, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5983", "name": "Esmer Pirinç + Levrek + Domates-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 547, "protein": 46.6, "carbs": 70.4, "fat": 8.5, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5984", "name": "Esmer Pirinç + Levrek + Domates-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 45.9, "carbs": 59.6, "fat": 14.6, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5985", "name": "Esmer Pirinç + Levrek + Domates-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 679, "protein": 48.4, "carbs": 67.9, "fat": 25.4, "name_en": "Brown Rice + Sea Bass + Tomato-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5986", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 629, "protein": 46.5, "carbs": 61.8, "fat": 21.8, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5987", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 591, "protein": 49.6, "carbs": 64.9, "fat": 14.1, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5988", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 599, "protein": 48.1, "carbs": 63.6, "fat": 17.4, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5989", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 657, "protein": 50.2, "carbs": 73.5, "fat": 17, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5990", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 547, "protein": 46.4, "carbs": 70.7, "fat": 8.3, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5991", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 45.7, "carbs": 59.9, "fat": 14.4, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5992", "name": "Esmer Pirinç + Levrek + Salatalık-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 619, "protein": 46.4, "carbs": 66.2, "fat": 20, "name_en": "Brown Rice + Sea Bass + Cucumber-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5993", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 571, "protein": 43.4, "carbs": 61.6, "fat": 16.1, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_5994", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Yoğurt Sos Bowl (1 Porsiyon)", "calories": 593, "protein": 48.3, "carbs": 66.7, "fat": 13.7, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5995", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Tahini Sos Bowl (1 Porsiyon)", "calories": 660, "protein": 48.6, "carbs": 67.5, "fat": 22.1, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5996", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Humus Sos Bowl (1 Porsiyon)", "calories": 659, "protein": 48.9, "carbs": 75.3, "fat": 16.6, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5997", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Domates Sos Bowl (1 Porsiyon)", "calories": 609, "protein": 46.9, "carbs": 74.5, "fat": 13.1, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5998", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Pesto Sos Bowl (1 Porsiyon)", "calories": 558, "protein": 44.4, "carbs": 61.7, "fat": 14, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_5999", "name": "Esmer Pirinç + Levrek + Salatalık-Soğan Avokado Sos Bowl (1 Porsiyon)", "calories": 681, "protein": 46.9, "carbs": 70, "fat": 24.8, "name_en": "Brown Rice + Sea Bass + Cucumber-Onion Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6000", "name": "Esmer Pirinç + Levrek + Biber-Kabak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 568, "protein": 44.7, "carbs": 59.7, "fat": 16.7, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6001", "name": "Esmer Pirinç + Levrek + Biber-Kabak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 531, "protein": 47.8, "carbs": 62.8, "fat": 9, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6002", "name": "Esmer Pirinç + Levrek + Biber-Kabak Tahini Sos Bowl (1 Porsiyon)", "calories": 598, "protein": 48.1, "carbs": 63.6, "fat": 17.5, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6003", "name": "Esmer Pirinç + Levrek + Biber-Kabak Humus Sos Bowl (1 Porsiyon)", "calories": 657, "protein": 50.2, "carbs": 73.4, "fat": 17.1, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6004", "name": "Esmer Pirinç + Levrek + Biber-Kabak Domates Sos Bowl (1 Porsiyon)", "calories": 547, "protein": 46.4, "carbs": 70.6, "fat": 8.4, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6005", "name": "Esmer Pirinç + Levrek + Biber-Kabak Pesto Sos Bowl (1 Porsiyon)", "calories": 556, "protein": 45.7, "carbs": 59.8, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6006", "name": "Esmer Pirinç + Levrek + Biber-Kabak Avokado Sos Bowl (1 Porsiyon)", "calories": 619, "protein": 46.4, "carbs": 66.1, "fat": 20.1, "name_en": "Brown Rice + Sea Bass + Pepper-Zucchini Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6007", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 583, "protein": 46, "carbs": 63.2, "fat": 16.7, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6008", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 545, "protein": 49.1, "carbs": 66.2, "fat": 9, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6009", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 612, "protein": 49.4, "carbs": 67, "fat": 17.5, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6010", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 51.5, "carbs": 76.8, "fat": 17.1, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6011", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 561, "protein": 47.7, "carbs": 74, "fat": 8.4, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6012", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 570, "protein": 47, "carbs": 63.2, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6013", "name": "Esmer Pirinç + Levrek + Biber-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 633, "protein": 47.7, "carbs": 69.5, "fat": 20.1, "name_en": "Brown Rice + Sea Bass + Pepper-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6014", "name": "Esmer Pirinç + Levrek + Biber-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 647, "protein": 45.4, "carbs": 68.2, "fat": 21.6, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6015", "name": "Esmer Pirinç + Levrek + Biber-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 549, "protein": 46.7, "carbs": 69.2, "fat": 8.7, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6016", "name": "Esmer Pirinç + Levrek + Biber-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 677, "protein": 48.8, "carbs": 72, "fat": 22.4, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6017", "name": "Esmer Pirinç + Levrek + Biber-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 49.1, "carbs": 79.8, "fat": 16.8, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6018", "name": "Esmer Pirinç + Levrek + Biber-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 625, "protein": 47.1, "carbs": 79, "fat": 13.3, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6019", "name": "Esmer Pirinç + Levrek + Biber-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 574, "protein": 44.6, "carbs": 66.2, "fat": 14.2, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6020", "name": "Esmer Pirinç + Levrek + Biber-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 45.3, "carbs": 72.5, "fat": 19.8, "name_en": "Brown Rice + Sea Bass + Pepper-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6021", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 586, "protein": 46.9, "carbs": 62.3, "fat": 16.9, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6022", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 608, "protein": 51.8, "carbs": 67.4, "fat": 14.5, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6023", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 52.1, "carbs": 68.2, "fat": 22.9, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6024", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 674, "protein": 52.4, "carbs": 76, "fat": 17.4, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6025", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 564, "protein": 48.6, "carbs": 73.2, "fat": 8.7, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6026", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 573, "protein": 47.9, "carbs": 62.4, "fat": 14.8, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6027", "name": "Esmer Pirinç + Levrek + Kabak-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 636, "protein": 48.6, "carbs": 68.7, "fat": 20.4, "name_en": "Brown Rice + Sea Bass + Zucchini-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6028", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 685, "protein": 52.7, "carbs": 61.2, "fat": 26.9, "name_en": "Brown Rice + Trout + Broccoli-Spinach Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6029", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Yoğurt Sos Bowl (1 Porsiyon)", "calories": 647, "protein": 55.8, "carbs": 64.2, "fat": 19.2, "name_en": "Brown Rice + Trout + Broccoli-Spinach Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6030", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Tahini Sos Bowl (1 Porsiyon)", "calories": 714, "protein": 56.1, "carbs": 65, "fat": 27.7, "name_en": "Brown Rice + Trout + Broccoli-Spinach Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6031", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Humus Sos Bowl (1 Porsiyon)", "calories": 833, "protein": 60, "carbs": 76.8, "fat": 32.5, "name_en": "Brown Rice + Trout + Broccoli-Spinach Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6032", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Domates Sos Bowl (1 Porsiyon)", "calories": 663, "protein": 54.4, "carbs": 72, "fat": 18.6, "name_en": "Brown Rice + Trout + Broccoli-Spinach Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6033", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Pesto Sos Bowl (1 Porsiyon)", "calories": 672, "protein": 53.7, "carbs": 61.2, "fat": 24.8, "name_en": "Brown Rice + Trout + Broccoli-Spinach Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6034", "name": "Esmer Pirinç + Alabalık + Brokoli-Ispanak Avokado Sos Bowl (1 Porsiyon)", "calories": 735, "protein": 54.4, "carbs": 67.5, "fat": 30.3, "name_en": "Brown Rice + Trout + Broccoli-Spinach Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6035", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 735, "protein": 55.5, "carbs": 59.4, "fat": 32, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6036", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 637, "protein": 56.8, "carbs": 60.5, "fat": 19.2, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6037", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Tahini Sos Bowl (1 Porsiyon)", "calories": 704, "protein": 57.1, "carbs": 61.2, "fat": 27.6, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6038", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Humus Sos Bowl (1 Porsiyon)", "calories": 823, "protein": 61, "carbs": 73.1, "fat": 32.5, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6039", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Domates Sos Bowl (1 Porsiyon)", "calories": 713, "protein": 57.2, "carbs": 70.3, "fat": 23.8, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6040", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Pesto Sos Bowl (1 Porsiyon)", "calories": 722, "protein": 56.5, "carbs": 59.5, "fat": 29.9, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6041", "name": "Esmer Pirinç + Alabalık + Ispanak-Mantar Avokado Sos Bowl (1 Porsiyon)", "calories": 725, "protein": 55.4, "carbs": 63.8, "fat": 30.3, "name_en": "Brown Rice + Trout + Spinach-Mushrooms Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6042", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 693, "protein": 50.4, "carbs": 64.8, "fat": 26.6, "name_en": "Brown Rice + Trout + Spinach-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6043", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 655, "protein": 53.5, "carbs": 67.8, "fat": 19, "name_en": "Brown Rice + Trout + Spinach-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6044", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 723, "protein": 53.8, "carbs": 68.6, "fat": 27.4, "name_en": "Brown Rice + Trout + Spinach-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6045", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 781, "protein": 55.9, "carbs": 78.4, "fat": 27.1, "name_en": "Brown Rice + Trout + Spinach-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6046", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 671, "protein": 52.1, "carbs": 75.6, "fat": 18.4, "name_en": "Brown Rice + Trout + Spinach-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6047", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 680, "protein": 51.4, "carbs": 64.8, "fat": 24.5, "name_en": "Brown Rice + Trout + Spinach-Carrot Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6048", "name": "Esmer Pirinç + Alabalık + Ispanak-Havuç Avokado Sos Bowl (1 Porsiyon)", "calories": 743, "protein": 52.1, "carbs": 71.1, "fat": 30.1, "name_en": "Brown Rice + Trout + Spinach-Carrot Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6049", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 671, "protein": 51.1, "carbs": 58.6, "fat": 26.6, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6050", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Yoğurt Sos Bowl (1 Porsiyon)", "calories": 694, "protein": 56, "carbs": 63.7, "fat": 24.1, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6051", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Tahini Sos Bowl (1 Porsiyon)", "calories": 701, "protein": 54.5, "carbs": 62.4, "fat": 27.4, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6052", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Humus Sos Bowl (1 Porsiyon)", "calories": 820, "protein": 58.4, "carbs": 74.3, "fat": 32.2, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6053", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Domates Sos Bowl (1 Porsiyon)", "calories": 650, "protein": 52.8, "carbs": 69.5, "fat": 18.3, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6054", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Pesto Sos Bowl (1 Porsiyon)", "calories": 659, "protein": 52.1, "carbs": 58.7, "fat": 24.5, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6055", "name": "Esmer Pirinç + Alabalık + Mantar-Domates Avokado Sos Bowl (1 Porsiyon)", "calories": 722, "protein": 52.8, "carbs": 65, "fat": 30, "name_en": "Brown Rice + Trout + Mushrooms-Tomato Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6056", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 671, "protein": 50.9, "carbs": 58.8, "fat": 26.5, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6057", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Yoğurt Sos Bowl (1 Porsiyon)", "calories": 634, "protein": 54, "carbs": 61.9, "fat": 18.8, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6058", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Tahini Sos Bowl (1 Porsiyon)", "calories": 701, "protein": 54.3, "carbs": 62.7, "fat": 27.2, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6059", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Humus Sos Bowl (1 Porsiyon)", "calories": 760, "protein": 56.4, "carbs": 72.5, "fat": 26.9, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6060", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Domates Sos Bowl (1 Porsiyon)", "calories": 650, "protein": 52.6, "carbs": 69.7, "fat": 18.2, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6061", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Pesto Sos Bowl (1 Porsiyon)", "calories": 659, "protein": 51.9, "carbs": 58.9, "fat": 24.3, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6062", "name": "Esmer Pirinç + Alabalık + Mantar-Salatalık Avokado Sos Bowl (1 Porsiyon)", "calories": 722, "protein": 52.6, "carbs": 65.2, "fat": 29.9, "name_en": "Brown Rice + Trout + Mushrooms-Cucumber Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6063", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 688, "protein": 53.1, "carbs": 61.3, "fat": 26.8, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6064", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Yoğurt Sos Bowl (1 Porsiyon)", "calories": 650, "protein": 56.2, "carbs": 64.4, "fat": 19.2, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6065", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Tahini Sos Bowl (1 Porsiyon)", "calories": 717, "protein": 56.4, "carbs": 65.2, "fat": 27.6, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6066", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Humus Sos Bowl (1 Porsiyon)", "calories": 776, "protein": 58.6, "carbs": 75, "fat": 27.3, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6067", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Domates Sos Bowl (1 Porsiyon)", "calories": 666, "protein": 54.8, "carbs": 72.2, "fat": 18.6, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6068", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Pesto Sos Bowl (1 Porsiyon)", "calories": 675, "protein": 54, "carbs": 61.4, "fat": 24.7, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6069", "name": "Esmer Pirinç + Alabalık + Mantar-Karnabahar Avokado Sos Bowl (1 Porsiyon)", "calories": 738, "protein": 54.8, "carbs": 67.7, "fat": 30.3, "name_en": "Brown Rice + Trout + Mushrooms-Cauliflower Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6070", "name": "Esmer Pirinç + Alabalık + Domates-Biber Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 669, "protein": 48, "carbs": 60.4, "fat": 26.5, "name_en": "Brown Rice + Trout + Tomato-Pepper Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6071", "name": "Esmer Pirinç + Alabalık + Domates-Biber Yoğurt Sos Bowl (1 Porsiyon)", "calories": 691, "protein": 52.9, "carbs": 65.5, "fat": 24, "name_en": "Brown Rice + Trout + Tomato-Pepper Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6072", "name": "Esmer Pirinç + Alabalık + Domates-Biber Tahini Sos Bowl (1 Porsiyon)", "calories": 758, "protein": 53.2, "carbs": 66.3, "fat": 32.4, "name_en": "Brown Rice + Trout + Tomato-Pepper Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6073", "name": "Esmer Pirinç + Alabalık + Domates-Biber Humus Sos Bowl (1 Porsiyon)", "calories": 817, "protein": 55.3, "carbs": 76.1, "fat": 32.1, "name_en": "Brown Rice + Trout + Tomato-Pepper Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6074", "name": "Esmer Pirinç + Alabalık + Domates-Biber Domates Sos Bowl (1 Porsiyon)", "calories": 647, "protein": 49.7, "carbs": 71.3, "fat": 18.2, "name_en": "Brown Rice + Trout + Tomato-Pepper Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6075", "name": "Esmer Pirinç + Alabalık + Domates-Biber Pesto Sos Bowl (1 Porsiyon)", "calories": 716, "protein": 50.8, "carbs": 62.5, "fat": 29.5, "name_en": "Brown Rice + Trout + Tomato-Pepper Pesto Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6076", "name": "Esmer Pirinç + Alabalık + Domates-Biber Avokado Sos Bowl (1 Porsiyon)", "calories": 719, "protein": 49.7, "carbs": 66.8, "fat": 29.9, "name_en": "Brown Rice + Trout + Tomato-Pepper Avocado Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6077", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Limonlu Zeytinyağı Bowl (1 Porsiyon)", "calories": 690, "protein": 47.8, "carbs": 66, "fat": 26.4, "name_en": "Brown Rice + Trout + Tomato-Carrot Lemon-Olive Oil Bowl (1 Serving)"},
-  {"food_id": "food_6078", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Yoğurt Sos Bowl (1 Porsiyon)", "calories": 652, "protein": 50.9, "carbs": 69, "fat": 18.8, "name_en": "Brown Rice + Trout + Tomato-Carrot Yogurt Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6079", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Tahini Sos Bowl (1 Porsiyon)", "calories": 719, "protein": 51.2, "carbs": 69.8, "fat": 27.2, "name_en": "Brown Rice + Trout + Tomato-Carrot Tahini Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6080", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Humus Sos Bowl (1 Porsiyon)", "calories": 778, "protein": 53.3, "carbs": 79.6, "fat": 26.9, "name_en": "Brown Rice + Trout + Tomato-Carrot Hummus Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6081", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Domates Sos Bowl (1 Porsiyon)", "calories": 668, "protein": 49.5, "carbs": 76.8, "fat": 18.2, "name_en": "Brown Rice + Trout + Tomato-Carrot Tomato Sauce Bowl (1 Serving)"},
-  {"food_id": "food_6082", "name": "Esmer Pirinç + Alabalık + Domates-Havuç Pesto Sos Bowl (1 Porsiyon)", "calories": 677, "protein": 48.8, "carbs": 66, "fat": 24.3, "name_en": "Brown Rice + Trout + Tomato-Carrot Pesto Sauce Bowl (1 Serving)"},
 
 
 
 
 ]
+
+# food_5384 - food_6082: base + protein + vegetable pair + sauce bowls,
+# generated from the component tables in food_bowls.py
+from food_bowls import BOWL_FOODS
+
+FOOD_DATABASE.extend(BOWL_FOODS)
@@ -0,0 +1,179 @@
+# =============================================================================
+# FOOD MATCH - Link free-text food labels (e.g. vision output) to catalog rows
+# =============================================================================
+# Catalog names are embedded once at import as L2-normalized character
+# trigram TF-IDF vectors (per word, with boundary padding, so "tavuk izgara"
+# and "Izgara Tavuk (100g)" still share most grams). The vectors are kept
+# as a sparse gram -> (document, weight) posting matrix, so scoring a label
+# only touches the postings of its own trigrams, and the top-k per
+# normalized label is memoized. Composite rows ("Izgara Tavuk Göğsü +
+# Yoğurt") are marked down for each "+ B" component the label does not
+# mention, so a plain label links to the plain food, not to a combo.
+# =============================================================================
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from food_catalog import FOOD_CATALOG, project_food
+from food_search import SEARCH_FIELDS, normalize_text, strip_portion, tokenize
+from food_units import SERVING_UNITS
+
+NGRAM = 3
+MATCH_TOP_K = 5
+# Cosine similarity at or above which a match is trusted to fill food_id
+MATCH_MIN_SCORE = 0.78
+MATCH_CACHE_SIZE = 4096
+# Score factor per composite "+ B" component the label does not mention,
+# and the component cosine below which it counts as not mentioned
+COMPOSITE_PENALTY = 0.85
+COMPONENT_MIN_SCORE = 0.3
+
+
+def char_ngrams(text: str, n: int = NGRAM) -> List[str]:
+    """Trigrams of the normalized words in `text`, each word padded with spaces."""
+    return [
+        padded[i:i + n]
+        for padded in (f" {token} " for token in tokenize(text))
+        for i in range(max(len(padded) - n + 1, 1))
+    ]
+
+
+class FoodMatcher:
+    """Character n-gram TF-IDF cosine matcher over both catalog name fields.
+
+    Identical base names (e.g. "Elma (100g)" / "Elma (1 Adet)") share one
+    document. A row's score is the best of its Turkish and English name, so
+    labels in either language match. Each "+ B" component of a composite
+    name (also embedded as a document) that scores below COMPONENT_MIN_SCORE
+    against the label multiplies that name's score by COMPOSITE_PENALTY.
+    Ties prefer rows whose portion is stated in grams (their macros can be
+    scaled to an estimated weight), then catalog order.
+    """
+
+    def __init__(self, foods: Sequence[Dict[str, Any]]):
+        self.size = len(foods)
+        documents: Dict[str, int] = {}
+        row_docs = ([], [])
+        # (row, component document) per name field for the "+ B" parts of composite names
+        component_rows, component_docs = ([], []), ([], [])
+        for row, food in enumerate(foods):
+            for i, field in enumerate(SEARCH_FIELDS.values()):
+                key = normalize_text(strip_portion(food[field]))
+                row_docs[i].append(documents.setdefault(key, len(documents)))
+                for part in key.split("+")[1:]:
+                    if part.strip():
+                        component_rows[i].append(row)
+                        component_docs[i].append(documents.setdefault(part.strip(), len(documents)))
+        self.row_docs = tuple(np.array(docs, dtype=np.int32) for docs in row_docs)
+        self.component_rows = tuple(np.array(rows, dtype=np.int32) for rows in component_rows)
+        self.component_docs = tuple(np.array(docs, dtype=np.int32) for docs in component_docs)
+        self.gram_rows = ~np.isnan(SERVING_UNITS.grams)
+
+        doc_grams = [char_ngrams(text) for text in documents]
+        all_grams = [g for grams in doc_grams for g in grams]
+        self.gram_ids: Dict[str, int] = {g: i for i, g in enumerate(dict.fromkeys(all_grams))}
+        gram_ids = np.fromiter(map(self.gram_ids.__getitem__, all_grams), dtype=np.int64, count=len(all_grams))
+        n_docs, n_grams = len(documents), len(self.gram_ids)
+        doc_ids = np.repeat(np.arange(n_docs), [len(grams) for grams in doc_grams])
+
+        # Sparse doc x gram matrix in CSC form: postings of gram g are
+        # self.docs[self.indptr[g]:self.indptr[g + 1]]
+        pairs, tf = np.unique(gram_ids * n_docs + doc_ids, return_counts=True)
+        grams, docs = np.divmod(pairs, n_docs)
+        df = np.bincount(grams, minlength=n_grams)
+        self.idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+        # Grams no catalog name contains (df = 0) still count towards a label's norm
+        self.idf_unknown = float(np.log(1 + n_docs) + 1.0)
+        weights = (1.0 + np.log(tf)) * self.idf[grams]
+        norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=n_docs))
+        self.docs = docs.astype(np.int32)
+        self.weights = (weights / norms[docs]).astype(np.float32)
+        self.indptr = np.concatenate(([0], np.cumsum(df)))
+        self.n_docs = n_docs
+        self.match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    def _match(self, normalized: str, k: int) -> Tuple[Tuple[int, float], ...]:
+        counts = Counter(char_ngrams(normalized))
+        known = [(self.gram_ids[g], tf) for g, tf in counts.items() if g in self.gram_ids]
+        if not known:
+            return ()
+        weights = [(g, (1.0 + math.log(tf)) * self.idf[g]) for g, tf in known]
+        norm = math.sqrt(
+            sum(w * w for _, w in weights)
+            + sum(((1.0 + math.log(tf)) * self.idf_unknown) ** 2 for g, tf in counts.items() if g not in self.gram_ids)
+        )
+        doc_scores = np.zeros(self.n_docs, dtype=np.float32)
+        for g, w in weights:
+            lo, hi = self.indptr[g], self.indptr[g + 1]
+            doc_scores[self.docs[lo:hi]] += self.weights[lo:hi] * np.float32(w / norm)
+        field_scores = []
+        for i in range(2):
+            field = doc_scores[self.row_docs[i]]
+            unmatched = doc_scores[self.component_docs[i]] < COMPONENT_MIN_SCORE
+            np.multiply.at(field, self.component_rows[i][unmatched], np.float32(COMPOSITE_PENALTY))
+            field_scores.append(field)
+        scores = np.maximum(*field_scores)
+
+        k = min(k, self.size)
+        cutoff = np.partition(scores, self.size - k)[self.size - k]
+        candidates = np.flatnonzero(scores >= cutoff if cutoff > 0 else scores > 0)
+        ranked = sorted(
+            candidates.tolist(),
+            key=lambda row: (-round(float(scores[row]), 5), not self.gram_rows[row], row),
+        )
+        return tuple((row, round(float(scores[row]), 4)) for row in ranked[:k])
+
+    def top(self, label: str, k: int = MATCH_TOP_K) -> Tuple[Tuple[int, float], ...]:
+        """Best (row, cosine) pairs for a free-text label, best first."""
+        return self.match(normalize_text(strip_portion(label)).strip(), k)
+
+
+FOOD_MATCHER = FoodMatcher(FOOD_CATALOG)
+
+
+def match_food(label: str, lang: str = "tr", k: int = MATCH_TOP_K) -> List[Dict[str, Any]]:
+    """Projected catalog candidates for `label` with their `match_score`."""
+    results = []
+    for row, score in FOOD_MATCHER.top(label, k):
+        item = project_food(FOOD_CATALOG[row], lang)
+        item["match_score"] = score
+        results.append(item)
+    return results
+
+
+def link_catalog_food(label: str, grams: Any = None) -> Optional[Dict[str, Any]]:
+    """Best confident catalog match for a detected item, or None.
+
+    Returns {"food_id", "name", "score", "calories", "protein", "carbs", "fat"}.
+    Macros are scaled to `grams` when the catalog portion is stated in grams;
+    otherwise they are None and the caller keeps its own estimate. `grams`
+    comes straight from the model: a value that is not a finite number
+    ("150g", a list, NaN) skips linking.
+    """
+    if grams is not None:
+        try:
+            grams = float(grams)
+        except (TypeError, ValueError):
+            return None
+        if not math.isfinite(grams):
+            return None
+    matches = FOOD_MATCHER.top(label, 1)
+    if not matches or matches[0][1] < MATCH_MIN_SCORE:
+        return None
+    row, score = matches[0]
+    food = FOOD_CATALOG[row]
+    linked = {"food_id": food["food_id"], "name": food["name"], "score": score,
+              "calories": None, "protein": None, "carbs": None, "fat": None}
+    portion = float(SERVING_UNITS.grams[row])
+    if not math.isnan(portion) and grams and grams > 0:
+        factor = grams / portion
+        linked["calories"] = round(food["calories"] * factor)
+        for field in ("protein", "carbs", "fat"):
+            linked[field] = round(food[field] * factor, 1)
+    return linked
@@ -0,0 +1,333 @@
+# =============================================================================
+# FOOD SEARCH - Turkish-aware text index over the food catalog
+# =============================================================================
+# Built once at import time. Lookups only touch posting lists for the query
+# tokens; nothing here scans the full catalog per request.
+# =============================================================================
+
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from food_catalog import FOOD_CATALOG, project_food
+
+# -------------------------
+# NORMALIZATION
+# -------------------------
+# Turkish dotted/dotless I must be mapped before str.lower(), otherwise
+# "İ".lower() yields "i" + U+0307 and "I" becomes "i" instead of "ı".
+# Diacritics are then folded so "sut", "süt" and "SÜT" meet in one token.
+# Chained str.replace is several times faster than str.translate here and
+# this runs for every name at startup.
+_TR_FOLD = (
+    ("ı", "i"), ("ş", "s"), ("ğ", "g"), ("ç", "c"), ("ö", "o"), ("ü", "u"),
+    ("â", "a"), ("î", "i"), ("û", "u"), ("é", "e"), ("è", "e"), ("ä", "a"), ("ñ", "n"),
+    ("\u0307", ""),
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text: str) -> str:
+    """Turkish case folding + diacritic folding (İ/ı→i, ş→s, ğ→g, ç→c, ö→o, ü→u)."""
+    if not text:
+        return ""
+    text = text.replace("İ", "i").replace("I", "ı").lower()
+    if text.isascii():
+        return text
+    for char, folded in _TR_FOLD:
+        if char in text:
+            text = text.replace(char, folded)
+    return text
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized alphanumeric tokens in order of appearance."""
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+_PORTION_RE = re.compile(r"\s*\([^()]*\)\s*$")
+
+
+def strip_portion(name: str) -> str:
+    """Drop the trailing portion note, e.g. "Somon (100g)" -> "Somon"."""
+    return _PORTION_RE.sub("", name or "").strip()
+
+
+# -------------------------
+# INVERTED INDEX
+# -------------------------
+SEARCH_FIELDS = {"tr": "name", "en": "name_en"}
+
+# Ranking tiers (lower is better)
+TIER_EXACT = 0        # normalized name equals the query
+TIER_PREFIX = 1       # name starts with the first query token
+TIER_ALL_TOKENS = 2   # every query token present as a whole word
+TIER_PARTIAL = 3      # last query token only matched as a prefix
+OTHER_FIELD_PENALTY = 4  # matched in the other language's name only
+
+MAX_PREFIX_EXPANSION = 64
+
+
+class FoodSearchIndex:
+    """Per-language inverted index over catalog names.
+
+    For every token we keep a {row: first position} map for membership tests
+    and a list of rows pre-sorted by (position, name length, row), which is
+    the ranking order inside a tier. Queries walk that list and stop as soon
+    as `limit` rows qualify.
+    """
+
+    def __init__(self, foods: Sequence[Dict[str, Any]], fields: Dict[str, str] = SEARCH_FIELDS):
+        self.foods = foods
+        self.fields = fields
+        self.postings: Dict[str, Dict[str, Dict[int, int]]] = {}
+        self.ranked: Dict[str, Dict[str, List[Tuple[int, int, int]]]] = {}
+        self.vocab: Dict[str, List[str]] = {}
+        self.exact_names: Dict[str, Dict[str, List[int]]] = {}
+        self.name_lengths: Dict[str, List[int]] = {}
+
+        for lang, field in fields.items():
+            postings: Dict[str, Dict[int, int]] = {}
+            exact: Dict[str, List[int]] = {}
+            lengths: List[int] = []
+            for row, food in enumerate(foods):
+                tokens = tokenize(food.get(field) or "")
+                lengths.append(len(tokens))
+                for pos, token in enumerate(tokens):
+                    postings.setdefault(token, {}).setdefault(row, pos)
+                exact.setdefault(" ".join(tokens), []).append(row)
+                # Also allow an exact hit on the name without its portion suffix
+                base = tokenize(strip_portion(food.get(field) or ""))
+                if base and len(base) != len(tokens):
+                    exact.setdefault(" ".join(base), []).append(row)
+            self.postings[lang] = postings
+            self.ranked[lang] = {
+                token: sorted((pos, lengths[row], row) for row, pos in plist.items())
+                for token, plist in postings.items()
+            }
+            self.vocab[lang] = sorted(postings)
+            self.exact_names[lang] = exact
+            self.name_lengths[lang] = lengths
+
+    def _expand_prefix(self, lang: str, prefix: str) -> List[str]:
+        vocab = self.vocab[lang]
+        out: List[str] = []
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix) and len(out) < MAX_PREFIX_EXPANSION:
+            out.append(vocab[i])
+            i += 1
+        return out
+
+    def _search_field(self, lang: str, tokens: List[str], limit: int) -> List[Tuple[int, int, int, int]]:
+        """Best `limit` (tier, position, length, row) keys for one name field."""
+        postings = self.postings[lang]
+        ranked = self.ranked[lang]
+        last = tokens[-1]
+        last_exact = last in postings
+
+        # Resolve each query token to one or more vocabulary tokens; only the
+        # last one may match as a prefix (the user is still typing it).
+        groups: List[List[str]] = []
+        for token in tokens[:-1]:
+            if token not in postings:
+                return []
+            groups.append([token])
+        groups.append([last] if last_exact else self._expand_prefix(lang, last))
+        if not groups[-1]:
+            return []
+
+        def members(group: List[str]) -> Any:
+            if len(group) == 1:
+                return postings[group[0]]
+            merged: Set[int] = set()
+            for token in group:
+                merged.update(postings[token])
+            return merged
+
+        # Driver: the first token's rows in ranking order
+        driver_group = groups[0]
+        if len(driver_group) == 1:
+            driver: Any = ranked[driver_group[0]]
+            driver_size = len(driver)
+        else:
+            driver = heapq.merge(*(ranked[t] for t in driver_group))
+            driver_size = sum(len(postings[t]) for t in driver_group)
+        filters = [members(g) for g in groups[1:]]
+
+        exact_rows = set(self.exact_names[lang].get(" ".join(tokens), ()))
+        non_exact_tier = TIER_ALL_TOKENS if last_exact else TIER_PARTIAL
+
+        def key_for(pos: int, length: int, row: int) -> Tuple[int, int, int, int]:
+            if row in exact_rows:
+                return (TIER_EXACT, pos, length, row)
+            return (TIER_PREFIX if pos == 0 else non_exact_tier, pos, length, row)
+
+        smallest = min((len(f) for f in filters), default=driver_size)
+        if filters and smallest * 4 < driver_size:
+            # Selective filter: intersect first, then rank the few survivors
+            rows = set(min(filters, key=len))
+            for f in filters:
+                rows.intersection_update(f)
+            driver_pos: Dict[int, Tuple[int, int]] = {}
+            for pos, length, row in driver:
+                if row in rows and row not in driver_pos:
+                    driver_pos[row] = (pos, length)
+            return heapq.nsmallest(limit, (key_for(p, ln, r) for r, (p, ln) in driver_pos.items()))
+
+        # Exact name hits always contain every query token, so they bypass the walk
+        first_positions = postings.get(driver_group[0], {})
+        lengths = self.name_lengths[lang]
+        out: List[Tuple[int, int, int, int]] = [
+            key_for(first_positions.get(row, 0), lengths[row], row) for row in exact_rows
+        ]
+        seen = set(exact_rows)
+        taken = 0
+        for pos, length, row in driver:
+            if row in seen:
+                continue
+            if all(row in f for f in filters):
+                seen.add(row)
+                out.append(key_for(pos, length, row))
+                taken += 1
+                if taken >= limit:
+                    break
+        out.sort()
+        return out[:limit]
+
+    def search(self, query: str, lang: str = "tr", limit: int = 20) -> List[Tuple[int, int]]:
+        """Return up to `limit` (row, tier) pairs, best first."""
+        tokens = tokenize(query)
+        if not tokens or limit <= 0:
+            return []
+        if lang not in self.fields:
+            lang = "tr"
+
+        best: Dict[int, Tuple[int, int, int, int]] = {}
+        for field_lang in self.fields:
+            penalty = 0 if field_lang == lang else OTHER_FIELD_PENALTY
+            for tier, pos, length, row in self._search_field(field_lang, tokens, limit):
+                key = (tier + penalty, pos, length, row)
+                if row not in best or key < best[row]:
+                    best[row] = key
+
+        top = heapq.nsmallest(limit, best.values())
+        return [(key[3], key[0]) for key in top]
+
+
+FOOD_SEARCH_INDEX = FoodSearchIndex(FOOD_CATALOG)
+
+
+# -------------------------
+# PREFIX AUTOCOMPLETE
+# -------------------------
+AUTOCOMPLETE_TOP_K = 10
+
+_KEY_END = "\uffff"
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class PrefixAutocomplete:
+    """Compact radix trie over normalized names, laid out as a sorted key array.
+
+    Keys are the normalized name plus every word-suffix of it ("esmer pirinc
+    levrek", "pirinc levrek", "levrek"), so typing any word of a name finds
+    it. Every trie node (a distinct longest-common-prefix of adjacent keys)
+    stores its precomputed top-k rows. A lookup is two bisects to find the
+    key range plus one dict hit for the node that spans it, so the cost
+    depends on len(prefix), not on how many rows share the prefix.
+
+    Ranking: full-name matches before mid-name word matches, then shorter
+    names, then catalog order.
+    """
+
+    def __init__(self, names: Sequence[str], k: int = AUTOCOMPLETE_TOP_K):
+        self.k = k
+        entries: Dict[str, List[Tuple[int, int, int]]] = {}
+        for row, name in enumerate(names):
+            tokens = tokenize(strip_portion(name))
+            for i in range(len(tokens)):
+                rank = (1 if i else 0, len(tokens), row)
+                entries.setdefault(" ".join(tokens[i:]), []).append(rank)
+        self.keys: List[str] = sorted(entries)
+        self.nodes: Dict[str, Tuple[int, ...]] = {}
+        self._build(entries)
+
+    def _top(self, ranks: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        out: List[Tuple[int, int, int]] = []
+        seen: Set[int] = set()
+        for rank in sorted(ranks):
+            if rank[2] not in seen:
+                seen.add(rank[2])
+                out.append(rank)
+                if len(out) == self.k:
+                    break
+        return out
+
+    def _build(self, entries: Dict[str, List[Tuple[int, int, int]]]) -> None:
+        # Single pass over the sorted keys with a stack of open nodes
+        # [depth, key, ranks]; a node closes once the next key diverges above it.
+        stack: List[List[Any]] = [[0, "", []]]
+        prev = ""
+        for key in self.keys:
+            lcp = _common_prefix_len(prev, key)
+            self._close_until(stack, lcp, key)
+            stack.append([len(key), key, self._top(entries[key])])
+            prev = key
+        self._close_until(stack, 0, "")
+        self.nodes[""] = tuple(r[2] for r in self._top(stack[0][2]))
+
+    def _close_until(self, stack: List[List[Any]], depth: int, next_key: str) -> None:
+        while stack[-1][0] > depth:
+            node_depth, node_key, ranks = stack.pop()
+            self.nodes[node_key[:node_depth]] = tuple(r[2] for r in ranks)
+            if stack[-1][0] < depth:
+                # Branching point between the parent and this node: open it
+                stack.append([depth, node_key, ranks])
+            else:
+                stack[-1][2] = self._top(stack[-1][2] + ranks)
+
+    def lookup(self, prefix: str, limit: Optional[int] = None) -> Tuple[int, ...]:
+        """Top rows whose name (or a word inside it) starts with `prefix`."""
+        tokens = tokenize(prefix)
+        if not tokens:
+            return ()
+        key = " ".join(tokens)
+        keys = self.keys
+        lo = bisect_left(keys, key)
+        if lo == len(keys) or not keys[lo].startswith(key):
+            return ()
+        hi = bisect_left(keys, key + _KEY_END, lo)
+        node = keys[lo][:_common_prefix_len(keys[lo], keys[hi - 1])]
+        rows = self.nodes[node]
+        return rows if limit is None else rows[:limit]
+
+
+FOOD_AUTOCOMPLETE: Dict[str, PrefixAutocomplete] = {
+    lang: PrefixAutocomplete([f.get(field) or "" for f in FOOD_CATALOG])
+    for lang, field in SEARCH_FIELDS.items()
+}
+
+
+def autocomplete_foods(prefix: str, lang: str = "tr", limit: int = AUTOCOMPLETE_TOP_K) -> List[Dict[str, Any]]:
+    """Client-facing rows completing `prefix` in the given locale."""
+    index = FOOD_AUTOCOMPLETE.get(lang) or FOOD_AUTOCOMPLETE["tr"]
+    return [project_food(FOOD_CATALOG[row], lang) for row in index.lookup(prefix, limit)]
+
+
+def search_foods(query: str, lang: str = "tr", limit: int = 20) -> List[Dict[str, Any]]:
+    """Ranked, client-facing rows for `query` with their match tier."""
+    return [
+        {**project_food(FOOD_CATALOG[row], lang), "match_tier": tier}
+        for row, tier in FOOD_SEARCH_INDEX.search(query, lang, limit)
+    ]
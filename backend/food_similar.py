@@ -0,0 +1,191 @@
+# =============================================================================
+# FOOD SIMILAR - Macro-profile nearest neighbours over the food catalog
+# =============================================================================
+# Every food is a point (calories, protein, carbs, fat), standardized per
+# dimension so 100 kcal does not outweigh 10 g of protein. A KD-tree with
+# per-node bounding boxes is built once at import; queries walk it
+# best-first and stop as soon as no unvisited box can beat the current k-th
+# neighbour, so a lookup touches a handful of leaves instead of all rows.
+#
+# Optional {field: (min, max)} constraints (e.g. a calorie cap) are applied
+# inside the search: boxes entirely outside the constraints are skipped and
+# leaf points are filtered before they compete for the top k.
+# =============================================================================
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from food_catalog import FOOD_CATALOG, FOOD_ROW_BY_ID, NUTRIENT_FIELDS, DEFAULT_LANG, macro_matrix, project_food
+
+LEAF_SIZE = 32
+SIMILAR_MAX_K = 50
+
+Ranges = Dict[str, Tuple[Optional[float], Optional[float]]]
+
+
+class MacroKDTree:
+    """Static KD-tree over standardized macro vectors.
+
+    Nodes live in flat lists; node i covers self.rows[start[i]:end[i]].
+    Leaves have left[i] == -1. Each node keeps its bounding box both in
+    standardized units (distance bounds) and raw units (constraint pruning).
+    """
+
+    def __init__(self, values: np.ndarray, leaf_size: int = LEAF_SIZE):
+        self.size, self.dims = values.shape
+        self.mean = values.mean(axis=0)
+        scale = values.std(axis=0)
+        self.scale = np.where(scale > 0, scale, 1.0)
+
+        points = (values - self.mean) / self.scale
+        order = np.arange(self.size)
+        start, end, left, right = [], [], [], []
+        stack = [(0, self.size, -1, False)]  # (start, end, parent, is_right)
+        while stack:
+            lo, hi, parent, is_right = stack.pop()
+            node = len(start)
+            start.append(lo)
+            end.append(hi)
+            left.append(-1)
+            right.append(-1)
+            if parent >= 0:
+                (right if is_right else left)[parent] = node
+            if hi - lo <= leaf_size:
+                continue
+            block = points[order[lo:hi]]
+            dim = int(np.argmax(block.max(axis=0) - block.min(axis=0)))
+            mid = (hi - lo) // 2
+            order[lo:hi] = order[lo:hi][np.argpartition(block[:, dim], mid)]
+            stack.append((lo + mid, hi, node, True))
+            stack.append((lo, lo + mid, node, False))
+
+        self.start = start
+        self.end = end
+        self.left = left
+        self.right = right
+        # Points and raw values permuted into tree order so every node is a slice
+        self.rows = order
+        self.points = points[order]
+        self.values = values[order]
+        self.position = np.empty_like(order)
+        self.position[order] = np.arange(self.size)
+        # Per-node boxes as plain tuples: with 4 dimensions, Python arithmetic
+        # beats the per-call overhead of tiny NumPy operations in the search loop
+        self.boxes = []
+        self.raw_boxes = []
+        for s, e in zip(start, end):
+            block, raw = self.points[s:e], self.values[s:e]
+            self.boxes.append((tuple(block.min(axis=0).tolist()), tuple(block.max(axis=0).tolist())))
+            self.raw_boxes.append((tuple(raw.min(axis=0).tolist()), tuple(raw.max(axis=0).tolist())))
+
+    def values_of(self, row: int) -> np.ndarray:
+        """Raw macro vector of catalog row `row`."""
+        return self.values[self.position[row]]
+
+    def _bounds(self, ranges: Optional[Ranges]) -> Tuple[List[float], List[float]]:
+        low = [-math.inf] * self.dims
+        high = [math.inf] * self.dims
+        for field, (lo, hi) in (ranges or {}).items():
+            dim = NUTRIENT_FIELDS.index(field)
+            if lo is not None:
+                low[dim] = float(lo)
+            if hi is not None:
+                high[dim] = float(hi)
+        return low, high
+
+    def query(
+        self,
+        values: Sequence[float],
+        k: int,
+        ranges: Optional[Ranges] = None,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """k nearest rows to raw `values` as (row, distance), closest first.
+
+        Ties are broken by row index so results are deterministic.
+        """
+        point = (np.asarray(values, dtype=np.float64) - self.mean) / self.scale
+        target = point.tolist()
+        low, high = self._bounds(ranges)
+        constrained = bool(ranges)
+        # Constraint box in standardized units; clipping node boxes to it gives
+        # a tighter lower bound than the node box alone
+        mean, scale = self.mean.tolist(), self.scale.tolist()
+        clip_lo = [(l - m) / sc for l, m, sc in zip(low, mean, scale)]
+        clip_hi = [(h - m) / sc for h, m, sc in zip(high, mean, scale)]
+        low_arr, high_arr = np.array(low), np.array(high)
+        dims = range(self.dims)
+
+        def lower_bound(node: int) -> Optional[float]:
+            if constrained:
+                raw_lo, raw_hi = self.raw_boxes[node]
+                for d in dims:
+                    if raw_hi[d] < low[d] or raw_lo[d] > high[d]:
+                        return None
+            box_lo, box_hi = self.boxes[node]
+            total = 0.0
+            for d in dims:
+                lo = box_lo[d] if box_lo[d] > clip_lo[d] else clip_lo[d]
+                hi = box_hi[d] if box_hi[d] < clip_hi[d] else clip_hi[d]
+                x = target[d]
+                gap = lo - x if x < lo else (x - hi if x > hi else 0.0)
+                total += gap * gap
+            return total
+
+        best: List[Tuple[float, int]] = []  # min-heap of (-dist2, -row), i.e. worst on top
+        frontier = [(0.0, 0)]
+        while frontier:
+            dist2, node = heapq.heappop(frontier)
+            # Small slack so float rounding in the bound never drops an exact tie
+            if len(best) == k and dist2 > -best[0][0] * (1 + 1e-9) + 1e-12:
+                break
+            left = self.left[node]
+            if left >= 0:
+                for child in (left, self.right[node]):
+                    bound = lower_bound(child)
+                    if bound is not None:
+                        heapq.heappush(frontier, (bound, child))
+                continue
+
+            s, e = self.start[node], self.end[node]
+            diff = self.points[s:e] - point
+            dists = np.einsum("ij,ij->i", diff, diff)
+            rows = self.rows[s:e]
+            keep = rows != exclude if exclude is not None else np.ones(e - s, dtype=bool)
+            if constrained:
+                block = self.values[s:e]
+                keep &= np.all((block >= low_arr) & (block <= high_arr), axis=1)
+            for d, row in zip(dists[keep].tolist(), rows[keep].tolist()):
+                entry = (-d, -row)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+        return [(-row, math.sqrt(-d)) for d, row in sorted(best, reverse=True)]
+
+
+MACRO_TREE = MacroKDTree(macro_matrix(FOOD_CATALOG))
+
+
+def similar_foods(
+    food_id: str,
+    k: int = 10,
+    ranges: Optional[Ranges] = None,
+    lang: str = DEFAULT_LANG,
+) -> Optional[List[Dict[str, Any]]]:
+    """Foods with the closest macro profile to `food_id`; None if the id is unknown."""
+    row = FOOD_ROW_BY_ID.get(food_id)
+    if row is None:
+        return None
+    results = []
+    for match, distance in MACRO_TREE.query(MACRO_TREE.values_of(row), k, ranges, exclude=row):
+        item = project_food(FOOD_CATALOG[match], lang)
+        item["distance"] = round(distance, 4)
+        results.append(item)
+    return results
@@ -0,0 +1,233 @@
+# =============================================================================
+# FOOD SNAPSHOT - Binary, memory-mapped copy of FOOD_DATABASE
+# =============================================================================
+# Importing food_database.py makes every worker compile and execute a
+# ~6,000-row Python literal. The snapshot stores the same rows as
+# fixed-width numeric columns plus a UTF-8 string table. Each worker
+# mmaps it read-only, so the pages are shared through the OS page cache.
+#
+# Build (also done automatically on first start when missing or stale):
+#     python food_snapshot.py [output_path]
+#
+# Layout (little-endian):
+#     header   magic, format version, row count, sha256 of SOURCE_PATHS
+#     sections (offset, length) table, see SECTIONS
+#     float64  calories[n], protein[n], carbs[n], fat[n]
+#     uint8    int_flags[n]   bit i set -> NUMERIC_FIELDS[i] was an int
+#     per string field: uint32 offsets[n + 1], utf-8 blob
+# =============================================================================
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+# Catalog sources; editing any of them invalidates the snapshot
+SOURCE_PATHS = (ROOT_DIR / "food_database.py", ROOT_DIR / "food_bowls.py")
+DEFAULT_SNAPSHOT_PATH = ROOT_DIR / "food_catalog.snap"
+
+MAGIC = b"FOODSNP1"
+FORMAT_VERSION = 1
+
+NUMERIC_FIELDS = ("calories", "protein", "carbs", "fat")
+STRING_FIELDS = ("food_id", "name", "name_en")
+ROW_FIELDS = ("food_id", "name", "calories", "protein", "carbs", "fat", "name_en")
+
+SECTIONS = (
+    [f"num:{f}" for f in NUMERIC_FIELDS]
+    + ["int_flags"]
+    + [f"{kind}:{f}" for f in STRING_FIELDS for kind in ("offsets", "blob")]
+)
+
+_HEADER = struct.Struct("<8sII32s")
+_SECTION = struct.Struct("<QQ")
+_HEADER_SIZE = _HEADER.size + _SECTION.size * len(SECTIONS)
+
+
+def source_digest(paths: Sequence[Path] = SOURCE_PATHS) -> bytes:
+    """sha256 over the catalog source files, used to detect stale snapshots."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def _align(n: int, to: int = 8) -> int:
+    return (n + to - 1) // to * to
+
+
+def build_snapshot(foods: Sequence[Dict[str, Any]], path: Union[str, Path], digest: bytes) -> Path:
+    """Write `foods` to `path` atomically (temp file + rename)."""
+    path = Path(path)
+    n = len(foods)
+
+    blobs: Dict[str, bytes] = {}
+    for field in NUMERIC_FIELDS:
+        blobs[f"num:{field}"] = np.array([float(f[field]) for f in foods], dtype="<f8").tobytes()
+    flags = np.zeros(n, dtype=np.uint8)
+    for bit, field in enumerate(NUMERIC_FIELDS):
+        flags |= np.array([isinstance(f[field], int) for f in foods], dtype=np.uint8) << bit
+    blobs["int_flags"] = flags.tobytes()
+    for field in STRING_FIELDS:
+        encoded = [str(f[field]).encode("utf-8") for f in foods]
+        offsets = np.zeros(n + 1, dtype="<u4")
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        blobs[f"offsets:{field}"] = offsets.tobytes()
+        blobs[f"blob:{field}"] = b"".join(encoded)
+
+    table = []
+    cursor = _align(_HEADER_SIZE)
+    for name in SECTIONS:
+        table.append((cursor, len(blobs[name])))
+        cursor = _align(cursor + len(blobs[name]))
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, FORMAT_VERSION, n, digest))
+        for offset, length in table:
+            fh.write(_SECTION.pack(offset, length))
+        for name, (offset, _) in zip(SECTIONS, table):
+            fh.write(b"\0" * (offset - fh.tell()))
+            fh.write(blobs[name])
+    os.replace(tmp, path)
+    return path
+
+
+class FoodSnapshot(Sequence):
+    """Read-only, list-like view over a snapshot file.
+
+    Rows are materialized as dicts only when indexed; numeric columns are
+    exposed as zero-copy NumPy views over the shared mapping.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rows, digest = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported food snapshot format: {self.path}")
+        self.rows = rows
+        self.digest = digest
+
+        sections = {}
+        for i, name in enumerate(SECTIONS):
+            sections[name] = _SECTION.unpack_from(self._mm, _HEADER.size + i * _SECTION.size)
+
+        def view(name: str, dtype: str) -> np.ndarray:
+            offset, length = sections[name]
+            return np.frombuffer(self._mm, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=offset)
+
+        self.columns: Dict[str, np.ndarray] = {f: view(f"num:{f}", "<f8") for f in NUMERIC_FIELDS}
+        self._int_flags = view("int_flags", "u1")
+        self._offsets = {f: view(f"offsets:{f}", "<u4") for f in STRING_FIELDS}
+        self._blob_start = {f: sections[f"blob:{f}"][0] for f in STRING_FIELDS}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def string(self, field: str, row: int) -> str:
+        offsets = self._offsets[field]
+        base = self._blob_start[field]
+        return self._mm[base + int(offsets[row]):base + int(offsets[row + 1])].decode("utf-8")
+
+    def strings(self, field: str) -> List[str]:
+        """Decode a whole string column in one pass."""
+        offsets = self._offsets[field].tolist()
+        base = self._blob_start[field]
+        blob = self._mm[base:base + offsets[-1]]
+        return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self.rows)]
+
+    def number(self, field: str, row: int) -> Union[int, float]:
+        value = float(self.columns[field][row])
+        if self._int_flags[row] & (1 << NUMERIC_FIELDS.index(field)):
+            return int(value)
+        return value
+
+    def __getitem__(self, row):  # type: ignore[override]
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(self.rows))]
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError("food snapshot row out of range")
+        return {
+            field: self.string(field, row) if field in STRING_FIELDS else self.number(field, row)
+            for field in ROW_FIELDS
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Column-at-a-time decode; much cheaper than per-row __getitem__
+        strings = {f: self.strings(f) for f in STRING_FIELDS}
+        flags = self._int_flags.tolist()
+        numbers = {}
+        for bit, f in enumerate(NUMERIC_FIELDS):
+            numbers[f] = [
+                int(v) if flags[i] & (1 << bit) else v
+                for i, v in enumerate(self.columns[f].tolist())
+            ]
+        for row in range(self.rows):
+            yield {
+                field: strings[field][row] if field in STRING_FIELDS else numbers[field][row]
+                for field in ROW_FIELDS
+            }
+
+
+def snapshot_path() -> Optional[Path]:
+    """Configured snapshot location; FOOD_SNAPSHOT_PATH="" disables snapshots."""
+    value = os.getenv("FOOD_SNAPSHOT_PATH")
+    if value is None:
+        return DEFAULT_SNAPSHOT_PATH
+    return Path(value) if value.strip() else None
+
+
+def load_catalog() -> Sequence[Dict[str, Any]]:
+    """FOOD_DATABASE rows, preferring the shared mmap snapshot.
+
+    A missing or stale snapshot is rebuilt from food_database.py (best
+    effort) so the next worker can map it; on any failure we fall back to
+    the plain Python list.
+    """
+    path = snapshot_path()
+    if path is None:
+        from food_database import FOOD_DATABASE
+        return FOOD_DATABASE
+
+    digest = source_digest()
+    try:
+        if path.exists():
+            snap = FoodSnapshot(path)
+            if snap.digest == digest:
+                return snap
+            logger.info(f"Food snapshot {path.name} is stale, rebuilding")
+    except Exception as e:
+        logger.warning(f"Food snapshot unreadable ({e}), rebuilding")
+
+    from food_database import FOOD_DATABASE
+    try:
+        build_snapshot(FOOD_DATABASE, path, digest)
+        logger.info(f"Food snapshot written: {path} ({len(FOOD_DATABASE)} rows)")
+        return FoodSnapshot(path)
+    except Exception as e:
+        logger.warning(f"Food snapshot unavailable ({e}); using in-memory FOOD_DATABASE")
+        return FOOD_DATABASE
+
+
+if __name__ == "__main__":
+    from food_database import FOOD_DATABASE
+
+    out = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SNAPSHOT_PATH
+    build_snapshot(FOOD_DATABASE, out, source_digest())
+    print(f"Wrote {out} ({len(FOOD_DATABASE)} rows, {out.stat().st_size} bytes)")
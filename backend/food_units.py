@@ -0,0 +1,232 @@
+# =============================================================================
+# FOOD UNITS - Structured serving units parsed from catalog names
+# =============================================================================
+# Catalog macros are per serving, and the serving is only described by the
+# trailing note of the display name: "(100g)", "(1 Adet)", "(1 Kase 200g)",
+# "(330ml)", "(2 Dilim ~60g)". The notes are parsed once at import into
+# columns (household unit, unit count, gram weight, volume) plus per-serving
+# and per-gram nutrient matrices, so a whole list of
+# (food_id, quantity, unit) lines is converted in one vectorized pass.
+# =============================================================================
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from food_catalog import FOOD_CATALOG, FOOD_ROW_BY_ID, NUTRIENT_FIELDS, macro_matrix
+from food_search import normalize_text
+
+BULK_NUTRIENTS_MAX_ITEMS = 500
+# Per line, in the line's unit (100 kg when given in grams)
+BULK_NUTRIENTS_MAX_QUANTITY = 100_000
+
+# Generic units accepted for every food (when the serving defines them)
+UNIT_SERVING = "serving"
+UNIT_GRAM = "g"
+UNIT_KILOGRAM = "kg"
+UNIT_MILLILITRE = "ml"
+UNIT_LITRE = "l"
+
+_MODE_SERVING, _MODE_MASS, _MODE_VOLUME, _MODE_HOUSEHOLD = range(4)
+# unit -> (mode, factor to grams / millilitres / servings)
+_GENERIC_UNITS = {
+    UNIT_SERVING: (_MODE_SERVING, 1.0),
+    UNIT_GRAM: (_MODE_MASS, 1.0),
+    UNIT_KILOGRAM: (_MODE_MASS, 1000.0),
+    UNIT_MILLILITRE: (_MODE_VOLUME, 1.0),
+    UNIT_LITRE: (_MODE_VOLUME, 1000.0),
+}
+
+# Household units as they appear in names (normalized), with English aliases
+HOUSEHOLD_UNITS = {
+    "porsiyon": ("portion",),
+    "adet": ("piece",),
+    "kase": ("bowl",),
+    "bardak": ("glass",),
+    "sise": ("bottle",),
+    "kutu": ("can",),
+    "paket": ("pack",),
+    "dilim": ("slice",),
+    "yemek kasigi": ("tbsp", "tablespoon"),
+    "fincan": ("cup",),
+    "parca": ("pieces",),
+    "tabak": ("plate",),
+    "top": ("scoop",),
+    "yaprak": ("sheet",),
+    "dis": ("clove",),
+    "yumurta": ("egg", "eggs"),
+}
+UNIT_ALIASES = {alias: unit for unit, aliases in HOUSEHOLD_UNITS.items() for alias in aliases}
+UNIT_ALIASES.update({"gram": UNIT_GRAM, "grams": UNIT_GRAM, "litre": UNIT_LITRE, "liter": UNIT_LITRE})
+
+_NOTE_RE = re.compile(r"\(([^()]*)\)\s*$")
+_MEASURE_RE = re.compile(r"~?\s*(\d+(?:[.,]\d+)?)\s*(kg|g|ml|l|litre)$", re.IGNORECASE)
+_COUNT_RE = re.compile(r"^(\d+(?:[.,]\d+)?)(?:/(\d+))?\s+(.+)$")
+
+
+def _number(text: str) -> float:
+    return float(text.replace(",", "."))
+
+
+def parse_serving(name: str) -> Dict[str, Any]:
+    """Serving described by the trailing note of a catalog name.
+
+    Returns {"unit", "count", "grams", "ml"}: `unit` is a household unit
+    (see HOUSEHOLD_UNITS), "g", "ml" or "serving" when the note carries no
+    usable amount; `grams`/`ml` are the serving's weight/volume if stated.
+    """
+    serving = {"unit": UNIT_SERVING, "count": 1.0, "grams": None, "ml": None}
+    match = _NOTE_RE.search(name or "")
+    if not match:
+        return serving
+    note = match.group(1).strip()
+
+    measure = _MEASURE_RE.search(note)
+    if measure:
+        amount, kind = _number(measure.group(1)), measure.group(2).lower()
+        if kind in ("g", "kg"):
+            serving["grams"] = amount * 1000 if kind == "kg" else amount
+            serving.update(unit=UNIT_GRAM, count=serving["grams"])
+        else:
+            serving["ml"] = amount if kind == "ml" else amount * 1000
+            serving.update(unit=UNIT_MILLILITRE, count=serving["ml"])
+        note = note[:measure.start()].strip()
+
+    counted = _COUNT_RE.match(note)
+    if counted:
+        unit = normalize_text(counted.group(3)).strip()
+        if unit == "litre":
+            serving["ml"] = serving["ml"] or _number(counted.group(1)) * 1000
+            serving.update(unit=UNIT_MILLILITRE, count=serving["ml"])
+        elif unit in HOUSEHOLD_UNITS:
+            count = _number(counted.group(1))
+            if counted.group(2):
+                count /= int(counted.group(2))
+            serving.update(unit=unit, count=count)
+    return serving
+
+
+class ServingUnitTable:
+    """Columnar serving units and nutrient factors indexed by catalog row."""
+
+    def __init__(self, foods: Sequence[Dict[str, Any]]):
+        self.size = len(foods)
+        self.units: List[str] = []
+        counts, grams, ml = [], [], []
+        for food in foods:
+            serving = parse_serving(food["name"])
+            self.units.append(serving["unit"])
+            counts.append(serving["count"])
+            grams.append(serving["grams"] if serving["grams"] else math.nan)
+            ml.append(serving["ml"] if serving["ml"] else math.nan)
+        self.unit_kinds = sorted(set(self.units))
+        self.unit_codes = np.array([self.unit_kinds.index(u) for u in self.units], dtype=np.int16)
+        self.counts = np.array(counts)
+        self.grams = np.array(grams)
+        self.ml = np.array(ml)
+        # Nutrients per catalog serving and per gram (NaN when the weight is unknown)
+        self.per_serving = macro_matrix(foods)
+        self.per_gram = self.per_serving / self.grams[:, None]
+
+    def serving(self, row: int) -> Dict[str, Any]:
+        """JSON-friendly serving description of a row."""
+        grams, ml = float(self.grams[row]), float(self.ml[row])
+        return {
+            "unit": self.units[row],
+            "count": float(self.counts[row]),
+            "grams": None if math.isnan(grams) else grams,
+            "ml": None if math.isnan(ml) else ml,
+        }
+
+    def compute(
+        self, rows: np.ndarray, quantities: np.ndarray, units: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Nutrients for many (row, quantity, unit) lines at once.
+
+        Returns (nutrients[n, len(NUTRIENT_FIELDS)], servings[n]); lines whose
+        unit does not apply to the food get NaN in both.
+        """
+        code_of = {unit: code for code, unit in enumerate(self.unit_kinds)}
+        modes = np.empty(len(units), dtype=np.int8)
+        scale = np.ones(len(units))
+        household = np.full(len(units), -1, dtype=np.int16)
+        for i, unit in enumerate(units):
+            if unit in _GENERIC_UNITS:
+                modes[i], scale[i] = _GENERIC_UNITS[unit]
+            else:
+                modes[i] = _MODE_HOUSEHOLD
+                household[i] = code_of.get(unit, -1)
+
+        amount = quantities * scale
+        by_mass = modes == _MODE_MASS
+        servings = np.select(
+            [
+                modes == _MODE_SERVING,
+                by_mass,
+                modes == _MODE_VOLUME,
+                (modes == _MODE_HOUSEHOLD) & (household == self.unit_codes[rows]),
+            ],
+            [amount, amount / self.grams[rows], amount / self.ml[rows], amount / self.counts[rows]],
+            default=np.nan,
+        )
+        nutrients = np.where(
+            by_mass[:, None],
+            amount[:, None] * self.per_gram[rows],
+            servings[:, None] * self.per_serving[rows],
+        )
+        return nutrients, servings
+
+
+SERVING_UNITS = ServingUnitTable(FOOD_CATALOG)
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """Canonical unit name for user input ("Adet", "piece", "G" -> "adet", "adet", "g")."""
+    unit = normalize_text(unit or UNIT_SERVING).strip()
+    return UNIT_ALIASES.get(unit, unit)
+
+
+def bulk_nutrients(lines: Sequence[Tuple[str, float, Optional[str]]]) -> Dict[str, Any]:
+    """Nutrients for (food_id, quantity, unit) lines in one vectorized pass.
+
+    Unknown foods and units that do not apply to a food (e.g. grams for
+    "(1 Adet)" rows without a stated weight) are reported per line and left
+    out of the totals.
+    """
+    units = [normalize_unit(unit) for _, _, unit in lines]
+    rows = np.array([FOOD_ROW_BY_ID.get(food_id, -1) for food_id, _, _ in lines], dtype=np.int64)
+    known = rows >= 0
+    quantities = np.array([float(quantity) for _, quantity, _ in lines])
+
+    nutrients = np.full((len(lines), len(NUTRIENT_FIELDS)), np.nan)
+    servings = np.full(len(lines), np.nan)
+    if known.any():
+        index = np.flatnonzero(known)
+        nutrients[index], servings[index] = SERVING_UNITS.compute(
+            rows[index], quantities[index], [units[i] for i in index]
+        )
+
+    items = []
+    for i, (food_id, quantity, _) in enumerate(lines):
+        item: Dict[str, Any] = {"food_id": food_id, "quantity": quantity, "unit": units[i]}
+        if not known[i]:
+            item["error"] = "unknown food_id"
+        elif math.isnan(servings[i]):
+            item["error"] = "unit not available for this food"
+            item["serving"] = SERVING_UNITS.serving(int(rows[i]))
+        else:
+            item["servings"] = round(float(servings[i]), 3)
+            for field, value in zip(NUTRIENT_FIELDS, nutrients[i].tolist()):
+                item[field] = round(value, 1)
+        items.append(item)
+
+    valid = ~np.isnan(servings)
+    totals = nutrients[valid].sum(axis=0) if valid.any() else np.zeros(len(NUTRIENT_FIELDS))
+    return {
+        "items": items,
+        "totals": {field: round(float(v), 1) for field, v in zip(NUTRIENT_FIELDS, totals)},
+    }
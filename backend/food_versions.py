@@ -0,0 +1,152 @@
+# =============================================================================
+# FOOD VERSIONS - Catalog version + per-row change tracking
+# =============================================================================
+# food_catalog_versions.json records, for every food_id, a content hash and
+# the catalog version in which the row was added and last changed, plus
+# [added, removed] versions for removed ids. Clients remember the version
+# they last synced and ask /api/food/database/changes?since=<version> for
+# the delta only.
+#
+# After editing food_database.py, record the new version and commit the
+# manifest together with the data:
+#     python food_versions.py
+#
+# If the manifest is behind the data at startup, the server refuses to
+# start: an unrecorded version would be reused by the next deploy, and
+# clients that synced the first one would never receive the second one.
+# =============================================================================
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from food_snapshot import ROW_FIELDS
+
+MANIFEST_PATH = Path(__file__).parent / "food_catalog_versions.json"
+
+
+def row_hash(food: Dict[str, Any]) -> str:
+    """Stable content hash of a catalog row (field order from ROW_FIELDS)."""
+    data = json.dumps([food.get(f) for f in ROW_FIELDS], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def read_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Stored manifest, or an empty version-0 manifest when none exists yet."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {"version": 0, "rows": {}, "removed": {}}
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path = MANIFEST_PATH) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        fh.write("\n")
+    os.replace(tmp, path)
+
+
+def advance_manifest(manifest: Dict[str, Any], hashes: Dict[str, str]) -> Tuple[Dict[str, Any], bool]:
+    """Apply current row hashes to a manifest.
+
+    Returns (manifest, changed). When anything was added, updated or removed
+    the result carries version + 1; otherwise the input is returned as is.
+    """
+    rows: Dict[str, List[Any]] = manifest.get("rows", {})
+    removed: Dict[str, List[int]] = manifest.get("removed", {})
+    version = int(manifest.get("version", 0)) + 1
+
+    new_rows: Dict[str, List[Any]] = {}
+    changed = False
+    for food_id, digest in hashes.items():
+        entry = rows.get(food_id)
+        if entry is None:
+            new_rows[food_id] = [digest, version, version]
+            changed = True
+        elif entry[0] != digest:
+            new_rows[food_id] = [digest, entry[1], version]
+            changed = True
+        else:
+            new_rows[food_id] = entry
+
+    new_removed = {food_id: v for food_id, v in removed.items() if food_id not in hashes}
+    for food_id, entry in rows.items():
+        if food_id not in hashes:
+            new_removed[food_id] = [entry[1], version]
+            changed = True
+
+    if not changed:
+        return manifest, False
+    return {"version": version, "rows": new_rows, "removed": new_removed}, True
+
+
+class ManifestOutOfDate(RuntimeError):
+    """food_database.py changed without a recorded catalog version."""
+
+
+class CatalogVersions:
+    """In-memory view of the manifest answering "what changed since v"."""
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self.version = int(manifest["version"])
+        self.rows: Dict[str, List[Any]] = manifest["rows"]
+        # (changed in, kind, food_id, added in) sorted; kind: 0 added, 1 updated, 2 removed
+        events = []
+        for food_id, (_, added, changed) in self.rows.items():
+            events.append((changed, 0 if added == changed else 1, food_id, added))
+        for food_id, (added, removed_in) in manifest["removed"].items():
+            events.append((removed_in, 2, food_id, added))
+        events.sort()
+        self._events = events
+        self._event_versions = [e[0] for e in events]
+
+    @classmethod
+    def for_catalog(cls, foods: Sequence[Dict[str, Any]], path: Path = MANIFEST_PATH) -> "CatalogVersions":
+        manifest = read_manifest(path)
+        hashes = {food["food_id"]: row_hash(food) for food in foods}
+        pending, changed = advance_manifest(manifest, hashes)
+        if changed:
+            raise ManifestOutOfDate(
+                f"food_database.py is ahead of {path.name} (version {manifest.get('version', 0)}). "
+                f"Run `python food_versions.py` and commit the manifest as version {pending['version']}."
+            )
+        return cls(manifest)
+
+    def changes_since(self, since: int) -> Tuple[List[str], List[str], List[str]]:
+        """(added, updated, removed) food_ids changed after version `since`.
+
+        A row added and then edited after `since` is reported as added; an id
+        removed after `since` that the client never had is omitted.
+        """
+        added: List[str] = []
+        updated: List[str] = []
+        removed: List[str] = []
+        for _, kind, food_id, added_in in self._events[bisect_right(self._event_versions, since):]:
+            if kind == 2:
+                if added_in <= since:
+                    removed.append(food_id)
+            elif kind == 0 or added_in > since:
+                added.append(food_id)
+            else:
+                updated.append(food_id)
+        return added, updated, removed
+
+
+if __name__ == "__main__":
+    from food_database import FOOD_DATABASE
+
+    manifest, changed = advance_manifest(
+        read_manifest(), {food["food_id"]: row_hash(food) for food in FOOD_DATABASE}
+    )
+    if changed:
+        write_manifest(manifest)
+        print(f"Catalog version {manifest['version']} written to {MANIFEST_PATH.name}")
+    else:
+        print(f"Catalog unchanged at version {manifest['version']}")
@@ -0,0 +1,277 @@
+# =============================================================================
+# HEDGING - Hedged primary/fallback calls with a circuit breaker
+# =============================================================================
+# The fallback model used to start only after the primary had failed, so a
+# slow primary cost the user its full timeout first. Now:
+#
+#   * if the primary has not answered within a hedge delay (the recent p95
+#     primary latency, clamped), the fallback is started too and whichever
+#     succeeds first wins; the other call is cancelled. The hedge is a
+#     second concurrent provider call, so it only starts if it can take a
+#     free admission slot of its own; otherwise the primary is awaited
+#   * if the primary fails outright, the fallback runs (as before)
+#   * a circuit breaker tracks the primary's recent error rate; while it is
+#     open, calls go straight to the fallback, and after a cool-down one
+#     probe call is let through to decide whether to close it again
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How a hedged call was answered
+PATH_PRIMARY = "primary"
+PATH_HEDGED_FALLBACK = "hedged_fallback"
+PATH_FALLBACK_AFTER_ERROR = "fallback_after_error"
+PATH_BREAKER_FALLBACK = "breaker_fallback"
+
+
+class LatencyWindow:
+    """Recent latencies of one call type, for percentile-based hedge delays."""
+
+    def __init__(self, size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class CircuitBreaker:
+    """Error-rate breaker over the last `window` outcomes.
+
+    closed -> open when at least `min_calls` outcomes are recorded and the
+    error rate reaches `error_rate`; open -> half-open after `cooldown`
+    seconds, when one probe call is allowed; the probe's outcome closes or
+    re-opens the breaker.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, window: int = 20, min_calls: int = 10, error_rate: float = 0.5, cooldown: float = 30.0):
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether the protected call may be attempted now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record(self, success: bool) -> None:
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            if success:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                logger.info("Circuit breaker closed after successful probe")
+            else:
+                self._open()
+            return
+        self._outcomes.append(success)
+        if self._state == self.CLOSED and len(self._outcomes) >= self.min_calls:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.error_rate:
+                self._open()
+
+    def release_probe(self) -> None:
+        """A probe ended without an outcome (cancelled); let another one through."""
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        logger.warning(f"Circuit breaker opened ({self._outcomes.count(False)}/{len(self._outcomes)} recent errors)")
+
+    def snapshot(self) -> Dict[str, Any]:
+        failures = self._outcomes.count(False)
+        return {
+            "state": self.state,
+            "recent_calls": len(self._outcomes),
+            "recent_errors": failures,
+            "error_rate": round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+            "times_opened": self.opened,
+        }
+
+
+class HedgedCaller:
+    """Runs primary/fallback coroutine factories with hedging and a breaker."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        hedge_enabled: bool = True,
+        hedge_quantile: float = 0.95,
+        default_delay: float = 8.0,
+        min_delay: float = 2.0,
+        max_delay: float = 20.0,
+        min_samples: int = 20,
+    ):
+        self.breaker = breaker
+        self.hedge_enabled = hedge_enabled
+        self.hedge_quantile = hedge_quantile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.primary_latency = LatencyWindow()
+        self.stats: Dict[str, int] = {
+            "calls": 0,
+            "primary": 0,
+            "fallback_after_error": 0,
+            "breaker_fallback": 0,
+            "hedges_started": 0,
+            "hedges_skipped": 0,
+            "hedge_primary_won": 0,
+            "hedge_fallback_won": 0,
+            "failed": 0,
+        }
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait for the primary before hedging; None disables hedging."""
+        if not self.hedge_enabled:
+            return None
+        if len(self.primary_latency) < self.min_samples:
+            return self.default_delay
+        p = self.primary_latency.percentile(self.hedge_quantile)
+        return min(self.max_delay, max(self.min_delay, p))
+
+    def _primary_done(self, task: asyncio.Future, started: float) -> Optional[BaseException]:
+        """Record a finished primary attempt; returns its exception, if any."""
+        error = task.exception()
+        self.breaker.record(error is None)
+        if error is None:
+            self.primary_latency.add(time.monotonic() - started)
+        return error
+
+    async def call(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        fallback: Callable[[], Awaitable[T]],
+        admission: Any = None,
+    ) -> Tuple[T, str]:
+        """(result, path); raises the fallback's error when both attempts fail.
+
+        The caller's own concurrency slot covers the primary and a fallback
+        that replaces it. A hedge runs alongside the primary, so with
+        `admission` (an AdmissionController) it needs a slot of its own:
+        when none is free the hedge is skipped and the primary awaited.
+        """
+        self.stats["calls"] += 1
+        if not self.breaker.allow():
+            self.stats["breaker_fallback"] += 1
+            return await self._counted(fallback()), PATH_BREAKER_FALLBACK
+
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        fallback_task: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay())
+            if not done and admission is not None and not await admission.try_acquire():
+                self.stats["hedges_skipped"] += 1
+                logger.info("Primary is slow but no admission slot is free, not hedging")
+                done, _ = await asyncio.wait({primary_task})
+            if done:
+                error = self._primary_done(primary_task, started)
+                if error is None:
+                    self.stats["primary"] += 1
+                    return primary_task.result(), PATH_PRIMARY
+                logger.warning(f"Primary call failed ({type(error).__name__}: {error}), using fallback")
+                self.stats["fallback_after_error"] += 1
+                return await self._counted(fallback()), PATH_FALLBACK_AFTER_ERROR
+
+            # Primary is slow: hedge with the fallback, first success wins
+            self.stats["hedges_started"] += 1
+            logger.info(f"Primary slower than {time.monotonic() - started:.1f}s, hedging with fallback")
+            fallback_task = asyncio.ensure_future(fallback() if admission is None else self._holding(admission, fallback))
+            pending = {primary_task, fallback_task}
+            fallback_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is primary_task:
+                        if self._primary_done(task, started) is None:
+                            self.stats["hedge_primary_won"] += 1
+                            return task.result(), PATH_PRIMARY
+                    elif task.exception() is None:
+                        self.stats["hedge_fallback_won"] += 1
+                        if not primary_task.done():
+                            # Censored sample: the primary took at least this long
+                            self.primary_latency.add(time.monotonic() - started)
+                        return task.result(), PATH_HEDGED_FALLBACK
+                    else:
+                        fallback_error = task.exception()
+            self.stats["failed"] += 1
+            raise fallback_error
+        finally:
+            for task in (primary_task, fallback_task):
+                if task is not None and not task.done():
+                    task.cancel()
+            if not primary_task.done() or primary_task.cancelled():
+                self.breaker.release_probe()
+
+    @staticmethod
+    async def _holding(admission: Any, fallback: Callable[[], Awaitable[T]]) -> T:
+        """Run the hedge on its already acquired admission slot, releasing it when done."""
+        started = time.perf_counter()
+        try:
+            return await fallback()
+        finally:
+            admission.release(time.perf_counter() - started)
+
+    async def _counted(self, call: Awaitable[T]) -> T:
+        try:
+            return await call
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+    def snapshot(self) -> Dict[str, Any]:
+        p50 = self.primary_latency.percentile(0.5)
+        p95 = self.primary_latency.percentile(0.95)
+        delay = self.hedge_delay()
+        return {
+            **self.stats,
+            "hedge_enabled": self.hedge_enabled,
+            "hedge_delay_seconds": round(delay, 3) if delay is not None else None,
+            "primary_latency_samples": len(self.primary_latency),
+            "primary_p50_seconds": round(p50, 3) if p50 is not None else None,
+            "primary_p95_seconds": round(p95, 3) if p95 is not None else None,
+            "breaker": self.breaker.snapshot(),
+        }
@@ -0,0 +1,102 @@
+# =============================================================================
+# IMAGE POOL - Bounded worker pool for CPU-heavy image work
+# =============================================================================
+# Decoding a 12 MP JPEG, resizing it and re-encoding takes hundreds of
+# milliseconds. Done inline in an async handler it blocks the event loop,
+# so every other request on the worker waits. Pillow releases the GIL in
+# decode, resample and encode, so a small thread pool runs that work in
+# parallel with the loop without the pickling cost of a process pool.
+#
+# The pool admits at most `max_workers + max_queue` jobs; beyond that
+# `run()` raises ImagePoolBusy immediately instead of letting an upload
+# burst pile up unbounded work (and memory) behind the executor.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ImagePoolBusy(Exception):
+    """Raised when the pool's queue is full."""
+
+
+class ImageWorkPool:
+    """Thread pool with a queue-depth limit and wait/run time counters."""
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 16):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image")
+        self._pending = 0
+        self.stats: Dict[str, float] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "max_pending": 0,
+            "wait_seconds_total": 0.0,
+            "run_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    @property
+    def pending(self) -> int:
+        """Jobs running or waiting for a worker."""
+        return self._pending
+
+    def _timed(self, fn: Callable[..., Any], args: tuple, submitted: float) -> Any:
+        started = time.perf_counter()
+        wait = started - submitted
+        self.stats["wait_seconds_total"] += wait
+        if wait > self.stats["wait_seconds_max"]:
+            self.stats["wait_seconds_max"] = wait
+        try:
+            return fn(*args)
+        finally:
+            self.stats["run_seconds_total"] += time.perf_counter() - started
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(*args)` on a worker thread; ImagePoolBusy if the queue is full."""
+        if self._pending >= self.max_workers + self.max_queue:
+            self.stats["rejected"] += 1
+            raise ImagePoolBusy(f"{self._pending} image jobs pending")
+        self._pending += 1
+        self.stats["submitted"] += 1
+        self.stats["max_pending"] = max(self.stats["max_pending"], self._pending)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, self._timed, fn, args, time.perf_counter())
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self._pending -= 1
+        self.stats["completed"] += 1
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus current depth and averages, for the debug endpoint."""
+        done = self.stats["completed"] + self.stats["failed"]
+        return {
+            **self.stats,
+            "wait_seconds_total": round(self.stats["wait_seconds_total"], 3),
+            "run_seconds_total": round(self.stats["run_seconds_total"], 3),
+            "wait_seconds_max": round(self.stats["wait_seconds_max"], 3),
+            "wait_ms_avg": round(1000 * self.stats["wait_seconds_total"] / done, 1) if done else 0.0,
+            "run_ms_avg": round(1000 * self.stats["run_seconds_total"] / done, 1) if done else 0.0,
+            "pending": self._pending,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
@@ -0,0 +1,129 @@
+# =============================================================================
+# IMAGE RESIZE - Vision upload pipeline sized for the model's detail level
+# =============================================================================
+# The provider downsamples images before the model sees them: "low" detail
+# to fit 512x512, "high" to fit 2048x2048 and then 768 px on the short
+# side. Anything larger is decode time and upload bytes spent for nothing,
+# so uploads go straight to that size:
+#
+#   1. JPEG draft(): libjpeg decodes at 1/2, 1/4 or 1/8 scale in the DCT
+#      domain, so a 12 MP photo is never materialized at full size
+#   2. EXIF orientation is applied (phones store rotated sensor data)
+#   3. one LANCZOS pass from the draft size to the detail target
+#   4. JPEG quality is the highest step whose output fits the byte budget
+#
+# A cheap complexity score of the resized image (edge density and number of
+# coarse colours on a 64 px thumbnail) is returned with it for model routing.
+# =============================================================================
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Tuple
+
+from PIL import Image, ImageFilter, ImageOps, ImageStat
+
+DETAIL_LOW = "low"
+DETAIL_HIGH = "high"
+
+# Provider-side limits per detail level ("auto" is treated as "high")
+LOW_DETAIL_MAX_SIDE = 512
+HIGH_DETAIL_MAX_SIDE = 2048
+HIGH_DETAIL_SHORT_SIDE = 768
+
+# Encoded JPEG budget per detail level, in bytes
+BYTE_BUDGETS = {DETAIL_LOW: 48_000, DETAIL_HIGH: 200_000}
+QUALITY_STEPS = (85, 78, 70, 62, 55, 48, 40)
+
+# Mean FIND_EDGES response and occupied 4x4x4 colour bins of a busy
+# multi-dish photo; complexity saturates at these
+BUSY_EDGE_MEAN = 24.0
+BUSY_COLOR_BINS = 10
+
+
+@dataclass(frozen=True)
+class VisionImage:
+    """Encoded upload plus what it took to produce it."""
+    jpeg: bytes
+    width: int
+    height: int
+    quality: int
+    source_size: Tuple[int, int]
+    decoded_size: Tuple[int, int]
+    complexity: float = 0.0
+
+
+def target_size(width: int, height: int, detail: str = DETAIL_LOW) -> Tuple[int, int]:
+    """Largest size the provider keeps for `detail`, never upscaling."""
+    if detail == DETAIL_LOW:
+        scale = min(1.0, LOW_DETAIL_MAX_SIDE / max(width, height))
+    else:
+        scale = min(1.0, HIGH_DETAIL_MAX_SIDE / max(width, height), HIGH_DETAIL_SHORT_SIDE / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def image_complexity(image: Image.Image) -> float:
+    """0..1 clutter score: edge density (textures, item borders) and coarse colour count (distinct foods)."""
+    thumb = image.copy()
+    thumb.thumbnail((64, 64))
+    edge_map = thumb.convert("L").filter(ImageFilter.FIND_EDGES)
+    # The filter leaves the outer ring unfiltered; drop it
+    edges = ImageStat.Stat(edge_map.crop((1, 1, edge_map.width - 1, edge_map.height - 1))).mean[0]
+    colors = ImageOps.posterize(thumb.convert("RGB"), 2).getcolors(64 * 64) or []
+    # Bins covering at least 1% of the thumbnail; JPEG fringes along borders don't count
+    bins = sum(1 for count, _ in colors if count * 100 >= thumb.width * thumb.height)
+    edge_score = min(1.0, edges / BUSY_EDGE_MEAN)
+    color_score = min(1.0, max(0, bins - 1) / BUSY_COLOR_BINS)
+    return round(0.6 * edge_score + 0.4 * color_score, 3)
+
+
+def encode_within_budget(image: Image.Image, budget: int) -> Tuple[bytes, int]:
+    """(JPEG bytes, quality) at the highest QUALITY_STEPS entry that fits `budget`.
+
+    Encoded size falls monotonically with quality, so after the first
+    (usually sufficient) attempt the remaining steps are bisected.
+    """
+    def encode(quality: int) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+    best = encode(QUALITY_STEPS[0])
+    if len(best) <= budget:
+        return best, QUALITY_STEPS[0]
+    lo, hi = 1, len(QUALITY_STEPS) - 1
+    best, quality = None, QUALITY_STEPS[-1]
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        data = encode(QUALITY_STEPS[mid])
+        if len(data) <= budget:
+            best, quality = data, QUALITY_STEPS[mid]
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    # Nothing fits: send the lowest quality step rather than fail
+    return best if best is not None else encode(QUALITY_STEPS[-1]), quality
+
+
+def resize_for_vision(data: bytes, detail: str = DETAIL_LOW, budget: int = None) -> VisionImage:
+    """Decode `data` at reduced scale and re-encode it for a `detail` vision request.
+
+    Raises PIL.UnidentifiedImageError / OSError for undecodable input.
+    """
+    image = Image.open(io.BytesIO(data))
+    source_size = image.size
+    if image.format == "JPEG":
+        # draft() picks the smallest DCT scale that is still >= the requested size
+        image.draft("RGB", target_size(*source_size, detail))
+    decoded_size = image.size
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    size = target_size(*image.size, detail)
+    if size != image.size:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+    jpeg, quality = encode_within_budget(image, budget or BYTE_BUDGETS.get(detail, BYTE_BUDGETS[DETAIL_HIGH]))
+    return VisionImage(jpeg, image.width, image.height, quality, source_size, decoded_size, image_complexity(image))
@@ -0,0 +1,94 @@
+# =============================================================================
+# JSON STREAM - Incremental extraction of array elements from streamed JSON
+# =============================================================================
+# A streamed completion arrives as JSON text fragments. To push food items
+# to the client while the model is still writing, the fragments are scanned
+# once, character by character (tracking nesting and string/escape state),
+# and every object element of the top-level `items` array is decoded as
+# soon as its closing brace arrives.
+# =============================================================================
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class JsonArrayItems:
+    """Yields complete object elements of a top-level array field from text chunks.
+
+        parser = JsonArrayItems("items")
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self, field: str = "items"):
+        self.field = field
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: Optional[str] = None
+        self._expect_array = False
+        self._in_array = False
+        self._element_start: Optional[int] = None
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Elements completed by `chunk`, in order."""
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        text = self._text
+        found = []
+        i = self._pos
+        while i < len(text):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._key = text[self._string_start + 1:i]
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ":":
+                self._expect_array = self._depth == 1 and self._key == self.field
+            elif ch in "{[":
+                self._depth += 1
+                if ch == "[" and self._depth == 2 and self._expect_array:
+                    self._in_array = True
+                elif ch == "{" and self._depth == 3 and self._in_array:
+                    self._element_start = i
+                self._expect_array = False
+            elif ch in "}]":
+                if ch == "}" and self._depth == 3 and self._element_start is not None:
+                    try:
+                        found.append(json.loads(text[self._element_start:i + 1]))
+                    except ValueError:
+                        pass
+                    self._element_start = None
+                elif ch == "]" and self._depth == 2 and self._in_array:
+                    self._in_array = False
+                    self.done = True
+                self._depth -= 1
+            i += 1
+        self._pos = i
+        # Keep only the unfinished element (or nothing) to bound memory
+        keep = self._element_start if self._element_start is not None else (
+            self._string_start if self._in_string else i
+        )
+        if keep > 0:
+            self._text = text[keep:]
+            self._pos -= keep
+            if self._element_start is not None:
+                self._element_start -= keep
+            self._string_start -= keep
+        return found
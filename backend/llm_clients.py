@@ -0,0 +1,94 @@
+# =============================================================================
+# LLM CLIENTS - Process-wide pooled AsyncOpenAI clients
+# =============================================================================
+# Building an OpenAI client per request opens a fresh connection pool, so
+# every call paid DNS + TCP + TLS setup. Clients are created once per
+# (api key, base_url) with a shared httpx pool (keep-alive, bounded
+# connections) and explicit timeouts, and closed on app shutdown.
+#
+# httpx async pools are bound to the event loop that opened them; a client
+# requested from a different (e.g. test) loop gets a fresh pool.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+import httpx
+import openai
+
+logger = logging.getLogger(__name__)
+
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_READ_TIMEOUT = float(os.getenv("LLM_READ_TIMEOUT", "60"))
+LLM_WRITE_TIMEOUT = float(os.getenv("LLM_WRITE_TIMEOUT", "20"))
+LLM_POOL_TIMEOUT = float(os.getenv("LLM_POOL_TIMEOUT", "10"))
+# Long generations (weekly diet plans) override the read timeout per call
+LLM_LONG_READ_TIMEOUT = float(os.getenv("LLM_LONG_READ_TIMEOUT", "180"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "16"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+
+def llm_timeout(read: float = LLM_READ_TIMEOUT) -> httpx.Timeout:
+    return httpx.Timeout(connect=LLM_CONNECT_TIMEOUT, read=read, write=LLM_WRITE_TIMEOUT, pool=LLM_POOL_TIMEOUT)
+
+
+class LLMClientRegistry:
+    """AsyncOpenAI clients keyed by (api_key, base_url), one pool each."""
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, Optional[str]], Tuple[asyncio.AbstractEventLoop, openai.AsyncOpenAI]] = {}
+
+    def get(self, api_key: str, base_url: Optional[str] = None) -> openai.AsyncOpenAI:
+        """Shared client for this key and endpoint; call from the event loop."""
+        key = (api_key, base_url)
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        http_client = httpx.AsyncClient(
+            timeout=llm_timeout(),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+        )
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=llm_timeout(),
+            max_retries=LLM_MAX_RETRIES,
+            http_client=http_client,
+        )
+        self._clients[key] = (loop, client)
+        logger.info(f"Created pooled LLM client for {base_url or 'api.openai.com'}")
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pool opened on the running loop (app shutdown)."""
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client_loop, client in clients.values():
+            if client_loop is not loop:
+                continue
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Closing LLM client failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+LLM_CLIENTS = LLMClientRegistry()
+
+
+def get_llm_client(api_key: str, base_url: Optional[str] = None) -> openai.AsyncOpenAI:
+    return LLM_CLIENTS.get(api_key, base_url)
@@ -0,0 +1,482 @@
+# =============================================================================
+# LLM USAGE - Token, cost and latency accounting for every LLM call
+# =============================================================================
+# Every logical LLM operation (a hedged vision analysis, a streamed
+# analysis, a diet generation) is recorded with the endpoint and user that
+# triggered it, the path it took (primary / hedged fallback / fallback
+# after error / breaker fallback), wall time, and each attempt inside it:
+# model, outcome, latency, SDK retries, `response.usage` tokens and the
+# estimated cost from a per-model price table.
+#
+# Recording is synchronous and cheap (a dict append + counters). Documents
+# are buffered and written to MongoDB (`llm_usage`, TTL on created_at) in
+# batches by a background task; in-process rollups per endpoint, per user,
+# per model and per prompt variant (A/B tests) back the debug summary
+# without a database round trip. Summaries name users only by a hash of
+# their id.
+# =============================================================================
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from hedging import LatencyWindow
+
+logger = logging.getLogger(__name__)
+
+# USD per 1M tokens: (input, cached input, output). Model names match by
+# longest prefix, so dated snapshots ("gpt-4.1-nano-2025-04-14") are priced.
+DEFAULT_PRICES: Dict[str, Tuple[float, float, float]] = {
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-5-nano": (0.05, 0.005, 0.40),
+    "gpt-5-mini": (0.25, 0.025, 2.00),
+    "gpt-5": (1.25, 0.125, 10.00),
+}
+
+# Overrides / additions as JSON, e.g. LLM_PRICES='{"gpt-4.1-nano": [0.1, 0.025, 0.4]}'
+LLM_PRICES = {k: tuple(v) for k, v in json.loads(os.getenv("LLM_PRICES", "") or "{}").items()}
+LLM_USAGE_TTL_DAYS = int(os.getenv("LLM_USAGE_TTL_DAYS", "90"))
+LLM_USAGE_FLUSH_SECONDS = float(os.getenv("LLM_USAGE_FLUSH_SECONDS", "5"))
+LLM_USAGE_BATCH_SIZE = int(os.getenv("LLM_USAGE_BATCH_SIZE", "200"))
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_CANCELLED = "cancelled"
+
+# (endpoint, user_id) of the request being served
+_REQUEST: ContextVar[Tuple[str, Optional[str]]] = ContextVar("llm_usage_request", default=("unknown", None))
+_OPERATION: ContextVar[Optional["UsageOperation"]] = ContextVar("llm_usage_operation", default=None)
+
+
+def user_tag(user_id: str) -> str:
+    """Stable pseudonym for a user id in usage summaries."""
+    return hashlib.sha256(user_id.encode()).hexdigest()[:12]
+
+
+def set_usage_context(endpoint: str, user_id: Optional[str]) -> None:
+    """Attribute LLM calls made by the current request (task) to this endpoint/user."""
+    _REQUEST.set((endpoint, user_id))
+
+
+def usage_tokens(usage: Any) -> Dict[str, int]:
+    """prompt / completion / cached / reasoning token counts from an SDK usage object."""
+    if usage is None:
+        return {}
+    prompt_details = getattr(usage, "prompt_tokens_details", None)
+    completion_details = getattr(usage, "completion_tokens_details", None)
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        "cached_tokens": getattr(prompt_details, "cached_tokens", 0) or 0,
+        "reasoning_tokens": getattr(completion_details, "reasoning_tokens", 0) or 0,
+    }
+
+
+def _price(prices: Dict[str, Tuple[float, float, float]], model: str) -> Optional[Tuple[float, float, float]]:
+    matches = [name for name in prices if model == name or model.startswith(name + "-")]
+    return prices[max(matches, key=len)] if matches else None
+
+
+class UsageOperation:
+    """One logical LLM operation and the attempts made for it."""
+
+    def __init__(self, name: str, endpoint: str, user_id: Optional[str]):
+        self.name = name
+        self.endpoint = endpoint
+        self.user_id = user_id
+        self.path = "single"
+        self.route: Optional[Dict[str, Any]] = None  # model router decision, if any
+        self.variant: Optional[str] = None  # prompt variant, for A/B comparisons
+        self.attempts: List[Dict[str, Any]] = []
+        self.started = time.perf_counter()
+
+
+class LLMUsageRecorder:
+    """Collects usage records, keeps rollups and writes batches to MongoDB."""
+
+    def __init__(
+        self,
+        collection=None,
+        prices: Optional[Dict[str, Tuple[float, float, float]]] = None,
+        ttl_days: int = 90,
+        flush_interval: float = 5.0,
+        batch_size: int = 200,
+        max_buffer: int = 5000,
+        max_users: int = 5000,
+    ):
+        self.collection = collection
+        self.prices = {**DEFAULT_PRICES, **(prices or {})}
+        self.ttl_days = ttl_days
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.max_users = max_users
+        self._buffer: List[Dict[str, Any]] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self.by_endpoint: Dict[str, Dict[str, Any]] = {}
+        self.by_model: Dict[str, Dict[str, Any]] = {}
+        self.by_user: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.by_variant: Dict[str, Dict[str, Any]] = {}
+        # (monotonic time, cost) of the last hour's operations, for spend budgets
+        self._spend: Deque[Tuple[float, float]] = deque()
+        self.stats: Dict[str, int] = {"operations": 0, "attempts": 0, "written": 0, "dropped": 0, "write_errors": 0}
+
+    # -------------------------
+    # RECORDING
+    # -------------------------
+    def estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> Optional[float]:
+        """Estimated USD cost, or None for a model missing from the price table."""
+        price = _price(self.prices, model)
+        if price is None:
+            return None
+        uncached = max(0, prompt_tokens - cached_tokens)
+        return (uncached * price[0] + cached_tokens * price[1] + completion_tokens * price[2]) / 1_000_000
+
+    def operation(self, name: str) -> UsageOperation:
+        endpoint, user_id = _REQUEST.get()
+        return UsageOperation(name, endpoint, user_id)
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[UsageOperation]:
+        """Record the LLM calls made inside the block (including tasks it spawns) as one operation.
+
+        Set `op.path` to the hedged path when known; the operation is
+        recorded as failed if the block raises, or as cancelled if it is
+        cancelled.
+        """
+        op = self.operation(name)
+        token = _OPERATION.set(op)
+        try:
+            yield op
+        except BaseException as e:
+            _OPERATION.reset(token)
+            cancelled = isinstance(e, (asyncio.CancelledError, GeneratorExit))
+            self.finish(op, OUTCOME_CANCELLED if cancelled else OUTCOME_ERROR)
+            raise
+        _OPERATION.reset(token)
+        self.finish(op, OUTCOME_OK)
+
+    def attempt(
+        self,
+        model: str,
+        role: str,
+        seconds: float,
+        usage: Any = None,
+        outcome: str = OUTCOME_OK,
+        status: Optional[int] = None,
+        retries: Optional[int] = None,
+        op: Optional[UsageOperation] = None,
+        served_model: Optional[str] = None,
+    ) -> None:
+        """Add one completion attempt to `op` (default: the current tracked operation).
+
+        `model` is the requested model name, which the attempt is rolled up
+        under whatever its outcome; `served_model` is the (dated snapshot)
+        name the API answered with. Outside any operation the attempt is
+        recorded as an operation of its own.
+        """
+        tokens = usage_tokens(usage)
+        record = {
+            "model": model,
+            "served_model": served_model,
+            "role": role,
+            "outcome": outcome,
+            "status": status,
+            "ms": round(seconds * 1000),
+            "retries": retries,
+            **tokens,
+            "cost_usd": self.estimate_cost(
+                model, tokens["prompt_tokens"], tokens["completion_tokens"], tokens["cached_tokens"]
+            ) if tokens else None,
+        }
+        self.stats["attempts"] += 1
+        # Cancelled (hedge loser) attempts count as calls but not as errors or latency samples
+        self._add(self._rollup(self.by_model, model), record, seconds, outcome == OUTCOME_ERROR, outcome == OUTCOME_OK)
+
+        target = op or _OPERATION.get()
+        if target is not None:
+            target.attempts.append(record)
+        else:
+            standalone = self.operation(role)
+            standalone.attempts.append(record)
+            self.finish(standalone, OUTCOME_OK if outcome == OUTCOME_OK else OUTCOME_ERROR)
+
+    async def create(self, client, role: str = "primary", **params: Any):
+        """client.chat.completions.create(**params) with an attempt record (non-streaming)."""
+        started = time.perf_counter()
+        try:
+            raw = await client.chat.completions.with_raw_response.create(**params)
+            response = raw.parse()
+        except asyncio.CancelledError:
+            self.attempt(params["model"], role, time.perf_counter() - started, outcome=OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            self.attempt(
+                params["model"], role, time.perf_counter() - started,
+                outcome=OUTCOME_ERROR, status=getattr(e, "status_code", None),
+            )
+            raise
+        self.attempt(
+            params["model"], role, time.perf_counter() - started,
+            usage=response.usage, retries=raw.retries_taken, served_model=getattr(response, "model", None),
+        )
+        return response
+
+    def finish(self, op: UsageOperation, outcome: str) -> None:
+        """Roll up a finished operation and queue its document for MongoDB."""
+        seconds = time.perf_counter() - op.started
+        answered = [a for a in op.attempts if a["outcome"] == OUTCOME_OK]
+        costs = [a["cost_usd"] for a in op.attempts if a["cost_usd"] is not None]
+        doc = {
+            "created_at": datetime.now(timezone.utc),
+            "endpoint": op.endpoint,
+            "user_id": op.user_id,
+            "operation": op.name,
+            "path": op.path,
+            "route": op.route,
+            "variant": op.variant,
+            "outcome": outcome,
+            "model": answered[-1]["model"] if answered else None,
+            "wall_ms": round(seconds * 1000),
+            "prompt_tokens": sum(a.get("prompt_tokens", 0) for a in op.attempts),
+            "completion_tokens": sum(a.get("completion_tokens", 0) for a in op.attempts),
+            "cached_tokens": sum(a.get("cached_tokens", 0) for a in op.attempts),
+            "retries": sum(a["retries"] or 0 for a in op.attempts),
+            "cost_usd": round(sum(costs), 8) if costs else None,
+            "attempts": list(op.attempts),
+        }
+        self.stats["operations"] += 1
+        if costs:
+            now = time.monotonic()
+            self._spend.append((now, doc["cost_usd"]))
+            while now - self._spend[0][0] > 3600:
+                self._spend.popleft()
+        # Cancelled operations (client gone) count as calls but not as errors or latency samples
+        failed, timed = outcome == OUTCOME_ERROR, outcome == OUTCOME_OK
+        self._add(self._rollup(self.by_endpoint, op.endpoint), doc, seconds, failed, timed)
+        if op.user_id:
+            self._add(self._user_rollup(op.user_id), doc, seconds, failed, timed)
+        if op.variant:
+            self._add(self._rollup(self.by_variant, op.variant), doc, seconds, failed, timed)
+
+        if self.collection is None:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self.stats["dropped"] += 1
+            return
+        self._buffer.append(doc)
+        if len(self._buffer) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    # -------------------------
+    # ROLLUPS
+    # -------------------------
+    @staticmethod
+    def _rollup(table: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+        rollup = table.get(key)
+        if rollup is None:
+            rollup = table[key] = {
+                "calls": 0,
+                "errors": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cached_tokens": 0,
+                "cost_usd": 0.0,
+                "latency": LatencyWindow(),
+                "recent": deque(maxlen=200),  # recent outcomes, True = failed
+            }
+        return rollup
+
+    def _user_rollup(self, user_id: str) -> Dict[str, Any]:
+        rollup = self._rollup(self.by_user, user_id)
+        self.by_user.move_to_end(user_id)
+        while len(self.by_user) > self.max_users:
+            self.by_user.popitem(last=False)
+        return rollup
+
+    @staticmethod
+    def _add(rollup: Dict[str, Any], record: Dict[str, Any], seconds: float, failed: bool, timed: bool = True) -> None:
+        rollup["calls"] += 1
+        rollup["errors"] += failed
+        for field in ("prompt_tokens", "completion_tokens", "cached_tokens"):
+            rollup[field] += record.get(field, 0)
+        rollup["cost_usd"] += record.get("cost_usd") or 0.0
+        if timed or failed:
+            rollup["recent"].append(failed)
+        if timed and not failed:
+            rollup["latency"].add(seconds)
+
+    @staticmethod
+    def _public(rollup: Dict[str, Any]) -> Dict[str, Any]:
+        latency, recent = rollup["latency"], rollup["recent"]
+        p50, p95 = latency.percentile(0.5), latency.percentile(0.95)
+        return {
+            **{k: v for k, v in rollup.items() if k not in ("latency", "recent")},
+            "cost_usd": round(rollup["cost_usd"], 6),
+            "error_rate": round(rollup["errors"] / rollup["calls"], 3) if rollup["calls"] else 0.0,
+            "avg_prompt_tokens": round(rollup["prompt_tokens"] / rollup["calls"], 1) if rollup["calls"] else 0.0,
+            "avg_completion_tokens": round(rollup["completion_tokens"] / rollup["calls"], 1) if rollup["calls"] else 0.0,
+            "recent_calls": len(recent),
+            "recent_error_rate": round(sum(recent) / len(recent), 3) if recent else 0.0,
+            "p50_ms": round(p50 * 1000) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000) if p95 is not None else None,
+        }
+
+    def model_stats(self, model: str) -> Optional[Dict[str, Any]]:
+        """Recent p50/p95 latency, error rate and spend of one model's attempts."""
+        rollup = self.by_model.get(model)
+        return self._public(rollup) if rollup is not None else None
+
+    def recent_spend(self, seconds: float = 3600) -> float:
+        """Estimated USD spent by operations finished in the last `seconds` (at most an hour)."""
+        now = time.monotonic()
+        while self._spend and now - self._spend[0][0] > 3600:
+            self._spend.popleft()
+        return sum(cost for at, cost in self._spend if now - at <= seconds)
+
+    # -------------------------
+    # BATCHED WRITES
+    # -------------------------
+    async def ensure_indexes(self) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.create_index("created_at", expireAfterSeconds=self.ttl_days * 86400)
+            await self.collection.create_index([("user_id", 1), ("created_at", -1)])
+            await self.collection.create_index([("endpoint", 1), ("created_at", -1)])
+        except Exception as e:
+            logger.warning(f"LLM usage index creation failed: {e}")
+
+    def start(self) -> None:
+        """Start the background writer on the running loop (no-op without MongoDB)."""
+        if self.collection is None or (self._flusher is not None and not self._flusher.done()):
+            return
+        self._wake = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self.collection is None:
+            return
+        while self._buffer:
+            batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                self.stats["written"] += len(batch)
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                logger.warning(f"Writing {len(batch)} LLM usage records failed: {e}")
+                # Keep them for the next round, within the buffer limit
+                room = self.max_buffer - len(self._buffer)
+                self.stats["dropped"] += max(0, len(batch) - room)
+                self._buffer = batch[:max(0, room)] + self._buffer
+                return
+
+    # -------------------------
+    # SUMMARIES
+    # -------------------------
+    def snapshot(self, top_users: int = 20) -> Dict[str, Any]:
+        """Rollups since process start; users are the top spenders."""
+        users = sorted(self.by_user.items(), key=lambda item: item[1]["cost_usd"], reverse=True)[:top_users]
+        return {
+            **self.stats,
+            "buffered": len(self._buffer),
+            "mongo": self.collection is not None,
+            "by_endpoint": {k: self._public(v) for k, v in self.by_endpoint.items()},
+            "by_model": {k: self._public(v) for k, v in self.by_model.items()},
+            "by_variant": {k: self._public(v) for k, v in self.by_variant.items()},
+            "top_users": {user_tag(k): self._public(v) for k, v in users},
+        }
+
+    async def stored_summary(self, hours: float = 24, top_users: int = 20) -> Optional[Dict[str, Any]]:
+        """Rollups over the stored records of the last `hours` (None without MongoDB)."""
+        if self.collection is None:
+            return None
+        group = {
+            "calls": {"$sum": 1},
+            "errors": {"$sum": {"$cond": [{"$eq": ["$outcome", OUTCOME_ERROR]}, 1, 0]}},
+            "prompt_tokens": {"$sum": "$prompt_tokens"},
+            "completion_tokens": {"$sum": "$completion_tokens"},
+            "cached_tokens": {"$sum": "$cached_tokens"},
+            "cost_usd": {"$sum": "$cost_usd"},
+            "avg_prompt_tokens": {"$avg": "$prompt_tokens"},
+            "avg_completion_tokens": {"$avg": "$completion_tokens"},
+            "avg_wall_ms": {"$avg": "$wall_ms"},
+        }
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        pipeline = [
+            {"$match": {"created_at": {"$gte": since}}},
+            {"$facet": {
+                "total": [{"$group": {"_id": None, **group}}],
+                "by_endpoint": [{"$group": {"_id": "$endpoint", **group}}, {"$sort": {"cost_usd": -1}}],
+                "by_path": [{"$group": {"_id": "$path", **group}}],
+                "by_route": [{"$group": {"_id": "$route.reason", **group}}],
+                "by_variant": [{"$match": {"variant": {"$ne": None}}}, {"$group": {"_id": "$variant", **group}}],
+                "top_users": [
+                    {"$match": {"user_id": {"$ne": None}}},
+                    {"$group": {"_id": "$user_id", **group}},
+                    {"$sort": {"cost_usd": -1}},
+                    {"$limit": top_users},
+                ],
+            }},
+        ]
+        try:
+            facets = (await self.collection.aggregate(pipeline).to_list(1))[0]
+        except Exception as e:
+            logger.warning(f"LLM usage summary failed: {e}")
+            return {"error": str(e)}
+
+        def rows(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+            return {str(row.pop("_id")): row for row in items}
+
+        total = facets["total"][0] if facets["total"] else {}
+        total.pop("_id", None)
+        return {
+            "hours": hours,
+            "total": total,
+            "by_endpoint": rows(facets["by_endpoint"]),
+            "by_path": rows(facets["by_path"]),
+            "by_route": rows(facets["by_route"]),
+            "by_variant": rows(facets["by_variant"]),
+            "top_users": {user_tag(k): v for k, v in rows(facets["top_users"]).items()},
+        }
+
+
+# Process-wide recorder; server.py attaches the MongoDB collection and
+# starts the writer on startup.
+LLM_USAGE = LLMUsageRecorder(
+    prices=LLM_PRICES,
+    ttl_days=LLM_USAGE_TTL_DAYS,
+    flush_interval=LLM_USAGE_FLUSH_SECONDS,
+    batch_size=LLM_USAGE_BATCH_SIZE,
+)
@@ -0,0 +1,215 @@
+# =============================================================================
+# MEAL MEMORY - Per-user corrected analyses keyed by perceptual image hash
+# =============================================================================
+# Users photograph the same meals over and over (the daily breakfast), and
+# every photo used to go to the vision model. When a user saves an analyzed
+# meal via /food/add-meal (confirmed or edited), the photo's dHash and the
+# saved items are remembered for that user. A later upload whose dHash is
+# within a small Hamming distance of a remembered photo gets the stored,
+# user-corrected result back immediately, without a model call.
+#
+# Each user keeps at most `max_per_user` meals (least recently used are
+# evicted). Entries live in MongoDB (`meal_memory`) when available and are
+# mirrored in a per-user in-process map, reloaded every `refresh_seconds`
+# so that meals saved through another worker show up. Each entry keeps the
+# id of the meal that last stored it: deleting that meal forgets the entry,
+# and deleting the account forgets all of the user's entries.
+# =============================================================================
+
+from __future__ import annotations
+
+import copy
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_INT64 = 1 << 63
+
+
+def _to_int64(value: int) -> int:
+    # MongoDB integers are signed 64-bit
+    return value - (1 << 64) if value >= _INT64 else value
+
+
+def _from_int64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class MealMemory:
+    """Per-user LRU of (dHash -> corrected analysis result)."""
+
+    def __init__(
+        self,
+        max_per_user: int = 50,
+        max_distance: int = 4,
+        max_users: int = 10000,
+        refresh_seconds: float = 60.0,
+        collection=None,
+    ):
+        self.max_per_user = max_per_user
+        self.max_distance = max_distance
+        self.max_users = max_users
+        self.refresh_seconds = refresh_seconds
+        self.collection = collection
+        # user_id -> (loaded_at, entry_id -> entry), both least recently used first
+        self._users: "OrderedDict[str, Tuple[float, OrderedDict[str, Dict[str, Any]]]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stored": 0, "updated": 0, "evicted": 0, "errors": 0}
+
+    # -------------------------
+    # STORAGE
+    # -------------------------
+    async def ensure_indexes(self) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.create_index([("user_id", 1), ("last_used_at", -1)])
+            await self.collection.create_index([("user_id", 1), ("meal_id", 1)])
+        except Exception as e:
+            logger.warning(f"Meal memory index creation failed: {e}")
+
+    async def _entries(self, user_id: str) -> "OrderedDict[str, Dict[str, Any]]":
+        cached = self._users.get(user_id)
+        if cached is not None and (self.collection is None or time.monotonic() - cached[0] < self.refresh_seconds):
+            self._users.move_to_end(user_id)
+            return cached[1]
+
+        entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        if self.collection is not None:
+            try:
+                cursor = self.collection.find({"user_id": user_id}).sort("last_used_at", -1).limit(self.max_per_user)
+                docs = await cursor.to_list(length=self.max_per_user)
+                for doc in reversed(docs):
+                    doc["dhash"] = _from_int64(doc["dhash"])
+                    entries[doc["_id"]] = doc
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Meal memory load failed: {e}")
+                if cached is not None:
+                    return cached[1]
+        elif cached is not None:
+            entries = cached[1]
+        self._users[user_id] = (time.monotonic(), entries)
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return entries
+
+    def _nearest(self, entries: "OrderedDict[str, Dict[str, Any]]", dhash: int) -> Optional[Dict[str, Any]]:
+        best, best_distance = None, self.max_distance + 1
+        for entry in entries.values():
+            distance = (entry["dhash"] ^ dhash).bit_count()
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        return best
+
+    async def _write(self, entry: Dict[str, Any]) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.replace_one(
+                {"_id": entry["_id"]}, {**entry, "dhash": _to_int64(entry["dhash"])}, upsert=True
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Meal memory store failed: {e}")
+
+    # -------------------------
+    # PUBLIC API
+    # -------------------------
+    async def recall(self, user_id: str, dhash: Optional[int]) -> Optional[Dict[str, Any]]:
+        """The user's stored result for a perceptually matching photo, or None."""
+        if dhash is None or self.max_distance < 0:
+            return None
+        entries = await self._entries(user_id)
+        entry = self._nearest(entries, dhash)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        entries.move_to_end(entry["_id"])
+        entry["last_used_at"] = datetime.now(timezone.utc)
+        entry["hits"] = entry.get("hits", 0) + 1
+        if self.collection is not None:
+            try:
+                await self.collection.update_one(
+                    {"_id": entry["_id"]},
+                    {"$set": {"last_used_at": entry["last_used_at"]}, "$inc": {"hits": 1}},
+                )
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Meal memory update failed: {e}")
+        return copy.deepcopy(entry["result"])
+
+    async def remember(
+        self, user_id: str, dhash: int, result: Dict[str, Any], name: str = "", meal_id: Optional[str] = None
+    ) -> None:
+        """Store the user's confirmed result; replaces the entry of a matching photo."""
+        entries = await self._entries(user_id)
+        now = datetime.now(timezone.utc)
+        entry = self._nearest(entries, dhash) if self.max_distance >= 0 else None
+        if entry is not None:
+            # Re-saved (possibly re-edited) meal: the latest correction wins
+            entry.update(dhash=dhash, result=copy.deepcopy(result), name=name, meal_id=meal_id, last_used_at=now)
+            entries.move_to_end(entry["_id"])
+            self.stats["updated"] += 1
+        else:
+            entry = {
+                "_id": f"mm_{uuid.uuid4().hex[:16]}",
+                "user_id": user_id,
+                "meal_id": meal_id,
+                "dhash": dhash,
+                "name": name,
+                "result": copy.deepcopy(result),
+                "hits": 0,
+                "created_at": now,
+                "last_used_at": now,
+            }
+            entries[entry["_id"]] = entry
+            self.stats["stored"] += 1
+        await self._write(entry)
+
+        while len(entries) > self.max_per_user:
+            entry_id, _ = entries.popitem(last=False)
+            self.stats["evicted"] += 1
+            if self.collection is not None:
+                try:
+                    await self.collection.delete_one({"_id": entry_id})
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"Meal memory eviction failed: {e}")
+
+    async def forget_meal(self, user_id: str, meal_id: str) -> None:
+        """Drop the entry stored by a meal the user deleted."""
+        cached = self._users.get(user_id)
+        if cached is not None:
+            for entry_id in [k for k, entry in cached[1].items() if entry.get("meal_id") == meal_id]:
+                del cached[1][entry_id]
+        if self.collection is not None:
+            try:
+                await self.collection.delete_many({"user_id": user_id, "meal_id": meal_id})
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Meal memory delete failed: {e}")
+
+    async def forget_user(self, user_id: str) -> None:
+        """Drop all of a user's entries (account deletion); storage errors propagate."""
+        self._users.pop(user_id, None)
+        if self.collection is not None:
+            await self.collection.delete_many({"user_id": user_id})
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "users_loaded": len(self._users),
+            "max_per_user": self.max_per_user,
+            "max_distance": self.max_distance,
+            "mongo": self.collection is not None,
+        }
@@ -0,0 +1,140 @@
+# =============================================================================
+# MODEL ROUTER - Per-request vision model and detail selection
+# =============================================================================
+# Every analysis used to go to the same primary model at the same detail,
+# whether the photo was a single apple or a crowded mezze table. The router
+# picks, per request:
+#
+#   * the cheap model for simple plates (low image complexity, see
+#     image_resize.image_complexity) and the strong model only for busy ones;
+#     premium users switch to the strong model at a lower complexity
+#   * high detail only for very busy photos routed to the strong model
+#   * the cheap model for everyone but premium users while the estimated
+#     spend of the last hour is over the budget
+#   * the other model when the chosen one is degraded (recent p95 latency or
+#     error rate over the limits) and the other one is not
+#
+# The model the router did not pick is the hedge/fallback model for the call.
+# Decisions are counted per model and reason and recorded on the usage docs.
+# =============================================================================
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+# Why a model was picked
+REASON_STATIC = "static"
+REASON_SIMPLE = "simple"
+REASON_COMPLEX = "complex"
+REASON_OVER_BUDGET = "over_budget"
+REASON_DEGRADED = "degraded"
+
+COMPLEXITY_BUCKETS = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+ModelStats = Callable[[str], Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class Route:
+    model: str
+    fallback: str
+    detail: str
+    reason: str
+    complexity: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ModelRouter:
+    """Cheap/strong model choice from image complexity, user tier, budget and live model health."""
+
+    def __init__(
+        self,
+        cheap_model: str,
+        strong_model: str,
+        model_stats: ModelStats,
+        spend: Callable[[], float],
+        complexity_threshold: float = 0.55,
+        premium_threshold: float = 0.35,
+        high_detail_threshold: float = 0.8,
+        default_detail: str = "low",
+        strong_detail: str = "high",
+        budget_usd_per_hour: float = 0.0,
+        max_p95_seconds: float = 12.0,
+        max_error_rate: float = 0.3,
+        min_samples: int = 20,
+        enabled: bool = True,
+    ):
+        self.cheap_model = cheap_model
+        self.strong_model = strong_model
+        self.model_stats = model_stats
+        self.spend = spend
+        self.complexity_threshold = complexity_threshold
+        self.premium_threshold = premium_threshold
+        self.high_detail_threshold = high_detail_threshold
+        self.default_detail = default_detail
+        self.strong_detail = strong_detail
+        self.budget_usd_per_hour = budget_usd_per_hour
+        self.max_p95_seconds = max_p95_seconds
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.enabled = enabled
+        self.decisions: Counter = Counter()
+        self.complexity: Counter = Counter()
+        self.details: Counter = Counter()
+
+    def healthy(self, model: str) -> bool:
+        """False when the model's recent error rate or p95 latency is over the limits."""
+        stats = self.model_stats(model)
+        if not stats or stats["recent_calls"] < self.min_samples:
+            return True
+        if stats["recent_error_rate"] > self.max_error_rate:
+            return False
+        return stats["p95_ms"] is None or stats["p95_ms"] <= self.max_p95_seconds * 1000
+
+    def over_budget(self) -> bool:
+        return self.budget_usd_per_hour > 0 and self.spend() >= self.budget_usd_per_hour
+
+    def route(self, complexity: float = 0.0, is_premium: bool = False) -> Route:
+        if not self.enabled:
+            route = Route(self.cheap_model, self.strong_model, self.default_detail, REASON_STATIC, complexity)
+        else:
+            threshold = self.premium_threshold if is_premium else self.complexity_threshold
+            strong, reason = complexity >= threshold, REASON_SIMPLE
+            if strong:
+                reason = REASON_COMPLEX
+                if not is_premium and self.over_budget():
+                    strong, reason = False, REASON_OVER_BUDGET
+            model, other = (self.strong_model, self.cheap_model) if strong else (self.cheap_model, self.strong_model)
+            if other != model and not self.healthy(model) and self.healthy(other):
+                model, other, reason = other, model, REASON_DEGRADED
+            detail = self.default_detail
+            if model == self.strong_model and complexity >= self.high_detail_threshold and reason == REASON_COMPLEX:
+                detail = self.strong_detail
+            route = Route(model, other, detail, reason, complexity)
+
+        self.decisions[f"{route.model}:{route.reason}"] += 1
+        self.details[route.detail] += 1
+        bucket = next(b for b in COMPLEXITY_BUCKETS if complexity <= b or b == COMPLEXITY_BUCKETS[-1])
+        self.complexity[f"<={bucket}"] += 1
+        return route
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "cheap_model": self.cheap_model,
+            "strong_model": self.strong_model,
+            "complexity_threshold": self.complexity_threshold,
+            "premium_threshold": self.premium_threshold,
+            "high_detail_threshold": self.high_detail_threshold,
+            "budget_usd_per_hour": self.budget_usd_per_hour,
+            "spend_last_hour_usd": round(self.spend(), 6),
+            "over_budget": self.over_budget(),
+            "healthy": {m: self.healthy(m) for m in {self.cheap_model, self.strong_model}},
+            "decisions": dict(self.decisions),
+            "details": dict(self.details),
+            "complexity": dict(self.complexity),
+        }
@@ -12,13 +12,16 @@ from typing import Optional, Dict, Any, List
 from urllib.parse import urlencode, quote, unquote
 from collections import defaultdict
 import time
+import asyncio
 
 import httpx
 from dotenv import load_dotenv
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Form, Query, status
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse, Response
+from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartParser, MultiPartException
 from pydantic import BaseModel, Field, field_validator, validator
 import re
 import json
@@ -97,14 +100,6 @@ else:
     logger.warning("⚠️ MONGO_URL not set - API write operations will fail!")
     logger.warning("⚠️ Set MONGO_URL environment variable to enable data persistence")
 
-# Optional Emergent integrations (shim exists in repo; still safe-guard)
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage, ImageContent  # type: ignore
-except Exception:
-    LlmChat = None
-    UserMessage = None
-    ImageContent = None
-
 EMERGENT_LLM_KEY = os.getenv("EMERGENT_LLM_KEY", "").strip()
 
 app = FastAPI()
@@ -199,6 +194,13 @@ async def startup_event():
   else:
     logger.warning("Using in-memory storage - data will be lost on restart!")
   
+  await ANALYSIS_CACHE.ensure_indexes()
+  await MEAL_MEMORY.ensure_indexes()
+  await ANALYSIS_JOBS.ensure_indexes()
+  ANALYSIS_JOBS.start()
+  await LLM_USAGE.ensure_indexes()
+  LLM_USAGE.start()
+  
   # Run cleanup for expired users (in background)
   try:
     deleted = await cleanup_expired_users()
@@ -785,6 +787,8 @@ async def store_delete_user_data(user_id: str):
     await mongo_db.steps.delete_many({"user_id": user_id})
     await mongo_db.vitamins.delete_many({"user_id": user_id})
     await mongo_db.user_sessions.delete_many({"user_id": user_id})
+    # meal_memory collection and this worker's in-process copy
+    await MEAL_MEMORY.forget_user(user_id)
     # Delete user
     await mongo_db.users.delete_one({"user_id": user_id})
     logger.info(f"Permanently deleted all data for user {user_id}")
@@ -1443,15 +1447,168 @@ async def calculate_diet_goals(request: dict, current_user: Optional[User] = Dep
 # -------------------------
 # FOOD DB (external file)
 # -------------------------
-from food_database import FOOD_DATABASE
+from food_catalog import get_catalog_payload, get_changes_payload, etag_matches, encoded_etag, filter_foods, SORTABLE_FIELDS, CATALOG_VERSION
+from food_search import search_foods, autocomplete_foods, AUTOCOMPLETE_TOP_K
+from food_similar import similar_foods, SIMILAR_MAX_K
+from food_match import link_catalog_food
+from food_units import bulk_nutrients, BULK_NUTRIENTS_MAX_ITEMS, BULK_NUTRIENTS_MAX_QUANTITY
+
+# Catalog only changes on deploy; clients revalidate cheaply with If-None-Match
+FOOD_DB_CACHE_MAX_AGE = int(os.getenv("FOOD_DB_CACHE_MAX_AGE", "3600"))
+FOOD_DB_CACHE_CONTROL = f"private, max-age={FOOD_DB_CACHE_MAX_AGE}, must-revalidate"
 
 @api_router.get("/food/database")
-async def get_food_database(lang: str = "tr", current_user: Optional[User] = Depends(get_current_user)):
+async def get_food_database(request: Request, lang: str = "tr", current_user: Optional[User] = Depends(get_current_user)):
+  """Full catalog for `lang`, served from precomputed bytes with ETag revalidation."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+
+  return _catalog_response(request, get_catalog_payload(lang))
+
+
+@api_router.get("/food/database/changes")
+async def get_food_database_changes(
+  request: Request,
+  since: int = Query(...),
+  lang: str = "tr",
+  current_user: Optional[User] = Depends(get_current_user)
+):
+  """Catalog delta since version `since`: {version, reset, added, updated, removed}."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+
+  return _catalog_response(request, get_changes_payload(since, lang))
+
+
+def _catalog_response(request: Request, payload) -> Response:
+  """Precomputed catalog payload with ETag/304 and content negotiation."""
+  body, encoding = payload.encoded_for(request.headers.get("accept-encoding"))
+  headers = {
+    # Each content-coding is its own representation with its own ETag
+    "ETag": encoded_etag(payload.etag, encoding),
+    "Cache-Control": FOOD_DB_CACHE_CONTROL,
+    "Vary": "Accept-Encoding",
+    "X-Catalog-Version": str(CATALOG_VERSION),
+  }
+  if etag_matches(request.headers.get("if-none-match"), payload.etag):
+    return Response(status_code=304, headers=headers)
+
+  if encoding:
+    headers["Content-Encoding"] = encoding
+  return Response(content=body, media_type="application/json", headers=headers)
+
+
+@api_router.get("/food/search")
+async def search_food(
+  q: str = Query(..., min_length=1, max_length=100),
+  lang: str = "tr",
+  limit: int = Query(20, ge=1, le=100),
+  current_user: Optional[User] = Depends(get_current_user)
+):
+  """Ranked catalog search over name/name_en (Turkish case and diacritic insensitive)."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+  results = search_foods(q, lang=lang, limit=limit)
+  return {"query": q, "lang": lang, "count": len(results), "results": results}
+
+
+@api_router.get("/food/autocomplete")
+async def autocomplete_food(
+  prefix: str = Query(..., min_length=1, max_length=100),
+  lang: str = "tr",
+  limit: int = Query(AUTOCOMPLETE_TOP_K, ge=1, le=AUTOCOMPLETE_TOP_K),
+  current_user: Optional[User] = Depends(get_current_user)
+):
+  """Type-ahead suggestions from the per-locale prefix index."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+  results = autocomplete_foods(prefix, lang=lang, limit=limit)
+  return {"prefix": prefix, "lang": lang, "results": results}
+
+
+@api_router.get("/food/filter")
+async def filter_food(
+  min_calories: Optional[float] = None,
+  max_calories: Optional[float] = None,
+  min_protein: Optional[float] = None,
+  max_protein: Optional[float] = None,
+  min_carbs: Optional[float] = None,
+  max_carbs: Optional[float] = None,
+  min_fat: Optional[float] = None,
+  max_fat: Optional[float] = None,
+  sort: Optional[str] = Query(None, description="calories, protein, carbs, fat or protein_density"),
+  order: str = Query("asc", pattern="^(asc|desc)$"),
+  offset: int = Query(0, ge=0),
+  limit: int = Query(50, ge=1, le=200),
+  lang: str = "tr",
+  current_user: Optional[User] = Depends(get_current_user)
+):
+  """Macro range filter with sorting and pagination over the columnar nutrient table."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+  if sort is not None and sort not in SORTABLE_FIELDS:
+    raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SORTABLE_FIELDS)}")
+
+  ranges = {
+    "calories": (min_calories, max_calories),
+    "protein": (min_protein, max_protein),
+    "carbs": (min_carbs, max_carbs),
+    "fat": (min_fat, max_fat),
+  }
+  ranges = {field: bounds for field, bounds in ranges.items() if bounds != (None, None)}
+  total, results = filter_foods(ranges, sort=sort, descending=order == "desc", offset=offset, limit=limit, lang=lang)
+  return {"total": total, "offset": offset, "limit": limit, "results": results}
+
+
+@api_router.get("/food/{food_id}/similar")
+async def get_similar_foods(
+  food_id: str,
+  k: int = Query(10, ge=1, le=SIMILAR_MAX_K),
+  min_calories: Optional[float] = None,
+  max_calories: Optional[float] = None,
+  min_protein: Optional[float] = None,
+  max_protein: Optional[float] = None,
+  min_carbs: Optional[float] = None,
+  max_carbs: Optional[float] = None,
+  min_fat: Optional[float] = None,
+  max_fat: Optional[float] = None,
+  lang: str = "tr",
+  current_user: Optional[User] = Depends(get_current_user)
+):
+  """Catalog foods with the closest macro profile, optionally within macro ranges (e.g. a calorie cap)."""
+  if not current_user:
+    raise HTTPException(status_code=401, detail="Not authenticated")
+
+  ranges = {
+    "calories": (min_calories, max_calories),
+    "protein": (min_protein, max_protein),
+    "carbs": (min_carbs, max_carbs),
+    "fat": (min_fat, max_fat),
+  }
+  ranges = {field: bounds for field, bounds in ranges.items() if bounds != (None, None)}
+  results = similar_foods(food_id, k=k, ranges=ranges, lang=lang)
+  if results is None:
+    raise HTTPException(status_code=404, detail="Food not found")
+  return {"food_id": food_id, "count": len(results), "results": results}
+
+
+class NutrientLine(BaseModel):
+  food_id: str
+  # inf / nan would pass gt=0 and break JSON encoding of the response
+  quantity: float = Field(1, gt=0, le=BULK_NUTRIENTS_MAX_QUANTITY, allow_inf_nan=False)
+  unit: Optional[str] = None  # serving (default), g, kg, ml, l or the food's own unit (adet, kase, ...)
+
+
+class BulkNutrientsRequest(BaseModel):
+  items: List[NutrientLine] = Field(..., min_length=1, max_length=BULK_NUTRIENTS_MAX_ITEMS)
+
+
+@api_router.post("/food/nutrients")
+async def compute_food_nutrients(request_data: BulkNutrientsRequest, current_user: Optional[User] = Depends(get_current_user)):
+  """Nutrients for many (food_id, quantity, unit) lines in one call, using the parsed serving units."""
   if not current_user:
     raise HTTPException(status_code=401, detail="Not authenticated")
-  if lang == "en":
-    return [{"food_id": f["food_id"], "name": f["name_en"], "calories": f["calories"], "protein": f["protein"], "carbs": f["carbs"], "fat": f["fat"]} for f in FOOD_DATABASE]
-  return [{"food_id": f["food_id"], "name": f["name"], "calories": f["calories"], "protein": f["protein"], "carbs": f["carbs"], "fat": f["fat"]} for f in FOOD_DATABASE]
+  return bulk_nutrients([(line.food_id, line.quantity, line.unit) for line in request_data.items])
 
 
 # -------------------------
@@ -1465,6 +1622,10 @@ class AddMealRequest(BaseModel):
   fat: float
   image_base64: Optional[str] = None
   meal_type: str = "snack"  # breakfast, lunch, dinner, snack
+  # From /food/analyze: the photo's image_hash and the (possibly edited) items
+  # the user confirmed; remembered so the next photo of this meal skips the model
+  image_hash: Optional[str] = None
+  items: Optional[List[Dict[str, Any]]] = None
 
 
 async def get_user_meals(user_id: str, date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -1502,6 +1663,7 @@ async def add_meal(meal: AddMealRequest, current_user: Optional[User] = Depends(
   }
   
   await add_user_meal(current_user.user_id, meal_doc)
+  await remember_meal(current_user.user_id, meal, meal_doc["meal_id"])
   return {"message": "Meal added", "meal_id": meal_doc["meal_id"]}
 
 
@@ -1557,10 +1719,20 @@ async def delete_meal(meal_id: str, current_user: Optional[User] = Depends(get_c
     if len(memory_meals) == original_len:
       raise HTTPException(status_code=404, detail="Meal not found")
   
+  # A deleted meal must not keep answering photos
+  await MEAL_MEMORY.forget_meal(current_user.user_id, meal_id)
   return {"message": "Meal deleted", "meal_id": meal_id}
 import openai
 from PIL import Image
 import io
+from llm_clients import LLM_CLIENTS, LLM_LONG_READ_TIMEOUT, get_llm_client, llm_timeout
+
+# LLM usage accounting: tokens, estimated cost, latency and hedging path of
+# every model call, per endpoint and user. Records are batched into the
+# `llm_usage` collection (TTL LLM_USAGE_TTL_DAYS); see /debug/llm-usage.
+from llm_usage import LLM_USAGE, OUTCOME_OK, OUTCOME_ERROR, OUTCOME_CANCELLED, set_usage_context
+
+LLM_USAGE.collection = mongo_db.llm_usage if mongo_db is not None else None
 
 def get_openai_api_key():
     """Get OpenAI API key from environment, checking multiple possible names."""
@@ -1577,6 +1749,145 @@ def get_openai_api_key():
 # GPT-5 nano output multiplier nedeniyle daha pahalı
 VISION_MODEL_PRIMARY = os.getenv("OPENAI_MODEL", "gpt-4.1-nano")  # En ucuz vision model
 VISION_MODEL_FALLBACK = os.getenv("OPENAI_MODEL_FALLBACK", "gpt-4o-mini")  # Fallback model
+# "low" is ~512px on the provider side; uploads are resized to match
+from image_resize import resize_for_vision, DETAIL_LOW
+
+VISION_IMAGE_DETAIL = os.getenv("OPENAI_IMAGE_DETAIL", DETAIL_LOW)
+
+# Analysis cache: repeated uploads of the same (or a re-encoded) photo with the
+# same locale/context reuse the previous result instead of calling the model,
+# if it was produced by the same routed model, detail and prompt variant.
+# ANALYZE_CACHE_DHASH_DISTANCE=-1 disables perceptual matching; the MongoDB
+# tier (shared between workers) is opt-in with ANALYZE_CACHE_MONGO=1.
+from analysis_cache import AnalysisCache, content_key, request_scope, image_dhash
+
+ANALYZE_CACHE_MAX_ENTRIES = int(os.getenv("ANALYZE_CACHE_MAX_ENTRIES", "512"))
+ANALYZE_CACHE_TTL_SECONDS = int(os.getenv("ANALYZE_CACHE_TTL_SECONDS", str(6 * 3600)))
+ANALYZE_CACHE_DHASH_DISTANCE = int(os.getenv("ANALYZE_CACHE_DHASH_DISTANCE", "4"))
+ANALYZE_CACHE_MONGO = os.getenv("ANALYZE_CACHE_MONGO", "0") == "1"
+
+ANALYSIS_CACHE = AnalysisCache(
+    max_entries=ANALYZE_CACHE_MAX_ENTRIES,
+    ttl_seconds=ANALYZE_CACHE_TTL_SECONDS,
+    max_distance=ANALYZE_CACHE_DHASH_DISTANCE,
+    collection=mongo_db.analysis_cache if ANALYZE_CACHE_MONGO and mongo_db is not None else None,
+)
+
+# Per-user meal memory: meals saved via /food/add-meal remember the photo's
+# dHash with the confirmed items; a later photo from the same user within
+# MEAL_MEMORY_DHASH_DISTANCE bits (no looser than the analysis cache) returns
+# that result without a model call, flagged memory_hit=true so the client can
+# offer a re-analyze (skip_memory=true). At most MEAL_MEMORY_MAX_PER_USER
+# meals per user (LRU).
+from meal_memory import MealMemory
+
+MEAL_MEMORY = MealMemory(
+    max_per_user=int(os.getenv("MEAL_MEMORY_MAX_PER_USER", "50")),
+    max_distance=int(os.getenv("MEAL_MEMORY_DHASH_DISTANCE", "4")),
+    collection=mongo_db.meal_memory if mongo_db is not None else None,
+)
+
+# Image decode/resize/re-encode runs on a small thread pool (Pillow releases
+# the GIL) so large uploads do not block the event loop. Jobs beyond
+# workers + queue are rejected with 503 instead of piling up.
+from image_pool import ImageWorkPool, ImagePoolBusy, default_workers
+
+IMAGE_POOL_WORKERS = int(os.getenv("IMAGE_POOL_WORKERS", str(default_workers())))
+IMAGE_POOL_MAX_QUEUE = int(os.getenv("IMAGE_POOL_MAX_QUEUE", "16"))
+IMAGE_POOL = ImageWorkPool(max_workers=IMAGE_POOL_WORKERS, max_queue=IMAGE_POOL_MAX_QUEUE)
+
+# Admission control for vision model calls (cache hits bypass it): at most
+# VISION_MAX_CONCURRENCY calls in flight (size it to the provider quota),
+# up to VISION_QUEUE_MAX waiting for VISION_QUEUE_TIMEOUT_SECONDS each;
+# anything beyond gets a fast 503 with Retry-After.
+from admission import AdmissionController, AdmissionRejected
+
+VISION_MAX_CONCURRENCY = int(os.getenv("VISION_MAX_CONCURRENCY", "8"))
+VISION_QUEUE_MAX = int(os.getenv("VISION_QUEUE_MAX", "32"))
+VISION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("VISION_QUEUE_TIMEOUT_SECONDS", "15"))
+VISION_ADMISSION = AdmissionController(
+    max_concurrent=VISION_MAX_CONCURRENCY,
+    max_queue=VISION_QUEUE_MAX,
+    queue_timeout=VISION_QUEUE_TIMEOUT_SECONDS,
+)
+
+# Hedging: if the primary model has not answered within its recent p95
+# latency (clamped to VISION_HEDGE_MIN/MAX_DELAY), the fallback model is
+# started as well and the first success wins. A circuit breaker sends calls
+# straight to the fallback while the primary's recent error rate is high.
+from hedging import CircuitBreaker, HedgedCaller, PATH_PRIMARY
+
+def build_vision_hedger() -> HedgedCaller:
+    return HedgedCaller(
+        CircuitBreaker(
+            window=int(os.getenv("VISION_BREAKER_WINDOW", "20")),
+            min_calls=int(os.getenv("VISION_BREAKER_MIN_CALLS", "10")),
+            error_rate=float(os.getenv("VISION_BREAKER_ERROR_RATE", "0.5")),
+            cooldown=float(os.getenv("VISION_BREAKER_COOLDOWN_SECONDS", "30")),
+        ),
+        hedge_enabled=os.getenv("VISION_HEDGE", "1") == "1",
+        hedge_quantile=float(os.getenv("VISION_HEDGE_QUANTILE", "0.95")),
+        default_delay=float(os.getenv("VISION_HEDGE_DEFAULT_DELAY", "8")),
+        min_delay=float(os.getenv("VISION_HEDGE_MIN_DELAY", "2")),
+        max_delay=float(os.getenv("VISION_HEDGE_MAX_DELAY", "20")),
+    )
+
+VISION_HEDGER = build_vision_hedger()
+# Hedgers (latency window + breaker) of other routed primary models
+VISION_HEDGERS: Dict[str, HedgedCaller] = {}
+
+def vision_hedger(model: str) -> HedgedCaller:
+    if model == VISION_MODEL_PRIMARY:
+        return VISION_HEDGER
+    if model not in VISION_HEDGERS:
+        VISION_HEDGERS[model] = build_vision_hedger()
+    return VISION_HEDGERS[model]
+
+# Model routing: simple plates (image complexity below the threshold) go to
+# VISION_MODEL_CHEAP, busy ones to VISION_MODEL_STRONG (premium users at a
+# lower threshold, high detail above VISION_ROUTER_HIGH_DETAIL_COMPLEXITY).
+# Over VISION_ROUTER_BUDGET_USD_PER_HOUR (0 = no budget) only premium users
+# get the strong model; a model over the p95/error-rate limits is avoided
+# while the other one is healthy. VISION_ROUTER=0 always uses the primary.
+from model_router import ModelRouter, Route, REASON_STATIC
+
+VISION_ROUTER = ModelRouter(
+    cheap_model=os.getenv("VISION_MODEL_CHEAP", VISION_MODEL_PRIMARY),
+    strong_model=os.getenv("VISION_MODEL_STRONG", VISION_MODEL_FALLBACK),
+    model_stats=LLM_USAGE.model_stats,
+    spend=LLM_USAGE.recent_spend,
+    complexity_threshold=float(os.getenv("VISION_ROUTER_COMPLEXITY", "0.55")),
+    premium_threshold=float(os.getenv("VISION_ROUTER_PREMIUM_COMPLEXITY", "0.35")),
+    high_detail_threshold=float(os.getenv("VISION_ROUTER_HIGH_DETAIL_COMPLEXITY", "0.8")),
+    default_detail=VISION_IMAGE_DETAIL,
+    strong_detail=os.getenv("VISION_ROUTER_STRONG_DETAIL", "high"),
+    budget_usd_per_hour=float(os.getenv("VISION_ROUTER_BUDGET_USD_PER_HOUR", "0")),
+    max_p95_seconds=float(os.getenv("VISION_ROUTER_MAX_P95_SECONDS", "12")),
+    max_error_rate=float(os.getenv("VISION_ROUTER_MAX_ERROR_RATE", "0.3")),
+    min_samples=int(os.getenv("VISION_ROUTER_MIN_SAMPLES", "20")),
+    enabled=os.getenv("VISION_ROUTER", "1") == "1",
+)
+
+# Prompt A/B: VISION_PROMPT_COMPACT_SHARE of the vision analyses use the
+# compact prompt with a strict JSON schema (see vision_prompt), the rest the
+# legacy prompt; 0 = legacy only, 1 = compact only. The variant is derived
+# from the user id (the image without one), so a user's retries keep their
+# variant and still hit the analysis cache. Tokens and latency per variant
+# are reported under by_variant in /api/debug/llm-usage.
+from pydantic import ValidationError
+from vision_prompt import (
+    PROMPT_LEGACY, PROMPT_COMPACT, COMPACT_SYSTEM_PROMPT, COMPACT_RESPONSE_FORMAT,
+    compact_item, compact_user_prompt, parse_compact_response, prompt_variant, result_totals,
+)
+
+VISION_PROMPT_COMPACT_SHARE = float(os.getenv("VISION_PROMPT_COMPACT_SHARE", "0"))
+
+def choose_prompt_variant(seed: str) -> str:
+    return prompt_variant(seed, VISION_PROMPT_COMPACT_SHARE)
+
+def cache_variant(route: Route, variant: str) -> str:
+    """Analysis cache partition: results are only reused for the same model, detail and prompt."""
+    return f"{route.model}:{route.detail}:{variant}"
 
 class FoodItem(BaseModel):
     name: str
@@ -1588,18 +1899,22 @@ class FoodItem(BaseModel):
 class FoodAnalyzeRequest(BaseModel):
     image_base64: str
     locale: str = "tr-TR"
+    skip_memory: bool = False  # re-analyze a photo the meal memory answered
 
 class FoodAnalyzeResponse(BaseModel):
     items: List[FoodItem] = []
     total: Dict[str, float] = Field(default_factory=lambda: {"calories_kcal": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0})
     questions: List[str] = []
     notes: str = ""
+    image_hash: Optional[str] = None  # send back with /food/add-meal
+    memory_hit: bool = False  # answered from the user's meal memory
 
 # Legacy response model for backward compatibility
 class AnalyzeFoodRequest(BaseModel):
     image_base64: str
     locale: str = "tr-TR"
     context: str = ""  # User-provided food description for better accuracy
+    skip_memory: bool = False  # re-analyze a photo the meal memory answered
 
 class AnalyzeFoodResponse(BaseModel):
     items: List[Dict[str, Any]] = []
@@ -1609,42 +1924,163 @@ class AnalyzeFoodResponse(BaseModel):
     total_protein: float = 0
     total_carbs: float = 0
     total_fat: float = 0
-
-def resize_image_base64(base64_str: str, max_size: int = 1280) -> str:
-    """Resize image to reduce payload size for API calls."""
+    image_hash: Optional[str] = None  # send back with /food/add-meal
+    memory_hit: bool = False  # answered from the user's meal memory
+
+def prepare_vision_bytes(image_bytes: bytes, detail: str = VISION_IMAGE_DETAIL) -> tuple:
+    """Resized base64 JPEG, its dHash (None if undecodable) and image complexity. CPU-bound: run on IMAGE_POOL."""
+    # Resize to the size the vision detail level actually uses (see image_resize);
+    # the cache key is taken from the resized bytes
+    complexity = 0.0
     try:
-        # Remove data URL prefix if present
-        if base64_str.startswith("data:"):
-            base64_str = base64_str.split(",", 1)[1]
-        
-        # Decode base64
-        image_data = base64.b64decode(base64_str)
-        image = Image.open(io.BytesIO(image_data))
-        
-        # Calculate new size maintaining aspect ratio
-        width, height = image.size
-        if max(width, height) > max_size:
-            if width > height:
-                new_width = max_size
-                new_height = int(height * (max_size / width))
-            else:
-                new_height = max_size
-                new_width = int(width * (max_size / height))
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Convert to JPEG with quality reduction
-        buffer = io.BytesIO()
-        if image.mode in ('RGBA', 'P'):
-            image = image.convert('RGB')
-        image.save(buffer, format='JPEG', quality=75)
-        
-        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+        vision_image = resize_for_vision(image_bytes, detail)
+        resized, complexity = vision_image.jpeg, vision_image.complexity
     except Exception as e:
         logger.warning(f"Image resize failed: {e}, using original")
-        return base64_str
+        resized = image_bytes
+    return base64.b64encode(resized).decode('utf-8'), image_dhash(resized), complexity
+
+def prepare_vision_image(image_base64: str, detail: str = VISION_IMAGE_DETAIL) -> tuple:
+    """prepare_vision_bytes for a base64 (optionally data URL) image."""
+    # Remove data URL prefix if present
+    if image_base64.startswith("data:"):
+        image_base64 = image_base64.split(",", 1)[1]
+    try:
+        image_bytes = base64.b64decode(image_base64)
+    except Exception as e:
+        logger.warning(f"Image base64 decode failed: {e}, using original")
+        return image_base64, None, 0.0
+    return prepare_vision_bytes(image_bytes, detail)
+
+async def prepare_vision_upload(
+    image_base64: str = "", image_bytes: Optional[bytes] = None, detail: str = VISION_IMAGE_DETAIL
+) -> tuple:
+    """(resized base64, dHash, complexity) computed on IMAGE_POOL; 503 when the pool is full."""
+    try:
+        if image_bytes is not None:
+            return await IMAGE_POOL.run(prepare_vision_bytes, image_bytes, detail)
+        return await IMAGE_POOL.run(prepare_vision_image, image_base64, detail)
+    except ImagePoolBusy as e:
+        logger.warning(f"Image pool full, rejecting analysis: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Image processing is busy. Please try again shortly.",
+            headers={"Retry-After": "2"},
+        )
+
+async def call_openai_vision(
+    image_base64: str = "",
+    locale: str = "tr-TR",
+    context: str = "",
+    image_bytes: Optional[bytes] = None,
+    user_id: Optional[str] = None,
+    is_premium: bool = False,
+    skip_memory: bool = False,
+) -> Dict[str, Any]:
+    """Analyze a food image (base64 or raw `image_bytes`), reusing cached results for repeated uploads.
+    
+    With `user_id` (and not `skip_memory`), a photo matching one of the
+    user's saved meals returns that meal's confirmed items (memory_hit=True)
+    without a model call.
+    Otherwise VISION_ROUTER picks the model and detail for the photo.
+    """
+    resized_base64, dhash, complexity = await prepare_vision_upload(image_base64, image_bytes)
+    image_hash = f"{dhash:016x}" if dhash is not None else None
+    
+    if user_id and not skip_memory:
+        remembered = await MEAL_MEMORY.recall(user_id, dhash)
+        if remembered is not None:
+            logger.info("Meal memory hit, skipping vision call")
+            return {**remembered, "memory_hit": True, "image_hash": image_hash}
+    
+    route = VISION_ROUTER.route(complexity, is_premium)
+    variant = choose_prompt_variant(user_id or resized_base64)
+    # Keyed on the default-detail upload (as the stream is); the route's detail is part of the variant
+    key = content_key(resized_base64, locale, context, cache_variant(route, variant))
+    scope = request_scope(locale, context, cache_variant(route, variant))
+    
+    async def analyze() -> Dict[str, Any]:
+        # Only a cache miss pays for re-preparing the upload at the route's detail
+        upload = resized_base64
+        if route.detail != VISION_IMAGE_DETAIL:
+            upload, _, _ = await prepare_vision_upload(image_base64, image_bytes, route.detail)
+        return await call_openai_vision_admitted(upload, locale, context, route, variant)
+    
+    result = await ANALYSIS_CACHE.get_or_compute(key, scope, dhash, analyze)
+    result["image_hash"] = image_hash
+    return result
+
+def meal_memory_result(meal: "AddMealRequest") -> Dict[str, Any]:
+    """A saved meal as a vision result; its items keep the user's values (no catalog override)."""
+    items = meal.items or [{
+        "label": meal.name, "calories": meal.calories,
+        "protein": meal.protein, "carbs": meal.carbs, "fat": meal.fat,
+    }]
+    vision_items = []
+    for item in items:
+        grams = (item.get("portion") or {}).get("estimate_g") or 100
+        vision_items.append({
+            "name": item.get("label") or item.get("name") or meal.name,
+            "quantity_estimate": {"grams": grams, "range_grams": [grams, grams]},
+            "calories_kcal": int(item.get("calories") or 0),
+            "macros": {
+                "protein_g": float(item.get("protein") or 0),
+                "carbs_g": float(item.get("carbs") or 0),
+                "fat_g": float(item.get("fat") or 0),
+            },
+            "confidence": 1.0,
+            "user_confirmed": True,
+        })
+    return {
+        "items": vision_items,
+        "total": result_totals(vision_items),
+        "questions": [],
+        "notes": "",
+    }
+
+async def remember_meal(user_id: str, meal: "AddMealRequest", meal_id: Optional[str] = None) -> None:
+    """Add a saved meal to the user's meal memory when its photo hash is known (best effort)."""
+    dhash = None
+    try:
+        if meal.image_hash:
+            dhash = int(meal.image_hash[:16], 16)
+        elif meal.image_base64:
+            _, dhash, _ = await prepare_vision_upload(meal.image_base64)
+        if dhash is not None:
+            await MEAL_MEMORY.remember(user_id, dhash, meal_memory_result(meal), meal.name, meal_id)
+    except Exception as e:
+        logger.warning(f"Meal memory store skipped: {e}")
+
+async def call_openai_vision_admitted(
+    resized_base64: str, locale: str, context: str, route: Optional[Route] = None, variant: Optional[str] = None
+) -> Dict[str, Any]:
+    """call_openai_vision_model under VISION_ADMISSION; a fallback reuses the slot, a hedge needs its own."""
+    try:
+        async with VISION_ADMISSION.slot():
+            return await call_openai_vision_model(resized_base64, locale, context=context, route=route, variant=variant)
+    except AdmissionRejected as e:
+        logger.warning(f"Vision analysis rejected ({e.reason}), retry after {e.retry_after}s")
+        raise HTTPException(
+            status_code=503,
+            detail="Food analysis is busy. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
 
-async def call_openai_vision(image_base64: str, locale: str = "tr-TR", use_fallback: bool = False, context: str = "") -> Dict[str, Any]:
-    """Call OpenAI Vision API to analyze food image using emergentintegrations."""
+async def call_openai_vision_model(
+    resized_base64: str,
+    locale: str = "tr-TR",
+    context: str = "",
+    route: Optional[Route] = None,
+    variant: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Analyze an already resized food image with the routed model (the primary without `route`).
+    
+    The model's hedger starts the other model when it fails, is slower than
+    its recent p95, or while its circuit breaker is open. Both calls use the
+    same prompt `variant` (default: picked per VISION_PROMPT_COMPACT_SHARE).
+    """
+    route = route or Route(VISION_MODEL_PRIMARY, VISION_MODEL_FALLBACK, VISION_IMAGE_DETAIL, REASON_STATIC)
+    variant = variant or choose_prompt_variant(resized_base64)
     
     api_key = get_openai_api_key()
     if not api_key:
@@ -1654,16 +2090,76 @@ async def call_openai_vision(image_base64: str, locale: str = "tr-TR", use_fallb
     # Log key presence (not the actual key!)
     logger.info(f"OpenAI API key found, length: {len(api_key)}, starts with: {api_key[:7]}...")
     
-    # Choose model
-    model = VISION_MODEL_FALLBACK if use_fallback else VISION_MODEL_PRIMARY
-    logger.info(f"Using model: {model}")
+    try:
+        with LLM_USAGE.track("vision_analysis") as usage:
+            usage.route = route.to_dict()
+            usage.variant = variant
+            result, path = await vision_hedger(route.model).call(
+                lambda: request_vision_analysis(
+                    resized_base64, locale, route.model, api_key, context,
+                    role="primary", detail=route.detail, variant=variant,
+                ),
+                lambda: request_vision_analysis(
+                    resized_base64, locale, route.fallback, api_key, context,
+                    role="fallback", detail=route.detail, variant=variant,
+                ),
+                admission=VISION_ADMISSION,
+            )
+            usage.path = path
+    except HTTPException:
+        raise
+    
+    except (json.JSONDecodeError, ValidationError) as e:
+        logger.error(f"JSON parse error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to parse AI response")
+    
+    except openai.RateLimitError as e:
+        logger.error(f"OpenAI rate limit: {e}")
+        raise HTTPException(status_code=429, detail="API rate limit exceeded. Please try again later.")
     
-    # Resize image to reduce costs
-    resized_base64 = resize_image_base64(image_base64)
+    except openai.NotFoundError as e:
+        # Model not found - likely not available for this API key
+        logger.error(f"OpenAI model not found: {e}")
+        raise HTTPException(status_code=502, detail="AI model not available")
     
-    # Remove data URL prefix if present
-    if resized_base64.startswith("data:"):
-        resized_base64 = resized_base64.split(",", 1)[1]
+    except openai.APIError as e:
+        logger.error(f"OpenAI API error: {e}")
+        raise HTTPException(status_code=502, detail="Food analysis service temporarily unavailable")
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in vision analysis: {e}")
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    
+    if path != PATH_PRIMARY:
+        logger.info(f"Vision analysis answered via {path}")
+    return result
+
+def vision_request_params(
+    resized_base64: str,
+    locale: str,
+    model: str,
+    context: str = "",
+    detail: str = VISION_IMAGE_DETAIL,
+    variant: str = PROMPT_LEGACY,
+) -> Dict[str, Any]:
+    """chat.completions.create() arguments for analyzing a resized food image."""
+    if variant == PROMPT_COMPACT:
+        # Constant system prompt + schema first: a stable, cacheable prefix
+        return {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": COMPACT_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": compact_user_prompt(locale, context)},
+                        {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{resized_base64}", "detail": detail}},
+                    ]
+                }
+            ],
+            "response_format": COMPACT_RESPONSE_FORMAT,
+            "max_tokens": 1500
+        }
     
     # Language-specific prompts
     is_turkish = locale.startswith("tr")
@@ -1716,98 +2212,75 @@ JSON ŞEMASI:
 Her yiyeceği tespit et ve besin değerlerini tahmin et. Porsiyon büyüklüğünü görsel ipuçlarından belirle.
 Kesin JSON formatında yanıt ver."""
 
-    try:
-        # Determine API endpoint based on key type
-        base_url = None
-        if api_key and api_key.startswith("sk-emergent"):
-            # Emergent keys need to go through Emergent proxy
-            base_url = "https://integrations.emergentagent.com/llm"
-            logger.info(f"Using Emergent proxy: {base_url}")
-        else:
-            # Real OpenAI key - use default OpenAI endpoint
-            logger.info("Using direct OpenAI API")
-        
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
-        
-        # Prepare image URL
-        image_url = f"data:image/jpeg;base64,{resized_base64}"
-        
-        # Use Chat Completions API for all models (OpenAI SDK 1.x compatible)
-        logger.info(f"Using Chat Completions API for model: {model}")
-        
-        request_params = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": user_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": image_url,
-                                "detail": "low"  # Cost optimization
-                            }
-                        }
-                    ]
-                }
-            ],
-            "response_format": {"type": "json_object"},
-            "max_tokens": 1500
-        }
-        
-        response = await client.chat.completions.create(**request_params)
-        content = response.choices[0].message.content or ""
-        
-        logger.info(f"Got response, length: {len(content)}, content preview: {content[:200] if content else 'EMPTY'}")
-        
-        if not content or not content.strip():
-            logger.error("Empty response from OpenAI")
-            raise HTTPException(status_code=500, detail="Empty response from AI model")
-        
-        result = json.loads(content)
-        logger.info(f"Vision analysis complete. Model: {model}, Items found: {len(result.get('items', []))}")
-        return result
-        
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parse error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to parse AI response")
-        
-    except openai.RateLimitError as e:
-        logger.error(f"OpenAI rate limit: {e}")
-        if not use_fallback:
-            # Retry with fallback model
-            logger.info("Retrying with fallback model...")
-            return await call_openai_vision(image_base64, locale, use_fallback=True)
-        raise HTTPException(status_code=429, detail="API rate limit exceeded. Please try again later.")
+    # Prepare image URL
+    image_url = f"data:image/jpeg;base64,{resized_base64}"
     
-    except openai.NotFoundError as e:
-        # Model not found - likely GPT-5 not available for this API key
-        logger.error(f"OpenAI model not found: {e}")
-        if not use_fallback:
-            logger.info(f"Model {model} not available, trying fallback model...")
-            return await call_openai_vision(image_base64, locale, use_fallback=True)
-        raise HTTPException(status_code=502, detail="AI model not available")
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": user_prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url,
+                            "detail": detail  # Cost optimization (see VISION_ROUTER)
+                        }
+                    }
+                ]
+            }
+        ],
+        "response_format": {"type": "json_object"},
+        "max_tokens": 1500
+    }
+
+def vision_client(api_key: str) -> openai.AsyncOpenAI:
+    """Shared client for the key's endpoint."""
+    # Determine API endpoint based on key type
+    base_url = None
+    if api_key and api_key.startswith("sk-emergent"):
+        # Emergent keys need to go through Emergent proxy
+        base_url = "https://integrations.emergentagent.com/llm"
+        logger.info(f"Using Emergent proxy: {base_url}")
+    else:
+        # Real OpenAI key - use default OpenAI endpoint
+        logger.info("Using direct OpenAI API")
+    return get_llm_client(api_key, base_url)
+
+async def request_vision_analysis(
+    resized_base64: str,
+    locale: str,
+    model: str,
+    api_key: str,
+    context: str = "",
+    role: Optional[str] = None,
+    detail: str = VISION_IMAGE_DETAIL,
+    variant: str = PROMPT_LEGACY,
+) -> Dict[str, Any]:
+    """One vision completion with `model`; raises on any failure (no fallback)."""
+    client = vision_client(api_key)
+    
+    # Use Chat Completions API for all models (OpenAI SDK 1.x compatible)
+    logger.info(f"Using Chat Completions API for model: {model}")
+    
+    role = role or ("primary" if model == VISION_MODEL_PRIMARY else "fallback")
+    response = await LLM_USAGE.create(
+        client, role=role, **vision_request_params(resized_base64, locale, model, context, detail, variant)
+    )
+    content = response.choices[0].message.content or ""
     
-    except openai.APIError as e:
-        logger.error(f"OpenAI API error: {e}")
-        if not use_fallback:
-            logger.info("Retrying with fallback model...")
-            return await call_openai_vision(image_base64, locale, use_fallback=True)
-        raise HTTPException(status_code=502, detail="Food analysis service temporarily unavailable")
+    logger.info(f"Got response, length: {len(content)}, content preview: {content[:200] if content else 'EMPTY'}")
     
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parse error: {e}, content: {content[:200] if content else 'empty'}")
-        raise HTTPException(status_code=500, detail="Failed to parse analysis results")
+    if not content or not content.strip():
+        logger.error("Empty response from OpenAI")
+        raise HTTPException(status_code=500, detail="Empty response from AI model")
     
-    except Exception as e:
-        logger.error(f"Unexpected error in vision analysis: {e}")
-        # Try fallback on any unexpected error
-        if not use_fallback:
-            logger.info(f"Unexpected error with {model}, trying fallback...")
-            return await call_openai_vision(image_base64, locale, use_fallback=True)
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    result = parse_compact_response(content) if variant == PROMPT_COMPACT else json.loads(content)
+    logger.info(f"Vision analysis complete. Model: {model}, Items found: {len(result.get('items', []))}")
+    return result
 
 @api_router.post("/food/analyze", response_model=AnalyzeFoodResponse)
 async def analyze_food(request_data: AnalyzeFoodRequest, current_user: Optional[User] = Depends(get_current_user)):
@@ -1817,6 +2290,7 @@ async def analyze_food(request_data: AnalyzeFoodRequest, current_user: Optional[
     """
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze", current_user.user_id)
     
     api_key = get_openai_api_key()
     if not api_key:
@@ -1828,58 +2302,12 @@ async def analyze_food(request_data: AnalyzeFoodRequest, current_user: Optional[
         result = await call_openai_vision(
             image_base64=request_data.image_base64,
             locale=request_data.locale,
-            context=request_data.context  # Pass user-provided context for better accuracy
-        )
-        
-        # Transform to legacy response format for frontend compatibility
-        items = result.get("items", [])
-        questions = result.get("questions", [])
-        notes = result.get("notes", "")
-        
-        # Calculate totals
-        total_calories = sum(item.get("calories_kcal", 0) for item in items)
-        total_protein = sum(item.get("macros", {}).get("protein_g", 0) for item in items)
-        total_carbs = sum(item.get("macros", {}).get("carbs_g", 0) for item in items)
-        total_fat = sum(item.get("macros", {}).get("fat_g", 0) for item in items)
-        
-        # Transform items to frontend expected format
-        transformed_items = []
-        for item in items:
-            qty = item.get("quantity_estimate", {})
-            macros = item.get("macros", {})
-            
-            transformed_items.append({
-                "label": item.get("name", "Bilinmeyen yemek"),
-                "aliases": [],
-                "portion": {
-                    "estimate_g": qty.get("grams", 100),
-                    "range_g": qty.get("range_grams", [80, 120]),
-                    "basis": "visual"
-                },
-                "confidence": item.get("confidence", 0.7),
-                "food_id": None,  # Not from database
-                "calories": item.get("calories_kcal", 0),
-                "protein": macros.get("protein_g", 0),
-                "carbs": macros.get("carbs_g", 0),
-                "fat": macros.get("fat_g", 0)
-            })
-        
-        # Build notes list
-        notes_list = []
-        if notes:
-            notes_list.append(notes)
-        if questions:
-            notes_list.extend(questions)
-        
-        return AnalyzeFoodResponse(
-            items=transformed_items,
-            notes=notes_list,
-            needs_user_confirmation=len(questions) > 0 or any(item.get("confidence", 0) < 0.7 for item in items),
-            total_calories=int(total_calories),
-            total_protein=round(total_protein, 1),
-            total_carbs=round(total_carbs, 1),
-            total_fat=round(total_fat, 1)
+            context=request_data.context,  # Pass user-provided context for better accuracy
+            user_id=current_user.user_id,
+            is_premium=current_user.is_premium,
+            skip_memory=request_data.skip_memory
         )
+        return build_analyze_response(result)
         
     except HTTPException:
         raise
@@ -1887,6 +2315,75 @@ async def analyze_food(request_data: AnalyzeFoodRequest, current_user: Optional[
         logger.error(f"Food analyze error: {e}")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+def transform_analyzed_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """One vision item in the frontend format, linked to the catalog when possible."""
+    qty = item.get("quantity_estimate", {})
+    macros = item.get("macros", {})
+    label = item.get("name", "Bilinmeyen yemek")
+    
+    transformed = {
+        "label": label,
+        "aliases": [],
+        "portion": {
+            "estimate_g": qty.get("grams", 100),
+            "range_g": qty.get("range_grams", [80, 120]),
+            "basis": "user" if item.get("user_confirmed") else "visual"
+        },
+        "confidence": item.get("confidence", 0.7),
+        "food_id": None,  # Not from database
+        "calories": item.get("calories_kcal", 0),
+        "protein": macros.get("protein_g", 0),
+        "carbs": macros.get("carbs_g", 0),
+        "fat": macros.get("fat_g", 0)
+    }
+    
+    # Link to the catalog when the label matches confidently; database
+    # macros replace the estimate when the catalog portion is in grams
+    linked = link_catalog_food(label, qty.get("grams"))
+    if linked:
+        transformed["food_id"] = linked["food_id"]
+        transformed["aliases"] = [linked["name"]]
+        # Values the user saved for this meal (meal memory) win over the catalog
+        if linked["calories"] is not None and not item.get("user_confirmed"):
+            transformed["portion"]["basis"] = "database"
+            for field in ("calories", "protein", "carbs", "fat"):
+                transformed[field] = linked[field]
+    return transformed
+
+def build_analyze_response(result: Dict[str, Any]) -> AnalyzeFoodResponse:
+    """Transform a vision result to the legacy response format for frontend compatibility."""
+    items = result.get("items", [])
+    questions = result.get("questions", [])
+    notes = result.get("notes", "")
+    
+    # Transform items to frontend expected format
+    transformed_items = [transform_analyzed_item(item) for item in items]
+    
+    # Calculate totals
+    total_calories = sum(item["calories"] or 0 for item in transformed_items)
+    total_protein = sum(item["protein"] or 0 for item in transformed_items)
+    total_carbs = sum(item["carbs"] or 0 for item in transformed_items)
+    total_fat = sum(item["fat"] or 0 for item in transformed_items)
+    
+    # Build notes list
+    notes_list = []
+    if notes:
+        notes_list.append(notes)
+    if questions:
+        notes_list.extend(questions)
+    
+    return AnalyzeFoodResponse(
+        items=transformed_items,
+        notes=notes_list,
+        needs_user_confirmation=len(questions) > 0 or any(item.get("confidence", 0) < 0.7 for item in items),
+        total_calories=int(total_calories),
+        total_protein=round(total_protein, 1),
+        total_carbs=round(total_carbs, 1),
+        total_fat=round(total_fat, 1),
+        image_hash=result.get("image_hash"),
+        memory_hit=result.get("memory_hit", False)
+    )
+
 # New endpoint with cleaner response format
 @api_router.post("/food/analyze/v2", response_model=FoodAnalyzeResponse)
 async def analyze_food_v2(request_data: FoodAnalyzeRequest, current_user: Optional[User] = Depends(get_current_user)):
@@ -1896,6 +2393,7 @@ async def analyze_food_v2(request_data: FoodAnalyzeRequest, current_user: Option
     """
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze/v2", current_user.user_id)
     
     api_key = get_openai_api_key()
     if not api_key:
@@ -1904,15 +2402,12 @@ async def analyze_food_v2(request_data: FoodAnalyzeRequest, current_user: Option
     try:
         result = await call_openai_vision(
             image_base64=request_data.image_base64,
-            locale=request_data.locale
-        )
-        
-        return FoodAnalyzeResponse(
-            items=[FoodItem(**item) for item in result.get("items", [])],
-            total=result.get("total", {"calories_kcal": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0}),
-            questions=result.get("questions", []),
-            notes=result.get("notes", "")
+            locale=request_data.locale,
+            user_id=current_user.user_id,
+            is_premium=current_user.is_premium,
+            skip_memory=request_data.skip_memory
         )
+        return build_analyze_v2_response(result)
         
     except HTTPException:
         raise
@@ -1920,6 +2415,420 @@ async def analyze_food_v2(request_data: FoodAnalyzeRequest, current_user: Option
         logger.error(f"Food analyze v2 error: {e}")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+def build_analyze_v2_response(result: Dict[str, Any]) -> FoodAnalyzeResponse:
+    return FoodAnalyzeResponse(
+        items=[FoodItem(**item) for item in result.get("items", [])],
+        total=result.get("total", {"calories_kcal": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0}),
+        questions=result.get("questions", []),
+        notes=result.get("notes", ""),
+        image_hash=result.get("image_hash"),
+        memory_hit=result.get("memory_hit", False)
+    )
+
+# Binary upload variants: the photo is sent as multipart/form-data (field
+# "image", optional "locale"/"context" fields) or as a raw
+# application/octet-stream / image/* body (locale/context as query params).
+# The body is streamed with a size cap and goes straight to the resize
+# pipeline, skipping the base64 + JSON round trip.
+ANALYZE_UPLOAD_MAX_BYTES = int(os.getenv("ANALYZE_UPLOAD_MAX_BYTES", str(15 * 1024 * 1024)))
+
+async def read_image_upload(request: Request, locale: str, context: str) -> tuple:
+    """(image bytes, locale, context) from a multipart or raw binary request body."""
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > ANALYZE_UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Image too large")
+    
+    async def capped_stream():
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > ANALYZE_UPLOAD_MAX_BYTES:
+                raise HTTPException(status_code=413, detail="Image too large")
+            yield chunk
+    
+    content_type = request.headers.get("content-type", "").lower()
+    if content_type.startswith("multipart/form-data"):
+        try:
+            form = await MultiPartParser(request.headers, capped_stream(), max_files=1, max_fields=8).parse()
+        except MultiPartException as e:
+            raise HTTPException(status_code=400, detail=f"Invalid multipart body: {e.message}")
+        try:
+            upload = form.get("image") or form.get("file")
+            if not isinstance(upload, UploadFile):
+                raise HTTPException(status_code=400, detail="Missing image file field")
+            image_bytes = await upload.read()
+            locale = str(form.get("locale") or locale)
+            context = str(form.get("context") or context)
+        finally:
+            await form.close()
+    elif content_type.startswith(("application/octet-stream", "image/")):
+        image_bytes = b"".join([chunk async for chunk in capped_stream()])
+    else:
+        raise HTTPException(status_code=415, detail="Use multipart/form-data or application/octet-stream")
+    
+    if not image_bytes:
+        raise HTTPException(status_code=400, detail="Empty image")
+    return image_bytes, locale, context
+
+@api_router.post("/food/analyze/upload", response_model=AnalyzeFoodResponse)
+async def analyze_food_upload(
+    request: Request,
+    locale: str = Query("tr-TR"),
+    context: str = Query(""),
+    skip_memory: bool = Query(False),
+    current_user: Optional[User] = Depends(get_current_user),
+):
+    """/food/analyze for a binary (multipart or octet-stream) image upload."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze/upload", current_user.user_id)
+    
+    if not get_openai_api_key():
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured. Set OPENAI_KEY environment variable.")
+    
+    image_bytes, locale, context = await read_image_upload(request, locale, context)
+    try:
+        result = await call_openai_vision(
+            image_bytes=image_bytes, locale=locale, context=context,
+            user_id=current_user.user_id, is_premium=current_user.is_premium, skip_memory=skip_memory,
+        )
+        return build_analyze_response(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Food analyze upload error: {e}")
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+@api_router.post("/food/analyze/v2/upload", response_model=FoodAnalyzeResponse)
+async def analyze_food_v2_upload(
+    request: Request,
+    locale: str = Query("tr-TR"),
+    skip_memory: bool = Query(False),
+    current_user: Optional[User] = Depends(get_current_user),
+):
+    """/food/analyze/v2 for a binary (multipart or octet-stream) image upload."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze/v2/upload", current_user.user_id)
+    
+    if not get_openai_api_key():
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured")
+    
+    image_bytes, locale, _ = await read_image_upload(request, locale, "")
+    try:
+        result = await call_openai_vision(
+            image_bytes=image_bytes, locale=locale,
+            user_id=current_user.user_id, is_premium=current_user.is_premium, skip_memory=skip_memory,
+        )
+        return build_analyze_v2_response(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Food analyze v2 upload error: {e}")
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+# Batch analyze: several photos (a whole day, a multi-plate meal) in one
+# request. Images are resized and analyzed concurrently under the same
+# IMAGE_POOL / VISION_ADMISSION limits as single requests, so wall time is
+# close to the slowest image; failures are reported per image. At most
+# ANALYZE_BATCH_CONCURRENCY images of one batch are in flight, kept below
+# the pool's workers + queue limit so a batch never gets itself rejected.
+ANALYZE_BATCH_MAX_IMAGES = int(os.getenv("ANALYZE_BATCH_MAX_IMAGES", "8"))
+ANALYZE_BATCH_CONCURRENCY = max(1, min(
+    int(os.getenv("ANALYZE_BATCH_CONCURRENCY", str(IMAGE_POOL_WORKERS))),
+    IMAGE_POOL_WORKERS + IMAGE_POOL_MAX_QUEUE - 1,
+))
+
+class AnalyzeBatchImage(BaseModel):
+    image_base64: str
+    context: str = ""
+
+class AnalyzeBatchRequest(BaseModel):
+    images: List[AnalyzeBatchImage] = Field(..., min_length=1, max_length=ANALYZE_BATCH_MAX_IMAGES)
+    locale: str = "tr-TR"
+
+class AnalyzeBatchItem(BaseModel):
+    index: int
+    ok: bool
+    result: Optional[AnalyzeFoodResponse] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+class AnalyzeBatchResponse(BaseModel):
+    results: List[AnalyzeBatchItem] = []
+    succeeded: int = 0
+    failed: int = 0
+    total_calories: int = 0
+    total_protein: float = 0
+    total_carbs: float = 0
+    total_fat: float = 0
+
+@api_router.post("/food/analyze/batch", response_model=AnalyzeBatchResponse)
+async def analyze_food_batch(request_data: AnalyzeBatchRequest, current_user: Optional[User] = Depends(get_current_user)):
+    """Analyze up to ANALYZE_BATCH_MAX_IMAGES food images concurrently."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze/batch", current_user.user_id)
+    
+    if not get_openai_api_key():
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured. Set OPENAI_KEY environment variable.")
+    
+    in_flight = asyncio.Semaphore(ANALYZE_BATCH_CONCURRENCY)
+    
+    async def analyze_one(index: int, image: AnalyzeBatchImage) -> AnalyzeBatchItem:
+        try:
+            async with in_flight:
+                result = await call_openai_vision(
+                    image_base64=image.image_base64,
+                    locale=request_data.locale,
+                    context=image.context,
+                    user_id=current_user.user_id,
+                    is_premium=current_user.is_premium
+                )
+            return AnalyzeBatchItem(index=index, ok=True, result=build_analyze_response(result))
+        except HTTPException as e:
+            return AnalyzeBatchItem(index=index, ok=False, status_code=e.status_code, error=str(e.detail))
+        except Exception as e:
+            logger.error(f"Food analyze batch item {index} error: {e}")
+            return AnalyzeBatchItem(index=index, ok=False, status_code=500, error=f"Analysis failed: {str(e)}")
+    
+    results = await asyncio.gather(*(analyze_one(i, image) for i, image in enumerate(request_data.images)))
+    analyzed = [item.result for item in results if item.ok]
+    return AnalyzeBatchResponse(
+        results=results,
+        succeeded=len(analyzed),
+        failed=len(results) - len(analyzed),
+        total_calories=sum(r.total_calories for r in analyzed),
+        total_protein=round(sum(r.total_protein for r in analyzed), 1),
+        total_carbs=round(sum(r.total_carbs for r in analyzed), 1),
+        total_fat=round(sum(r.total_fat for r in analyzed), 1)
+    )
+
+# Job mode: POST /food/analyze/jobs answers immediately with a job id and
+# the analysis runs on ANALYSIS_JOBS' worker tasks; clients poll
+# GET /food/analyze/jobs/{job_id}. Jobs are kept ANALYZE_JOB_TTL_SECONDS in
+# MongoDB (memory without it); resubmitting the same image (same raw
+# upload, locale and context) attaches to the existing job.
+from analysis_jobs import AnalysisJobQueue, JobQueueFull, public_job
+
+ANALYZE_JOB_WORKERS = int(os.getenv("ANALYZE_JOB_WORKERS", "4"))
+ANALYZE_JOB_MAX_PENDING = int(os.getenv("ANALYZE_JOB_MAX_PENDING", "64"))
+ANALYZE_JOB_TTL_SECONDS = int(os.getenv("ANALYZE_JOB_TTL_SECONDS", str(24 * 3600)))
+ANALYSIS_JOBS = AnalysisJobQueue(
+    workers=ANALYZE_JOB_WORKERS,
+    max_pending=ANALYZE_JOB_MAX_PENDING,
+    ttl_seconds=ANALYZE_JOB_TTL_SECONDS,
+    collection=mongo_db.analysis_jobs if mongo_db is not None else None,
+)
+
+@api_router.post("/food/analyze/jobs", status_code=202)
+async def submit_analyze_job(request_data: AnalyzeFoodRequest, current_user: Optional[User] = Depends(get_current_user)):
+    """Queue a food analysis; returns the job (status "queued", or the existing job for the same image)."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    if not get_openai_api_key():
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured. Set OPENAI_KEY environment variable.")
+    
+    image_base64 = request_data.image_base64
+    if image_base64.startswith("data:"):
+        image_base64 = image_base64.split(",", 1)[1]
+    image_hash = content_key(image_base64, request_data.locale, request_data.context)
+    if request_data.skip_memory:
+        # A re-analyze must not attach to the job that answered from memory
+        image_hash += ":fresh"
+    
+    async def work() -> Dict[str, Any]:
+        # Runs on a job worker task, outside this request's context
+        set_usage_context("/food/analyze/jobs", current_user.user_id)
+        result = await call_openai_vision(
+            image_base64=image_base64,
+            locale=request_data.locale,
+            context=request_data.context,
+            user_id=current_user.user_id,
+            is_premium=current_user.is_premium,
+            skip_memory=request_data.skip_memory
+        )
+        return build_analyze_response(result).model_dump()
+    
+    try:
+        job, deduplicated = await ANALYSIS_JOBS.submit(current_user.user_id, image_hash, work)
+    except JobQueueFull as e:
+        logger.warning(f"Analysis job queue full: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many analyses pending. Please try again shortly.",
+            headers={"Retry-After": "5"},
+        )
+    return {**public_job(job), "deduplicated": deduplicated}
+
+@api_router.get("/food/analyze/jobs/{job_id}")
+async def get_analyze_job(job_id: str, current_user: Optional[User] = Depends(get_current_user)):
+    """Job status; `result` has the /food/analyze response once status is "succeeded"."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    job = await ANALYSIS_JOBS.get(job_id, current_user.user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return public_job(job)
+
+# Streaming analyze (Server-Sent Events): the model is called with
+# stream=True and every element of its "items" array is pushed as an
+# "item" event (same shape as /food/analyze items) as soon as its JSON
+# object is complete. A final "done" event carries totals, notes and
+# first_item_ms; failures end the stream with an "error" event. Meal memory
+# and analysis cache hits are replayed immediately. The stream uses the primary model only; if it
+# fails before any item was sent, the hedged non-streaming path is used.
+from json_stream import JsonArrayItems
+from hedging import LatencyWindow
+
+ANALYZE_STREAM_FIRST_ITEM = LatencyWindow()
+ANALYZE_STREAM_STATS: Dict[str, int] = {"streams": 0, "cache_replays": 0, "fallbacks": 0, "errors": 0}
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def stream_vision_items(
+    resized_base64: str, locale: str, api_key: str, context: str = "", route: Optional[Route] = None,
+    variant: Optional[str] = None,
+):
+    """Yield ("item", raw item) while the completion streams, then ("result", full result)."""
+    client = vision_client(api_key)
+    model = route.model if route else VISION_MODEL_PRIMARY
+    variant = variant or choose_prompt_variant(resized_base64)
+    params = vision_request_params(
+        resized_base64, locale, model, context, route.detail if route else VISION_IMAGE_DETAIL, variant
+    )
+    usage_op = LLM_USAGE.operation("vision_analysis_stream")
+    usage_op.path = "stream"
+    usage_op.route = route.to_dict() if route else None
+    usage_op.variant = variant
+    usage = served_model = None
+    started = time.perf_counter()
+    try:
+        stream = await client.chat.completions.create(**params, stream=True, stream_options={"include_usage": True})
+        parser = JsonArrayItems("items")
+        parts = []
+        try:
+            async for chunk in stream:
+                served_model = served_model or getattr(chunk, "model", None)
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                parts.append(delta)
+                for item in parser.feed(delta):
+                    yield "item", compact_item(item) if variant == PROMPT_COMPACT else item
+        finally:
+            await stream.close()
+    except BaseException as e:
+        cancelled = isinstance(e, (asyncio.CancelledError, GeneratorExit))
+        LLM_USAGE.attempt(
+            model, "stream", time.perf_counter() - started, usage,
+            outcome=OUTCOME_CANCELLED if cancelled else OUTCOME_ERROR,
+            status=getattr(e, "status_code", None), op=usage_op,
+        )
+        # A client disconnect is not a model failure
+        LLM_USAGE.finish(usage_op, OUTCOME_CANCELLED if cancelled else OUTCOME_ERROR)
+        raise
+    LLM_USAGE.attempt(model, "stream", time.perf_counter() - started, usage, op=usage_op, served_model=served_model)
+    LLM_USAGE.finish(usage_op, OUTCOME_OK)
+    content = "".join(parts)
+    if not content.strip():
+        raise HTTPException(status_code=500, detail="Empty response from AI model")
+    yield "result", parse_compact_response(content) if variant == PROMPT_COMPACT else json.loads(content)
+
+@api_router.post("/food/analyze/stream")
+async def analyze_food_stream(request_data: AnalyzeFoodRequest, current_user: Optional[User] = Depends(get_current_user)):
+    """/food/analyze as a text/event-stream of item events and a final done event."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/food/analyze/stream", current_user.user_id)
+    
+    api_key = get_openai_api_key()
+    if not api_key:
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured. Set OPENAI_KEY environment variable.")
+    
+    resized_base64, dhash, complexity = await prepare_vision_upload(request_data.image_base64)
+    locale, context = request_data.locale, request_data.context
+    
+    async def events():
+        ANALYZE_STREAM_STATS["streams"] += 1
+        started = time.perf_counter()
+        first_item_ms = None
+        sent = 0
+        
+        def item_event(item: Dict[str, Any]) -> str:
+            nonlocal first_item_ms, sent
+            if first_item_ms is None:
+                first_item_ms = round((time.perf_counter() - started) * 1000)
+                ANALYZE_STREAM_FIRST_ITEM.add(first_item_ms / 1000)
+            sent += 1
+            return sse_event("item", transform_analyzed_item(item))
+        
+        remembered = None if request_data.skip_memory else await MEAL_MEMORY.recall(current_user.user_id, dhash)
+        result = remembered
+        if result is None:
+            route = VISION_ROUTER.route(complexity, current_user.is_premium)
+            variant = choose_prompt_variant(current_user.user_id)
+            key = content_key(resized_base64, locale, context, cache_variant(route, variant))
+            scope = request_scope(locale, context, cache_variant(route, variant))
+            result = await ANALYSIS_CACHE.lookup(key, scope, dhash)
+        if result is not None:
+            ANALYZE_STREAM_STATS["cache_replays"] += 1
+            for item in result.get("items", []):
+                yield item_event(item)
+        else:
+            image_base64 = resized_base64
+            try:
+                if route.detail != VISION_IMAGE_DETAIL:
+                    image_base64, _, _ = await prepare_vision_upload(request_data.image_base64, detail=route.detail)
+                async with VISION_ADMISSION.slot():
+                    try:
+                        async for kind, payload in stream_vision_items(image_base64, locale, api_key, context, route, variant):
+                            if kind == "item":
+                                yield item_event(payload)
+                            else:
+                                result = payload
+                    except Exception as e:
+                        if sent:
+                            raise
+                        logger.warning(f"Streaming analysis failed before the first item ({e}), using hedged call")
+                        ANALYZE_STREAM_STATS["fallbacks"] += 1
+                        result = await call_openai_vision_model(image_base64, locale, context=context, route=route, variant=variant)
+                        for item in result.get("items", []):
+                            yield item_event(item)
+            except AdmissionRejected as e:
+                ANALYZE_STREAM_STATS["errors"] += 1
+                yield sse_event("error", {"status_code": 503, "detail": "Food analysis is busy. Please try again shortly.", "retry_after": e.retry_after})
+                return
+            except HTTPException as e:
+                ANALYZE_STREAM_STATS["errors"] += 1
+                yield sse_event("error", {"status_code": e.status_code, "detail": e.detail})
+                return
+            except Exception as e:
+                ANALYZE_STREAM_STATS["errors"] += 1
+                logger.error(f"Food analyze stream error: {e}")
+                yield sse_event("error", {"status_code": 500, "detail": f"Analysis failed: {str(e)}"})
+                return
+            await ANALYSIS_CACHE.store(key, scope, dhash, result, time.perf_counter() - started)
+        
+        result["image_hash"] = f"{dhash:016x}" if dhash is not None else None
+        result["memory_hit"] = remembered is not None
+        
+        done = build_analyze_response(result).model_dump(exclude={"items"})
+        done["item_count"] = sent
+        done["first_item_ms"] = first_item_ms
+        yield sse_event("done", done)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 # Debug endpoint to check OpenAI key status
 @api_router.get("/debug/openai-status")
@@ -1941,6 +2850,77 @@ async def check_openai_status():
             "hint": "Set OPENAI_KEY=sk-your-key in Render environment variables"
         }
 
+# Accounts allowed to read the operational debug endpoints below, which
+# expose spend, budgets and user-derived data (comma-separated emails)
+ADMIN_EMAILS = {e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
+
+async def require_admin(current_user: Optional[User] = Depends(get_current_user)) -> User:
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if current_user.email.lower() not in ADMIN_EMAILS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user
+
+@api_router.get("/debug/analyze-cache", dependencies=[Depends(require_admin)])
+async def analyze_cache_status():
+    """Analysis cache hit/miss counters and the model calls/latency they saved."""
+    return ANALYSIS_CACHE.snapshot()
+
+@api_router.get("/debug/image-pool", dependencies=[Depends(require_admin)])
+async def image_pool_status():
+    """Image resize pool depth, rejections and wait/run times."""
+    return IMAGE_POOL.snapshot()
+
+@api_router.get("/debug/analyze-admission", dependencies=[Depends(require_admin)])
+async def analyze_admission_status():
+    """Vision call concurrency, queue depth, wait times and rejections."""
+    return VISION_ADMISSION.snapshot()
+
+@api_router.get("/debug/meal-memory", dependencies=[Depends(require_admin)])
+async def meal_memory_status():
+    """Meal memory hits/misses, stored and evicted meals."""
+    return MEAL_MEMORY.snapshot()
+
+@api_router.get("/debug/vision-hedging", dependencies=[Depends(require_admin)])
+async def vision_hedging_status():
+    """Primary/fallback outcomes, hedge delay and circuit breaker state."""
+    return VISION_HEDGER.snapshot()
+
+@api_router.get("/debug/vision-router", dependencies=[Depends(require_admin)])
+async def vision_router_status():
+    """Model routing decisions per model and reason, complexity mix, budget and model health."""
+    return {
+        **VISION_ROUTER.snapshot(),
+        "hedgers": {VISION_MODEL_PRIMARY: VISION_HEDGER.snapshot(), **{m: h.snapshot() for m, h in VISION_HEDGERS.items()}},
+    }
+
+@api_router.get("/debug/llm-usage", dependencies=[Depends(require_admin)])
+async def llm_usage_status(hours: float = Query(24, gt=0, le=48)):
+    """LLM tokens, estimated cost and latency per endpoint, model and top users.
+    
+    `process` covers this worker since start; `stored` aggregates the
+    llm_usage collection over the last `hours` (null without MongoDB).
+    Users are listed by a hash of their id.
+    """
+    return {"process": LLM_USAGE.snapshot(), "stored": await LLM_USAGE.stored_summary(hours)}
+
+@api_router.get("/debug/analyze-jobs", dependencies=[Depends(require_admin)])
+async def analyze_jobs_status():
+    """Job queue depth and submitted/deduplicated/finished counters."""
+    return ANALYSIS_JOBS.snapshot()
+
+@api_router.get("/debug/analyze-stream", dependencies=[Depends(require_admin)])
+async def analyze_stream_status():
+    """Streaming analyze counters and time-to-first-item percentiles."""
+    p50 = ANALYZE_STREAM_FIRST_ITEM.percentile(0.5)
+    p95 = ANALYZE_STREAM_FIRST_ITEM.percentile(0.95)
+    return {
+        **ANALYZE_STREAM_STATS,
+        "first_item_samples": len(ANALYZE_STREAM_FIRST_ITEM),
+        "first_item_p50_ms": round(p50 * 1000) if p50 is not None else None,
+        "first_item_p95_ms": round(p95 * 1000) if p95 is not None else None,
+    }
+
 
 # -------------------------
 # WATER TRACKING
@@ -2894,6 +3874,7 @@ async def generate_weekly_diet(
     """Generate detailed 7-day diet plan with full meal details (Premium feature)."""
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/diet/generate-weekly", current_user.user_id)
     
     if not current_user.is_premium:
         raise HTTPException(status_code=403, detail="Premium subscription required")
@@ -2994,13 +3975,16 @@ Create all 7 days with different, varied, and delicious meals. Use Turkish cuisi
         if api_key and api_key.startswith("sk-emergent"):
             base_url = "https://emergent-api.onrender.com/v1"
         
-        client = openai.OpenAI(api_key=api_key, base_url=base_url)
-        response = client.chat.completions.create(
-            model=VISION_MODEL_PRIMARY,
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=8000,
-            response_format={"type": "json_object"}
-        )
+        client = get_llm_client(api_key, base_url)
+        with LLM_USAGE.track("diet_weekly"):
+            response = await LLM_USAGE.create(
+                client,
+                model=VISION_MODEL_PRIMARY,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=8000,
+                response_format={"type": "json_object"},
+                timeout=llm_timeout(LLM_LONG_READ_TIMEOUT)
+            )
         
         result_text = response.choices[0].message.content
         diet_plan = parse_llm_json_response(result_text)
@@ -3191,6 +4175,7 @@ async def generate_personal_diet(
     """Generate personalized diet plan using GPT-5 nano (Premium feature)."""
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    set_usage_context("/diet/generate-personal", current_user.user_id)
     
     if not current_user.is_premium:
         raise HTTPException(status_code=403, detail="Premium subscription required")
@@ -3233,13 +4218,16 @@ Make meals realistic, delicious, and balanced. Use Turkish cuisine."""
         if api_key and api_key.startswith("sk-emergent"):
             base_url = "https://emergent-api.onrender.com/v1"
         
-        client = openai.OpenAI(api_key=api_key, base_url=base_url)
-        response = client.chat.completions.create(
-            model=VISION_MODEL_PRIMARY,
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=4000,
-            response_format={"type": "json_object"}
-        )
+        client = get_llm_client(api_key, base_url)
+        with LLM_USAGE.track("diet_personal"):
+            response = await LLM_USAGE.create(
+                client,
+                model=VISION_MODEL_PRIMARY,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=4000,
+                response_format={"type": "json_object"},
+                timeout=llm_timeout(LLM_LONG_READ_TIMEOUT)
+            )
         
         result_text = response.choices[0].message.content
         diet_plan = parse_llm_json_response(result_text)
@@ -4491,6 +5479,10 @@ app.include_router(api_router)
 @app.on_event("shutdown")
 async def shutdown_db_client():
   global mongo_client
+  IMAGE_POOL.shutdown()
+  await ANALYSIS_JOBS.stop()
+  await LLM_USAGE.stop()
+  await LLM_CLIENTS.aclose()
   try:
     if mongo_client:
       mongo_client.close()
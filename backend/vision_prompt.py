@@ -0,0 +1,135 @@
+# =============================================================================
+# VISION PROMPT - Compact food analysis prompt with a strict JSON schema
+# =============================================================================
+# The original analysis prompt (server.vision_request_params, "legacy") is a
+# long Turkish instruction block with an example JSON document, rebuilt per
+# request, and asks the model for a `total` block that the API recomputes
+# anyway. The "compact" variant:
+#
+#   * has a short English system prompt that never changes (the locale and
+#     user context go in the user message), so the request prefix is
+#     byte-identical across requests and provider-side prompt caching can
+#     apply to it
+#   * uses `response_format: json_schema` (strict) generated from the
+#     pydantic models below, with flat item fields and no totals, which
+#     keeps the completion short
+#   * validates the reply with a precompiled TypeAdapter and converts it to
+#     the internal result shape (quantity_estimate / macros / total), so
+#     everything downstream is unchanged
+# =============================================================================
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+PROMPT_LEGACY = "legacy"
+PROMPT_COMPACT = "compact"
+
+# The schema names the fields; the prompt only says what the schema can't
+COMPACT_SYSTEM_PROMPT = (
+    "Estimate the foods in a meal photo for a calorie tracker: one item per distinct food or drink, "
+    "named in the requested language. Judge portions from plate size, utensils and hands; "
+    "grams_low/grams_high bound the portion, confidence is 0-1. No food visible: no items. "
+    "Ask questions only if the answer would change the estimate a lot. Notes: short or empty."
+)
+
+
+class CompactVisionItem(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    grams: float
+    grams_low: float
+    grams_high: float
+    kcal: int
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+    confidence: float
+
+
+class CompactVisionAnalysis(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CompactVisionItem]
+    questions: List[str]
+    notes: str
+
+
+def _lean_schema(node: Any, defs: Optional[Dict[str, Any]] = None) -> Any:
+    # Titles and $defs/$ref indirection are prompt tokens the model does not need
+    if isinstance(node, dict):
+        if defs is None:
+            defs = node.get("$defs", {})
+        if "$ref" in node:
+            return _lean_schema(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+        return {k: _lean_schema(v, defs) for k, v in node.items() if k not in ("title", "$defs")}
+    if isinstance(node, list):
+        return [_lean_schema(v, defs) for v in node]
+    return node
+
+
+COMPACT_ADAPTER = TypeAdapter(CompactVisionAnalysis)
+COMPACT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "food_analysis",
+        "strict": True,
+        "schema": _lean_schema(COMPACT_ADAPTER.json_schema()),
+    },
+}
+
+
+def prompt_variant(seed: str, compact_share: float) -> str:
+    """A/B variant for `seed` (a user id or image); the same seed always gets the same variant."""
+    bucket = int(hashlib.sha256(seed.encode("utf-8")).hexdigest()[:8], 16) / 0x1_0000_0000
+    return PROMPT_COMPACT if bucket < compact_share else PROMPT_LEGACY
+
+
+def compact_user_prompt(locale: str, context: str = "") -> str:
+    language = "Turkish" if locale.startswith("tr") else "English"
+    prompt = f"Locale: {locale}. Food names in {language}."
+    if context and context.strip():
+        prompt += f" User note: {context.strip()}"
+    return prompt
+
+
+def result_totals(items: List[Dict[str, Any]]) -> Dict[str, float]:
+    """`total` block of a vision result from its items."""
+    return {
+        "calories_kcal": sum(int(i.get("calories_kcal") or 0) for i in items),
+        "protein_g": round(sum(float(i.get("macros", {}).get("protein_g") or 0) for i in items), 1),
+        "carbs_g": round(sum(float(i.get("macros", {}).get("carbs_g") or 0) for i in items), 1),
+        "fat_g": round(sum(float(i.get("macros", {}).get("fat_g") or 0) for i in items), 1),
+    }
+
+
+def _internal_item(item: CompactVisionItem) -> Dict[str, Any]:
+    low, high = sorted((item.grams_low, item.grams_high))
+    return {
+        "name": item.name,
+        "quantity_estimate": {"grams": item.grams, "range_grams": [low, high]},
+        "calories_kcal": item.kcal,
+        "macros": {"protein_g": item.protein_g, "carbs_g": item.carbs_g, "fat_g": item.fat_g},
+        "confidence": min(1.0, max(0.0, item.confidence)),
+    }
+
+
+def compact_item(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """One streamed compact item (already JSON-decoded) in the internal item shape."""
+    return _internal_item(CompactVisionItem.model_validate(raw))
+
+
+def parse_compact_response(content: str) -> Dict[str, Any]:
+    """Validate a compact-variant reply; raises pydantic.ValidationError on schema mismatch."""
+    analysis = COMPACT_ADAPTER.validate_json(content)
+    items = [_internal_item(item) for item in analysis.items]
+    return {
+        "items": items,
+        "total": result_totals(items),
+        "questions": analysis.questions,
+        "notes": analysis.notes,
+    }
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from admission import AdmissionController, AdmissionRejected
+
+
+def test_calls_beyond_the_limit_wait_for_a_slot():
+    admission = AdmissionController(max_concurrent=2, max_queue=4, queue_timeout=1.0)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with admission.slot():
+            peak = max(peak, admission._active)
+            await asyncio.sleep(0.02)
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2
+    assert admission.stats["admitted"] == 6
+    assert admission.stats["queued"] == 4
+    assert admission._active == 0 and admission._waiting == 0
+
+
+def test_full_queue_is_rejected_immediately():
+    admission = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5.0)
+
+    async def scenario():
+        await admission.acquire()
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire()
+        admission.release(0.1)
+        await waiter
+        admission.release(0.1)
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.reason == "queue full"
+    assert rejected.retry_after >= 1
+    assert admission.stats["rejected_queue_full"] == 1
+
+
+def test_queued_call_past_its_deadline_is_rejected():
+    admission = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout=0.05)
+
+    async def scenario():
+        await admission.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire()
+        admission.release(0.1)
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.reason == "queue deadline exceeded"
+    assert admission.stats["rejected_deadline"] == 1
+    assert admission._waiting == 0
+
+
+def test_retry_after_scales_with_queue_and_service_time():
+    admission = AdmissionController(max_concurrent=2, max_queue=10)
+    assert admission.retry_after() == 1  # no samples yet
+
+    async def scenario():
+        await admission.acquire()
+        admission.release(4.0)
+
+    asyncio.run(scenario())
+    admission._waiting = 3
+    assert admission.retry_after() == 8  # ceil(4.0 * (3 + 1) / 2)
+
+
+def test_try_acquire_never_queues():
+    admission = AdmissionController(max_concurrent=1, max_queue=4)
+
+    async def scenario():
+        first = await admission.try_acquire()
+        second = await admission.try_acquire()
+        admission.release(0.1)
+        third = await admission.try_acquire()
+        admission.release(0.1)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == (True, False, True)
+    assert admission.stats["rejected_busy"] == 1
+    assert admission.stats["queued"] == 0
@@ -0,0 +1,134 @@
+import asyncio
+import io
+
+import pytest
+
+from analysis_cache import AnalysisCache, content_key, image_dhash, request_scope
+
+Image = pytest.importorskip("PIL.Image")
+
+RESULT = {"items": [{"name": "menemen"}]}
+
+
+def photo(size=None, quality=90):
+    image = Image.new("RGB", (320, 240))
+    image.putdata([((x * 3) % 256, (y * 5) % 256, ((x + y) * 2) % 256)
+                   for y in range(240) for x in range(320)])
+    if size is not None:
+        image = image.resize(size)
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def test_dhash_survives_reencoding_and_resizing():
+    original = image_dhash(photo())
+    reencoded = image_dhash(photo(quality=40))
+    resized = image_dhash(photo(size=(640, 480)))
+    assert original is not None
+    assert (original ^ reencoded).bit_count() <= 4
+    assert (original ^ resized).bit_count() <= 4
+    assert image_dhash(b"not an image") is None
+
+
+def test_key_and_scope_separate_locale_context_and_variant():
+    keys = {content_key("abc", "tr"), content_key("abc", "en"), content_key("abc", "tr", "lunch"),
+            content_key("abc", "tr", variant="gpt-4o-mini/high"), content_key("abd", "tr")}
+    assert len(keys) == 5
+    assert request_scope("tr", " lunch ") == request_scope("tr", "lunch")
+    assert request_scope("tr", variant="a") != request_scope("tr", variant="b")
+
+
+def test_exact_and_perceptual_hits_skip_compute():
+    cache = AnalysisCache(max_distance=4)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return RESULT
+
+    async def scenario():
+        scope = request_scope("tr")
+        first = await cache.get_or_compute("k1", scope, 0b1010, compute)
+        exact = await cache.get_or_compute("k1", scope, 0b1010, compute)
+        near = await cache.get_or_compute("k2", scope, 0b1010 ^ 0b1111, compute)
+        far = await cache.get_or_compute("k3", scope, 0b1010 ^ 0b11111, compute)
+        other_scope = await cache.get_or_compute("k4", request_scope("en"), 0b1010, compute)
+        return first, exact, near, far, other_scope
+
+    results = asyncio.run(scenario())
+    assert all(result == RESULT for result in results)
+    assert len(calls) == 3  # first, far, other_scope
+    assert cache.stats["hits_exact"] == 1 and cache.stats["hits_perceptual"] == 1
+    assert cache.stats["misses"] == 3
+
+
+def test_hits_are_copies():
+    cache = AnalysisCache()
+
+    async def compute():
+        return {"items": []}
+
+    async def scenario():
+        first = await cache.get_or_compute("k", "s", None, compute)
+        first["items"].append("mutated")
+        return await cache.get_or_compute("k", "s", None, compute)
+
+    assert asyncio.run(scenario()) == {"items": []}
+
+
+def test_concurrent_requests_are_coalesced():
+    cache = AnalysisCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return RESULT
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_compute("k", "s", None, compute) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert results == [RESULT] * 5
+    assert len(calls) == 1
+    assert cache.stats["coalesced"] == 4
+
+
+def test_failure_reaches_waiters_and_is_not_cached():
+    cache = AnalysisCache()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("model down")
+
+    async def ok():
+        return RESULT
+
+    async def scenario():
+        outcomes = await asyncio.gather(
+            *(cache.get_or_compute("k", "s", None, failing) for _ in range(3)), return_exceptions=True
+        )
+        return outcomes, await cache.get_or_compute("k", "s", None, ok)
+
+    outcomes, retried = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert retried == RESULT
+
+
+def test_lru_evicts_oldest_entry():
+    cache = AnalysisCache(max_entries=2, max_distance=-1)
+
+    async def compute():
+        return RESULT
+
+    async def scenario():
+        for key in ("a", "b", "a", "c"):
+            await cache.get_or_compute(key, "s", None, compute)
+
+    asyncio.run(scenario())
+    assert list(cache._entries) == ["a", "c"]
+    assert cache.stats["evictions"] == 1
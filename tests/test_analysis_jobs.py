@@ -0,0 +1,110 @@
+import asyncio
+from datetime import timedelta
+
+from analysis_jobs import STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED, AnalysisJobQueue, _now
+
+
+def test_queued_job_lease_is_renewed_while_waiting():
+    async def scenario():
+        jobs = AnalysisJobQueue(workers=1, stale_seconds=0.2, heartbeat_seconds=0.05)
+        release = asyncio.Event()
+
+        async def blocking():
+            await release.wait()
+            return {"items": []}
+
+        async def done():
+            return {"items": ["soup"]}
+
+        await jobs.submit("u1", "busy", blocking)
+        queued, _ = await jobs.submit("u1", "waiting", done)
+        await asyncio.sleep(0.5)
+
+        polled = dict(await jobs.get(queued["_id"], "u1"))
+        again, deduplicated = await jobs.submit("u1", "waiting", done)
+
+        release.set()
+        await jobs._queue.join()
+        finished = await jobs.get(queued["_id"], "u1")
+        await jobs.stop()
+        return queued, polled, again, deduplicated, finished
+
+    queued, polled, again, deduplicated, finished = asyncio.run(scenario())
+    assert polled["status"] == STATUS_QUEUED
+    assert deduplicated and again["_id"] == queued["_id"]
+    assert finished["status"] == STATUS_SUCCEEDED
+    assert finished["result"] == {"items": ["soup"]}
+
+
+def test_orphaned_queued_job_is_lost_and_resubmission_starts_over():
+    async def scenario():
+        jobs = AnalysisJobQueue(workers=1, stale_seconds=600)
+        now = _now()
+        # Persisted by a process that went away before a worker picked it up
+        orphan = {
+            "_id": "job_orphan", "user_id": "u1", "image_hash": "photo", "owner": "gone",
+            "status": STATUS_QUEUED, "result": None, "error": None,
+            "created_at": now - timedelta(seconds=3600), "updated_at": now - timedelta(seconds=3600),
+            "expires_at": now + timedelta(hours=23),
+        }
+        jobs._memory[orphan["_id"]] = orphan
+
+        async def work():
+            return {"items": ["soup"]}
+
+        polled = await jobs.get("job_orphan", "u1")
+        job, deduplicated = await jobs.submit("u1", "photo", work)
+        await jobs._queue.join()
+        finished = await jobs.get(job["_id"], "u1")
+        await jobs.stop()
+        return polled, job, deduplicated, finished
+
+    polled, job, deduplicated, finished = asyncio.run(scenario())
+    assert polled["status"] == "failed"
+    assert polled["error"]["status_code"] == 503
+    assert not deduplicated and job["_id"] != "job_orphan"
+    assert job["owner"] != "gone"
+    assert finished["status"] == STATUS_SUCCEEDED
+
+
+def test_running_job_heartbeat_keeps_it_live():
+    async def scenario():
+        jobs = AnalysisJobQueue(workers=1, stale_seconds=0.2, heartbeat_seconds=0.05)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return {"items": []}
+
+        job, _ = await jobs.submit("u1", "slow", slow)
+        await asyncio.sleep(0.5)
+        running = dict(await jobs.get(job["_id"], "u1"))
+
+        jobs.heartbeat_seconds = 3600
+        release.set()
+        await jobs._queue.join()
+        await jobs.stop()
+        return running
+
+    running = asyncio.run(scenario())
+    assert running["status"] == STATUS_RUNNING
+
+
+def test_running_job_without_heartbeat_is_lost():
+    async def scenario():
+        jobs = AnalysisJobQueue(workers=1, stale_seconds=0.1, heartbeat_seconds=3600)
+        release = asyncio.Event()
+
+        async def stuck():
+            await release.wait()
+            return {"items": []}
+
+        job, _ = await jobs.submit("u1", "stuck", stuck)
+        await asyncio.sleep(0.2)
+        lost = await jobs.get(job["_id"], "u1")
+        await jobs.stop()
+        return lost
+
+    lost = asyncio.run(scenario())
+    assert lost["status"] == "failed"
+    assert lost["error"]["status_code"] == 503
@@ -0,0 +1,67 @@
+import pytest
+
+from food_catalog import FOOD_CATALOG
+from food_search import (
+    AUTOCOMPLETE_TOP_K,
+    FOOD_AUTOCOMPLETE,
+    SEARCH_FIELDS,
+    PrefixAutocomplete,
+    autocomplete_foods,
+    strip_portion,
+    tokenize,
+)
+
+
+def brute_force(names, prefix, k=AUTOCOMPLETE_TOP_K):
+    """Rows with a name (or a word-suffix of it) starting with `prefix`, ranked like the trie."""
+    key = " ".join(tokenize(prefix))
+    if not key:
+        return ()
+    best = {}
+    for row, name in enumerate(names):
+        tokens = tokenize(strip_portion(name))
+        for i in range(len(tokens)):
+            if " ".join(tokens[i:]).startswith(key):
+                rank = (1 if i else 0, len(tokens), row)
+                best[row] = min(best.get(row, rank), rank)
+    return tuple(rank[2] for rank in sorted(best.values())[:k])
+
+
+PREFIXES = ["t", "ta", "tav", "tavuk g", "TAVUK GÖ", "ız", "su", "süt", "pirinc", "mer", "c", "ch", "zz", "a b", "100"]
+
+
+@pytest.mark.parametrize("lang", sorted(SEARCH_FIELDS))
+@pytest.mark.parametrize("prefix", PREFIXES)
+def test_catalog_autocomplete_matches_brute_force(lang, prefix):
+    names = [food.get(SEARCH_FIELDS[lang]) or "" for food in FOOD_CATALOG]
+    assert FOOD_AUTOCOMPLETE[lang].lookup(prefix) == brute_force(names, prefix)
+
+
+def test_every_prefix_of_a_small_catalog_matches_brute_force():
+    names = [
+        "Elma (100g)", "Elmalı Turta", "Esmer Pirinç Levrek", "Pirinç Pilavı", "Pirinç",
+        "Levrek Izgara", "Elma Suyu (1 Bardak)", "Süt", "Sütlaç", "Su", "Ayran", "Ayva",
+    ]
+    index = PrefixAutocomplete(names, k=3)
+    prefixes = set()
+    for name in names:
+        tokens = tokenize(strip_portion(name))
+        for i in range(len(tokens)):
+            key = " ".join(tokens[i:])
+            prefixes.update(key[:n] for n in range(1, len(key) + 1))
+    for prefix in sorted(prefixes):
+        assert index.lookup(prefix) == brute_force(names, prefix, k=3), prefix
+
+
+def test_limit_and_empty_prefix():
+    assert len(FOOD_AUTOCOMPLETE["tr"].lookup("ta", limit=3)) == 3
+    assert FOOD_AUTOCOMPLETE["tr"].lookup("  ") == ()
+    assert autocomplete_foods("zzzzqq") == []
+
+
+def test_full_name_match_ranks_before_mid_name_word():
+    rows = FOOD_AUTOCOMPLETE["tr"].lookup("levrek")
+    names = [tokenize(strip_portion(FOOD_CATALOG[row]["name"])) for row in rows]
+    first_mid = next((i for i, tokens in enumerate(names) if tokens[0] != "levrek"), len(names))
+    assert all(tokens[0] == "levrek" for tokens in names[:first_mid])
+    assert all(tokens[0] != "levrek" for tokens in names[first_mid:])
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from food_catalog import FOOD_CATALOG, NUTRIENT_TABLE, NutrientTable, filter_foods
+
+
+def tied_foods(n=60, seed=7):
+    rng = random.Random(seed)
+    # Few distinct values, so most sort keys are ties
+    return [
+        {"calories": rng.choice([0, 50, 100, 100, 200]), "protein": rng.choice([0, 5, 10]),
+         "carbs": rng.choice([1, 2]), "fat": rng.choice([0.5, 1.5])}
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("sort", ["calories", "protein", "protein_density"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("limit", [1, 7, 25, 100])
+def test_pages_concatenate_to_the_stable_full_order(sort, descending, limit):
+    foods = tied_foods()
+    table = NutrientTable(foods)
+    ranges = {"carbs": (None, 1.5)}
+    expected = [
+        row for row in sorted(
+            (row for row in range(len(foods)) if foods[row]["carbs"] <= 1.5),
+            key=lambda row: ((-1 if descending else 1) * float(table.columns[sort][row]), row),
+        )
+    ]
+    pages = []
+    for offset in range(0, len(expected) + limit, limit):
+        total, rows = table.query(ranges, sort, descending, offset, limit)
+        assert total == len(expected)
+        pages.extend(rows.tolist())
+    assert pages == expected
+
+
+def test_mask_matches_python_filter_on_the_catalog():
+    ranges = {"protein": (20, None), "calories": (None, 400), "fat": (2, 15)}
+    expected = [
+        row for row, food in enumerate(FOOD_CATALOG)
+        if float(food["protein"]) >= 20 and float(food["calories"]) <= 400 and 2 <= float(food["fat"]) <= 15
+    ]
+    total, rows = NUTRIENT_TABLE.query(ranges, limit=len(FOOD_CATALOG))
+    assert total == len(expected)
+    assert rows.tolist() == expected
+
+
+def test_protein_density_is_zero_without_calories():
+    table = NutrientTable([{"calories": 0, "protein": 5, "carbs": 0, "fat": 0},
+                           {"calories": 200, "protein": 20, "carbs": 0, "fat": 0}])
+    assert table.columns["protein_density"].tolist() == [0.0, 10.0]
+
+
+def test_filter_foods_projects_the_page_with_derived_sort_field():
+    total, page = filter_foods({"calories": (100, None)}, sort="protein_density", descending=True, limit=5)
+    assert total > 5 and len(page) == 5
+    densities = [item["protein_density"] for item in page]
+    assert densities == sorted(densities, reverse=True)
+    assert all(item["calories"] >= 100 for item in page)
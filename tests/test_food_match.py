@@ -0,0 +1,41 @@
+import pytest
+
+from food_match import MATCH_MIN_SCORE, link_catalog_food, match_food
+
+
+@pytest.mark.parametrize("label", ["Izgara tavuk göğsü", "Grilled chicken breast", "Tavuk göğsü"])
+def test_plain_label_links_to_plain_food_not_composite(label):
+    linked = link_catalog_food(label)
+    assert linked is not None
+    assert linked["food_id"] == "food_001"
+    assert linked["score"] >= MATCH_MIN_SCORE
+
+
+@pytest.mark.parametrize("label", ["Izgara tavuk göğsü ve yoğurt", "Grilled chicken breast with yogurt"])
+def test_label_naming_every_component_links_to_composite(label):
+    assert link_catalog_food(label)["food_id"] == "food_3821"
+
+
+def test_match_food_ranks_exact_name_first():
+    matches = match_food("Mercimek çorbası", "tr", k=3)
+    assert matches[0]["food_id"] == "food_038"
+    assert matches[0]["match_score"] == 1.0
+    assert [m["match_score"] for m in matches] == sorted((m["match_score"] for m in matches), reverse=True)
+
+
+def test_linked_macros_scale_to_model_grams():
+    linked = link_catalog_food("Tavuk göğsü", "150")
+    per_100g = link_catalog_food("Tavuk göğsü", 100)
+    assert linked["calories"] == round(per_100g["calories"] * 1.5)
+    assert linked["protein"] == round(per_100g["protein"] * 1.5, 1)
+
+
+@pytest.mark.parametrize("grams", ["150g", [150], float("nan"), float("inf")])
+def test_unusable_model_grams_skip_linking(grams):
+    assert link_catalog_food("Tavuk göğsü", grams) is None
+
+
+def test_missing_grams_links_without_macros():
+    linked = link_catalog_food("Tavuk göğsü")
+    assert linked["food_id"] == "food_001"
+    assert linked["calories"] is None
@@ -0,0 +1,102 @@
+import gzip
+import json
+
+import pytest
+
+from food_catalog import (
+    FOOD_CATALOG, CatalogPayload, encoded_etag, etag_matches, get_catalog_payload, parse_accept_encoding,
+    project_food,
+)
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    ("*", True),
+    (ETAG, True),
+    ("W/" + ETAG, True),
+    ('"0123456789abcdef-gzip"', True),
+    ('"0123456789abcdef-br"', True),
+    ('"other", ' + ETAG, True),
+    ('"other", "another"', False),
+    ('"0123456789abcdef-deflate"', False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, ETAG) is expected
+
+
+def test_each_coding_has_its_own_etag():
+    assert encoded_etag(ETAG, None) == ETAG
+    assert encoded_etag(ETAG, "gzip") == '"0123456789abcdef-gzip"'
+    assert encoded_etag(ETAG, "gzip") != encoded_etag(ETAG, "br")
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, br;q=0.5, identity;q=0, x;q=bad") == {
+        "gzip": 1.0, "br": 0.5, "identity": 0.0, "x": 0.0,
+    }
+    assert parse_accept_encoding(None) == {}
+
+
+@pytest.mark.parametrize("accept, encoding", [
+    (None, None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("*", "br"),
+    ("br", "br"),
+    ("br;q=0, gzip", "gzip"),
+])
+def test_encoded_for_picks_an_accepted_coding(accept, encoding):
+    payload = CatalogPayload.build({"a": 1})
+    if payload.br_body is None and encoding == "br":
+        encoding = "gzip" if accept == "*" else None
+    body, chosen = payload.encoded_for(accept)
+    assert chosen == encoding
+    assert body == {None: payload.body, "gzip": payload.gzip_body, "br": payload.br_body}[chosen]
+
+
+@pytest.mark.parametrize("lang, name_field", [("tr", "name"), ("en", "name_en"), ("xx", "name")])
+def test_catalog_payload_is_the_projected_catalog(lang, name_field):
+    payload = get_catalog_payload(lang)
+    data = json.loads(gzip.decompress(payload.gzip_body))
+    assert json.loads(payload.body) == data
+    assert len(data) == len(FOOD_CATALOG)
+    assert data[0] == project_food(FOOD_CATALOG[0], lang)
+    assert data[0]["name"] == FOOD_CATALOG[0][name_field]
+
+
+def test_payloads_are_deterministic_and_etags_differ_per_language():
+    assert CatalogPayload.build([1, 2]).etag == CatalogPayload.build([1, 2]).etag
+    assert CatalogPayload.build([1, 2]).gzip_body == CatalogPayload.build([1, 2]).gzip_body
+    assert get_catalog_payload("tr").etag != get_catalog_payload("en").etag
+
+
+@pytest.fixture
+def client():
+    from datetime import datetime, timezone
+
+    testclient = pytest.importorskip("fastapi.testclient")
+    import server
+
+    user = server.User(user_id="u1", email="u1@example.com", name="U", created_at=datetime.now(timezone.utc))
+    server.app.dependency_overrides[server.get_current_user] = lambda: user
+    yield testclient.TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+def test_database_endpoint_revalidates_with_304(client):
+    first = client.get("/api/food/database?lang=en", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].endswith('-gzip"')
+    assert len(first.json()) == len(FOOD_CATALOG)
+
+    again = client.get("/api/food/database?lang=en", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    other_lang = client.get("/api/food/database?lang=tr", headers={"If-None-Match": first.headers["etag"]})
+    assert other_lang.status_code == 200
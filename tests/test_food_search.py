@@ -0,0 +1,85 @@
+import pytest
+
+from food_catalog import FOOD_CATALOG
+from food_search import (
+    FOOD_SEARCH_INDEX,
+    MAX_PREFIX_EXPANSION,
+    OTHER_FIELD_PENALTY,
+    SEARCH_FIELDS,
+    TIER_ALL_TOKENS,
+    TIER_EXACT,
+    TIER_PARTIAL,
+    TIER_PREFIX,
+    normalize_text,
+    search_foods,
+    strip_portion,
+    tokenize,
+)
+
+
+@pytest.mark.parametrize("text, folded", [
+    ("İNCİR", "incir"),
+    ("ILIK SÜT", "ilik sut"),
+    ("Çiğ Köfte", "cig kofte"),
+    ("Işkembe Çorbası", "iskembe corbasi"),
+    ("Yoğurt", "yogurt"),
+    ("plain ascii", "plain ascii"),
+    ("", ""),
+])
+def test_turkish_folding(text, folded):
+    assert normalize_text(text) == folded
+
+
+def test_tokenize_and_strip_portion():
+    assert tokenize("Izgara Tavuk (100g)") == ["izgara", "tavuk", "100g"]
+    assert strip_portion("Somon (Izgara) (100g)") == "Somon (Izgara)"
+
+
+def brute_force(query, lang, limit):
+    """Tiered search by scanning every catalog name."""
+    tokens = tokenize(query)
+    best = {}
+    for field_lang, field in SEARCH_FIELDS.items():
+        names = [tokenize(food.get(field) or "") for food in FOOD_CATALOG]
+        vocab = sorted({t for name in names for t in name})
+        last = tokens[-1]
+        if last in vocab:
+            last_group = {last}
+        else:
+            last_group = set([t for t in vocab if t.startswith(last)][:MAX_PREFIX_EXPANSION])
+        groups = [{t} for t in tokens[:-1]] + [last_group]
+        penalty = 0 if field_lang == lang else OTHER_FIELD_PENALTY
+        for row, name in enumerate(names):
+            if not all(group & set(name) for group in groups):
+                continue
+            pos = min(name.index(t) for t in groups[0] if t in name)
+            base = tokenize(strip_portion(FOOD_CATALOG[row].get(field) or ""))
+            if name == tokens or base == tokens:
+                tier = TIER_EXACT
+            elif pos == 0:
+                tier = TIER_PREFIX
+            else:
+                tier = TIER_ALL_TOKENS if last in vocab else TIER_PARTIAL
+            key = (tier + penalty, pos, len(name), row)
+            best[row] = min(best.get(row, key), key)
+    return [(key[3], key[0]) for key in sorted(best.values())[:limit]]
+
+
+@pytest.mark.parametrize("query", [
+    "tavuk", "TAVUK GÖĞSÜ", "tavuk gogsu", "sut", "izgara tav", "mercimek ç", "chicken breast",
+    "pilav", "İncir", "yogurt granola", "xyzzy",
+])
+@pytest.mark.parametrize("lang", ["tr", "en"])
+def test_search_matches_brute_force(query, lang):
+    assert FOOD_SEARCH_INDEX.search(query, lang, 20) == brute_force(query, lang, 20)
+
+
+def test_search_is_case_and_diacritic_insensitive():
+    assert FOOD_SEARCH_INDEX.search("SÜT", "tr") == FOOD_SEARCH_INDEX.search("sut", "tr")
+    assert FOOD_SEARCH_INDEX.search("IZGARA", "tr") == FOOD_SEARCH_INDEX.search("ızgara", "tr")
+
+
+def test_exact_name_ranks_first():
+    results = search_foods("Mercimek Çorbası", "tr", 5)
+    assert results[0]["match_tier"] == TIER_EXACT
+    assert normalize_text(strip_portion(results[0]["name"])) == "mercimek corbasi"
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from food_catalog import FOOD_CATALOG
+from food_similar import MACRO_TREE, MacroKDTree, similar_foods
+
+
+def brute_force(tree, values, k, ranges=None, exclude=None):
+    point = (np.asarray(values, dtype=np.float64) - tree.mean) / tree.scale
+    diff = tree.points - point
+    dists = np.einsum("ij,ij->i", diff, diff)
+    keep = np.ones(tree.size, dtype=bool)
+    if exclude is not None:
+        keep &= tree.rows != exclude
+    low, high = tree._bounds(ranges)
+    keep &= np.all((tree.values >= np.array(low)) & (tree.values <= np.array(high)), axis=1)
+    ranked = sorted(zip(dists[keep].tolist(), tree.rows[keep].tolist()), key=lambda pair: (pair[0], pair[1]))
+    return [row for _, row in ranked[:k]]
+
+
+@pytest.mark.parametrize("row", [0, 17, 500, len(FOOD_CATALOG) // 2, len(FOOD_CATALOG) - 1])
+@pytest.mark.parametrize("k", [1, 10, 50])
+def test_tree_matches_brute_force(row, k):
+    values = MACRO_TREE.values_of(row)
+    found = [match for match, _ in MACRO_TREE.query(values, k, exclude=row)]
+    assert found == brute_force(MACRO_TREE, values, k, exclude=row)
+
+
+@pytest.mark.parametrize("ranges", [
+    {"protein": (20, None)},
+    {"calories": (None, 150), "fat": (None, 5)},
+    {"carbs": (10, 40), "protein": (5, 15)},
+])
+def test_constrained_query_matches_brute_force(ranges):
+    values = MACRO_TREE.values_of(3)
+    found = [match for match, _ in MACRO_TREE.query(values, 20, ranges, exclude=3)]
+    assert found == brute_force(MACRO_TREE, values, 20, ranges, exclude=3)
+
+
+def test_duplicate_points_are_ordered_by_row():
+    values = np.array([[100.0, 5.0, 10.0, 2.0]] * 10 + [[300.0, 20.0, 30.0, 10.0]] * 10)
+    tree = MacroKDTree(values, leaf_size=2)
+    result = tree.query([100.0, 5.0, 10.0, 2.0], 12)
+    assert [row for row, _ in result] == list(range(12))
+    assert [distance for _, distance in result[:10]] == [0.0] * 10
+
+
+def test_similar_foods_excludes_the_food_itself():
+    food_id = FOOD_CATALOG[42]["food_id"]
+    results = similar_foods(food_id, k=5)
+    assert len(results) == 5
+    assert all(item["food_id"] != food_id for item in results)
+    distances = [item["distance"] for item in results]
+    assert distances == sorted(distances)
+    assert similar_foods("no_such_food") is None
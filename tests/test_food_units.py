@@ -0,0 +1,73 @@
+import pytest
+
+from food_catalog import FOOD_CATALOG, FOOD_ROW_BY_ID, NUTRIENT_FIELDS
+from food_units import bulk_nutrients, normalize_unit, parse_serving
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Tavuk Göğsü (100g)", {"unit": "g", "count": 100.0, "grams": 100.0, "ml": None}),
+    ("Un (1kg)", {"unit": "g", "count": 1000.0, "grams": 1000.0, "ml": None}),
+    ("Kola (330ml)", {"unit": "ml", "count": 330.0, "grams": None, "ml": 330.0}),
+    ("Su (1,5 l)", {"unit": "ml", "count": 1500.0, "grams": None, "ml": 1500.0}),
+    ("Yumurta (1 Adet)", {"unit": "adet", "count": 1.0, "grams": None, "ml": None}),
+    ("Bal (1 Yemek Kaşığı)", {"unit": "yemek kasigi", "count": 1.0, "grams": None, "ml": None}),
+    ("Yulaf Lapası (1 Paket 40g)", {"unit": "paket", "count": 1.0, "grams": 40.0, "ml": None}),
+    ("Sarımsak (1 Diş ~5g)", {"unit": "dis", "count": 1.0, "grams": 5.0, "ml": None}),
+    ("Sütaş Süt (UHT) (1 Şişe 250ml)", {"unit": "sise", "count": 1.0, "grams": None, "ml": 250.0}),
+    ("Pizza (1/2 Tabak)", {"unit": "tabak", "count": 0.5, "grams": None, "ml": None}),
+    ("Sushi (Somon) (8 Parça)", {"unit": "parca", "count": 8.0, "grams": None, "ml": None}),
+    ("Kahve (Sade)", {"unit": "serving", "count": 1.0, "grams": None, "ml": None}),
+    ("Elma", {"unit": "serving", "count": 1.0, "grams": None, "ml": None}),
+])
+def test_parse_serving(name, expected):
+    assert parse_serving(name) == expected
+
+
+@pytest.mark.parametrize("unit, expected", [
+    (None, "serving"), ("G", "g"), ("grams", "g"), ("Adet", "adet"), ("piece", "adet"),
+    ("Yemek Kaşığı", "yemek kasigi"), ("tbsp", "yemek kasigi"), ("liter", "l"),
+])
+def test_normalize_unit(unit, expected):
+    assert normalize_unit(unit) == expected
+
+
+def macros(food_id, factor):
+    food = FOOD_CATALOG[FOOD_ROW_BY_ID[food_id]]
+    return {field: round(float(food[field]) * factor, 1) for field in NUTRIENT_FIELDS}
+
+
+def test_bulk_nutrients_converts_each_unit():
+    result = bulk_nutrients([
+        ("food_001", 250, "g"),          # (100g)
+        ("food_001", 0.5, "kg"),
+        ("food_1040", 2, "can"),         # (1 Kutu 400g)
+        ("food_1040", 100, "g"),
+        ("food_065", 0.66, "l"),         # (330ml)
+        ("food_1050", 3, "eggs"),        # (2 Yumurta)
+        ("food_010", 1.5, None),         # (1 Porsiyon)
+    ])
+    items = result["items"]
+    expected = [
+        ("food_001", 2.5), ("food_001", 5.0), ("food_1040", 2.0), ("food_1040", 0.25),
+        ("food_065", 2.0), ("food_1050", 1.5), ("food_010", 1.5),
+    ]
+    for item, (food_id, servings) in zip(items, expected):
+        assert "error" not in item
+        assert item["servings"] == servings
+        for field, value in macros(food_id, servings).items():
+            assert item[field] == pytest.approx(value, abs=0.11)
+
+
+def test_bulk_nutrients_reports_bad_lines_and_leaves_them_out_of_totals():
+    result = bulk_nutrients([
+        ("food_001", 100, "g"),
+        ("food_008", 50, "g"),           # (1 Adet), weight unknown
+        ("food_001", 1, "bowl"),         # not a unit of this food
+        ("no_such_food", 1, None),
+    ])
+    ok, no_weight, wrong_unit, unknown = result["items"]
+    assert no_weight["error"] == "unit not available for this food"
+    assert no_weight["serving"] == {"unit": "adet", "count": 1.0, "grams": None, "ml": None}
+    assert wrong_unit["error"] == "unit not available for this food"
+    assert unknown["error"] == "unknown food_id"
+    assert result["totals"] == {field: ok[field] for field in NUTRIENT_FIELDS}
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from food_catalog import CATALOG_VERSION, get_changes_payload
+from food_versions import CatalogVersions, advance_manifest
+
+EMPTY = {"version": 0, "rows": {}, "removed": {}}
+
+
+def history():
+    """v1: a, b, c; v2: b edited, d added; v3: c removed, d edited; v4: e added, e removed in v5."""
+    manifest, _ = advance_manifest(EMPTY, {"a": "a1", "b": "b1", "c": "c1"})
+    manifest, _ = advance_manifest(manifest, {"a": "a1", "b": "b2", "c": "c1", "d": "d1"})
+    manifest, _ = advance_manifest(manifest, {"a": "a1", "b": "b2", "d": "d2"})
+    manifest, _ = advance_manifest(manifest, {"a": "a1", "b": "b2", "d": "d2", "e": "e1"})
+    manifest, _ = advance_manifest(manifest, {"a": "a1", "b": "b2", "d": "d2"})
+    return manifest
+
+
+def test_unchanged_catalog_keeps_its_version():
+    manifest = history()
+    same, changed = advance_manifest(manifest, {"a": "a1", "b": "b2", "d": "d2"})
+    assert not changed and same is manifest
+    assert manifest["version"] == 5
+
+
+@pytest.mark.parametrize("since, expected", [
+    (0, (["a", "b", "d"], [], [])),
+    (1, (["d"], ["b"], ["c"])),
+    (2, ([], ["d"], ["c"])),
+    (3, ([], [], [])),
+    (4, ([], [], ["e"])),
+    (5, ([], [], [])),
+])
+def test_changes_since(since, expected):
+    added, updated, removed = CatalogVersions(history()).changes_since(since)
+    assert (sorted(added), sorted(updated), sorted(removed)) == tuple(sorted(part) for part in expected)
+
+
+def test_replaying_changes_reproduces_the_catalog():
+    manifest = history()
+    versions = CatalogVersions(manifest)
+    snapshots = {1: {"a", "b", "c"}, 2: {"a", "b", "c", "d"}, 3: {"a", "b", "d"}, 4: {"a", "b", "d", "e"}}
+    for since, rows in snapshots.items():
+        added, updated, removed = versions.changes_since(since)
+        assert set(updated) <= rows
+        assert (rows | set(added)) - set(removed) == set(manifest["rows"])
+
+
+@pytest.mark.parametrize("since", [-1, CATALOG_VERSION + 1])
+def test_unknown_version_asks_for_a_reset(since):
+    delta = json.loads(get_changes_payload(since, "tr").body)
+    assert delta == {"version": CATALOG_VERSION, "reset": True, "added": [], "updated": [], "removed": []}
+
+
+def test_current_version_has_no_changes():
+    delta = json.loads(get_changes_payload(CATALOG_VERSION, "en").body)
+    assert delta == {"version": CATALOG_VERSION, "reset": False, "added": [], "updated": [], "removed": []}
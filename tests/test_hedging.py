@@ -0,0 +1,202 @@
+"""HedgedCaller / CircuitBreaker against fake async primary and fallback calls."""
+
+import asyncio
+import time
+
+import pytest
+
+from admission import AdmissionController
+from hedging import (
+    PATH_BREAKER_FALLBACK,
+    PATH_FALLBACK_AFTER_ERROR,
+    PATH_HEDGED_FALLBACK,
+    PATH_PRIMARY,
+    CircuitBreaker,
+    HedgedCaller,
+)
+
+
+class FakeCall:
+    """Coroutine factory answering `value` after `delay` seconds (or raising `error`)."""
+
+    def __init__(self, value=None, delay=0.0, error=None):
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.started = 0
+        self.cancelled = 0
+
+    def __call__(self):
+        return self._run()
+
+    async def _run(self):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def caller(breaker=None, **kwargs):
+    kwargs.setdefault("default_delay", 0.05)
+    kwargs.setdefault("min_delay", 0.0)
+    return HedgedCaller(breaker or CircuitBreaker(window=10, min_calls=5), **kwargs)
+
+
+def test_slow_primary_is_hedged_and_fallback_wins():
+    hedger = caller()
+    primary, fallback = FakeCall("primary", delay=2.0), FakeCall("fallback", delay=0.01)
+
+    async def run():
+        started = time.monotonic()
+        result = await hedger.call(primary, fallback)
+        return result, time.monotonic() - started
+
+    (result, path), elapsed = asyncio.run(run())
+
+    assert (result, path) == ("fallback", PATH_HEDGED_FALLBACK)
+    assert 0.05 <= elapsed < 1.0
+    assert fallback.started == 1
+    assert primary.cancelled == 1
+    assert hedger.stats["hedges_started"] == 1
+    assert hedger.stats["hedge_fallback_won"] == 1
+
+
+def test_fast_primary_is_not_hedged():
+    hedger = caller()
+    fallback = FakeCall("fallback")
+
+    result, path = asyncio.run(hedger.call(FakeCall("primary"), fallback))
+
+    assert (result, path) == ("primary", PATH_PRIMARY)
+    assert fallback.started == 0
+
+
+def test_primary_error_falls_back_and_counts_against_breaker():
+    hedger = caller()
+    primary = FakeCall(error=RuntimeError("boom"))
+
+    result, path = asyncio.run(hedger.call(primary, FakeCall("fallback")))
+
+    assert (result, path) == ("fallback", PATH_FALLBACK_AFTER_ERROR)
+    assert hedger.stats["fallback_after_error"] == 1
+    assert hedger.breaker.snapshot()["recent_errors"] == 1
+
+
+def test_both_failing_raises_fallback_error():
+    hedger = caller()
+    with pytest.raises(ValueError):
+        asyncio.run(hedger.call(FakeCall(error=RuntimeError("p")), FakeCall(error=ValueError("f"))))
+    assert hedger.stats["failed"] == 1
+
+
+def test_breaker_opens_half_opens_and_closes():
+    breaker = CircuitBreaker(window=4, min_calls=2, error_rate=0.5, cooldown=0.05)
+    hedger = caller(breaker, hedge_enabled=False)
+    failing = FakeCall(error=RuntimeError("down"))
+
+    for _ in range(2):
+        asyncio.run(hedger.call(failing, FakeCall("fallback")))
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Open: the primary is not attempted at all
+    result, path = asyncio.run(hedger.call(failing, FakeCall("fallback")))
+    assert path == PATH_BREAKER_FALLBACK
+    assert failing.started == 2
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    result, path = asyncio.run(hedger.call(FakeCall("primary"), FakeCall("fallback")))
+    assert (result, path) == ("primary", PATH_PRIMARY)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.opened == 1
+
+
+def test_failed_probe_reopens_breaker():
+    breaker = CircuitBreaker(window=4, min_calls=2, error_rate=0.5, cooldown=0.05)
+    for _ in range(2):
+        breaker.record(False)
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opened == 2
+
+
+def test_cancelled_caller_releases_half_open_probe():
+    breaker = CircuitBreaker(window=4, min_calls=2, error_rate=0.5, cooldown=0.05)
+    for _ in range(2):
+        breaker.record(False)
+    time.sleep(0.06)
+    hedger = caller(breaker, hedge_enabled=False)
+    primary = FakeCall("primary", delay=5.0)
+
+    async def run():
+        task = asyncio.create_task(hedger.call(primary, FakeCall("fallback")))
+        await asyncio.sleep(0.02)
+        assert not breaker.allow()  # the probe is in flight
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert primary.cancelled == 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()  # the next caller may probe
+
+
+def test_hedge_takes_its_own_admission_slot():
+    admission = AdmissionController(max_concurrent=2)
+    hedger = caller()
+    primary, fallback = FakeCall("primary", delay=2.0), FakeCall("fallback", delay=0.05)
+
+    async def run():
+        async with admission.slot():
+            result = await hedger.call(primary, fallback, admission=admission)
+            return result, admission.snapshot()["active"]
+
+    (result, path), active_after = asyncio.run(run())
+
+    assert (result, path) == ("fallback", PATH_HEDGED_FALLBACK)
+    assert admission.stats["admitted"] == 2
+    assert active_after == 1  # the hedge's slot was released, the caller's is still held
+
+
+def test_hedge_is_skipped_without_a_free_slot():
+    admission = AdmissionController(max_concurrent=1)
+    hedger = caller()
+    primary, fallback = FakeCall("primary", delay=0.2), FakeCall("fallback")
+
+    async def run():
+        async with admission.slot():
+            return await hedger.call(primary, fallback, admission=admission)
+
+    result, path = asyncio.run(run())
+
+    assert (result, path) == ("primary", PATH_PRIMARY)
+    assert fallback.started == 0
+    assert hedger.stats["hedges_skipped"] == 1
+    assert admission.stats["rejected_busy"] == 1
+
+
+def test_primary_error_after_skipped_hedge_still_falls_back():
+    admission = AdmissionController(max_concurrent=1)
+    hedger = caller()
+    primary = FakeCall(delay=0.2, error=RuntimeError("boom"))
+    fallback = FakeCall("fallback")
+
+    async def run():
+        async with admission.slot():
+            return await hedger.call(primary, fallback, admission=admission)
+
+    result, path = asyncio.run(run())
+
+    assert (result, path) == ("fallback", PATH_FALLBACK_AFTER_ERROR)
+    assert hedger.stats["hedges_skipped"] == 1
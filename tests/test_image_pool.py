@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from image_pool import ImagePoolBusy, ImageWorkPool
+
+
+def test_work_runs_off_the_event_loop_thread():
+    pool = ImageWorkPool(max_workers=2, max_queue=2)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        worker_thread = await pool.run(lambda: (time.sleep(0.2), threading.get_ident())[1])
+        task.cancel()
+        return loop_thread, worker_thread, ticks
+
+    loop_thread, worker_thread, ticks = asyncio.run(scenario())
+    pool.shutdown()
+    assert worker_thread != loop_thread
+    assert ticks >= 5  # the loop kept running while the job slept
+
+
+def test_full_queue_rejects_immediately():
+    pool = ImageWorkPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        jobs = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(ImagePoolBusy):
+            await pool.run(release.wait)
+        pending = pool.pending
+        release.set()
+        await asyncio.gather(*jobs)
+        return pending
+
+    assert asyncio.run(scenario()) == 2
+    assert pool.stats["rejected"] == 1
+    assert pool.stats["completed"] == 2
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_errors_propagate_and_free_the_slot():
+    pool = ImageWorkPool(max_workers=1, max_queue=0)
+
+    def broken():
+        raise ValueError("cannot identify image file")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await pool.run(broken)
+        return await pool.run(lambda x: x * 2, 21)
+
+    assert asyncio.run(scenario()) == 42
+    assert pool.stats["failed"] == 1
+    pool.shutdown()
@@ -0,0 +1,80 @@
+import io
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from image_resize import (
+    DETAIL_HIGH, DETAIL_LOW, QUALITY_STEPS, encode_within_budget, image_complexity, resize_for_vision, target_size,
+)
+
+
+def jpeg(size, orientation=None, noise=False):
+    image = Image.new("RGB", size, (200, 120, 40))
+    if noise:
+        rng = random.Random(1)
+        image.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+                       for _ in range(size[0] * size[1])])
+    buffer = io.BytesIO()
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    image.save(buffer, "JPEG", quality=90, exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("size, detail, expected", [
+    ((4000, 3000), DETAIL_LOW, (512, 384)),
+    ((3000, 4000), DETAIL_LOW, (384, 512)),
+    ((4000, 3000), DETAIL_HIGH, (1024, 768)),
+    ((8000, 1000), DETAIL_HIGH, (2048, 256)),
+    ((300, 200), DETAIL_LOW, (300, 200)),
+    ((700, 700), DETAIL_HIGH, (700, 700)),
+])
+def test_target_size(size, detail, expected):
+    assert target_size(*size, detail) == expected
+
+
+@pytest.mark.parametrize("detail, decoded, output", [
+    (DETAIL_LOW, (1000, 750), (512, 384)),
+    (DETAIL_HIGH, (2000, 1500), (1024, 768)),
+])
+def test_jpeg_is_drafted_at_reduced_scale(detail, decoded, output):
+    result = resize_for_vision(jpeg((4000, 3000)), detail)
+    assert result.source_size == (4000, 3000)
+    assert result.decoded_size == decoded
+    assert (result.width, result.height) == output
+    assert Image.open(io.BytesIO(result.jpeg)).size == output
+
+
+def test_exif_orientation_is_applied():
+    result = resize_for_vision(jpeg((800, 600), orientation=6), DETAIL_LOW)
+    assert (result.width, result.height) == (384, 512)
+
+
+@pytest.mark.parametrize("step", range(len(QUALITY_STEPS)))
+def test_highest_quality_step_that_fits_the_budget(step):
+    image = Image.open(io.BytesIO(jpeg((256, 256), noise=True)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=QUALITY_STEPS[step])
+    data, quality = encode_within_budget(image, len(buffer.getvalue()))
+    assert quality == QUALITY_STEPS[step]
+    assert data == buffer.getvalue()
+
+
+def test_nothing_fits_falls_back_to_the_lowest_step():
+    image = Image.open(io.BytesIO(jpeg((256, 256), noise=True)))
+    assert encode_within_budget(image, 100)[1] == QUALITY_STEPS[-1]
+
+
+def test_complexity_separates_flat_from_busy_images():
+    flat = image_complexity(Image.new("RGB", (256, 256), (240, 240, 240)))
+    busy = resize_for_vision(jpeg((256, 256), noise=True), DETAIL_LOW).complexity
+    assert flat == 0.0
+    assert busy > 0.5
+
+
+def test_undecodable_input_raises():
+    with pytest.raises(OSError):
+        resize_for_vision(b"definitely not an image")
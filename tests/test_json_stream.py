@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from json_stream import JsonArrayItems
+
+DOCUMENT = json.dumps({
+    "meta": {"items": [{"decoy": True}], "note": "not the {items} you want"},
+    "tags": ["a", "b"],
+    "items": [
+        {"name": "menemen", "portion": {"grams": 250, "notes": ["pan", "}"]}},
+        {"name": "ayran \"yayık\"", "calories_kcal": 70},
+        {"name": "pide \\ {kıymalı}", "calories_kcal": 520.5},
+    ],
+    "total": {"calories_kcal": 890},
+}, ensure_ascii=False)
+ITEMS = json.loads(DOCUMENT)["items"]
+
+
+def parse(chunks):
+    parser = JsonArrayItems("items")
+    found = []
+    for chunk in chunks:
+        found.extend(parser.feed(chunk))
+    return parser, found
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 64, len(DOCUMENT)])
+def test_items_are_the_same_for_any_chunk_size(size):
+    parser, found = parse(DOCUMENT[i:i + size] for i in range(0, len(DOCUMENT), size))
+    assert found == ITEMS
+    assert parser.done
+
+
+def test_items_are_the_same_for_every_split_point():
+    for split in range(len(DOCUMENT) + 1):
+        _, found = parse([DOCUMENT[:split], DOCUMENT[split:]])
+        assert found == ITEMS, split
+
+
+def test_each_item_is_emitted_when_its_closing_brace_arrives():
+    parser = JsonArrayItems("items")
+    end_of_first = DOCUMENT.index(', {"name": "ayran') - 1  # the "}" closing item 1
+    assert parser.feed(DOCUMENT[:end_of_first]) == []
+    assert parser.feed(DOCUMENT[end_of_first:end_of_first + 1]) == ITEMS[:1]
+    assert not parser.done
+
+
+def test_buffer_only_holds_the_unfinished_element():
+    parser = JsonArrayItems("items")
+    parser.feed(DOCUMENT[:DOCUMENT.index('{"name": "pide')])
+    assert len(parser._text) < 10
+
+
+def test_input_after_the_array_is_ignored():
+    parser = JsonArrayItems("items")
+    assert parser.feed('{"items": [{"a": 1}], "more": [{"b": 2}]}') == [{"a": 1}]
+    assert parser.done
+    assert parser.feed('{"items": [{"c": 3}]}') == []
@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from llm_usage import LLMUsageRecorder, OUTCOME_ERROR
+from model_router import ModelRouter, REASON_DEGRADED, REASON_SIMPLE
+
+
+class FakeError(Exception):
+    status_code = 500
+
+
+class FakeRaw:
+    retries_taken = 0
+
+    def __init__(self, response):
+        self.response = response
+
+    def parse(self):
+        return self.response
+
+
+class FakeCompletions:
+    """chat.completions with with_raw_response; answers with a dated snapshot name."""
+
+    def __init__(self):
+        self.fail = False
+        self.with_raw_response = self
+
+    async def create(self, **params):
+        if self.fail:
+            raise FakeError("boom")
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20, prompt_tokens_details=None)
+        return FakeRaw(SimpleNamespace(model=params["model"] + "-2025-04-14", usage=usage))
+
+
+def fake_client():
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+
+def test_attempts_roll_up_under_the_requested_model():
+    usage = LLMUsageRecorder()
+    client = fake_client()
+
+    async def scenario():
+        for _ in range(200):
+            await usage.create(client, model="gpt-4.1-nano", messages=[])
+        client.chat.completions.fail = True
+        for _ in range(20):
+            with pytest.raises(FakeError):
+                await usage.create(client, model="gpt-4.1-nano", messages=[])
+
+    asyncio.run(scenario())
+    assert list(usage.by_model) == ["gpt-4.1-nano"]
+    stats = usage.model_stats("gpt-4.1-nano")
+    assert stats["calls"] == 220
+    assert stats["recent_error_rate"] == 0.1
+
+    router = ModelRouter("gpt-4.1-nano", "gpt-4o-mini", usage.model_stats, spend=lambda: 0.0)
+    assert router.healthy("gpt-4.1-nano")
+    assert router.route(0.1).reason == REASON_SIMPLE
+
+
+def test_served_model_is_kept_on_the_attempt():
+    usage = LLMUsageRecorder()
+    with usage.track("vision") as op:
+        asyncio.run(usage.create(fake_client(), model="gpt-4.1-nano", messages=[]))
+    attempt = op.attempts[0]
+    assert attempt["model"] == "gpt-4.1-nano"
+    assert attempt["served_model"] == "gpt-4.1-nano-2025-04-14"
+    assert attempt["cost_usd"] is not None
+
+
+def test_failing_model_is_routed_around():
+    usage = LLMUsageRecorder()
+    for _ in range(30):
+        usage.attempt("gpt-4.1-nano", "primary", 0.5, outcome=OUTCOME_ERROR)
+        usage.attempt("gpt-4o-mini", "primary", 0.5)
+    router = ModelRouter("gpt-4.1-nano", "gpt-4o-mini", usage.model_stats, spend=lambda: 0.0)
+    route = router.route(0.1)
+    assert (route.model, route.reason) == ("gpt-4o-mini", REASON_DEGRADED)
@@ -0,0 +1,117 @@
+import asyncio
+
+from meal_memory import MealMemory
+
+RESULT = {"items": [{"name": "menemen", "calories_kcal": 300}], "total": {"calories_kcal": 300}}
+PHOTO = 0x0F0F_F0F0_1234_5678
+
+
+class FakeCursor:
+    def sort(self, *args):
+        return self
+
+    def limit(self, *args):
+        return self
+
+    async def to_list(self, length):
+        return []
+
+
+class FakeCollection:
+    def __init__(self):
+        self.deleted = []
+
+    def find(self, query):
+        return FakeCursor()
+
+    async def update_one(self, *args, **kwargs):
+        pass
+
+    async def replace_one(self, *args, **kwargs):
+        pass
+
+    async def delete_many(self, query):
+        self.deleted.append(query)
+
+
+def test_recall_matches_only_within_max_distance():
+    memory = MealMemory(max_distance=4)
+
+    async def scenario():
+        await memory.remember("u1", PHOTO, RESULT, "menemen", "meal_1")
+        near = await memory.recall("u1", PHOTO ^ 0b1111)
+        far = await memory.recall("u1", PHOTO ^ 0b11111)
+        other_user = await memory.recall("u2", PHOTO)
+        return near, far, other_user
+
+    near, far, other_user = asyncio.run(scenario())
+    assert near == RESULT
+    assert far is None and other_user is None
+
+
+def test_deleted_meal_stops_answering():
+    collection = FakeCollection()
+    memory = MealMemory(collection=collection)
+
+    async def scenario():
+        await memory.remember("u1", PHOTO, RESULT, "menemen", "meal_1")
+        await memory.remember("u1", ~PHOTO & (2**64 - 1), RESULT, "soup", "meal_2")
+        await memory.forget_meal("u1", "meal_1")
+        return await memory.recall("u1", PHOTO), await memory.recall("u1", ~PHOTO & (2**64 - 1))
+
+    gone, kept = asyncio.run(scenario())
+    assert gone is None
+    assert kept == RESULT
+    assert {"user_id": "u1", "meal_id": "meal_1"} in collection.deleted
+
+
+def test_account_deletion_forgets_all_entries():
+    memory = MealMemory()
+
+    async def scenario():
+        await memory.remember("u1", PHOTO, RESULT, "menemen", "meal_1")
+        await memory.forget_user("u1")
+        return await memory.recall("u1", PHOTO)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_resaved_photo_replaces_the_earlier_correction():
+    memory = MealMemory()
+    edited = {"items": [{"name": "menemen", "calories_kcal": 420}], "total": {"calories_kcal": 420}}
+
+    async def scenario():
+        await memory.remember("u1", PHOTO, RESULT, "menemen", "meal_1")
+        await memory.remember("u1", PHOTO ^ 0b1, edited, "menemen", "meal_2")
+        return await memory.recall("u1", PHOTO)
+
+    assert asyncio.run(scenario()) == edited
+    assert memory.stats["stored"] == 1 and memory.stats["updated"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    memory = MealMemory(max_per_user=2, max_distance=0)
+    photos = [PHOTO, PHOTO ^ 0xFF, PHOTO ^ 0xFF00]
+
+    async def scenario():
+        await memory.remember("u1", photos[0], RESULT, "a")
+        await memory.remember("u1", photos[1], RESULT, "b")
+        await memory.recall("u1", photos[0])
+        await memory.remember("u1", photos[2], RESULT, "c")
+        return [await memory.recall("u1", photo) for photo in photos]
+
+    kept, evicted, newest = asyncio.run(scenario())
+    assert kept == RESULT and newest == RESULT
+    assert evicted is None
+    assert memory.stats["evicted"] == 1
+
+
+def test_recall_returns_a_copy():
+    memory = MealMemory()
+
+    async def scenario():
+        await memory.remember("u1", PHOTO, RESULT, "menemen")
+        (await memory.recall("u1", PHOTO))["items"].clear()
+        return await memory.recall("u1", PHOTO)
+
+    assert asyncio.run(scenario()) == RESULT
@@ -0,0 +1,68 @@
+import pytest
+
+from model_router import (
+    REASON_COMPLEX, REASON_DEGRADED, REASON_OVER_BUDGET, REASON_SIMPLE, REASON_STATIC, ModelRouter,
+)
+
+CHEAP, STRONG = "gpt-4.1-nano", "gpt-4o-mini"
+HEALTHY = {"recent_calls": 100, "recent_error_rate": 0.0, "p95_ms": 2000}
+FAILING = {"recent_calls": 100, "recent_error_rate": 0.5, "p95_ms": 2000}
+SLOW = {"recent_calls": 100, "recent_error_rate": 0.0, "p95_ms": 30000}
+
+
+def router(stats=None, spend=0.0, **kwargs):
+    stats = stats or {}
+    return ModelRouter(CHEAP, STRONG, lambda model: stats.get(model, HEALTHY), lambda: spend, **kwargs)
+
+
+@pytest.mark.parametrize("complexity, is_premium, expected", [
+    (0.1, False, (CHEAP, STRONG, "low", REASON_SIMPLE)),
+    (0.54, False, (CHEAP, STRONG, "low", REASON_SIMPLE)),
+    (0.55, False, (STRONG, CHEAP, "low", REASON_COMPLEX)),
+    (0.9, False, (STRONG, CHEAP, "high", REASON_COMPLEX)),
+    (0.34, True, (CHEAP, STRONG, "low", REASON_SIMPLE)),
+    (0.4, True, (STRONG, CHEAP, "low", REASON_COMPLEX)),
+])
+def test_complexity_thresholds(complexity, is_premium, expected):
+    route = router().route(complexity, is_premium)
+    assert (route.model, route.fallback, route.detail, route.reason) == expected
+
+
+def test_over_budget_keeps_everyone_but_premium_on_the_cheap_model():
+    busy = router(spend=5.0, budget_usd_per_hour=2.0)
+    assert (busy.route(0.9).model, busy.route(0.9).reason) == (CHEAP, REASON_OVER_BUDGET)
+    assert busy.route(0.9).detail == "low"
+    assert busy.route(0.9, is_premium=True).model == STRONG
+    assert router(spend=1.0, budget_usd_per_hour=2.0).route(0.9).model == STRONG
+    assert router(spend=5.0).route(0.9).model == STRONG  # no budget set
+
+
+@pytest.mark.parametrize("bad", [FAILING, SLOW])
+def test_degraded_model_is_routed_around(bad):
+    route = router({STRONG: bad}).route(0.9)
+    assert (route.model, route.fallback, route.reason, route.detail) == (CHEAP, STRONG, REASON_DEGRADED, "low")
+    route = router({CHEAP: bad}).route(0.1)
+    assert (route.model, route.reason) == (STRONG, REASON_DEGRADED)
+
+
+def test_both_degraded_keeps_the_choice():
+    route = router({CHEAP: FAILING, STRONG: FAILING}).route(0.1)
+    assert (route.model, route.reason) == (CHEAP, REASON_SIMPLE)
+
+
+def test_few_samples_are_not_judged():
+    sparse = {"recent_calls": 5, "recent_error_rate": 1.0, "p95_ms": 60000}
+    assert router({CHEAP: sparse}).healthy(CHEAP)
+    assert router({CHEAP: None}).healthy(CHEAP)
+
+
+def test_disabled_router_is_static_and_decisions_are_counted():
+    static = router(enabled=False)
+    assert (static.route(0.9).model, static.route(0.9).reason) == (CHEAP, REASON_STATIC)
+    counted = router()
+    for complexity in (0.1, 0.1, 0.7, 1.0):
+        counted.route(complexity)
+    snapshot = counted.snapshot()
+    assert snapshot["decisions"] == {f"{CHEAP}:simple": 2, f"{STRONG}:complex": 2}
+    assert snapshot["details"] == {"low": 3, "high": 1}
+    assert snapshot["complexity"] == {"<=0.2": 2, "<=0.8": 1, "<=1.0": 1}
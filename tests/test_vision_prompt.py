@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from vision_prompt import (
+    COMPACT_RESPONSE_FORMAT,
+    PROMPT_COMPACT,
+    PROMPT_LEGACY,
+    compact_item,
+    parse_compact_response,
+    prompt_variant,
+)
+
+ITEM = {
+    "name": "Mercimek çorbası", "grams": 250, "grams_low": 300, "grams_high": 200,
+    "kcal": 180, "protein_g": 9, "carbs_g": 25, "fat_g": 5, "confidence": 1.4,
+}
+
+
+def test_prompt_variant_is_stable_per_seed():
+    seeds = [f"user_{i}" for i in range(2000)]
+    first = [prompt_variant(seed, 0.3) for seed in seeds]
+    assert first == [prompt_variant(seed, 0.3) for seed in seeds]
+    assert 0.25 < first.count(PROMPT_COMPACT) / len(seeds) < 0.35
+
+
+def test_prompt_variant_share_bounds():
+    assert prompt_variant("user_1", 0.0) == PROMPT_LEGACY
+    assert prompt_variant("user_1", 1.0) == PROMPT_COMPACT
+
+
+def test_compact_reply_is_converted_to_the_internal_shape():
+    result = parse_compact_response(json.dumps({"items": [ITEM, ITEM], "questions": [], "notes": ""}))
+    item = result["items"][0]
+    assert item["quantity_estimate"] == {"grams": 250, "range_grams": [200, 300]}
+    assert item["macros"] == {"protein_g": 9, "carbs_g": 25, "fat_g": 5}
+    assert item["confidence"] == 1.0
+    assert result["total"] == {"calories_kcal": 360, "protein_g": 18.0, "carbs_g": 50.0, "fat_g": 10.0}
+
+
+def test_strict_schema_rejects_extra_and_missing_fields():
+    with pytest.raises(ValidationError):
+        parse_compact_response(json.dumps({"items": [], "questions": [], "notes": "", "total": {}}))
+    with pytest.raises(ValidationError):
+        compact_item({**ITEM, "brand": "x"})
+    with pytest.raises(ValidationError):
+        compact_item({k: v for k, v in ITEM.items() if k != "kcal"})
+
+
+def test_response_format_schema_is_strict_and_flat():
+    schema = COMPACT_RESPONSE_FORMAT["json_schema"]["schema"]
+    text = json.dumps(schema)
+    assert COMPACT_RESPONSE_FORMAT["json_schema"]["strict"] is True
+    assert "$ref" not in text and "$defs" not in text and '"title"' not in text
+    assert schema["additionalProperties"] is False
+    assert schema["properties"]["items"]["items"]["additionalProperties"] is False